@@ -15,7 +15,9 @@ import uvicorn
 
 from agent_card import get_agent_card, get_health_status
 from agent_factory import create_agent
+from invocation_pool import InvocationPool
 from logger_util import get_logger, log
+from prompt_cache import record_prompt_cache_usage
 from response_formatter import format_error_response, format_success_response
 
 _active_tasks = 0
@@ -72,6 +74,7 @@ def handle_message_tool(payload_json: str) -> str:
     try:
         agent = create_agent()
         agent_result = agent(text)
+        record_prompt_cache_usage(agent_result, correlation_id)
 
         msg = agent_result.message
         content_blocks = msg.get("content", []) if isinstance(msg, dict) else []
@@ -213,6 +216,7 @@ def handle_invocation_body(body: bytes) -> dict:
 
 
 app = FastAPI()
+_invocation_pool = InvocationPool()
 
 
 @app.get("/ping")
@@ -220,7 +224,7 @@ def ping_endpoint():
     """Health check (required by AgentCore service contract)."""
     with _active_tasks_lock:
         is_busy = _active_tasks > 0
-    return get_health_status(is_busy=is_busy)
+    return get_health_status(is_busy=is_busy or _invocation_pool.is_busy)
 
 
 @app.get("/.well-known/agent-card.json")
@@ -233,7 +237,8 @@ def agent_card_endpoint():
 async def handle_invocation(request: Request):
     """Handle invoke_agent_runtime payload as JSON-RPC 2.0."""
     body = await request.body()
-    content = handle_invocation_body(body)
+    # Blocking agent run: offload so /ping and other requests stay responsive
+    content = await _invocation_pool.run(handle_invocation_body, body)
     return JSONResponse(content=content)
 
 
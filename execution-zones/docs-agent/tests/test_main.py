@@ -59,3 +59,24 @@ class TestJsonRpc:
         resp = main.handle_invocation_body(body)
         assert resp["id"] == "req-2"
         assert resp["result"]["status"] == "success"
+
+
+class TestPingEndpoint:
+    def test_ping_busy_while_invocation_in_flight(self):
+        """GET /ping returns HealthyBusy while the invocation pool has work."""
+        import asyncio
+        import threading
+
+        import main
+        ping_handler = main.app._routes.get(("GET", "/ping"))
+        release = threading.Event()
+
+        async def scenario():
+            task = asyncio.ensure_future(main._invocation_pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            status = ping_handler()["status"]
+            release.set()
+            await task
+            return status
+
+        assert asyncio.run(scenario()) == "HealthyBusy"
@@ -0,0 +1,91 @@
+"""
+Unit tests for prompt_cache.py.
+
+Covers:
+- BEDROCK_PROMPT_CACHE toggling system prompt and tool cache checkpoints
+- Cache read/write token counts logged and emitted as one EMF line
+"""
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import prompt_cache
+from prompt_cache import (
+    bedrock_cache_config,
+    cached_system_prompt,
+    record_prompt_cache_usage,
+)
+
+
+def _result(usage):
+    return SimpleNamespace(metrics=SimpleNamespace(accumulated_usage=usage))
+
+
+class TestCacheCheckpoints:
+    def test_enabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("BEDROCK_PROMPT_CACHE", raising=False)
+        assert bedrock_cache_config() == {"cache_tools": "default"}
+        assert cached_system_prompt("prompt") == [
+            {"text": "prompt"},
+            {"cachePoint": {"type": "default"}},
+        ]
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("BEDROCK_PROMPT_CACHE", "false")
+        assert bedrock_cache_config() == {}
+        assert cached_system_prompt("prompt") == "prompt"
+
+
+class TestRecordPromptCacheUsage:
+    def test_emits_read_write_and_uncached_tokens(self):
+        usage = {"inputTokens": 50, "cacheReadInputTokens": 4000, "cacheWriteInputTokens": 12}
+        with patch("prompt_cache.emit_emf") as mock_emit:
+            counts = record_prompt_cache_usage(_result(usage), "corr-1")
+
+        assert counts == {
+            "cache_read_input_tokens": 4000,
+            "cache_write_input_tokens": 12,
+            "uncached_input_tokens": 50,
+        }
+        mock_emit.assert_called_once_with(
+            prompt_cache.METRICS_NAMESPACE,
+            {
+                prompt_cache.METRIC_CACHE_READ_TOKENS: 4000,
+                prompt_cache.METRIC_CACHE_WRITE_TOKENS: 12,
+                prompt_cache.METRIC_UNCACHED_INPUT_TOKENS: 50,
+            },
+            {"Agent": "docs-agent"},
+        )
+
+    def test_emf_line_defines_metrics(self, capsys):
+        record_prompt_cache_usage(_result({"inputTokens": 5, "cacheReadInputTokens": 7}))
+
+        emf = next(
+            json.loads(line) for line in capsys.readouterr().out.splitlines() if '"_aws"' in line
+        )
+        directive = emf["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == "SlackAI/PromptCache"
+        assert directive["Dimensions"] == [["Agent"]]
+        assert {m["Name"] for m in directive["Metrics"]} == {
+            prompt_cache.METRIC_CACHE_READ_TOKENS,
+            prompt_cache.METRIC_CACHE_WRITE_TOKENS,
+            prompt_cache.METRIC_UNCACHED_INPUT_TOKENS,
+        }
+        assert emf["Agent"] == "docs-agent"
+        assert emf[prompt_cache.METRIC_CACHE_READ_TOKENS] == 7
+
+    def test_missing_cache_keys_count_as_zero(self):
+        with patch("prompt_cache.emit_emf"):
+            counts = record_prompt_cache_usage(_result({"inputTokens": 10}))
+        assert counts["cache_read_input_tokens"] == 0
+        assert counts["cache_write_input_tokens"] == 0
+
+    def test_result_without_usage_is_ignored(self):
+        with patch("prompt_cache.emit_emf") as mock_emit:
+            assert record_prompt_cache_usage(MagicMock()) is None
+        mock_emit.assert_not_called()
@@ -112,6 +112,16 @@ register_agent_in_dynamodb() {
         }" \
         && log_success "Agent ${agent_id} registered in DynamoDB" \
         || log_warning "Failed to register ${agent_id} in DynamoDB (non-fatal)"
+
+    # Bump the registry version marker so running Verification Agents reload
+    aws dynamodb update-item \
+        --table-name "${table_name}" \
+        --region "${AWS_REGION}" ${PROFILE_ARGS} \
+        --key "{\"env\": {\"S\": \"${DEPLOYMENT_ENV}\"}, \"agent_id\": {\"S\": \"__registry_version__\"}}" \
+        --update-expression "ADD registry_version :one SET updated_at = :updated_at" \
+        --expression-attribute-values "{\":one\": {\"N\": \"1\"}, \":updated_at\": {\"S\": \"${updated_at}\"}}" \
+        >/dev/null \
+        || log_warning "Failed to bump agent registry version (non-fatal)"
 }
 
 register_agent_in_dynamodb
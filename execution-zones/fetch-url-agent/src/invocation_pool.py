@@ -0,0 +1,74 @@
+"""
+Bounded worker pool for invocation handlers.
+
+FastAPI runs ``async`` routes on the event loop, so calling a blocking handler
+(the Strands agent run) directly from ``handle_invocation`` stalls every other
+request — including ``/ping`` — until the model call finishes.
+``InvocationPool.run`` executes the handler on a dedicated ThreadPoolExecutor
+instead, leaving the event loop free.
+
+AGENT_MAX_CONCURRENT_INVOCATIONS (default 4) sets how many invocations run at
+once in this container; further requests wait for a free worker. The pool
+counts invocations from submission until the worker finishes (a client
+disconnect does not end the count early), so ``/ping`` reports HealthyBusy for
+as long as any work is queued or running.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+DEFAULT_MAX_CONCURRENT_INVOCATIONS = 4
+
+
+def get_max_concurrent_invocations() -> int:
+    """Read AGENT_MAX_CONCURRENT_INVOCATIONS (default 4, minimum 1)."""
+    try:
+        value = int(os.environ.get("AGENT_MAX_CONCURRENT_INVOCATIONS", str(DEFAULT_MAX_CONCURRENT_INVOCATIONS)))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENT_INVOCATIONS
+    return max(1, value)
+
+
+class InvocationPool:
+    """Runs blocking invocation handlers off the event loop and tracks in-flight work."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or get_max_concurrent_invocations()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="invocation"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Invocations queued or running."""
+        with self._lock:
+            return self._in_flight
+
+    @property
+    def is_busy(self) -> bool:
+        return self.in_flight > 0
+
+    def _call(self, func: Callable[..., Any], args: tuple) -> Any:
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` on a pool worker and await its result."""
+        with self._lock:
+            self._in_flight += 1
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor.submit(self._call, func, args)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        return await asyncio.wrap_future(future, loop=loop)
@@ -42,3 +42,22 @@ def test_get_tools_returns_only_fetch_url() -> None:
                       "get_business_document_guidelines", "get_presentation_slide_guidelines",
                       "search_docs", "get_current_time"):
         assert forbidden not in returned_names, f"{forbidden} must NOT be in get_tools()"
+
+
+def test_create_agent_uses_prompt_cache_checkpoints() -> None:
+    """create_agent must cache the system prompt and tool specs (see prompt_cache)."""
+    tree = _load_agent_factory_ast()
+
+    create_agent_fn = next(
+        (n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == "create_agent"),
+        None,
+    )
+    assert create_agent_fn is not None, "create_agent() function not found"
+
+    called = {
+        node.func.id
+        for node in ast.walk(create_agent_fn)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+    }
+    assert "cached_system_prompt" in called
+    assert "bedrock_cache_config" in called
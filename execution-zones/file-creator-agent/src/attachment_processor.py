@@ -10,12 +10,23 @@ Follows Slack and AWS best practices:
 
 Adapted from Lambda version for AgentCore container environment.
 
+Extraction cache: attachments relayed by the Verification Agent carry
+``content_sha256``. Successful results (image bytes, extracted text, document
+blocks, slide images) are kept per (file_id, content_sha256) for
+ATTACHMENT_CACHE_TTL_SECONDS (default 3600), up to ATTACHMENT_CACHE_MAX_BYTES
+(default 64 MB) per container, least recently used evicted. A follow-up question
+about the same file skips download and extraction.
+
 Reference:
 - Slack files.info: https://api.slack.com/methods/files.info
 - AWS Bedrock Converse: https://docs.aws.amazon.com/bedrock/latest/userguide/conversation-inference.html
 """
 
-from typing import Any, Dict, List, Optional
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from file_downloader import download_file, get_file_download_url, download_from_presigned_url
 from logger_util import get_logger, log
@@ -28,6 +39,61 @@ def _log(level: str, event_type: str, data: dict) -> None:
     log(_logger, level, event_type, data, service="execution-agent-attachment")
 
 
+ATTACHMENT_CACHE_TTL_SECONDS = int(os.environ.get("ATTACHMENT_CACHE_TTL_SECONDS", "3600"))
+ATTACHMENT_CACHE_MAX_BYTES = int(os.environ.get("ATTACHMENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+def _entry_bytes(entry: Dict[str, Any]) -> int:
+    return sum(len(entry.get(k) or b"") for k in ("content", "document_bytes"))
+
+
+class _ExtractionCache:
+    """Processed attachment entries per (file_id, content_sha256), TTL + LRU by size."""
+
+    def __init__(self):
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, int, List[Dict[str, Any]]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, _, entries = item
+            if expires_at <= time.time():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return [dict(e) for e in entries]
+
+    def put(self, key: Tuple[str, str], entries: List[Dict[str, Any]]) -> None:
+        if not entries or any(e.get("processing_status") != "success" for e in entries):
+            return
+        size = sum(_entry_bytes(e) for e in entries)
+        if size > ATTACHMENT_CACHE_MAX_BYTES:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.time() + ATTACHMENT_CACHE_TTL_SECONDS, size, [dict(e) for e in entries])
+            self._bytes += size
+            while self._bytes > ATTACHMENT_CACHE_MAX_BYTES and self._entries:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+_extraction_cache = _ExtractionCache()
+
+
 # Supported image MIME types (Bedrock Converse API supported formats)
 SUPPORTED_IMAGE_TYPES = [
     "image/png",
@@ -165,6 +231,7 @@ def process_attachments(
         file_size = attachment.get("size", 0)
         presigned_url = attachment.get("presigned_url")
         download_url = attachment.get("url_private_download")
+        content_sha256 = attachment.get("content_sha256")
 
         log_data = {
             "file_id": file_id,
@@ -175,6 +242,14 @@ def process_attachments(
         if correlation_id:
             log_data["correlation_id"] = correlation_id
 
+        if content_sha256:
+            cached = _extraction_cache.get((file_id, content_sha256))
+            if cached is not None:
+                _log("INFO", "attachment_cache_hit", {**log_data, "entries": len(cached)})
+                processed.extend(cached)
+                continue
+        first_entry = len(processed)
+
         # Download: prefer S3 pre-signed URL; fallback to Slack when absent.
         # For images, expected_mimetype triggers magic-bytes validation in download_from_presigned_url;
         # validated bytes are then passed as content for Bedrock image blocks.
@@ -395,6 +470,9 @@ def process_attachments(
                 "error_message": f"Unsupported file type: {mime_type}",
             })
 
+        if content_sha256:
+            _extraction_cache.put((file_id, content_sha256), processed[first_entry:])
+
     return processed
 
 
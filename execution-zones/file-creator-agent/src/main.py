@@ -23,10 +23,12 @@ from botocore.exceptions import ClientError
 from bedrock_client_converse import build_content_blocks
 from response_formatter import format_success_response, format_error_response, build_file_artifact, validate_file_for_artifact
 from agent_factory import create_agent
+from invocation_pool import InvocationPool
 import file_config as file_config
 from attachment_processor import process_attachments, get_processing_summary
 from agent_card import get_agent_card, get_health_status
 from logger_util import get_logger, log
+from prompt_cache import record_prompt_cache_usage
 
 # Track active processing for health status
 _active_tasks = 0
@@ -466,6 +468,8 @@ def handle_message_tool(payload_json: str) -> str:
                 else:
                     raise
 
+            record_prompt_cache_usage(agent_result, correlation_id)
+
             # Extract response text from agent result
             msg = agent_result.message
             content_blocks_out = msg.get("content", []) if isinstance(msg, dict) else []
@@ -714,6 +718,7 @@ def handle_invocation_body(body: bytes) -> dict:
 # ─── FastAPI app ───
 
 app = FastAPI()
+_invocation_pool = InvocationPool()
 
 
 @app.get("/ping")
@@ -721,7 +726,7 @@ def ping_endpoint():
     """Health check (required by AgentCore service contract)."""
     with _active_tasks_lock:
         is_busy = _active_tasks > 0
-    return get_health_status(is_busy=is_busy)
+    return get_health_status(is_busy=is_busy or _invocation_pool.is_busy)
 
 
 @app.get("/.well-known/agent-card.json")
@@ -734,7 +739,8 @@ def agent_card_endpoint():
 async def handle_invocation(request: Request):
     """Handle invoke_agent_runtime payload as JSON-RPC 2.0 (CSP-independent A2A)."""
     body = await request.body()
-    content = handle_invocation_body(body)
+    # Blocking agent run: offload so /ping and other requests stay responsive
+    content = await _invocation_pool.run(handle_invocation_body, body)
     return JSONResponse(content=content)
 
 
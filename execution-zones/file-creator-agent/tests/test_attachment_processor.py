@@ -6,12 +6,15 @@ Tests:
 - Download from pre-signed URL when presigned_url present
 - Fallback to Slack download when presigned_url absent (backward compatibility)
 - No bot_token required when using pre-signed URL
+- Extraction cache per (file_id, content_sha256)
 """
 
 import os
 import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
@@ -403,3 +406,83 @@ class TestImageProcessingViaS3:
         assert success[0].get("content") == jpeg_bytes
         assert success[0].get("document_bytes") is None
         assert success[0].get("document_format") is None
+
+
+class TestExtractionCache:
+    """Repeat references to the same relayed file skip download and extraction."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from attachment_processor import _extraction_cache
+
+        _extraction_cache.clear()
+        yield
+        _extraction_cache.clear()
+
+    @staticmethod
+    def _pdf(sha="abc123", file_id="F1"):
+        return {
+            "id": file_id,
+            "name": "report.pdf",
+            "mimetype": "application/pdf",
+            "size": 16,
+            "presigned_url": "https://s3.example.com/k?sig=1",
+            "content_sha256": sha,
+        }
+
+    @patch("attachment_processor.download_from_presigned_url")
+    @patch("attachment_processor.extract_text_from_pdf")
+    def test_same_file_and_hash_served_from_cache(self, mock_extract_pdf, mock_download):
+        mock_download.return_value = b"%PDF-1.4 minimal"
+        mock_extract_pdf.return_value = "Extracted text"
+
+        from attachment_processor import process_attachments
+
+        first = process_attachments([self._pdf()], bot_token="", correlation_id="c1")
+        second = process_attachments([self._pdf()], bot_token="", correlation_id="c2")
+
+        assert second == first
+        assert second[0]["content"] == "Extracted text"
+        assert second[0]["document_bytes"] == b"%PDF-1.4 minimal"
+        mock_download.assert_called_once()
+        mock_extract_pdf.assert_called_once()
+
+    @patch("attachment_processor.download_from_presigned_url")
+    @patch("attachment_processor.extract_text_from_pdf")
+    def test_different_hash_is_processed_again(self, mock_extract_pdf, mock_download):
+        mock_download.return_value = b"%PDF-1.4 minimal"
+        mock_extract_pdf.return_value = "Extracted text"
+
+        from attachment_processor import process_attachments
+
+        process_attachments([self._pdf(sha="v1")], bot_token="", correlation_id="c1")
+        process_attachments([self._pdf(sha="v2")], bot_token="", correlation_id="c2")
+
+        assert mock_download.call_count == 2
+
+    @patch("attachment_processor.download_from_presigned_url")
+    @patch("attachment_processor.extract_text_from_pdf")
+    def test_failed_extraction_not_cached(self, mock_extract_pdf, mock_download):
+        mock_download.return_value = b"%PDF-1.4 minimal"
+        mock_extract_pdf.return_value = None
+
+        from attachment_processor import process_attachments
+
+        process_attachments([self._pdf()], bot_token="", correlation_id="c1")
+        result = process_attachments([self._pdf()], bot_token="", correlation_id="c2")
+
+        assert result[0]["processing_status"] == "failed"
+        assert mock_download.call_count == 2
+
+    @patch("attachment_processor.download_from_presigned_url")
+    @patch("attachment_processor.extract_text_from_pdf")
+    def test_without_content_hash_not_cached(self, mock_extract_pdf, mock_download):
+        mock_download.return_value = b"%PDF-1.4 minimal"
+        mock_extract_pdf.return_value = "Extracted text"
+
+        from attachment_processor import process_attachments
+
+        process_attachments([self._pdf(sha=None)], bot_token="", correlation_id="c1")
+        process_attachments([self._pdf(sha=None)], bot_token="", correlation_id="c2")
+
+        assert mock_download.call_count == 2
@@ -5,12 +5,15 @@ Tests:
 - Metric emission with correct namespace
 - Silent failure handling
 - Singleton client behavior
+- Buffering until flush
 """
 
 import os
 import sys
 from unittest.mock import Mock, patch
 
+import pytest
+
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -18,21 +21,31 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 class TestEmitMetric:
     """Test CloudWatch metric emission."""
 
+    @pytest.fixture(autouse=True)
+    def _clean_buffer(self, monkeypatch):
+        import cloudwatch_metrics
+
+        monkeypatch.delenv("METRICS_OUTPUT", raising=False)
+        cloudwatch_metrics._buffer._drain()
+        yield
+        cloudwatch_metrics._buffer._drain()
+
     @patch("cloudwatch_metrics._get_cloudwatch_client")
     def test_emit_metric_calls_put_metric_data(self, mock_get_client):
         """emit_metric should call CloudWatch PutMetricData."""
         mock_cw = Mock()
         mock_get_client.return_value = mock_cw
 
-        from cloudwatch_metrics import emit_metric
+        from cloudwatch_metrics import emit_metric, flush_metrics
 
         emit_metric("SlackAI/ExecutionAgent", "BedrockApiError", 1.0)
+        flush_metrics()
 
         mock_cw.put_metric_data.assert_called_once()
         call_kwargs = mock_cw.put_metric_data.call_args[1]
         assert call_kwargs["Namespace"] == "SlackAI/ExecutionAgent"
         assert call_kwargs["MetricData"][0]["MetricName"] == "BedrockApiError"
-        assert call_kwargs["MetricData"][0]["Value"] == 1.0
+        assert call_kwargs["MetricData"][0]["StatisticValues"]["Sum"] == 1.0
 
     @patch("cloudwatch_metrics._get_cloudwatch_client")
     def test_emit_metric_silent_on_error(self, mock_get_client):
@@ -41,10 +54,20 @@ class TestEmitMetric:
         mock_cw.put_metric_data.side_effect = Exception("CloudWatch down")
         mock_get_client.return_value = mock_cw
 
-        from cloudwatch_metrics import emit_metric
+        from cloudwatch_metrics import emit_metric, flush_metrics
 
         # Should not raise
         emit_metric("SlackAI/ExecutionAgent", "AsyncTaskFailed", 1.0)
+        flush_metrics()
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_emit_does_not_call_api_until_flush(self, mock_get_client):
+        """emit_metric only buffers; PutMetricData is sent by the flush."""
+        from cloudwatch_metrics import emit_metric
+
+        emit_metric("SlackAI/ExecutionAgent", "AsyncTaskCreated", 1.0)
+
+        mock_get_client.return_value.put_metric_data.assert_not_called()
 
     @patch("cloudwatch_metrics._get_cloudwatch_client")
     def test_emit_metric_with_dimensions(self, mock_get_client):
@@ -52,10 +75,11 @@ class TestEmitMetric:
         mock_cw = Mock()
         mock_get_client.return_value = mock_cw
 
-        from cloudwatch_metrics import emit_metric
+        from cloudwatch_metrics import emit_metric, flush_metrics
 
         dims = [{"Name": "TeamId", "Value": "TEAM123"}]
         emit_metric("SlackAI/ExecutionAgent", "AsyncTaskCreated", 1.0, dimensions=dims)
+        flush_metrics()
 
         call_kwargs = mock_cw.put_metric_data.call_args[1]
         assert call_kwargs["MetricData"][0]["Dimensions"] == dims
@@ -66,9 +90,10 @@ class TestEmitMetric:
         mock_cw = Mock()
         mock_get_client.return_value = mock_cw
 
-        from cloudwatch_metrics import emit_metric
+        from cloudwatch_metrics import emit_metric, flush_metrics
 
         emit_metric("SlackAI/ExecutionAgent", "AttachmentProcessed", 1.0)
+        flush_metrics()
 
         call_kwargs = mock_cw.put_metric_data.call_args[1]
         assert call_kwargs["MetricData"][0]["Unit"] == "Count"
@@ -431,6 +431,25 @@ class TestA2ARouting:
 
         assert ("GET", "/ping") in main.app._routes, "/ping GET route not registered on FastAPI app"
 
+    def test_ping_busy_while_invocation_in_flight(self):
+        """GET /ping returns HealthyBusy while the invocation pool has work."""
+        import asyncio
+        import threading
+
+        import main
+        ping_handler = main.app._routes.get(("GET", "/ping"))
+        release = threading.Event()
+
+        async def scenario():
+            task = asyncio.ensure_future(main._invocation_pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            status = ping_handler()["status"]
+            release.set()
+            await task
+            return status
+
+        assert asyncio.run(scenario()) == "HealthyBusy"
+
     def test_post_root_route_registered(self):
         """POST / route must be registered for invoke_agent_runtime payloads."""
         import main
@@ -10,6 +10,7 @@ from typing import Any, List
 from strands import Agent
 from strands.models.bedrock import BedrockModel
 
+from prompt_cache import bedrock_cache_config, cached_system_prompt
 from system_prompt import FULL_SYSTEM_PROMPT
 from tools.get_current_time import get_current_time
 
@@ -36,10 +37,11 @@ def create_agent(tools: List[Any] | None = None) -> Agent:
     )
     region = os.environ.get("AWS_REGION_NAME", "ap-northeast-1")
 
-    model = BedrockModel(model_id=model_id, region_name=region)
+    # Cache checkpoints after the system prompt and tool specs (see prompt_cache)
+    model = BedrockModel(model_id=model_id, region_name=region, **bedrock_cache_config())
 
     return Agent(
         model=model,
         tools=tool_list,
-        system_prompt=FULL_SYSTEM_PROMPT,
+        system_prompt=cached_system_prompt(FULL_SYSTEM_PROMPT),
     )
@@ -0,0 +1,90 @@
+"""
+Bedrock prompt caching for the Time Agent.
+
+Every invocation resends the same system prompt and tool specifications. With
+BEDROCK_PROMPT_CACHE enabled (default) agent_factory marks this static prefix
+with Bedrock cache checkpoints:
+
+- ``cached_system_prompt`` turns the system prompt into content blocks ending
+  with a ``cachePoint`` block.
+- ``bedrock_cache_config`` returns the BedrockModel config that adds a
+  ``cachePoint`` after the tool specifications (``cache_tools``).
+
+``record_prompt_cache_usage`` logs the cache read/write token counts of an
+invocation and prints them as one CloudWatch EMF line (``emf_metrics``), so the
+response is never delayed by a metrics call.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Union
+
+from emf_metrics import emit_emf
+from logger_util import get_logger, log
+
+_logger = get_logger()
+
+AGENT_NAME = "time-agent"
+METRICS_NAMESPACE = "SlackAI/PromptCache"
+METRIC_CACHE_READ_TOKENS = "PromptCacheReadInputTokens"
+METRIC_CACHE_WRITE_TOKENS = "PromptCacheWriteInputTokens"
+METRIC_UNCACHED_INPUT_TOKENS = "PromptUncachedInputTokens"
+
+_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+
+def _log(level: str, event_type: str, data: Dict[str, Any]) -> None:
+    log(_logger, level, event_type, data, service="time-agent")
+
+
+def is_prompt_cache_enabled() -> bool:
+    """Read BEDROCK_PROMPT_CACHE (default true)."""
+    return os.environ.get("BEDROCK_PROMPT_CACHE", "true").strip().lower() not in ("0", "false", "no")
+
+
+def bedrock_cache_config() -> Dict[str, Any]:
+    """BedrockModel keyword arguments that place a cache checkpoint after the tool specs."""
+    if not is_prompt_cache_enabled():
+        return {}
+    return {"cache_tools": "default"}
+
+
+def cached_system_prompt(prompt: str) -> Union[str, List[Dict[str, Any]]]:
+    """Return the system prompt as content blocks ending with a cache checkpoint.
+
+    Returns the plain string when caching is disabled.
+    """
+    if not is_prompt_cache_enabled():
+        return prompt
+    return [{"text": prompt}, dict(_CACHE_POINT)]
+
+
+def record_prompt_cache_usage(result: Any, correlation_id: str = "") -> Optional[Dict[str, int]]:
+    """Log and emit the prompt cache token counts of one agent invocation.
+
+    Args:
+        result: Strands AgentResult (``result.metrics.accumulated_usage``).
+        correlation_id: Request correlation ID for the log entry.
+
+    Returns:
+        The recorded counts, or None when the result carries no usage.
+    """
+    metrics = getattr(result, "metrics", None)
+    usage = getattr(metrics, "accumulated_usage", None)
+    if not isinstance(usage, dict):
+        return None
+    counts = {
+        "cache_read_input_tokens": int(usage.get("cacheReadInputTokens", 0) or 0),
+        "cache_write_input_tokens": int(usage.get("cacheWriteInputTokens", 0) or 0),
+        "uncached_input_tokens": int(usage.get("inputTokens", 0) or 0),
+    }
+    _log("INFO", "bedrock_prompt_cache_usage", {"correlation_id": correlation_id, **counts})
+    emit_emf(
+        METRICS_NAMESPACE,
+        {
+            METRIC_CACHE_READ_TOKENS: counts["cache_read_input_tokens"],
+            METRIC_CACHE_WRITE_TOKENS: counts["cache_write_input_tokens"],
+            METRIC_UNCACHED_INPUT_TOKENS: counts["uncached_input_tokens"],
+        },
+        {"Agent": AGENT_NAME},
+    )
+    return counts
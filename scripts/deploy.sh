@@ -156,6 +156,15 @@ delete_excluded_agent_registry_entries() {
             log_warning "Could not delete registry item ${agent_id} (env=${reg_env})"
         fi
     done
+    # Bump the registry version marker so running Verification Agents reload
+    aws dynamodb update-item \
+        --table-name "${table_name}" \
+        --region "${AWS_REGION}" ${PROFILE_ARGS} \
+        --key "{\"env\":{\"S\":\"${reg_env}\"},\"agent_id\":{\"S\":\"__registry_version__\"}}" \
+        --update-expression "ADD registry_version :one" \
+        --expression-attribute-values "{\":one\":{\"N\":\"1\"}}" \
+        >/dev/null 2>&1 \
+        || log_warning "Could not bump agent registry version (env=${reg_env})"
 }
 
 save_slack_search_arn_to_config() {
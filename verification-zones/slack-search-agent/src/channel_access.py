@@ -9,7 +9,7 @@ Determines whether a given channel is accessible based on:
 
 from dataclasses import dataclass
 
-from slack_sdk import WebClient
+from slack_api import get_slack_client
 
 
 @dataclass
@@ -53,8 +53,7 @@ def is_accessible(
         )
 
     # Check channel privacy via conversations.info
-    client = WebClient(token=bot_token)
-    response = client.conversations_info(channel=channel_id)
+    response = get_slack_client(bot_token).call("conversations.info", {"channel": channel_id})
 
     channel_info = response.get("channel", {})
     is_private = channel_info.get("is_private", True)  # Default to private if unknown
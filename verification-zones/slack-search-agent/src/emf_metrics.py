@@ -0,0 +1,33 @@
+"""
+CloudWatch Embedded Metric Format (EMF) output.
+
+``emit_emf`` prints one JSON line that CloudWatch Logs turns into metrics, so
+recording a metric needs no CloudWatch client, background thread or buffer and
+never waits on the network.
+"""
+
+import json
+import time
+from typing import Mapping
+
+
+def emit_emf(
+    namespace: str,
+    values: Mapping[str, float],
+    dimensions: Mapping[str, str],
+    unit: str = "Count",
+) -> None:
+    """Print one EMF record; every entry of ``values`` becomes a metric with ``dimensions``."""
+    record = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": namespace,
+                "Dimensions": [list(dimensions)],
+                "Metrics": [{"Name": name, "Unit": unit} for name in values],
+            }],
+        },
+        **dimensions,
+        **values,
+    }
+    print(json.dumps(record), flush=True)
@@ -0,0 +1,156 @@
+"""
+Shared Slack Web API client layer for Slack Search Agent.
+
+All Slack Web API calls of this agent (channel_access, SlackClient) go through
+this module:
+
+- One process-wide ``requests.Session`` whose connection pool
+  (SLACK_HTTP_POOL_SIZE, default 20) keeps TLS connections to slack.com alive
+  across tool calls and invocations.
+- ``get_slack_client(bot_token)`` returns the cached ``SlackApiClient`` of a
+  token (up to SLACK_CLIENT_CACHE_SIZE tokens, least recently used evicted).
+- HTTP 429 waits for ``Retry-After`` and retries up to SLACK_API_MAX_RETRIES
+  times unless the wait exceeds SLACK_API_MAX_RETRY_AFTER_SECONDS.
+- The latency of every call is printed per Slack method as a CloudWatch EMF
+  line (namespace ``SlackAI/SlackApi``, metric ``SlackApiLatency``, dimension
+  ``Method``); rate-limited responses are counted as ``SlackApiRateLimited``.
+  Names match the Verification Agent's slack_api, so both agents chart together.
+
+Unlike the Verification Agent's copy, ``call`` raises
+``slack_sdk.errors.SlackApiError`` for ``ok: false`` and still-rate-limited
+responses, as slack_sdk's WebClient does: the search tools were written
+against WebClient and turn that exception into tool error messages. This agent
+only calls Web API methods, so there is no file download helper.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from slack_sdk.errors import SlackApiError
+
+from emf_metrics import emit_emf
+from logger_util import get_logger, log
+
+_logger = get_logger()
+
+SLACK_API_BASE_URL = "https://slack.com/api/"
+SLACK_HTTP_POOL_SIZE = int(os.environ.get("SLACK_HTTP_POOL_SIZE", "20"))
+SLACK_CLIENT_CACHE_SIZE = int(os.environ.get("SLACK_CLIENT_CACHE_SIZE", "64"))
+SLACK_API_MAX_RETRIES = int(os.environ.get("SLACK_API_MAX_RETRIES", "2"))
+SLACK_API_MAX_RETRY_AFTER_SECONDS = float(os.environ.get("SLACK_API_MAX_RETRY_AFTER_SECONDS", "10"))
+
+METRICS_NAMESPACE = "SlackAI/SlackApi"
+METRIC_LATENCY = "SlackApiLatency"
+METRIC_RATE_LIMITED = "SlackApiRateLimited"
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_clients: "OrderedDict[str, SlackApiClient]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _log(level: str, event_type: str, data: dict) -> None:
+    log(_logger, level, event_type, data, service="slack-search-agent")
+
+
+def _get_session() -> requests.Session:
+    """Return the shared keep-alive session (created on first use)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SLACK_HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "1")))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _record_latency(method: str, started: float) -> None:
+    emit_emf(
+        METRICS_NAMESPACE,
+        {METRIC_LATENCY: (time.monotonic() - started) * 1000},
+        {"Method": method},
+        unit="Milliseconds",
+    )
+
+
+class SlackApiClient:
+    """Slack Web API calls for one bot token over the shared session."""
+
+    def __init__(self, bot_token: str):
+        self._headers = {"Authorization": f"Bearer {bot_token}"}
+
+    def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 10.0,
+    ) -> Dict[str, Any]:
+        """
+        Call a Slack Web API method (GET) and return the parsed JSON body.
+
+        Raises:
+            SlackApiError: If the response is ``ok: false`` or stays rate limited
+            requests.RequestException: On transport errors and other HTTP errors
+        """
+        session = _get_session()
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            response = session.get(
+                SLACK_API_BASE_URL + method,
+                headers=self._headers,
+                params=params or {},
+                timeout=timeout,
+            )
+            _record_latency(method, started)
+            if response.status_code != 429:
+                break
+            retry_after = _retry_after_seconds(response)
+            emit_emf(METRICS_NAMESPACE, {METRIC_RATE_LIMITED: 1}, {"Method": method})
+            if attempt >= SLACK_API_MAX_RETRIES or retry_after > SLACK_API_MAX_RETRY_AFTER_SECONDS:
+                raise SlackApiError(
+                    f"Slack API rate limited: {method}",
+                    {"ok": False, "error": "ratelimited", "status_code": 429, "retry_after": retry_after},
+                )
+            attempt += 1
+            _log("WARN", "slack_api_rate_limited", {
+                "method": method,
+                "retry_after_seconds": retry_after,
+                "attempt": attempt,
+            })
+            response.close()
+            time.sleep(retry_after)
+
+        response.raise_for_status()
+        data = response.json()
+        if not data.get("ok"):
+            raise SlackApiError(f"Slack API error: {method}: {data.get('error', 'unknown')}", data)
+        return data
+
+
+def get_slack_client(bot_token: str) -> SlackApiClient:
+    """Return the cached client for bot_token, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(bot_token)
+        if client is not None:
+            _clients.move_to_end(bot_token)
+            return client
+        client = SlackApiClient(bot_token)
+        _clients[bot_token] = client
+        while len(_clients) > max(1, SLACK_CLIENT_CACHE_SIZE):
+            _clients.popitem(last=False)
+        return client
@@ -1,18 +1,19 @@
 """
 Slack API client wrapper for Slack Search Agent.
 
-Provides a thin wrapper around slack_sdk.WebClient with:
+Provides a thin wrapper around the shared Slack API client (slack_api) with:
 - 10-second timeout
+- Pooled keep-alive connections and per-token client reuse
 - SlackApiError catch + logging
 - Consistent return types for channel info, history, and thread replies
 """
 
 from typing import Any, Dict, List, Optional
 
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from logger_util import get_logger, log
+from slack_api import get_slack_client
 
 _logger = get_logger()
 
@@ -22,10 +23,11 @@ def _log(level: str, event_type: str, data: dict) -> None:
 
 
 class SlackClient:
-    """Wrapper around slack_sdk.WebClient for Slack Search Agent operations."""
+    """Slack Search Agent operations over the shared Slack API client."""
 
     def __init__(self, bot_token: str, timeout: int = 10) -> None:
-        self._client = WebClient(token=bot_token, timeout=timeout)
+        self._client = get_slack_client(bot_token)
+        self._timeout = timeout
 
     def get_channel_info(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -39,7 +41,9 @@ class SlackClient:
             SlackApiError: If the API returns an error
         """
         try:
-            response = self._client.conversations_info(channel=channel_id)
+            response = self._client.call(
+                "conversations.info", {"channel": channel_id}, timeout=self._timeout
+            )
             return response.get("channel")
         except SlackApiError as e:
             _log("ERROR", "conversations_info_error", {
@@ -67,9 +71,10 @@ class SlackClient:
             SlackApiError: If the API returns an error
         """
         try:
-            response = self._client.conversations_history(
-                channel=channel_id,
-                limit=min(limit, 20),
+            response = self._client.call(
+                "conversations.history",
+                {"channel": channel_id, "limit": min(limit, 20)},
+                timeout=self._timeout,
             )
             return response.get("messages", [])
         except SlackApiError as e:
@@ -100,10 +105,10 @@ class SlackClient:
             SlackApiError: If the API returns an error
         """
         try:
-            response = self._client.conversations_replies(
-                channel=channel_id,
-                ts=thread_ts,
-                limit=min(limit, 20),
+            response = self._client.call(
+                "conversations.replies",
+                {"channel": channel_id, "ts": thread_ts, "limit": min(limit, 20)},
+                timeout=self._timeout,
             )
             return response.get("messages", [])
         except SlackApiError as e:
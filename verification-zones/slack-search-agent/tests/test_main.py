@@ -24,6 +24,26 @@ def test_agent_card_endpoint_registered():
     assert ("GET", "/.well-known/agent-card.json") in app._routes
 
 
+def test_ping_busy_while_invocation_in_flight():
+    """GET /ping returns HealthyBusy while the invocation pool has work."""
+    import asyncio
+    import threading
+
+    import main
+    ping_handler = main.app._routes.get(("GET", "/ping"))
+    release = threading.Event()
+
+    async def scenario():
+        task = asyncio.ensure_future(main._invocation_pool.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        status = ping_handler()["status"]
+        release.set()
+        await task
+        return status
+
+    assert asyncio.run(scenario()) == "HealthyBusy"
+
+
 # --- JSON-RPC error handling ---
 
 def test_invalid_json_returns_parse_error():
@@ -0,0 +1,99 @@
+"""Unit tests for slack_api.py — shared Slack Web API client layer."""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
+
+import slack_api
+from slack_api import get_slack_client
+from slack_sdk.errors import SlackApiError
+
+
+def _response(status_code=200, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body or {}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients():
+    slack_api._clients.clear()
+    yield
+    slack_api._clients.clear()
+
+
+@pytest.fixture(autouse=True)
+def mock_emit():
+    with patch("slack_api.emit_emf") as emit:
+        yield emit
+
+
+def test_same_token_reuses_client():
+    assert get_slack_client("xoxb-a") is get_slack_client("xoxb-a")
+    assert get_slack_client("xoxb-a") is not get_slack_client("xoxb-b")
+
+
+def test_call_returns_body_over_shared_session():
+    session = MagicMock()
+    session.get.return_value = _response(body={"ok": True, "channel": {"id": "C1"}})
+    with patch("slack_api._get_session", return_value=session):
+        data = get_slack_client("xoxb-t").call("conversations.info", {"channel": "C1"})
+
+    assert data["channel"] == {"id": "C1"}
+    assert session.get.call_args.args == ("https://slack.com/api/conversations.info",)
+    assert session.get.call_args.kwargs["headers"] == {"Authorization": "Bearer xoxb-t"}
+
+
+def test_not_ok_raises_slack_api_error():
+    session = MagicMock()
+    session.get.return_value = _response(body={"ok": False, "error": "channel_not_found"})
+    with patch("slack_api._get_session", return_value=session):
+        with pytest.raises(SlackApiError) as excinfo:
+            get_slack_client("xoxb-t").call("conversations.info", {"channel": "C1"})
+
+    assert excinfo.value.response["error"] == "channel_not_found"
+
+
+def test_latency_emitted_per_method(mock_emit):
+    session = MagicMock()
+    session.get.return_value = _response(body={"ok": True})
+    with patch("slack_api._get_session", return_value=session):
+        get_slack_client("xoxb-t").call("conversations.history")
+
+    namespace, values, dimensions = mock_emit.call_args.args
+    assert namespace == "SlackAI/SlackApi"
+    assert list(values) == ["SlackApiLatency"]
+    assert dimensions == {"Method": "conversations.history"}
+    assert mock_emit.call_args.kwargs["unit"] == "Milliseconds"
+
+
+def test_rate_limit_waits_retry_after(mock_emit):
+    session = MagicMock()
+    session.get.side_effect = [
+        _response(429, headers={"Retry-After": "2"}),
+        _response(body={"ok": True}),
+    ]
+    with patch("slack_api._get_session", return_value=session), \
+         patch("slack_api.time.sleep") as mock_sleep:
+        assert get_slack_client("xoxb-t").call("conversations.history")["ok"] is True
+
+    mock_sleep.assert_called_once_with(2.0)
+    assert [c.args[1] for c in mock_emit.call_args_list].count({"SlackApiRateLimited": 1}) == 1
+
+
+def test_rate_limit_beyond_budget_raises():
+    session = MagicMock()
+    session.get.return_value = _response(429, headers={"Retry-After": "60"})
+    with patch("slack_api._get_session", return_value=session), \
+         patch("slack_api.time.sleep") as mock_sleep:
+        with pytest.raises(SlackApiError) as excinfo:
+            get_slack_client("xoxb-t").call("conversations.history")
+
+    assert excinfo.value.response["error"] == "ratelimited"
+    mock_sleep.assert_not_called()
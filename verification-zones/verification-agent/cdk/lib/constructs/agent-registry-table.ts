@@ -7,6 +7,9 @@ import { Construct } from "constructs";
  *
  * Each execution agent's deploy script writes its own entry via PutItem.
  * The verification agent reads all entries at startup via a single Query on PK=env.
+ * After each PutItem the deploy script increments `registry_version` on the
+ * marker item (agent_id "__registry_version__"); warm verification agents poll
+ * only that item and re-run the Query when it changes.
  *
  * Partition key: env ("dev" or "prod")
  * Sort key: agent_id ("time", "docs", "fetch-url", "file-creator", "slack-search")
@@ -5,12 +5,17 @@ import { Construct } from "constructs";
 /**
  * DynamoDB Export Job construct.
  *
- * Purpose: Trigger a daily full DynamoDB-to-S3 export at JST 00:00 (UTC 15:00)
- * via EventBridge Scheduler. Uses DynamoDB native ExportTableToPointInTime API
- * (requires PITR to be enabled on the source table).
+ * Purpose: Export the usage-history table to S3 up to each JST 00:00
+ * (UTC 15:00) boundary and compact completed exports into Parquet for
+ * analytics. Uses DynamoDB native ExportTableToPointInTime API (requires PITR
+ * to be enabled on the source table): a full export on the first run, then
+ * incremental exports covering the window since the previous export.
  *
- * Responsibilities: Python Lambda that calls ExportTableToPointInTime;
- * EventBridge Schedule cron(0 15 * * ? *); least-privilege IAM.
+ * Responsibilities: Python Lambda that starts exports and converts completed
+ * ones (joined with content/ objects) into analytics/usage/date=.../channel_id=.../
+ * Parquet files; one EventBridge Schedule rate(30 minutes) and reserved
+ * concurrency 1, so runs are serialized and never race on the run state;
+ * least-privilege IAM.
  *
  * Inputs: DynamoDbExportJobProps (table, bucket).
  * Outputs: function (for CloudWatch alarm attachment in verification-stack).
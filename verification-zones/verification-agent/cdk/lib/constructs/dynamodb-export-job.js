@@ -87,7 +87,11 @@ class DynamoDbExportJob extends constructs_1.Construct {
                     },
                 },
             }),
-            timeout: cdk.Duration.seconds(60),
+            // Conversion reads every exported record and its content objects
+            timeout: cdk.Duration.minutes(15),
+            memorySize: 1024,
+            // Serialize runs: the run state in dynamodb-exports/_state.json has a single writer
+            reservedConcurrentExecutions: 1,
             environment: {
                 TABLE_ARN: props.table.tableArn,
                 EXPORT_BUCKET_NAME: props.bucket.bucketName,
@@ -100,6 +104,11 @@ class DynamoDbExportJob extends constructs_1.Construct {
             actions: ["dynamodb:ExportTableToPointInTime"],
             resources: [props.table.tableArn],
         }));
+        this.function.addToRolePolicy(new iam.PolicyStatement({
+            effect: iam.Effect.ALLOW,
+            actions: ["dynamodb:DescribeExport"],
+            resources: [`${props.table.tableArn}/export/*`],
+        }));
         // S3 write permissions — Lambda role holds all required permissions (no DynamoDB service principal)
         props.bucket.grantPut(this.function, "dynamodb-exports/*");
         this.function.addToRolePolicy(new iam.PolicyStatement({
@@ -107,7 +116,11 @@ class DynamoDbExportJob extends constructs_1.Construct {
             actions: ["s3:AbortMultipartUpload"],
             resources: [`${props.bucket.bucketArn}/dynamodb-exports/*`],
         }));
-        // EventBridge Scheduler: daily at JST 00:00 = UTC 15:00
+        // Conversion: read exports (and the run state) and content, write Parquet files
+        props.bucket.grantRead(this.function, "dynamodb-exports/*");
+        props.bucket.grantRead(this.function, "content/*");
+        props.bucket.grantPut(this.function, "analytics/*");
+        // EventBridge Scheduler: every 30 minutes (exports are cut at JST 00:00 = UTC 15:00)
         const schedulerInvokeRole = new iam.Role(this, "SchedulerInvokeRole", {
             assumedBy: new iam.ServicePrincipal("scheduler.amazonaws.com"),
             description: "Invoke role for DynamoDB export Lambda (EventBridge Scheduler target)",
@@ -120,10 +133,10 @@ class DynamoDbExportJob extends constructs_1.Construct {
                     "The Lambda invoke permission model uses function ARN patterns that may include `:*$` suffixes.",
             },
         ], true);
-        new aws_scheduler_1.Schedule(this, "DailySchedule", {
-            schedule: aws_scheduler_1.ScheduleExpression.cron({ hour: "15", minute: "0" }),
+        new aws_scheduler_1.Schedule(this, "RunSchedule", {
+            schedule: aws_scheduler_1.ScheduleExpression.rate(cdk.Duration.minutes(30)),
             target: new aws_scheduler_targets_1.LambdaInvoke(this.function, { role: schedulerInvokeRole }),
-            description: "Daily DynamoDB usage-history export to S3 (JST 00:00)",
+            description: "Export usage history up to JST 00:00 and convert completed exports to Parquet",
         });
         // cdk-nag suppressions:
         // - IAM4: Lambda uses AWS-managed basic execution policy for CloudWatch logs
@@ -142,7 +155,8 @@ class DynamoDbExportJob extends constructs_1.Construct {
                 {
                     id: "AwsSolutions-IAM5",
                     reason: "S3 multipart upload operations use wildcard actions (Abort*, List*) as part of the AWS S3 API. " +
-                        "Permissions are scoped to the dynamodb-exports/ prefix in the usage-history bucket.",
+                        "Permissions are scoped to the dynamodb-exports/, content/ (read) and analytics/ prefixes " +
+                        "in the usage-history bucket and to exports of the usage-history table.",
                 },
             ], true);
         }
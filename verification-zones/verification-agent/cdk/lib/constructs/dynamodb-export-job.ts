@@ -14,12 +14,17 @@ import { NagSuppressions } from "cdk-nag";
 /**
  * DynamoDB Export Job construct.
  *
- * Purpose: Trigger a daily full DynamoDB-to-S3 export at JST 00:00 (UTC 15:00)
- * via EventBridge Scheduler. Uses DynamoDB native ExportTableToPointInTime API
- * (requires PITR to be enabled on the source table).
+ * Purpose: Export the usage-history table to S3 up to each JST 00:00
+ * (UTC 15:00) boundary and compact completed exports into Parquet for
+ * analytics. Uses DynamoDB native ExportTableToPointInTime API (requires PITR
+ * to be enabled on the source table): a full export on the first run, then
+ * incremental exports covering the window since the previous export.
  *
- * Responsibilities: Python Lambda that calls ExportTableToPointInTime;
- * EventBridge Schedule cron(0 15 * * ? *); least-privilege IAM.
+ * Responsibilities: Python Lambda that starts exports and converts completed
+ * ones (joined with content/ objects) into analytics/usage/date=.../channel_id=.../
+ * Parquet files; one EventBridge Schedule rate(30 minutes) and reserved
+ * concurrency 1, so runs are serialized and never race on the run state;
+ * least-privilege IAM.
  *
  * Inputs: DynamoDbExportJobProps (table, bucket).
  * Outputs: function (for CloudWatch alarm attachment in verification-stack).
@@ -78,7 +83,11 @@ export class DynamoDbExportJob extends Construct {
           },
         },
       }),
-      timeout: cdk.Duration.seconds(60),
+      // Conversion reads every exported record and its content objects
+      timeout: cdk.Duration.minutes(15),
+      memorySize: 1024,
+      // Serialize runs: the run state in dynamodb-exports/_state.json has a single writer
+      reservedConcurrentExecutions: 1,
       environment: {
         TABLE_ARN: props.table.tableArn,
         EXPORT_BUCKET_NAME: props.bucket.bucketName,
@@ -94,6 +103,13 @@ export class DynamoDbExportJob extends Construct {
         resources: [props.table.tableArn],
       })
     );
+    this.function.addToRolePolicy(
+      new iam.PolicyStatement({
+        effect: iam.Effect.ALLOW,
+        actions: ["dynamodb:DescribeExport"],
+        resources: [`${props.table.tableArn}/export/*`],
+      })
+    );
 
     // S3 write permissions — Lambda role holds all required permissions (no DynamoDB service principal)
     props.bucket.grantPut(this.function, "dynamodb-exports/*");
@@ -104,8 +120,12 @@ export class DynamoDbExportJob extends Construct {
         resources: [`${props.bucket.bucketArn}/dynamodb-exports/*`],
       })
     );
+    // Conversion: read exports (and the run state) and content, write Parquet files
+    props.bucket.grantRead(this.function, "dynamodb-exports/*");
+    props.bucket.grantRead(this.function, "content/*");
+    props.bucket.grantPut(this.function, "analytics/*");
 
-    // EventBridge Scheduler: daily at JST 00:00 = UTC 15:00
+    // EventBridge Scheduler: every 30 minutes (exports are cut at JST 00:00 = UTC 15:00)
     const schedulerInvokeRole = new iam.Role(this, "SchedulerInvokeRole", {
       assumedBy: new iam.ServicePrincipal("scheduler.amazonaws.com"),
       description: "Invoke role for DynamoDB export Lambda (EventBridge Scheduler target)",
@@ -125,10 +145,10 @@ export class DynamoDbExportJob extends Construct {
       true,
     );
 
-    new Schedule(this, "DailySchedule", {
-      schedule: ScheduleExpression.cron({ hour: "15", minute: "0" }),
+    new Schedule(this, "RunSchedule", {
+      schedule: ScheduleExpression.rate(cdk.Duration.minutes(30)),
       target: new LambdaInvoke(this.function, { role: schedulerInvokeRole }),
-      description: "Daily DynamoDB usage-history export to S3 (JST 00:00)",
+      description: "Export usage history up to JST 00:00 and convert completed exports to Parquet",
     });
 
     // cdk-nag suppressions:
@@ -153,7 +173,8 @@ export class DynamoDbExportJob extends Construct {
             id: "AwsSolutions-IAM5",
             reason:
               "S3 multipart upload operations use wildcard actions (Abort*, List*) as part of the AWS S3 API. " +
-              "Permissions are scoped to the dynamodb-exports/ prefix in the usage-history bucket.",
+              "Permissions are scoped to the dynamodb-exports/, content/ (read) and analytics/ prefixes " +
+              "in the usage-history bucket and to exports of the usage-history table.",
           },
         ],
         true,
@@ -54,7 +54,7 @@ class ExistenceCheckCache extends constructs_1.Construct {
     constructor(scope, id, props) {
         super(scope, id);
         // Create DynamoDB table for Existence Check cache
-        // Cache stores verification results for team/user/channel combinations
+        // Cache stores verification results per entity (team#, user#, channel# keys)
         // TTL: 5 minutes (300 seconds) to reduce Slack API calls
         const stackName = cdk.Stack.of(this).stackName;
         this.table = new dynamodb.Table(this, "ExistenceCheckCacheTable", {
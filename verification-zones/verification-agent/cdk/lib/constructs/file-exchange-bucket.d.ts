@@ -7,7 +7,8 @@ import { Construct } from "constructs";
  * to download via pre-signed URLs; lifecycle rules and auto-delete limit exposure.
  *
  * Responsibilities: Create bucket with SSE-S3, block public access, enforce SSL; lifecycle
- * on attachments/ and generated_files/; auto-delete objects on stack removal.
+ * on attachments/ and generated_files/ (1 day) and attachment_cache/ (7 days, Slack files
+ * reused across requests); auto-delete objects on stack removal.
  *
  * Inputs: None (construct id only).
  *
@@ -11,7 +11,8 @@ import { scopedBucketName } from "./s3-bucket-name";
  * to download via pre-signed URLs; lifecycle rules and auto-delete limit exposure.
  *
  * Responsibilities: Create bucket with SSE-S3, block public access, enforce SSL; lifecycle
- * on attachments/ and generated_files/; auto-delete objects on stack removal.
+ * on attachments/ and generated_files/ (1 day) and attachment_cache/ (7 days, Slack files
+ * reused across requests); auto-delete objects on stack removal.
  *
  * Inputs: None (construct id only).
  *
@@ -48,6 +49,13 @@ export class FileExchangeBucket extends Construct {
           abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
           enabled: true,
         },
+        {
+          id: "expire-attachment-cache",
+          prefix: "attachment_cache/",
+          expiration: cdk.Duration.days(7),
+          abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
+          enabled: true,
+        },
         {
           id: "delete-generated-files",
           prefix: "generated_files/",
@@ -99,6 +99,8 @@ class SlackEventHandler extends constructs_1.Construct {
                 EXISTENCE_CHECK_CACHE_TABLE: props.existenceCheckCacheTableName,
                 WHITELIST_TABLE_NAME: props.whitelistConfigTableName,
                 RATE_LIMIT_TABLE_NAME: props.rateLimitTableName,
+                // Buffered metrics are written as Embedded Metric Format log lines (no PutMetricData call on the request path)
+                METRICS_OUTPUT: "emf",
                 AWS_REGION_NAME: props.awsRegion,
                 BEDROCK_MODEL_ID: props.bedrockModelId,
                 // Store secret names (not values) in environment variables
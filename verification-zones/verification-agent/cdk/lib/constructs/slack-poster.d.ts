@@ -7,6 +7,10 @@ import { Construct } from "constructs";
  * Purpose: Verification Agent sends post requests to this queue; Lambda consumes and calls Slack API.
  * Decouples agent from Slack API and allows retries.
  *
+ * The queue is FIFO: requests of one answer share a MessageGroupId (the
+ * correlation id), so streamed partial updates and the final answer are
+ * applied in order, one at a time.
+ *
  * Responsibilities: Create SQS queue and Lambda; Lambda has Slack OAuth token and posts to channels.
  *
  * Inputs: SlackPosterProps (stackName for queue naming).
@@ -51,11 +51,13 @@ class SlackPoster extends constructs_1.Construct {
         super(scope, id);
         const lambdaPath = path.join(__dirname, "../lambda/slack-poster");
         const dlq = new sqs.Queue(this, "SlackPostRequestDlq", {
-            queueName: `${props.stackName}-slack-post-request-dlq`,
+            queueName: `${props.stackName}-slack-post-request-dlq.fifo`,
+            fifo: true,
             retentionPeriod: cdk.Duration.days(14),
         });
         this.queue = new sqs.Queue(this, "SlackPostRequest", {
-            queueName: `${props.stackName}-slack-post-request`,
+            queueName: `${props.stackName}-slack-post-request.fifo`,
+            fifo: true,
             retentionPeriod: cdk.Duration.days(1),
             visibilityTimeout: cdk.Duration.seconds(60),
             deadLetterQueue: {
@@ -15,6 +15,10 @@ import { NagSuppressions } from "cdk-nag";
  * Purpose: Verification Agent sends post requests to this queue; Lambda consumes and calls Slack API.
  * Decouples agent from Slack API and allows retries.
  *
+ * The queue is FIFO: requests of one answer share a MessageGroupId (the
+ * correlation id), so streamed partial updates and the final answer are
+ * applied in order, one at a time.
+ *
  * Responsibilities: Create SQS queue and Lambda; Lambda has Slack OAuth token and posts to channels.
  *
  * Inputs: SlackPosterProps (stackName for queue naming).
@@ -36,12 +40,14 @@ export class SlackPoster extends Construct {
     const lambdaPath = path.join(__dirname, "../lambda/slack-poster");
 
     const dlq = new sqs.Queue(this, "SlackPostRequestDlq", {
-      queueName: `${props.stackName}-slack-post-request-dlq`,
+      queueName: `${props.stackName}-slack-post-request-dlq.fifo`,
+      fifo: true,
       retentionPeriod: cdk.Duration.days(14),
     });
 
     this.queue = new sqs.Queue(this, "SlackPostRequest", {
-      queueName: `${props.stackName}-slack-post-request`,
+      queueName: `${props.stackName}-slack-post-request.fifo`,
+      fifo: true,
       retentionPeriod: cdk.Duration.days(1),
       visibilityTimeout: cdk.Duration.seconds(60),
       deadLetterQueue: {
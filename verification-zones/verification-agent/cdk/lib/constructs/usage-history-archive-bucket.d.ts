@@ -5,7 +5,7 @@ import { Construct } from "constructs";
  *
  * Purpose: Independent archive destination for S3 Same-Region Replication from
  * the primary usage-history bucket. Receives automatic copies of all objects
- * across content/, attachments/, and dynamodb-exports/ prefixes.
+ * across content/, attachments/, dynamodb-exports/, and analytics/ prefixes.
  *
  * Requirements:
  * - versioned: true — required by S3 Replication (AWS hard requirement on destination)
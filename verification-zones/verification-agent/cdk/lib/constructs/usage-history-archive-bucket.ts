@@ -9,7 +9,7 @@ import { scopedBucketName } from "./s3-bucket-name";
  *
  * Purpose: Independent archive destination for S3 Same-Region Replication from
  * the primary usage-history bucket. Receives automatic copies of all objects
- * across content/, attachments/, and dynamodb-exports/ prefixes.
+ * across content/, attachments/, dynamodb-exports/, and analytics/ prefixes.
  *
  * Requirements:
  * - versioned: true — required by S3 Replication (AWS hard requirement on destination)
@@ -60,6 +60,13 @@ export class UsageHistoryArchiveBucket extends Construct {
           abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
           enabled: true,
         },
+        {
+          id: "expire-archive-analytics",
+          prefix: "analytics/",
+          expiration: cdk.Duration.days(90),
+          abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
+          enabled: true,
+        },
         {
           id: "expire-noncurrent-versions",
           noncurrentVersionExpiration: cdk.Duration.days(7),
@@ -89,6 +89,13 @@ class UsageHistoryBucket extends constructs_1.Construct {
                     abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
                     enabled: true,
                 },
+                {
+                    id: "expire-analytics",
+                    prefix: "analytics/",
+                    expiration: cdk.Duration.days(90),
+                    abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
+                    enabled: true,
+                },
                 {
                     id: "expire-noncurrent-versions",
                     noncurrentVersionExpiration: cdk.Duration.days(7),
@@ -204,6 +204,8 @@ class VerificationAgentRuntime extends constructs_1.Construct {
             RATE_LIMIT_TABLE_NAME: props.rateLimitTable.tableName,
             EXISTENCE_CHECK_CACHE_TABLE: props.existenceCheckCacheTable.tableName,
             RATE_LIMIT_PER_MINUTE: "10",
+            RATE_LIMIT_SCOPE: "agent",
+            SLACK_STREAMING_ENABLED: "true",
             MAX_AGENT_TURNS: "5",
         };
         if (props.agentRegistryTable) {
@@ -232,6 +234,7 @@ class VerificationAgentRuntime extends constructs_1.Construct {
             props.fileExchangeBucket.grantReadWrite(this.executionRole, "attachments/*");
             props.fileExchangeBucket.grantDelete(this.executionRole, "attachments/*");
             props.fileExchangeBucket.grantReadWrite(this.executionRole, "generated_files/*");
+            props.fileExchangeBucket.grantReadWrite(this.executionRole, "attachment_cache/*");
         }
         // Agent registry DynamoDB read permissions (Query)
         if (props.agentRegistryTable) {
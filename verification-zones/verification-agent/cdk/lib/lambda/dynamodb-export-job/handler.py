@@ -1,55 +1,463 @@
 """
 DynamoDB Export Job Lambda handler.
 
-Initiates a full DynamoDB-to-S3 export via ExportTableToPointInTime API.
-Triggered daily by EventBridge Scheduler at JST 00:00 (UTC 15:00).
+Exports the usage-history table to S3 and compacts each export into
+partitioned Parquet files for analytics.
+
+One EventBridge Scheduler trigger invokes this function every 30 minutes, and
+the function's reserved concurrency of 1 keeps runs serialized, so the run
+state is never written by two invocations at once. Each run:
+
+1. Starts exports up to the most recent JST 00:00 (UTC 15:00) boundary via
+   ExportTableToPointInTime. The first run is a FULL_EXPORT; later runs are
+   INCREMENTAL_EXPORTs covering the window since the previous export. A gap
+   longer than 24 hours (the API limit) is split into back-to-back windows
+   started in the same run. Raw exports are written under
+   ``dynamodb-exports/{YYYY/MM/DD}/``.
+2. Checks every export started earlier. A FAILED export is started again for
+   the same window. A COMPLETED export is converted one data file at a time:
+   records are joined with their ``content/.../input.json`` and ``output.json``
+   objects and written in chunks as zstd-compressed Parquet files per
+   (date, channel):
+   ``analytics/usage/date=YYYY-MM-DD/channel_id=C.../part-{export_id}-{file}-{chunk}.parquet``.
+   Progress is saved after each data file, so a conversion that outlives one
+   invocation resumes where it stopped; re-converting a data file overwrites
+   its files instead of duplicating rows. An export that keeps failing is
+   moved to ``failed`` after a few attempts so it does not block later ones.
+
+Run state (last export time, exports awaiting conversion, failed exports) is
+kept in ``dynamodb-exports/_state.json`` in the export bucket.
 
 Fail-open: any exception is logged as WARNING and the function returns an error
 status — it must never affect user Slack responses (Constitution IV).
 """
 
 import datetime
+import gzip
+import io
+import json
 import logging
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import boto3
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
 
 _logger = logging.getLogger(__name__)
 
+EXPORT_PREFIX = "dynamodb-exports"
+STATE_KEY = f"{EXPORT_PREFIX}/_state.json"
+ANALYTICS_PREFIX = os.environ.get("ANALYTICS_PREFIX", "analytics/usage")
+# Exports are cut at JST 00:00
+EXPORT_BOUNDARY_HOUR_UTC = 15
+# ExportTableToPointInTime accepts incremental windows of 15 minutes to 24 hours
+INCREMENTAL_MIN_WINDOW = datetime.timedelta(minutes=15)
+INCREMENTAL_MAX_WINDOW = datetime.timedelta(hours=24)
+MAX_EXPORTS_PER_RUN = int(os.environ.get("MAX_EXPORTS_PER_RUN", "7"))
+MAX_ATTEMPTS = int(os.environ.get("MAX_ATTEMPTS", "3"))
+ROWS_PER_CHUNK = int(os.environ.get("ROWS_PER_CHUNK", "5000"))
+# Stop starting new data files when less than this is left of the Lambda timeout
+MIN_REMAINING_MS = int(os.environ.get("MIN_REMAINING_MS", "120000"))
+CONTENT_FETCH_WORKERS = int(os.environ.get("CONTENT_FETCH_WORKERS", "16"))
 
-def lambda_handler(event: dict, context: object) -> dict:
+_deserializer = TypeDeserializer()
+_content_pool = ThreadPoolExecutor(max_workers=CONTENT_FETCH_WORKERS, thread_name_prefix="export-content")
+
+
+def _clients() -> Tuple[object, object]:
     region = os.environ.get("AWS_REGION_NAME", "ap-northeast-1")
-    table_arn = os.environ["TABLE_ARN"]
-    bucket_name = os.environ["EXPORT_BUCKET_NAME"]
+    return boto3.client("dynamodb", region_name=region), boto3.client("s3", region_name=region)
+
 
-    date_path = datetime.datetime.now(datetime.timezone.utc).strftime("%Y/%m/%d")
-    s3_prefix = f"dynamodb-exports/{date_path}"
+def _is_missing(exc: ClientError) -> bool:
+    return exc.response.get("Error", {}).get("Code") in ("NoSuchKey", "404")
 
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _remaining_ms(context: object) -> float:
+    if context is None or not hasattr(context, "get_remaining_time_in_millis"):
+        return math.inf
+    return context.get_remaining_time_in_millis()
+
+
+# ---------------------------------------------------------------------------
+# State
+# ---------------------------------------------------------------------------
+
+
+def _load_state(s3, bucket_name: str) -> dict:
     try:
-        ddb = boto3.client("dynamodb", region_name=region)
-        response = ddb.export_table_to_point_in_time(
-            TableArn=table_arn,
-            S3Bucket=bucket_name,
-            S3Prefix=s3_prefix,
-            ExportFormat="DYNAMODB_JSON",
-        )
-        export_arn = response["ExportDescription"]["ExportArn"]
+        body = s3.get_object(Bucket=bucket_name, Key=STATE_KEY)["Body"].read()
+    except ClientError as exc:
+        if not _is_missing(exc):
+            raise
+        return {"last_export_time": None, "pending": [], "failed": []}
+    state = json.loads(body)
+    state.setdefault("last_export_time", None)
+    state.setdefault("pending", [])
+    state.setdefault("failed", [])
+    return state
+
+
+def _save_state(s3, bucket_name: str, state: dict) -> None:
+    s3.put_object(
+        Bucket=bucket_name,
+        Key=STATE_KEY,
+        Body=json.dumps(state).encode("utf-8"),
+        ContentType="application/json",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def export_boundary(now: datetime.datetime) -> datetime.datetime:
+    """Most recent JST 00:00 (UTC 15:00) at or before now."""
+    boundary = now.replace(hour=EXPORT_BOUNDARY_HOUR_UTC, minute=0, second=0, microsecond=0)
+    if boundary > now:
+        boundary -= datetime.timedelta(days=1)
+    return boundary
+
+
+def plan_exports(last_export_time: Optional[str], now: datetime.datetime) -> List[dict]:
+    """
+    Decide the exports to start in this run.
+
+    Returns:
+        ``[{"type": "FULL_EXPORT", "to": iso}]`` when no export ran yet;
+        otherwise back-to-back ``{"type": "INCREMENTAL_EXPORT", "from": iso, "to": iso}``
+        windows from last_export_time up to the latest export boundary, split
+        evenly so each is within the 15-minute to 24-hour API limits (at most
+        MAX_EXPORTS_PER_RUN; the rest is started by the next run). Empty when
+        that span is shorter than 15 minutes.
+    """
+    if not last_export_time:
+        return [{"type": "FULL_EXPORT", "to": now.isoformat()}]
+    start = datetime.datetime.fromisoformat(last_export_time)
+    span = export_boundary(now) - start
+    if span < INCREMENTAL_MIN_WINDOW:
+        return []
+    count = math.ceil(span / INCREMENTAL_MAX_WINDOW)
+    step = span / count
+    plans = []
+    for i in range(min(count, MAX_EXPORTS_PER_RUN)):
+        end = start + step * (i + 1) if i + 1 < count else start + span
+        plans.append({
+            "type": "INCREMENTAL_EXPORT",
+            "from": (start + step * i).isoformat(),
+            "to": end.isoformat(),
+        })
+    return plans
+
+
+def _start_export(ddb, table_arn: str, bucket_name: str, plan: dict, s3_prefix: str) -> str:
+    params = {
+        "TableArn": table_arn,
+        "S3Bucket": bucket_name,
+        "S3Prefix": s3_prefix,
+        "ExportFormat": "DYNAMODB_JSON",
+        "ExportType": plan["type"],
+    }
+    export_to = datetime.datetime.fromisoformat(plan["to"])
+    if plan["type"] == "FULL_EXPORT":
+        params["ExportTime"] = export_to
+    else:
+        params["IncrementalExportSpecification"] = {
+            "ExportFromTime": datetime.datetime.fromisoformat(plan["from"]),
+            "ExportToTime": export_to,
+            "ExportViewType": "NEW_IMAGE",
+        }
+    response = ddb.export_table_to_point_in_time(**params)
+    return response["ExportDescription"]["ExportArn"]
+
+
+def _run_exports(ddb, s3, table_arn: str, bucket_name: str, state: dict, now: datetime.datetime) -> List[str]:
+    """Start the planned exports, saving state after each; returns the new export ARNs."""
+    s3_prefix = f"{EXPORT_PREFIX}/{now.strftime('%Y/%m/%d')}"
+    started = []
+    for plan in plan_exports(state["last_export_time"], now):
+        export_arn = _start_export(ddb, table_arn, bucket_name, plan, s3_prefix)
+        state["pending"].append({"export_arn": export_arn, **plan})
+        state["last_export_time"] = plan["to"]
+        _save_state(s3, bucket_name, state)
+        started.append(export_arn)
         _logger.info(
             "DynamoDB export initiated",
             extra={
                 "export_arn": export_arn,
+                "export_type": plan["type"],
+                "export_from": plan.get("from"),
+                "export_to": plan["to"],
                 "table_arn": table_arn,
                 "s3_prefix": s3_prefix,
             },
         )
-        return {"status": "export_initiated", "export_arn": export_arn}
+    return started
+
+
+# ---------------------------------------------------------------------------
+# Conversion
+# ---------------------------------------------------------------------------
+
+
+def _data_file_keys(s3, bucket_name: str, manifest_key: str) -> List[str]:
+    summary = json.loads(s3.get_object(Bucket=bucket_name, Key=manifest_key)["Body"].read())
+    body = s3.get_object(Bucket=bucket_name, Key=summary["manifestFilesS3Key"])["Body"].read()
+    return [json.loads(line)["dataFileS3Key"] for line in body.decode("utf-8").splitlines() if line.strip()]
+
+
+def _data_file_items(s3, bucket_name: str, data_key: str) -> Iterator[dict]:
+    """Stream the deserialized items of one data file (deletions in incremental exports are skipped)."""
+    body = s3.get_object(Bucket=bucket_name, Key=data_key)["Body"]
+    for line in gzip.GzipFile(fileobj=body):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        image = record.get("Item") or record.get("NewImage")
+        if image:
+            yield {k: _deserializer.deserialize(v) for k, v in image.items()}
+
+
+def _read_text(s3, bucket_name: str, key: str) -> Optional[str]:
+    try:
+        body = s3.get_object(Bucket=bucket_name, Key=key)["Body"].read()
+    except ClientError as exc:
+        if not _is_missing(exc):
+            raise
+        return None
+    return json.loads(body).get("text")
+
+
+def to_row(item: dict, input_text: Optional[str], output_text: Optional[str]) -> dict:
+    """Flatten a usage-history item into one analytics row."""
+    pipeline = item.get("pipeline_result") or {}
+    orchestration = item.get("orchestration") or {}
+    created_at = datetime.datetime.fromisoformat(item["created_at"])
+    return {
+        "date": created_at.date().isoformat(),
+        "channel_id": item.get("channel_id"),
+        "request_id": item.get("request_id"),
+        "correlation_id": item.get("correlation_id"),
+        "team_id": item.get("team_id"),
+        "user_id": item.get("user_id"),
+        "created_at": created_at,
+        "duration_ms": int(item.get("duration_ms", 0)),
+        "existence_check": pipeline.get("existence_check"),
+        "authorization": pipeline.get("authorization"),
+        "rate_limited": pipeline.get("rate_limited"),
+        "rejection_stage": pipeline.get("rejection_stage") or None,
+        "rejection_reason": pipeline.get("rejection_reason") or None,
+        "agents_called": list(orchestration.get("agents_called") or []),
+        "turns_used": int(orchestration["turns_used"]) if "turns_used" in orchestration else None,
+        "orchestration_success": orchestration.get("success"),
+        "attachment_count": len(item.get("attachment_keys") or []),
+        "skipped_attachment_count": len(item.get("skipped_attachments") or []),
+        "input_text": input_text,
+        "output_text": output_text,
+    }
+
+
+def _rows(s3, bucket_name: str, items: List[dict]) -> List[dict]:
+    """Join items with their S3 content objects (fetched concurrently)."""
+    def _row(item: dict) -> dict:
+        prefix = item.get("s3_content_prefix")
+        if not prefix:
+            return to_row(item, None, None)
+        return to_row(
+            item,
+            _read_text(s3, bucket_name, f"{prefix}input.json"),
+            _read_text(s3, bucket_name, f"{prefix}output.json"),
+        )
+
+    return list(_content_pool.map(_row, items))
+
+
+def partition_rows(rows: List[dict]) -> Dict[Tuple[str, str], List[dict]]:
+    """Group rows by (date, channel_id); partition columns are dropped from the rows."""
+    partitions: Dict[Tuple[str, str], List[dict]] = {}
+    for row in rows:
+        row = dict(row)
+        key = (row.pop("date"), row.pop("channel_id") or "unknown")
+        partitions.setdefault(key, []).append(row)
+    return partitions
+
+
+def _parquet_bytes(rows: List[dict]) -> bytes:
+    # pyarrow is imported lazily so runs without a completed export do not load it
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("request_id", pa.string()),
+        ("correlation_id", pa.string()),
+        ("team_id", pa.string()),
+        ("user_id", pa.string()),
+        ("created_at", pa.timestamp("ms", tz="UTC")),
+        ("duration_ms", pa.int64()),
+        ("existence_check", pa.bool_()),
+        ("authorization", pa.bool_()),
+        ("rate_limited", pa.bool_()),
+        ("rejection_stage", pa.string()),
+        ("rejection_reason", pa.string()),
+        ("agents_called", pa.list_(pa.string())),
+        ("turns_used", pa.int32()),
+        ("orchestration_success", pa.bool_()),
+        ("attachment_count", pa.int32()),
+        ("skipped_attachment_count", pa.int32()),
+        ("input_text", pa.string()),
+        ("output_text", pa.string()),
+    ])
+    buf = io.BytesIO()
+    pq.write_table(pa.Table.from_pylist(rows, schema=schema), buf, compression="zstd")
+    return buf.getvalue()
+
+
+def _convert_data_file(s3, bucket_name: str, data_key: str, file_tag: str) -> int:
+    """Write the Parquet partitions of one data file in row chunks; returns the number of files."""
+    items = _data_file_items(s3, bucket_name, data_key)
+    written = 0
+    chunk_index = 0
+    while True:
+        chunk = list(islice(items, ROWS_PER_CHUNK))
+        if not chunk:
+            return written
+        for (date, channel_id), rows in partition_rows(_rows(s3, bucket_name, chunk)).items():
+            s3.put_object(
+                Bucket=bucket_name,
+                Key=(
+                    f"{ANALYTICS_PREFIX}/date={date}/channel_id={channel_id}/"
+                    f"part-{file_tag}-{chunk_index:04d}.parquet"
+                ),
+                Body=_parquet_bytes(rows),
+                ContentType="application/vnd.apache.parquet",
+            )
+            written += 1
+        chunk_index += 1
+
+
+def _give_up(state: dict, pending: dict, error: Optional[str]) -> None:
+    state["pending"].remove(pending)
+    state["failed"].append({**pending, "last_error": error})
+    _logger.error(
+        "dynamodb_export_job: export abandoned after repeated failures",
+        extra={"export_arn": pending["export_arn"], "attempts": pending.get("attempts"), "error": error},
+    )
+
+
+def _convert_export(s3, bucket_name: str, state: dict, pending: dict, manifest_key: str, context: object) -> bool:
+    """
+    Convert the remaining data files of one completed export.
+
+    Each data file is an attempt: the attempt count is saved before the file is
+    read (so a timeout counts too) and reset once the file is written. Returns
+    True when the whole export was converted.
+    """
+    export_id = pending["export_arn"].rsplit("/", 1)[-1]
+    data_keys = _data_file_keys(s3, bucket_name, manifest_key)
+    while pending.get("next_file", 0) < len(data_keys):
+        if _remaining_ms(context) < MIN_REMAINING_MS:
+            return False
+        index = pending.get("next_file", 0)
+        pending["attempts"] = pending.get("attempts", 0) + 1
+        _save_state(s3, bucket_name, state)
+        files = _convert_data_file(s3, bucket_name, data_keys[index], f"{export_id}-{index:05d}")
+        pending["next_file"] = index + 1
+        pending["attempts"] = 0
+        pending.pop("last_error", None)
+        _save_state(s3, bucket_name, state)
+        _logger.info(
+            "DynamoDB export data file converted to Parquet",
+            extra={"export_arn": pending["export_arn"], "data_file": index, "files": files},
+        )
+    return True
+
+
+def _retry_export(ddb, table_arn: str, bucket_name: str, state: dict, pending: dict, failure: Optional[str]) -> None:
+    """Start the failed export again for exactly the same window."""
+    if pending.get("export_attempts", 1) >= MAX_ATTEMPTS:
+        _give_up(state, pending, failure)
+        return
+    plan = {k: pending[k] for k in ("type", "from", "to") if k in pending}
+    s3_prefix = f"{EXPORT_PREFIX}/{_now().strftime('%Y/%m/%d')}"
+    export_arn = _start_export(ddb, table_arn, bucket_name, plan, s3_prefix)
+    _logger.warning(
+        "dynamodb_export_job: export failed, same window exported again",
+        extra={"export_arn": pending["export_arn"], "retry_export_arn": export_arn, "failure": failure},
+    )
+    pending["export_arn"] = export_arn
+    pending["export_attempts"] = pending.get("export_attempts", 1) + 1
+
+
+def _run_convert(ddb, s3, table_arn: str, bucket_name: str, state: dict, context: object) -> List[str]:
+    """Check every pending export; returns the ids of exports fully converted in this run."""
+    converted = []
+    for pending in list(state["pending"]):
+        try:
+            description = ddb.describe_export(ExportArn=pending["export_arn"])["ExportDescription"]
+            status = description["ExportStatus"]
+            if status == "IN_PROGRESS":
+                continue
+            if status == "FAILED":
+                _retry_export(ddb, table_arn, bucket_name, state, pending, description.get("FailureMessage"))
+                _save_state(s3, bucket_name, state)
+                continue
+            if pending.get("attempts", 0) >= MAX_ATTEMPTS:
+                _give_up(state, pending, pending.get("last_error"))
+                _save_state(s3, bucket_name, state)
+                continue
+            if not _convert_export(s3, bucket_name, state, pending, description["ExportManifest"], context):
+                break
+            state["pending"].remove(pending)
+            _save_state(s3, bucket_name, state)
+            converted.append(pending["export_arn"].rsplit("/", 1)[-1])
+        except Exception as exc:
+            _logger.warning(
+                "dynamodb_export_job: export conversion failed, will retry",
+                extra={
+                    "export_arn": pending["export_arn"],
+                    "attempts": pending.get("attempts", 0),
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
+            )
+            pending["last_error"] = str(exc)
+            if pending.get("attempts", 0) >= MAX_ATTEMPTS:
+                _give_up(state, pending, str(exc))
+            _save_state(s3, bucket_name, state)
+    return converted
+
+
+def lambda_handler(event: dict, context: object) -> dict:
+    table_arn = os.environ["TABLE_ARN"]
+    bucket_name = os.environ["EXPORT_BUCKET_NAME"]
+
+    try:
+        ddb, s3 = _clients()
+        state = _load_state(s3, bucket_name)
+        started = _run_exports(ddb, s3, table_arn, bucket_name, state, _now())
+        converted = _run_convert(ddb, s3, table_arn, bucket_name, state, context)
+        return {
+            "status": "ok",
+            "exports_started": started,
+            "converted": converted,
+            "pending": len(state["pending"]),
+            "failed": len(state["failed"]),
+        }
 
     except Exception as exc:
         _logger.warning(
-            "dynamodb_export_job: failed to initiate export (fail-open)",
+            "dynamodb_export_job: failed (fail-open)",
             extra={
                 "table_arn": table_arn,
-                "s3_prefix": s3_prefix,
                 "error": str(exc),
                 "error_type": type(exc).__name__,
             },
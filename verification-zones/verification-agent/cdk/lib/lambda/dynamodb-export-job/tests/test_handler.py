@@ -0,0 +1,336 @@
+"""
+Unit tests for DynamoDB Export Job Lambda: incremental exports and Parquet conversion.
+"""
+
+import datetime
+import gzip
+import io
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from botocore.exceptions import ClientError
+
+import handler
+from handler import lambda_handler, partition_rows, plan_exports, to_row
+
+ENV = {
+    "TABLE_ARN": "arn:aws:dynamodb:ap-northeast-1:123456789012:table/test-usage-history",
+    "EXPORT_BUCKET_NAME": "test-usage-history",
+    "AWS_REGION_NAME": "ap-northeast-1",
+}
+NOW = datetime.datetime(2026, 10, 17, 15, 0, tzinfo=datetime.timezone.utc)
+
+
+def _missing():
+    return ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+
+def _body(data: bytes):
+    return {"Body": io.BytesIO(data)}
+
+
+def _item(channel_id="C001", created_at="2026-10-17T01:02:03+00:00", correlation_id="corr-1"):
+    return {
+        "channel_id": {"S": channel_id},
+        "request_id": {"S": f"1760662923000#{correlation_id}"},
+        "correlation_id": {"S": correlation_id},
+        "team_id": {"S": "T001"},
+        "user_id": {"S": "U001"},
+        "created_at": {"S": created_at},
+        "s3_content_prefix": {"S": f"content/{channel_id}/2026/10/17/{correlation_id}/"},
+        "duration_ms": {"N": "1234"},
+        "pipeline_result": {"M": {
+            "existence_check": {"BOOL": True},
+            "authorization": {"BOOL": True},
+            "rate_limited": {"BOOL": False},
+            "rejection_stage": {"S": ""},
+            "rejection_reason": {"S": ""},
+        }},
+        "orchestration": {"M": {
+            "agents_called": {"L": [{"S": "file-creator"}]},
+            "turns_used": {"N": "2"},
+            "success": {"BOOL": True},
+        }},
+        "attachment_keys": {"L": [{"S": "attachments/C001/corr-1/F1/a.pdf"}]},
+        "skipped_attachments": {"L": []},
+        "ttl": {"N": "1768438923"},
+    }
+
+
+class TestPlanExports:
+    def test_full_export_when_no_previous_export(self):
+        assert plan_exports(None, NOW) == [{"type": "FULL_EXPORT", "to": NOW.isoformat()}]
+
+    def test_incremental_export_covers_window_up_to_boundary(self):
+        last = (NOW - datetime.timedelta(hours=24)).isoformat()
+        plans = plan_exports(last, NOW + datetime.timedelta(minutes=30))
+        assert plans == [{"type": "INCREMENTAL_EXPORT", "from": last, "to": NOW.isoformat()}]
+
+    def test_long_gap_split_into_back_to_back_windows(self):
+        last = NOW - datetime.timedelta(days=2, hours=12)
+        plans = plan_exports(last.isoformat(), NOW)
+
+        assert len(plans) == 3
+        assert plans[0]["from"] == last.isoformat()
+        assert plans[-1]["to"] == NOW.isoformat()
+        for prev, nxt in zip(plans, plans[1:]):
+            assert prev["to"] == nxt["from"]
+        for plan in plans:
+            window = datetime.datetime.fromisoformat(plan["to"]) - datetime.datetime.fromisoformat(plan["from"])
+            assert handler.INCREMENTAL_MIN_WINDOW <= window <= handler.INCREMENTAL_MAX_WINDOW
+
+    def test_windows_per_run_are_capped(self):
+        last = NOW - datetime.timedelta(days=30)
+        plans = plan_exports(last.isoformat(), NOW)
+        assert len(plans) == handler.MAX_EXPORTS_PER_RUN
+
+    def test_no_export_before_next_boundary(self):
+        assert plan_exports(NOW.isoformat(), NOW + datetime.timedelta(hours=23)) == []
+
+
+def _clients(ddb, s3):
+    return lambda svc, **kw: ddb if svc == "dynamodb" else s3
+
+
+class TestExports:
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("boto3.client")
+    def test_starts_incremental_export_and_records_it(self, mock_boto_client, _now):
+        ddb, s3 = MagicMock(), MagicMock()
+        mock_boto_client.side_effect = _clients(ddb, s3)
+        last = (NOW - datetime.timedelta(hours=24)).isoformat()
+        s3.get_object.return_value = _body(json.dumps({"last_export_time": last, "pending": []}).encode())
+        ddb.export_table_to_point_in_time.return_value = {
+            "ExportDescription": {"ExportArn": f"{ENV['TABLE_ARN']}/export/01-abc"}
+        }
+        ddb.describe_export.return_value = {"ExportDescription": {"ExportStatus": "IN_PROGRESS"}}
+
+        result = lambda_handler({}, None)
+
+        assert result["exports_started"] == [f"{ENV['TABLE_ARN']}/export/01-abc"]
+        params = ddb.export_table_to_point_in_time.call_args[1]
+        assert params["ExportType"] == "INCREMENTAL_EXPORT"
+        assert params["S3Prefix"] == "dynamodb-exports/2026/10/17"
+        spec = params["IncrementalExportSpecification"]
+        assert spec["ExportFromTime"].isoformat() == last
+        assert spec["ExportToTime"] == NOW
+        state = json.loads(s3.put_object.call_args[1]["Body"])
+        assert state["last_export_time"] == NOW.isoformat()
+        assert state["pending"][0]["export_arn"].endswith("/export/01-abc")
+
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("boto3.client")
+    def test_first_run_starts_full_export(self, mock_boto_client, _now):
+        ddb, s3 = MagicMock(), MagicMock()
+        mock_boto_client.side_effect = _clients(ddb, s3)
+        s3.get_object.side_effect = _missing()
+        ddb.export_table_to_point_in_time.return_value = {"ExportDescription": {"ExportArn": "arn:x/export/1"}}
+        ddb.describe_export.return_value = {"ExportDescription": {"ExportStatus": "IN_PROGRESS"}}
+
+        lambda_handler({}, None)
+
+        params = ddb.export_table_to_point_in_time.call_args[1]
+        assert params["ExportType"] == "FULL_EXPORT"
+        assert params["ExportTime"] == NOW
+
+    @patch.dict(os.environ, ENV)
+    @patch("boto3.client")
+    def test_error_is_fail_open(self, mock_boto_client):
+        mock_boto_client.return_value.get_object.side_effect = Exception("S3 down")
+
+        result = lambda_handler({}, None)
+
+        assert result["status"] == "error"
+
+
+class TestRows:
+    def test_to_row_flattens_item_and_content(self):
+        item = {k: handler._deserializer.deserialize(v) for k, v in _item().items()}
+        row = to_row(item, "hello", "world")
+
+        assert row["date"] == "2026-10-17"
+        assert row["duration_ms"] == 1234
+        assert row["agents_called"] == ["file-creator"]
+        assert row["turns_used"] == 2
+        assert row["rejection_stage"] is None
+        assert row["attachment_count"] == 1
+        assert (row["input_text"], row["output_text"]) == ("hello", "world")
+
+    def test_partition_rows_by_date_and_channel(self):
+        rows = [
+            {"date": "2026-10-17", "channel_id": "C001", "request_id": "a"},
+            {"date": "2026-10-17", "channel_id": "C002", "request_id": "b"},
+            {"date": "2026-10-17", "channel_id": "C001", "request_id": "c"},
+        ]
+        partitions = partition_rows(rows)
+
+        assert [r["request_id"] for r in partitions[("2026-10-17", "C001")]] == ["a", "c"]
+        assert "date" not in partitions[("2026-10-17", "C002")][0]
+
+
+class TestConvert:
+    def _s3(self, state: dict, data_files: list):
+        manifest_key = "dynamodb-exports/2026/10/17/AWSDynamoDB/01-abc/manifest-summary.json"
+        objects = {
+            handler.STATE_KEY: json.dumps(state).encode(),
+            manifest_key: json.dumps({"manifestFilesS3Key": "m/manifest-files.json"}).encode(),
+            "m/manifest-files.json": "\n".join(
+                json.dumps({"dataFileS3Key": f"m/data/{i}.json.gz"}) for i in range(len(data_files))
+            ).encode(),
+            "content/C001/2026/10/17/corr-1/input.json": json.dumps({"text": "hello"}).encode(),
+        }
+        for i, lines in enumerate(data_files):
+            objects[f"m/data/{i}.json.gz"] = gzip.compress("\n".join(json.dumps(l) for l in lines).encode())
+        s3 = MagicMock()
+
+        def _get(Bucket, Key):
+            if Key not in objects:
+                raise _missing()
+            return _body(objects[Key])
+
+        s3.get_object.side_effect = _get
+        return s3, manifest_key
+
+    @staticmethod
+    def _state(pending: list) -> dict:
+        # No export is due before the next boundary
+        return {"last_export_time": NOW.isoformat(), "pending": pending}
+
+    @staticmethod
+    def _saved_state(s3) -> dict:
+        saved = [c[1]["Body"] for c in s3.put_object.call_args_list if c[1]["Key"] == handler.STATE_KEY]
+        return json.loads(saved[-1])
+
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("handler._parquet_bytes", side_effect=lambda rows: json.dumps(rows, default=str).encode())
+    @patch("boto3.client")
+    def test_completed_export_written_per_data_file(self, mock_boto_client, _parquet, _now):
+        s3, manifest_key = self._s3(self._state([{"export_arn": "arn:x/export/01-abc"}]), [
+            [
+                {"NewImage": _item()},
+                {"Keys": {"channel_id": {"S": "C001"}}},  # deletion (TTL expiry)
+            ],
+            [{"NewImage": _item(channel_id="C002", correlation_id="corr-2")}],
+        ])
+        ddb = MagicMock()
+        ddb.describe_export.return_value = {
+            "ExportDescription": {"ExportStatus": "COMPLETED", "ExportManifest": manifest_key}
+        }
+        mock_boto_client.side_effect = _clients(ddb, s3)
+
+        result = lambda_handler({}, None)
+
+        assert result["converted"] == ["01-abc"]
+        assert result["pending"] == 0
+        written = {c[1]["Key"]: c[1]["Body"] for c in s3.put_object.call_args_list}
+        key = "analytics/usage/date=2026-10-17/channel_id=C001/part-01-abc-00000-0000.parquet"
+        assert key in written
+        assert "analytics/usage/date=2026-10-17/channel_id=C002/part-01-abc-00001-0000.parquet" in written
+        row = json.loads(written[key])[0]
+        assert (row["input_text"], row["output_text"]) == ("hello", None)
+        assert self._saved_state(s3)["pending"] == []
+
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("handler._parquet_bytes", side_effect=lambda rows: b"parquet")
+    @patch("boto3.client")
+    def test_conversion_resumes_from_saved_data_file(self, mock_boto_client, _parquet, _now):
+        pending = {"export_arn": "arn:x/export/01-abc", "next_file": 1}
+        s3, manifest_key = self._s3(self._state([pending]), [
+            [{"NewImage": _item()}],
+            [{"NewImage": _item(channel_id="C002", correlation_id="corr-2")}],
+        ])
+        ddb = MagicMock()
+        ddb.describe_export.return_value = {
+            "ExportDescription": {"ExportStatus": "COMPLETED", "ExportManifest": manifest_key}
+        }
+        mock_boto_client.side_effect = _clients(ddb, s3)
+
+        lambda_handler({}, None)
+
+        parquet_keys = [c[1]["Key"] for c in s3.put_object.call_args_list if c[1]["Key"] != handler.STATE_KEY]
+        assert parquet_keys == ["analytics/usage/date=2026-10-17/channel_id=C002/part-01-abc-00001-0000.parquet"]
+
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("handler._parquet_bytes", side_effect=lambda rows: b"parquet")
+    @patch("boto3.client")
+    def test_failing_export_does_not_block_later_exports(self, mock_boto_client, _parquet, _now):
+        broken = {"export_arn": "arn:x/export/00-bad"}
+        s3, manifest_key = self._s3(self._state([broken, {"export_arn": "arn:x/export/01-abc"}]), [
+            [{"NewImage": _item()}],
+        ])
+        ddb = MagicMock()
+        ddb.describe_export.side_effect = lambda ExportArn: {"ExportDescription": {
+            "ExportStatus": "COMPLETED",
+            "ExportManifest": "missing/manifest-summary.json" if ExportArn.endswith("00-bad") else manifest_key,
+        }}
+        mock_boto_client.side_effect = _clients(ddb, s3)
+
+        result = lambda_handler({}, None)
+
+        assert result["converted"] == ["01-abc"]
+        state = self._saved_state(s3)
+        assert state["pending"][0]["export_arn"] == broken["export_arn"]
+        assert "NoSuchKey" in state["pending"][0]["last_error"]
+
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("handler._parquet_bytes", side_effect=RuntimeError("boom"))
+    @patch("boto3.client")
+    def test_export_abandoned_after_max_attempts(self, mock_boto_client, _parquet, _now):
+        pending = {"export_arn": "arn:x/export/01-abc", "attempts": handler.MAX_ATTEMPTS - 1}
+        s3, manifest_key = self._s3(self._state([pending]), [[{"NewImage": _item()}]])
+        ddb = MagicMock()
+        ddb.describe_export.return_value = {
+            "ExportDescription": {"ExportStatus": "COMPLETED", "ExportManifest": manifest_key}
+        }
+        mock_boto_client.side_effect = _clients(ddb, s3)
+
+        result = lambda_handler({}, None)
+
+        assert (result["pending"], result["failed"]) == (0, 1)
+        failed = self._saved_state(s3)["failed"][0]
+        assert failed["attempts"] == handler.MAX_ATTEMPTS
+        assert failed["last_error"] == "boom"
+
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("boto3.client")
+    def test_in_progress_export_stays_pending(self, mock_boto_client, _now):
+        pending = {"export_arn": "arn:x/export/01-abc"}
+        s3, _ = self._s3(self._state([pending]), [])
+        ddb = MagicMock()
+        ddb.describe_export.return_value = {"ExportDescription": {"ExportStatus": "IN_PROGRESS"}}
+        mock_boto_client.side_effect = _clients(ddb, s3)
+
+        result = lambda_handler({}, None)
+
+        assert result["pending"] == 1
+        s3.put_object.assert_not_called()
+
+    @patch.dict(os.environ, ENV)
+    @patch("handler._now", return_value=NOW)
+    @patch("boto3.client")
+    def test_failed_export_window_is_exported_again(self, mock_boto_client, _now):
+        start = (NOW - datetime.timedelta(hours=24)).isoformat()
+        pending = {"export_arn": "arn:x/export/01-abc", "type": "INCREMENTAL_EXPORT", "from": start, "to": NOW.isoformat()}
+        s3, _ = self._s3(self._state([pending]), [])
+        ddb = MagicMock()
+        ddb.describe_export.return_value = {"ExportDescription": {"ExportStatus": "FAILED"}}
+        ddb.export_table_to_point_in_time.return_value = {"ExportDescription": {"ExportArn": "arn:x/export/02-def"}}
+        mock_boto_client.side_effect = _clients(ddb, s3)
+
+        lambda_handler({}, None)
+
+        spec = ddb.export_table_to_point_in_time.call_args[1]["IncrementalExportSpecification"]
+        assert (spec["ExportFromTime"].isoformat(), spec["ExportToTime"].isoformat()) == (start, NOW.isoformat())
+        state = self._saved_state(s3)
+        assert state["last_export_time"] == NOW.isoformat()
+        assert state["pending"] == [{**pending, "export_arn": "arn:x/export/02-def", "export_attempts": 2}]
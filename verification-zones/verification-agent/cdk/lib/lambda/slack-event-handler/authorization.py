@@ -18,51 +18,23 @@ backward compatibility when all entities are configured.
 
 import os
 import time
-import boto3
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from whitelist_loader import load_whitelist_config, AuthorizationError as LoaderError
+from cloudwatch_metrics import emit_metric
 from logger import log_info, log_error
 
-# CloudWatch client for metrics
-_cloudwatch_client = None
-
-
-def _get_cloudwatch_client():
-    """Get CloudWatch client (singleton pattern)."""
-    global _cloudwatch_client
-    if _cloudwatch_client is None:
-        _cloudwatch_client = boto3.client("cloudwatch", region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"))
-    return _cloudwatch_client
-
-
+# CloudWatch metrics
 def _emit_metric(metric_name: str, value: float, unit: str = "Count") -> None:
     """
-    Emit CloudWatch custom metric.
-    
+    Emit CloudWatch custom metric (buffered and flushed in batches by cloudwatch_metrics).
+
     Args:
         metric_name: Metric name (e.g., "WhitelistAuthorizationSuccess")
         value: Metric value
         unit: Metric unit (default: "Count")
     """
-    try:
-        client = _get_cloudwatch_client()
-        client.put_metric_data(
-            Namespace="SlackEventHandler",
-            MetricData=[
-                {
-                    "MetricName": metric_name,
-                    "Value": value,
-                    "Unit": unit,
-                }
-            ],
-        )
-    except Exception as e:
-        # Log but don't fail on metric emission errors
-        log_error("cloudwatch_metric_emission_failed", {
-            "metric_name": metric_name,
-            "error": str(e),
-        }, include_stack_trace=False)
+    emit_metric("SlackEventHandler", metric_name, value, unit)
 
 
 class AuthorizationError(Exception):
@@ -0,0 +1,312 @@
+"""
+CloudWatch Metrics Helper for Slack Event Handler.
+
+Provides a process-wide, buffered metrics emitter. ``emit_metric`` only appends
+the datapoint to an in-memory buffer; a background thread flushes the buffer
+every ``METRICS_FLUSH_INTERVAL_SECONDS``, aggregating datapoints into one
+statistic set per metric and dimension set and sending them with as few
+PutMetricData calls as possible (up to 1000 datums per call). The buffer is
+also flushed at interpreter exit and can be flushed explicitly with
+``flush_metrics()`` (e.g. at the end of a Lambda invocation).
+
+With ``METRICS_OUTPUT=emf`` the flush writes CloudWatch Embedded Metric Format
+documents to stdout instead of calling the API.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from logger import log
+
+# Singleton CloudWatch client
+_cloudwatch_client: Optional[Any] = None
+
+METRICS_OUTPUT_API = "api"
+METRICS_OUTPUT_EMF = "emf"
+
+# Seconds between background flushes; 0 disables the thread (flush explicitly)
+METRICS_FLUSH_INTERVAL_SECONDS = float(os.environ.get("METRICS_FLUSH_INTERVAL_SECONDS", "10"))
+# Datapoints held in memory before new ones are dropped
+METRICS_MAX_BUFFERED_DATAPOINTS = int(os.environ.get("METRICS_MAX_BUFFERED_DATAPOINTS", "20000"))
+
+# PutMetricData accepts at most 1000 datums per call
+_MAX_DATUMS_PER_CALL = 1000
+# EMF allows at most 100 metrics per document and 100 values per metric
+_MAX_EMF_METRICS = 100
+_MAX_EMF_VALUES = 100
+
+_SeriesKey = Tuple[str, str, str, Tuple[Tuple[str, str], ...]]
+
+
+def _get_cloudwatch_client():
+    """
+    Get or create singleton CloudWatch client.
+
+    Returns:
+        boto3 CloudWatch client instance
+    """
+    global _cloudwatch_client
+    if _cloudwatch_client is None:
+        region = os.environ.get("AWS_REGION_NAME", "ap-northeast-1")
+        _cloudwatch_client = boto3.client("cloudwatch", region_name=region)
+    return _cloudwatch_client
+
+
+def _log(level: str, event_type: str, data: Dict[str, Any]) -> None:
+    """
+    Structured JSON logging for CloudWatch metrics errors.
+
+    Args:
+        level: Log level (ERROR, WARN, INFO)
+        event_type: Event type identifier
+        data: Additional log data
+    """
+    log(level, event_type, {**data, "component": "cloudwatch_metrics"})
+
+
+def _get_output() -> str:
+    """Read METRICS_OUTPUT ("api" or "emf", default "api")."""
+    output = os.environ.get("METRICS_OUTPUT", METRICS_OUTPUT_API).strip().lower()
+    return METRICS_OUTPUT_EMF if output == METRICS_OUTPUT_EMF else METRICS_OUTPUT_API
+
+
+class _MetricsBuffer:
+    """Thread-safe datapoint buffer keyed by (namespace, metric, unit, dimensions)."""
+
+    def __init__(self, flush_interval: float, max_datapoints: int):
+        self._flush_interval = flush_interval
+        self._max_datapoints = max_datapoints
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._series: Dict[_SeriesKey, List[float]] = {}
+        self._started_at: Dict[_SeriesKey, float] = {}
+        self._size = 0
+        self._dropped = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def add(
+        self,
+        namespace: str,
+        metric_name: str,
+        value: float,
+        unit: str,
+        dimensions: Optional[List[Dict[str, str]]],
+    ) -> None:
+        dims = tuple(sorted((d["Name"], d["Value"]) for d in dimensions or ()))
+        key = (namespace, metric_name, unit, dims)
+        with self._lock:
+            if self._size >= self._max_datapoints:
+                self._dropped += 1
+                return
+            values = self._series.get(key)
+            if values is None:
+                values = self._series[key] = []
+                self._started_at[key] = time.time()
+            values.append(float(value))
+            self._size += 1
+            self._ensure_flusher()
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flush thread on first use. Caller holds the lock."""
+        if self._flush_interval <= 0:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._flush_interval)
+            self.flush()
+
+    def _drain(self):
+        with self._lock:
+            series, started_at, dropped = self._series, self._started_at, self._dropped
+            self._series, self._started_at = {}, {}
+            self._size = 0
+            self._dropped = 0
+        return series, started_at, dropped
+
+    def flush(self) -> None:
+        """Send every buffered datapoint; never raises."""
+        # Serialise flushes so an explicit flush and the background thread do not interleave
+        with self._flush_lock:
+            series, started_at, dropped = self._drain()
+            if dropped:
+                _log("WARN", "cloudwatch_metric_datapoints_dropped", {"dropped": dropped})
+            if not series:
+                return
+            try:
+                if _get_output() == METRICS_OUTPUT_EMF:
+                    _write_emf(series, started_at)
+                else:
+                    _put_statistic_sets(series, started_at)
+            except Exception as e:
+                _log("ERROR", "cloudwatch_unexpected_error", {
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                })
+
+
+def _put_statistic_sets(
+    series: Dict[_SeriesKey, List[float]], started_at: Dict[_SeriesKey, float]
+) -> None:
+    """Aggregate each series into a StatisticValues datum and send in batches per namespace."""
+    by_namespace: Dict[str, List[Dict[str, Any]]] = {}
+    for key, values in series.items():
+        namespace, metric_name, unit, dims = key
+        datum: Dict[str, Any] = {
+            "MetricName": metric_name,
+            "Timestamp": datetime.fromtimestamp(started_at[key], tz=timezone.utc),
+            "StatisticValues": {
+                "SampleCount": float(len(values)),
+                "Sum": sum(values),
+                "Minimum": min(values),
+                "Maximum": max(values),
+            },
+            "Unit": unit,
+        }
+        if dims:
+            datum["Dimensions"] = [{"Name": n, "Value": v} for n, v in dims]
+        by_namespace.setdefault(namespace, []).append(datum)
+
+    for namespace, data in by_namespace.items():
+        for i in range(0, len(data), _MAX_DATUMS_PER_CALL):
+            batch = data[i : i + _MAX_DATUMS_PER_CALL]
+            try:
+                _get_cloudwatch_client().put_metric_data(Namespace=namespace, MetricData=batch)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                _log("ERROR", "cloudwatch_metric_emission_failed", {
+                    "namespace": namespace,
+                    "metric_count": len(batch),
+                    "error_code": error_code,
+                    "error_message": str(e),
+                })
+            except BotoCoreError as e:
+                _log("ERROR", "cloudwatch_client_error", {
+                    "namespace": namespace,
+                    "metric_count": len(batch),
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                })
+            except Exception as e:
+                _log("ERROR", "cloudwatch_unexpected_error", {
+                    "namespace": namespace,
+                    "metric_count": len(batch),
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                })
+
+
+def _write_emf(
+    series: Dict[_SeriesKey, List[float]], started_at: Dict[_SeriesKey, float]
+) -> None:
+    """Write one EMF document per namespace and dimension set to stdout."""
+    groups: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[_SeriesKey]] = {}
+    for key in series:
+        namespace, _, _, dims = key
+        groups.setdefault((namespace, dims), []).append(key)
+
+    for (namespace, dims), keys in groups.items():
+        for i in range(0, len(keys), _MAX_EMF_METRICS):
+            chunk = keys[i : i + _MAX_EMF_METRICS]
+            offset = 0
+            # A metric with more than 100 values spills into additional documents
+            while True:
+                document: Dict[str, Any] = {name: value for name, value in dims}
+                definitions = []
+                for key in chunk:
+                    values = series[key][offset : offset + _MAX_EMF_VALUES]
+                    if not values:
+                        continue
+                    _, metric_name, unit, _ = key
+                    document[metric_name] = values if len(values) > 1 else values[0]
+                    definitions.append({"Name": metric_name, "Unit": unit})
+                if not definitions:
+                    break
+                document["_aws"] = {
+                    "Timestamp": int(min(started_at[k] for k in chunk) * 1000),
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": namespace,
+                            "Dimensions": [[name for name, _ in dims]],
+                            "Metrics": definitions,
+                        }
+                    ],
+                }
+                print(json.dumps(document), flush=True)
+                offset += _MAX_EMF_VALUES
+
+
+_buffer = _MetricsBuffer(METRICS_FLUSH_INTERVAL_SECONDS, METRICS_MAX_BUFFERED_DATAPOINTS)
+atexit.register(_buffer.flush)
+
+
+def emit_metric(
+    namespace: str,
+    metric_name: str,
+    value: float,
+    unit: str = "Count",
+    dimensions: Optional[List[Dict[str, str]]] = None,
+) -> None:
+    """
+    Record a custom CloudWatch metric datapoint.
+
+    The datapoint is buffered and sent by the next flush, so this call never
+    blocks on the CloudWatch API. This function fails silently - it will not
+    raise exceptions or crash the handler if metrics emission fails.
+
+    Args:
+        namespace: CloudWatch metric namespace (e.g., "SlackAIApp/Verification")
+        metric_name: Name of the metric (e.g., "ExistenceCheckFailed")
+        value: Metric value (typically 1.0 for count metrics)
+        unit: Metric unit (default: "Count")
+        dimensions: Optional list of dimension dictionaries
+                    (e.g., [{"Name": "TeamId", "Value": "TEAM123"}])
+    """
+    try:
+        _buffer.add(namespace, metric_name, value, unit, dimensions)
+    except Exception as e:
+        _log("ERROR", "cloudwatch_unexpected_error", {
+            "namespace": namespace,
+            "metric_name": metric_name,
+            "error_type": type(e).__name__,
+            "error_message": str(e),
+        })
+
+
+def flush_metrics() -> None:
+    """Send all buffered datapoints now (blocking). Never raises."""
+    _buffer.flush()
+
+
+def flush_metrics_after(handler: Callable) -> Callable:
+    """
+    Decorate a Lambda handler so buffered metrics are flushed before it returns.
+
+    Lambda freezes the execution environment between invocations, so the
+    background flush thread cannot be relied on to run.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            flush_metrics()
+
+    return wrapper
+
@@ -11,60 +11,43 @@ but they cannot call Slack API without Bot Token. This feature verifies
 that entities exist in Slack, preventing attackers from creating fake
 requests with made-up IDs.
 
-Verification results are cached in DynamoDB for 5 minutes to minimize
-performance impact. The system fails securely (rejects requests) when
-Slack API is unavailable, prioritizing security over availability.
+Verification results are cached per entity (team, user, channel) in an
+in-process TTL/LRU tier backed by DynamoDB for 5 minutes to minimize
+performance impact; *_not_found results are cached briefly as well. On a
+cache miss the remaining lookups run concurrently under one shared deadline
+and are merged fail-closed. The system fails securely (rejects requests)
+when Slack API is unavailable, prioritizing security over availability.
 """
 
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import partial
 import boto3
-from typing import Optional, Dict, Any
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+from boto3.dynamodb.types import TypeDeserializer
+from typing import Optional, Dict, Any, List, Tuple
+import requests
 from botocore.exceptions import ClientError
+from cloudwatch_metrics import emit_metric
 from logger import log_info, log_warn, log_error
+from slack_api import get_slack_client
 import socket
 
-# CloudWatch client for metrics
-_cloudwatch_client = None
-
-
-def _get_cloudwatch_client():
-    """Get CloudWatch client (singleton pattern)."""
-    global _cloudwatch_client
-    if _cloudwatch_client is None:
-        _cloudwatch_client = boto3.client("cloudwatch")
-    return _cloudwatch_client
-
+_deserializer = TypeDeserializer()
 
+# CloudWatch metrics
 def _emit_metric(metric_name: str, value: float, unit: str = "Count") -> None:
     """
-    Emit CloudWatch custom metric.
-    
+    Emit CloudWatch custom metric (buffered and flushed in batches by cloudwatch_metrics).
+
     Args:
         metric_name: Metric name (e.g., "ExistenceCheckFailed")
         value: Metric value
         unit: Metric unit (default: "Count")
     """
-    try:
-        client = _get_cloudwatch_client()
-        client.put_metric_data(
-            Namespace="SlackEventHandler",
-            MetricData=[
-                {
-                    "MetricName": metric_name,
-                    "Value": value,
-                    "Unit": unit,
-                }
-            ],
-        )
-    except Exception as e:
-        # Log but don't fail on metric emission errors
-        log_warn("cloudwatch_metric_emission_failed", {
-            "metric_name": metric_name,
-            "error": str(e),
-        })
+    emit_metric("SlackEventHandler", metric_name, value, unit)
 
 
 class ExistenceCheckError(Exception):
@@ -72,17 +55,94 @@ class ExistenceCheckError(Exception):
     pass
 
 
+class EntityNotFoundError(ExistenceCheckError):
+    """Raised when Slack reports {entity_type}_not_found (cached negatively)."""
+
+    def __init__(self, entity_type: str, entity_id: str) -> None:
+        super().__init__(f"{entity_type.capitalize()} not found: {entity_id}")
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+
+
+# Shared deadline (seconds) for all Slack lookups of one check, retries included.
+# The Slack Event Handler must ack within 3 seconds, so the default leaves headroom.
+EXISTENCE_CHECK_DEADLINE_SECONDS = float(
+    os.environ.get("EXISTENCE_CHECK_DEADLINE_SECONDS", "2.5")
+)
+
+# team.info / users.info / conversations.info are issued concurrently on this pool.
+_lookup_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("EXISTENCE_CHECK_MAX_WORKERS", "6")),
+    thread_name_prefix="existence-check",
+)
+
+
+# Cache TTLs (seconds). Negative entries (*_not_found) expire quickly so a newly
+# created user or channel is not locked out for long.
+EXISTENCE_CHECK_CACHE_TTL_SECONDS = int(os.environ.get("EXISTENCE_CHECK_CACHE_TTL_SECONDS", "300"))
+EXISTENCE_CHECK_NEGATIVE_TTL_SECONDS = int(
+    os.environ.get("EXISTENCE_CHECK_NEGATIVE_TTL_SECONDS", "60")
+)
+
+CACHE_STATUS_EXISTS = "exists"
+CACHE_STATUS_NOT_FOUND = "not_found"
+
+
+class _LocalEntityCache:
+    """
+    In-process TTL/LRU tier in front of the DynamoDB cache.
+
+    Maps per-entity cache keys to (status, expires_at epoch seconds). Warm
+    containers answer repeat lookups without DynamoDB or Slack round trips.
+    Thread-safe: entity lookups run on a worker pool.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """Return the cached status, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            status, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return status
+
+    def put(self, cache_key: str, status: str, expires_at: int) -> None:
+        """Store status until expires_at, evicting least recently used entries."""
+        with self._lock:
+            self._entries[cache_key] = (status, expires_at)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_local_cache = _LocalEntityCache(
+    max_entries=int(os.environ.get("EXISTENCE_CHECK_LOCAL_CACHE_SIZE", "2048"))
+)
+
 def _get_cache_table():
     """
     Get DynamoDB table for Existence Check cache.
-    
+
     Returns:
         DynamoDB table resource or None if table name not configured
     """
     table_name = os.environ.get("EXISTENCE_CHECK_CACHE_TABLE")
     if not table_name:
         return None
-    
+
     dynamodb = boto3.resource("dynamodb")
     return dynamodb.Table(table_name)
 
@@ -90,10 +150,10 @@ def _get_cache_table():
 def get_from_cache(cache_key: str) -> Optional[Dict[str, Any]]:
     """
     Get cached verification result from DynamoDB.
-    
+
     Args:
-        cache_key: Cache key in format "{team_id}#{user_id}#{channel_id}"
-        
+        cache_key: Per-entity cache key in format "{entity_type}#{entity_id}"
+
     Returns:
         Cached entry dictionary if found and valid, None otherwise
     """
@@ -101,17 +161,17 @@ def get_from_cache(cache_key: str) -> Optional[Dict[str, Any]]:
         table = _get_cache_table()
         if not table:
             return None
-        
+
         response = table.get_item(Key={"cache_key": cache_key})
         item = response.get("Item")
-        
+
         if item:
             # Check if cache entry is still valid (TTL not expired)
             ttl = item.get("ttl", 0)
             current_time = int(time.time())
             if ttl > current_time:
                 return item
-        
+
         return None
     except ClientError as e:
         log_warn(
@@ -129,25 +189,78 @@ def get_from_cache(cache_key: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def save_to_cache(cache_key: str, ttl: int = 300) -> None:
+def get_many_from_cache(cache_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get several cached verification results from DynamoDB in one BatchGetItem.
+
+    Unprocessed keys and read errors are treated as cache misses (the entity is
+    then verified against Slack), so this never weakens the check.
+
+    Args:
+        cache_keys: Per-entity cache keys
+
+    Returns:
+        Mapping of cache_key to valid (non-expired) cache entry
+    """
+    if not cache_keys:
+        return {}
+    if len(cache_keys) == 1:
+        item = get_from_cache(cache_keys[0])
+        return {cache_keys[0]: item} if item else {}
+    try:
+        table = _get_cache_table()
+        if not table:
+            return {}
+
+        response = table.meta.client.batch_get_item(
+            RequestItems={
+                table.name: {"Keys": [{"cache_key": {"S": key}} for key in cache_keys]}
+            }
+        )
+        current_time = int(time.time())
+        items: Dict[str, Dict[str, Any]] = {}
+        for raw in response.get("Responses", {}).get(table.name, []):
+            item = {k: _deserializer.deserialize(v) for k, v in raw.items()}
+            if item.get("ttl", 0) > current_time:
+                items[item["cache_key"]] = item
+        return items
+    except ClientError as e:
+        log_warn(
+            "existence_check_cache_read_failed",
+            {"cache_keys": cache_keys, "error_code": e.response.get("Error", {}).get("Code")},
+            e,
+        )
+        return {}
+    except Exception as e:
+        log_warn(
+            "existence_check_cache_read_failed",
+            {"cache_keys": cache_keys},
+            e,
+        )
+        return {}
+
+
+def save_to_cache(cache_key: str, ttl: int = 300, status: str = CACHE_STATUS_EXISTS) -> None:
     """
     Save verification result to DynamoDB cache.
-    
+
     Args:
-        cache_key: Cache key in format "{team_id}#{user_id}#{channel_id}"
+        cache_key: Per-entity cache key in format "{entity_type}#{entity_id}"
         ttl: Time to live in seconds (default: 300 = 5 minutes)
+        status: "exists" or "not_found" (negative cache entry)
     """
     try:
         table = _get_cache_table()
         if not table:
             return
-        
+
         current_time = int(time.time())
         table.put_item(
             Item={
                 "cache_key": cache_key,
                 "ttl": current_time + ttl,
                 "verified_at": current_time,
+                "status": status,
             }
         )
     except ClientError as e:
@@ -164,26 +277,122 @@ def save_to_cache(cache_key: str, ttl: int = 300) -> None:
         )
 
 
+def _cache_entity_result(cache_key: str, status: str) -> None:
+    """Write an entity result to both cache tiers (local first, then DynamoDB)."""
+    ttl = (
+        EXISTENCE_CHECK_NEGATIVE_TTL_SECONDS
+        if status == CACHE_STATUS_NOT_FOUND
+        else EXISTENCE_CHECK_CACHE_TTL_SECONDS
+    )
+    _local_cache.put(cache_key, status, int(time.time()) + ttl)
+    save_to_cache(cache_key, ttl=ttl, status=status)
+
+
+def _ensure_retry_budget(
+    entity_type: str,
+    entity_id: str,
+    delay: float,
+    deadline: Optional[float],
+    cancelled: Optional[threading.Event],
+) -> None:
+    """
+    Fail closed instead of retrying when the retry cannot finish in time.
+
+    Raises:
+        ExistenceCheckError: If a sibling lookup already failed or the backoff
+            would run past the shared deadline
+    """
+    if cancelled is not None and cancelled.is_set():
+        raise ExistenceCheckError(f"Existence check cancelled for {entity_type}: {entity_id}")
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        _emit_metric("ExistenceCheckFailed", 1.0)
+        raise ExistenceCheckError(
+            f"Existence check timeout for {entity_type}: {entity_id} (retry would exceed deadline)"
+        )
+
+
+def _verify_entities_concurrently(
+    lookups: list,
+    deadline_seconds: float,
+) -> None:
+    """
+    Run entity lookups concurrently under one shared deadline (fail-closed merge).
+
+    The first failing lookup (in team, user, channel order) is raised and the
+    remaining lookups are cancelled. Lookups still pending at the deadline
+    reject the request.
+
+    Args:
+        lookups: List of (entity_type, entity_id, verify_func) tuples
+        deadline_seconds: Shared time budget for all lookups and their retries
+
+    Raises:
+        ExistenceCheckError: If any lookup fails or the deadline is exceeded
+    """
+    deadline = time.monotonic() + deadline_seconds
+    cancelled = threading.Event()
+    futures = [
+        _lookup_executor.submit(
+            _verify_entity_with_retry,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            verify_func=verify_func,
+            deadline=deadline,
+            cancelled=cancelled,
+        )
+        for entity_type, entity_id, verify_func in lookups
+    ]
+    done, not_done = wait(futures, timeout=deadline_seconds, return_when=FIRST_EXCEPTION)
+
+    failed = next(
+        (f for f in futures if f in done and f.exception() is not None), None
+    )
+    if failed is not None or not_done:
+        cancelled.set()
+        for future in not_done:
+            future.cancel()
+    if failed is not None:
+        raise failed.exception()
+    if not_done:
+        pending = [
+            entity_type
+            for (entity_type, _, _), future in zip(lookups, futures)
+            if future in not_done
+        ]
+        log_error("existence_check_timeout", {
+            "pending_entity_types": pending,
+            "deadline_seconds": deadline_seconds,
+        })
+        _emit_metric("ExistenceCheckFailed", 1.0)
+        raise ExistenceCheckError(
+            f"Existence check timeout: deadline of {deadline_seconds}s exceeded for {', '.join(pending)}"
+        )
+
+
 def _verify_entity_with_retry(
-    client: WebClient,
     entity_type: str,
     entity_id: str,
     verify_func,
     max_retries: int = 3,
+    deadline: Optional[float] = None,
+    cancelled: Optional[threading.Event] = None,
 ) -> None:
     """
     Verify entity existence with retry logic for rate limits.
-    
-    Implements exponential backoff retry (1s, 2s, 4s) for rate limit errors (429).
+
+    Retries rate limit errors (429) after Slack's Retry-After, or with exponential
+    backoff (1s, 2s, 4s) when the response carries none.
     Fails securely (rejects request) on all other errors or after retries exhausted.
-    
+    A retry is only attempted when its backoff still fits before ``deadline``.
+
     Args:
-        client: Slack WebClient instance
         entity_type: Entity type ("team", "user", "channel")
         entity_id: Entity ID to verify
         verify_func: Function to call for verification (lambda that calls Slack API)
         max_retries: Maximum number of retry attempts (default: 3)
-        
+        deadline: time.monotonic() value after which no retry is started (optional)
+        cancelled: Event set when a sibling lookup already failed (optional)
+
     Raises:
         ExistenceCheckError: If entity verification fails or Slack API error occurs
     """
@@ -193,11 +402,13 @@ def _verify_entity_with_retry(
             if not result.get("ok"):
                 error = result.get("error", "unknown")
                 if error == f"{entity_type}_not_found":
-                    raise ExistenceCheckError(f"{entity_type.capitalize()} not found: {entity_id}")
+                    _emit_metric("ExistenceCheckFailed", 1.0)
+                    raise EntityNotFoundError(entity_type, entity_id)
                 elif result.get("status_code") == 429:
-                    # Rate limit error - retry with exponential backoff
+                    # Rate limit error - retry after Retry-After (or exponential backoff)
                     if attempt < max_retries - 1:
-                        delay = 2 ** attempt  # 1s, 2s, 4s
+                        delay = result.get("retry_after") or 2 ** attempt  # 1s, 2s, 4s
+                        _ensure_retry_budget(entity_type, entity_id, delay, deadline, cancelled)
                         log_warn("existence_check_rate_limit_retry", {
                             "entity_type": entity_type,
                             "entity_id": entity_id,
@@ -208,50 +419,27 @@ def _verify_entity_with_retry(
                         time.sleep(delay)
                         continue
                     else:
+                        # Emit failure metric after retries exhausted
+                        _emit_metric("ExistenceCheckFailed", 1.0)
                         raise ExistenceCheckError(f"Slack API rate limit exceeded for {entity_type}: {entity_id}")
                 else:
+                    # Emit failure metric for other API errors
+                    _emit_metric("ExistenceCheckFailed", 1.0)
                     raise ExistenceCheckError(f"Slack API error verifying {entity_type}: {error}")
             # Success - break out of retry loop
             break
-        except SlackApiError as e:
-            error_code = e.response.get("error", "unknown")
-            status_code = e.response.get("status_code")
-            
-            if error_code == f"{entity_type}_not_found":
-                # Emit failure metric (Phase 6 - Polish)
-                _emit_metric("ExistenceCheckFailed", 1.0)
-                raise ExistenceCheckError(f"{entity_type.capitalize()} not found: {entity_id}")
-            elif status_code == 429:
-                # Rate limit error - retry with exponential backoff
-                if attempt < max_retries - 1:
-                    delay = 2 ** attempt  # 1s, 2s, 4s
-                    log_warn("existence_check_rate_limit_retry", {
-                        "entity_type": entity_type,
-                        "entity_id": entity_id,
-                        "attempt": attempt + 1,
-                        "max_retries": max_retries,
-                        "delay_seconds": delay,
-                    })
-                    time.sleep(delay)
-                    continue
-                else:
-                    # Emit failure metric after retries exhausted (Phase 6 - Polish)
-                    _emit_metric("ExistenceCheckFailed", 1.0)
-                    raise ExistenceCheckError(f"Slack API rate limit exceeded for {entity_type}: {entity_id}")
-            else:
-                # Emit failure metric for other API errors (Phase 6 - Polish)
-                _emit_metric("ExistenceCheckFailed", 1.0)
-                raise ExistenceCheckError(f"Slack API error verifying {entity_type}: {error_code}")
-        except (socket.timeout, TimeoutError) as e:
+        except (socket.timeout, TimeoutError, requests.Timeout):
             # Timeout error - fail closed (reject request)
             log_error("existence_check_timeout", {
                 "entity_type": entity_type,
                 "entity_id": entity_id,
                 "attempt": attempt + 1,
             })
-            # Emit timeout metric (Phase 6 - Polish)
+            # Emit timeout metric
             _emit_metric("ExistenceCheckFailed", 1.0)
             raise ExistenceCheckError(f"Existence check timeout for {entity_type}: {entity_id}")
+        except ExistenceCheckError:
+            raise
         except Exception as e:
             # Other errors - fail closed (reject request)
             log_error("existence_check_api_error", {
@@ -260,31 +448,35 @@ def _verify_entity_with_retry(
                 "error": str(e),
                 "attempt": attempt + 1,
             })
-            # Emit failure metric (Phase 6 - Polish)
+            # Emit failure metric
             _emit_metric("ExistenceCheckFailed", 1.0)
             raise ExistenceCheckError(f"Existence check failed for {entity_type}: {str(e)}")
 
 
-def _generate_cache_key(team_id: Optional[str], user_id: Optional[str], channel_id: Optional[str]) -> str:
+def _generate_entity_cache_key(entity_type: str, entity_id: str) -> str:
     """
-    Generate cache key from team_id, user_id, and channel_id.
-    
-    Format: "{team_id}#{user_id}#{channel_id}"
-    Uses '#' separator which is not used in Slack IDs.
-    
+    Generate per-entity cache key.
+
+    Format: "{entity_type}#{entity_id}" (e.g. "team#T01234567").
+    Uses '#' separator which is not used in Slack IDs. Team, user and channel
+    are cached independently so a new user in a known channel only needs a
+    single Slack lookup.
+
     Args:
-        team_id: Slack team/workspace ID (can be None)
-        user_id: Slack user ID (can be None)
-        channel_id: Slack channel ID (can be None)
-        
+        entity_type: Entity type ("team", "user", "channel")
+        entity_id: Slack entity ID
+
     Returns:
-        Cache key string in format "{team_id}#{user_id}#{channel_id}"
+        Cache key string in format "{entity_type}#{entity_id}"
     """
-    # Use empty string for None values to ensure consistent key format
-    team = team_id or ""
-    user = user_id or ""
-    channel = channel_id or ""
-    return f"{team}#{user}#{channel}"
+    return f"{entity_type}#{entity_id}"
+
+
+def _raise_if_cached_not_found(entity_type: str, entity_id: str, status: str) -> None:
+    """Fail closed on a negative cache entry without calling Slack."""
+    if status == CACHE_STATUS_NOT_FOUND:
+        _emit_metric("ExistenceCheckFailed", 1.0)
+        raise EntityNotFoundError(entity_type, entity_id)
 
 
 def check_entity_existence(
@@ -295,88 +487,128 @@ def check_entity_existence(
 ) -> bool:
     """
     Verify that team_id, user_id, and channel_id exist in Slack.
-    
+
     This function implements the second key in the two-key defense model.
     It verifies entities exist in Slack by calling Slack API before processing
     requests. This prevents attackers who have stolen only the Signing Secret
     from creating fake requests with made-up IDs.
-    
+
     Args:
         bot_token: Slack Bot Token (xoxb-...) for API authentication
         team_id: Slack team/workspace ID to verify (optional)
         user_id: Slack user ID to verify (optional)
         channel_id: Slack channel ID to verify (optional)
-        
+
     Returns:
         True if all provided entities exist in Slack, False otherwise
-        
+
     Raises:
         ExistenceCheckError: If entity verification fails or Slack API error occurs
-        
+
     Note:
         - If team_id, user_id, or channel_id is None, that entity is skipped
-        - Verification results are cached in DynamoDB for 5 minutes
+        - Each entity is cached separately: in-process TTL/LRU tier first,
+          then DynamoDB (one BatchGetItem), then Slack for the remainder
+        - Positive results are cached for 5 minutes, *_not_found for
+          EXISTENCE_CHECK_NEGATIVE_TTL_SECONDS
+        - Entities still unverified are checked concurrently within
+          EXISTENCE_CHECK_DEADLINE_SECONDS (retries included)
         - System fails securely (rejects requests) when Slack API is unavailable
     """
-    # Generate cache key
-    cache_key = _generate_cache_key(team_id, user_id, channel_id)
-    
-    # Check cache first (Phase 4 - User Story 2)
-    cached_result = get_from_cache(cache_key)
-    if cached_result:
+    entities = [
+        (entity_type, entity_id)
+        for entity_type, entity_id in (
+            ("team", team_id),
+            ("user", user_id),
+            ("channel", channel_id),
+        )
+        if entity_id
+    ]
+    if not entities:
+        return True
+
+    # Tier 1: in-process cache
+    local_misses = []
+    for entity_type, entity_id in entities:
+        cache_key = _generate_entity_cache_key(entity_type, entity_id)
+        status = _local_cache.get(cache_key)
+        if status is None:
+            local_misses.append((entity_type, entity_id))
+        else:
+            _raise_if_cached_not_found(entity_type, entity_id, status)
+
+    # Tier 2: DynamoDB (only for entities this container has not seen)
+    unverified = []
+    if local_misses:
+        cached_items = get_many_from_cache(
+            [_generate_entity_cache_key(t, i) for t, i in local_misses]
+        )
+        for entity_type, entity_id in local_misses:
+            cache_key = _generate_entity_cache_key(entity_type, entity_id)
+            item = cached_items.get(cache_key)
+            if not item:
+                unverified.append((entity_type, entity_id))
+                continue
+            status = item.get("status", CACHE_STATUS_EXISTS)
+            _local_cache.put(cache_key, status, int(item["ttl"]))
+            _raise_if_cached_not_found(entity_type, entity_id, status)
+
+    cache_keys = [_generate_entity_cache_key(t, i) for t, i in entities]
+    if not unverified:
         log_info("existence_check_cache_hit", {
-            "cache_key": cache_key,
+            "cache_keys": cache_keys,
+            "dynamodb_reads": len(local_misses),
         })
-        # Emit cache hit metric (Phase 6 - Polish)
+        # Emit cache hit metric
         _emit_metric("ExistenceCheckCacheHit", 1.0)
         return True  # Cache hit - skip Slack API calls
-    
+
     log_info("existence_check_cache_miss", {
-        "cache_key": cache_key,
+        "cache_keys": cache_keys,
+        "unverified": [_generate_entity_cache_key(t, i) for t, i in unverified],
     })
-    # Emit cache miss metric (Phase 6 - Polish)
+    # Emit cache miss metric
     _emit_metric("ExistenceCheckCacheMiss", 1.0)
-    
-    # Create Slack API client with 2-second timeout (Phase 5 - User Story 3)
-    client = WebClient(token=bot_token, timeout=2)
-    
-    # Track API latency (Phase 6 - Polish)
+
+    # Cached per bot token; calls share the keep-alive session of slack_api
+    client = get_slack_client(bot_token)
+
+    # Track API latency
     api_start_time = time.time()
-    
-    # Verify team_id if provided (with retry logic for rate limits)
-    if team_id:
-        _verify_entity_with_retry(
-            client=client,
-            entity_type="team",
-            entity_id=team_id,
-            verify_func=lambda: client.team_info(team=team_id),
-        )
-    
-    # Verify user_id if provided (with retry logic for rate limits)
-    if user_id:
-        _verify_entity_with_retry(
-            client=client,
-            entity_type="user",
-            entity_id=user_id,
-            verify_func=lambda: client.users_info(user=user_id),
-        )
-    
-    # Verify channel_id if provided (with retry logic for rate limits)
-    if channel_id:
-        _verify_entity_with_retry(
-            client=client,
-            entity_type="channel",
-            entity_id=channel_id,
-            verify_func=lambda: client.conversations_info(channel=channel_id),
+
+    # Verify remaining entities concurrently (each with retry logic for rate limits)
+    verify_funcs = {
+        "team": lambda entity_id: client.call(
+            "team.info", {"team": entity_id}, timeout=2, max_retries=0
+        ),
+        "user": lambda entity_id: client.call(
+            "users.info", {"user": entity_id}, timeout=2, max_retries=0
+        ),
+        "channel": lambda entity_id: client.call(
+            "conversations.info", {"channel": entity_id}, timeout=2, max_retries=0
+        ),
+    }
+    lookups = [
+        (entity_type, entity_id, partial(verify_funcs[entity_type], entity_id))
+        for entity_type, entity_id in unverified
+    ]
+    try:
+        _verify_entities_concurrently(lookups, EXISTENCE_CHECK_DEADLINE_SECONDS)
+    except EntityNotFoundError as e:
+        # Negative cache: short TTL so newly created entities recover quickly
+        _cache_entity_result(
+            _generate_entity_cache_key(e.entity_type, e.entity_id), CACHE_STATUS_NOT_FOUND
         )
-    
-    # Emit API latency metric (Phase 6 - Polish)
+        raise
+
+    # Emit API latency metric
     api_latency_ms = (time.time() - api_start_time) * 1000
     _emit_metric("SlackAPILatency", api_latency_ms, "Milliseconds")
-    
-    # All verifications passed
-    # Save to cache (Phase 4 - User Story 2)
-    save_to_cache(cache_key, ttl=300)  # 5 minutes TTL
-    
-    return True
 
+    # All verifications passed - cache each entity separately
+    for entity_type, entity_id in unverified:
+        _cache_entity_result(
+            _generate_entity_cache_key(entity_type, entity_id), CACHE_STATUS_EXISTS
+        )
+
+    return True
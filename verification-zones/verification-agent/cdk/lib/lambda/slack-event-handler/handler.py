@@ -3,8 +3,8 @@ import os
 import re
 import uuid
 import boto3
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_api import get_slack_client
 from token_storage import store_token, get_token
 from slack_verifier import verify_signature
 from validation import validate_prompt
@@ -12,6 +12,7 @@ from event_dedupe import is_duplicate_event, mark_event_processed
 from existence_check import check_entity_existence, ExistenceCheckError
 from authorization import authorize_request
 from rate_limiter import check_rate_limit, RateLimitExceededError
+from cloudwatch_metrics import flush_metrics_after
 from botocore.exceptions import ClientError
 from typing import Optional
 from attachment_extractor import extract_attachment_metadata
@@ -151,6 +152,7 @@ def log_event(level: str, event_type: str, data: dict, context=None):
     log(level, event_type, data)
 
 
+@flush_metrics_after
 def lambda_handler(event, context):
     """
     Slack event handler with async Bedrock AI integration.
@@ -669,8 +671,7 @@ def lambda_handler(event, context):
 
                     # Post validation error to user (bot_token already retrieved above)
                     if bot_token and channel:
-                        client = WebClient(token=bot_token)
-                        client.chat_postMessage(channel=channel, text=error_message)
+                        get_slack_client(bot_token).chat_postMessage(channel=channel, text=error_message)
                         log_event(
                             "INFO",
                             "validation_error_posted",
@@ -689,8 +690,10 @@ def lambda_handler(event, context):
                 # Best practice: Use "eyes" emoji to show message is being reviewed/processed
                 if bot_token and channel and slack_event.get("ts"):
                     try:
-                        client = WebClient(token=bot_token, timeout=2)
-                        client.reactions_add(
+                        # No 429 wait here: the reaction must not delay the ack to Slack
+                        get_slack_client(bot_token).reactions_add(
+                            timeout=2,
+                            max_retries=0,
                             channel=channel,
                             name="eyes",  # Slack API standard name for 👀 emoji
                             timestamp=slack_event.get("ts")
@@ -8,14 +8,28 @@ Rate limiting strategy:
 - User-level throttling: {team_id}#{user_id} as the rate limit key
 - Time window: 1 minute (60 seconds)
 - Default limit: 10 requests per minute per user (configurable via environment variable)
+- Local token bucket per container: bursts beyond the limit are rejected in memory
+  without touching DynamoDB
+- Lease reservation (opt-in): with RATE_LIMIT_LEASE_SIZE > 1, a key that already
+  reserved from this container in the current window reserves that many tokens per
+  DynamoDB write; later requests in the same window spend the lease locally
+- Window mode (RATE_LIMIT_MODE): "fixed" (default) counts per aligned window,
+  "sliding" weights the previous window's count to smooth boundary bursts
+- Scope (RATE_LIMIT_SCOPE): optional key prefix so callers sharing one table
+  (Slack Event Handler and Verification Agent) do not count the same request twice
 - DynamoDB TTL: Automatic cleanup of expired entries
 """
 
 import os
+import threading
 import time
-import boto3
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional, Tuple
+
+import boto3
 from botocore.exceptions import ClientError
+from cloudwatch_metrics import emit_metric
 from logger import log_info, log_warn, log_error
 
 
@@ -25,54 +39,243 @@ class RateLimitExceededError(Exception):
     pass
 
 
-# CloudWatch client for metrics
-_cloudwatch_client = None
-
-
-def _get_cloudwatch_client():
-    """Get CloudWatch client (singleton pattern)."""
-    global _cloudwatch_client
-    if _cloudwatch_client is None:
-        _cloudwatch_client = boto3.client(
-            "cloudwatch",
-            region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"),
-        )
-    return _cloudwatch_client
-
-
+# CloudWatch metrics
 def _emit_metric(metric_name: str, value: float, unit: str = "Count") -> None:
     """
-    Emit CloudWatch custom metric.
+    Emit CloudWatch custom metric (buffered and flushed in batches by cloudwatch_metrics).
 
     Args:
         metric_name: Metric name (e.g., "RateLimitExceeded")
         value: Metric value
         unit: Metric unit (default: "Count")
     """
+    emit_metric("SlackEventHandler", metric_name, value, unit)
+
+
+RATE_LIMIT_MODE_FIXED = "fixed"
+RATE_LIMIT_MODE_SLIDING = "sliding"
+
+# Upper bound on per-user buckets held in memory; least recently used keys are evicted.
+RATE_LIMIT_LOCAL_MAX_KEYS = int(os.environ.get("RATE_LIMIT_LOCAL_MAX_KEYS", "4096"))
+
+# Tokens reserved per DynamoDB write when RATE_LIMIT_LEASE_SIZE is unset (no leases).
+DEFAULT_RATE_LIMIT_LEASE_SIZE = 1
+
+
+@dataclass
+class _LocalBucket:
+    """Per-container state for one rate limit key."""
+
+    tokens: float
+    updated_at: float
+    lease_window_start: int = -1
+    lease_tokens: int = 0
+    previous_window_start: int = -1
+    previous_window_count: int = 0
+
+
+_buckets: "OrderedDict[str, _LocalBucket]" = OrderedDict()
+_buckets_lock = threading.Lock()
+
+
+def _reset_local_state() -> None:
+    """Drop all in-memory buckets and leases (used by tests)."""
+    with _buckets_lock:
+        _buckets.clear()
+
+
+def _get_lease_size() -> int:
+    """
+    Read RATE_LIMIT_LEASE_SIZE (tokens reserved per DynamoDB write, default 1).
+
+    Leased tokens are charged to the shared counter at once and never returned,
+    so a lease is only taken for a key that already reserved from this container
+    in the current window. Most requests reach a fresh AgentCore session or Lambda
+    container, where a lease would waste all but one token. 1 disables leases.
+    """
+    raw = os.environ.get("RATE_LIMIT_LEASE_SIZE", str(DEFAULT_RATE_LIMIT_LEASE_SIZE))
     try:
-        client = _get_cloudwatch_client()
-        client.put_metric_data(
-            Namespace="SlackEventHandler",
-            MetricData=[
-                {
-                    "MetricName": metric_name,
-                    "Value": value,
-                    "Unit": unit,
-                }
-            ],
-        )
-    except Exception as e:
-        # Log but don't fail on metric emission errors
-        log_warn(
-            "cloudwatch_metric_emission_failed",
-            {
-                "metric_name": metric_name,
-                "error": str(e),
+        return max(1, int(raw))
+    except ValueError:
+        log_warn("rate_limit_config_invalid", {"rate_limit_lease_size": raw})
+        return DEFAULT_RATE_LIMIT_LEASE_SIZE
+
+
+def _get_mode() -> str:
+    """Read RATE_LIMIT_MODE ("fixed" or "sliding", default "fixed")."""
+    raw = os.environ.get("RATE_LIMIT_MODE", RATE_LIMIT_MODE_FIXED).strip().lower()
+    if raw not in (RATE_LIMIT_MODE_FIXED, RATE_LIMIT_MODE_SLIDING):
+        log_warn("rate_limit_config_invalid", {"rate_limit_mode": raw})
+        return RATE_LIMIT_MODE_FIXED
+    return raw
+
+
+def _get_bucket(rate_limit_key: str, limit: int, now: float) -> _LocalBucket:
+    """Return the bucket for a key, creating a full one on first use. Caller holds the lock."""
+    bucket = _buckets.get(rate_limit_key)
+    if bucket is None:
+        bucket = _LocalBucket(tokens=float(limit), updated_at=now)
+        _buckets[rate_limit_key] = bucket
+        while len(_buckets) > RATE_LIMIT_LOCAL_MAX_KEYS:
+            _buckets.popitem(last=False)
+    else:
+        _buckets.move_to_end(rate_limit_key)
+    return bucket
+
+
+def _take_local_token(
+    rate_limit_key: str, limit: int, window_seconds: int, now: float
+) -> bool:
+    """
+    Spend one token from the container-local bucket.
+
+    The bucket holds at most ``limit`` tokens and refills at ``limit / window_seconds``
+    tokens per second, so a single container can never admit more than the limit
+    within any window, regardless of where the window boundaries fall.
+    """
+    with _buckets_lock:
+        bucket = _get_bucket(rate_limit_key, limit, now)
+        elapsed = max(0.0, now - bucket.updated_at)
+        bucket.tokens = min(float(limit), bucket.tokens + elapsed * limit / window_seconds)
+        bucket.updated_at = now
+        if bucket.tokens < 1.0:
+            return False
+        bucket.tokens -= 1.0
+        return True
+
+
+def _refund_local_token(rate_limit_key: str, limit: int) -> None:
+    """Return a token taken for a request that the shared counter rejected."""
+    with _buckets_lock:
+        bucket = _buckets.get(rate_limit_key)
+        if bucket is not None:
+            bucket.tokens = min(float(limit), bucket.tokens + 1.0)
+
+
+def _take_lease_token(rate_limit_key: str, window_start: int) -> Optional[int]:
+    """
+    Spend one token from a lease reserved earlier in the same window.
+
+    Returns:
+        Tokens left in the lease after this request, or None if no lease is available
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(rate_limit_key)
+        if bucket is None or bucket.lease_window_start != window_start or bucket.lease_tokens <= 0:
+            return None
+        bucket.lease_tokens -= 1
+        return bucket.lease_tokens
+
+
+def _has_window_history(rate_limit_key: str, window_start: int) -> bool:
+    """True if this container already reserved tokens for the key in this window."""
+    with _buckets_lock:
+        bucket = _buckets.get(rate_limit_key)
+        return bucket is not None and bucket.lease_window_start == window_start
+
+
+def _store_lease(rate_limit_key: str, window_start: int, tokens: int) -> None:
+    """Keep unspent reserved tokens for later requests in the same window (0 records history)."""
+    with _buckets_lock:
+        bucket = _buckets.get(rate_limit_key)
+        if bucket is None:
+            return
+        if bucket.lease_window_start != window_start:
+            bucket.lease_window_start = window_start
+            bucket.lease_tokens = 0
+        bucket.lease_tokens += tokens
+
+
+def _reserve_quota(
+    table,
+    item_key: str,
+    tokens: int,
+    allowed_in_window: int,
+    window_start: int,
+    ttl: int,
+) -> Optional[int]:
+    """
+    Atomically add ``tokens`` to the shared window counter if they fit under the allowance.
+
+    Returns:
+        New request_count, or None if the reservation would exceed the allowance
+
+    Raises:
+        ClientError: For DynamoDB errors other than a failed condition
+    """
+    # Note: 'ttl' is a reserved keyword in DynamoDB, so we use ExpressionAttributeNames to escape it
+    try:
+        response = table.update_item(
+            Key={"rate_limit_key": item_key},
+            UpdateExpression="SET request_count = if_not_exists(request_count, :zero) + :inc, #ttl = :ttl, window_start = :window_start",
+            ConditionExpression="attribute_not_exists(request_count) OR request_count <= :max_before",
+            ExpressionAttributeNames={
+                "#ttl": "ttl",  # Escape reserved keyword 'ttl'
             },
+            ExpressionAttributeValues={
+                ":zero": 0,
+                ":inc": tokens,
+                ":max_before": allowed_in_window - tokens,
+                ":ttl": ttl,
+                ":window_start": window_start,
+            },
+            ReturnValues="UPDATED_NEW",
         )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code", "") == "ConditionalCheckFailedException":
+            return None
+        raise
+    return int(response.get("Attributes", {}).get("request_count", tokens))
+
+
+def _get_previous_window_count(
+    table, rate_limit_key: str, item_prefix: str, window_start: int, window_seconds: int
+) -> int:
+    """
+    Return the final request count of the previous window (sliding mode).
+
+    The previous window is closed, so its count is read from DynamoDB once per
+    window and then served from the local bucket.
+    """
+    previous_start = window_start - window_seconds
+    with _buckets_lock:
+        bucket = _buckets.get(rate_limit_key)
+        if bucket is not None and bucket.previous_window_start == previous_start:
+            return bucket.previous_window_count
+
+    response = table.get_item(Key={"rate_limit_key": f"{item_prefix}#{previous_start}"})
+    count = int(response.get("Item", {}).get("request_count", 0))
+
+    with _buckets_lock:
+        bucket = _buckets.get(rate_limit_key)
+        if bucket is not None:
+            bucket.previous_window_start = previous_start
+            bucket.previous_window_count = count
+    return count
+
+
+def _reject(rate_limit_key: str, limit: int, window_seconds: int, window_start: int, source: str) -> None:
+    """Log, emit metric, and raise RateLimitExceededError."""
+    log_error(
+        "rate_limit_exceeded",
+        {
+            "rate_limit_key": rate_limit_key,
+            "limit": limit,
+            "window_start": window_start,
+            "source": source,
+        },
+    )
+
+    # Emit metric for rate limit exceeded
+    _emit_metric("RateLimitExceeded", 1.0)
+
+    raise RateLimitExceededError(
+        f"Rate limit exceeded: {limit} requests per {window_seconds} seconds"
+    )
 
 
 def _get_rate_limit_table():
+
     """
     Get DynamoDB table for rate limiting.
 
@@ -109,26 +312,34 @@ def _generate_rate_limit_key(team_id: Optional[str], user_id: Optional[str]) ->
     return f"{team}#{user}"
 
 
+
+
 def check_rate_limit(
     team_id: Optional[str],
     user_id: Optional[str],
     limit: Optional[int] = None,
     window_seconds: int = 60,
+    mode: Optional[str] = None,
 ) -> Tuple[bool, Optional[int]]:
     """
     Check if request is within rate limit.
 
-    Implements token bucket algorithm using DynamoDB:
-    - Each user has a bucket with a maximum capacity (limit)
-    - Each request consumes one token
-    - Tokens are replenished at a fixed rate (window_seconds)
-    - If bucket is empty, request is rejected
+    Implements a local-first token bucket backed by a shared DynamoDB window counter:
+    - Each container keeps a bucket per user (capacity = limit, refilled over window_seconds);
+      an empty bucket rejects the request without any DynamoDB call
+    - Tokens left in a lease reserved earlier in the same window are spent locally
+    - Otherwise one token is reserved from the window counter with one conditional
+      update; a key that already reserved from this container in the window reserves
+      RATE_LIMIT_LEASE_SIZE tokens instead, falling back to a single token near the limit
+    - In sliding mode the window allowance is reduced by the previous window's count,
+      weighted by how much of the previous window still overlaps the sliding window
 
     Args:
         team_id: Slack team/workspace ID (optional)
         user_id: Slack user ID (optional)
         limit: Maximum requests per time window (default: from environment variable RATE_LIMIT_PER_MINUTE)
         window_seconds: Time window in seconds (default: 60 = 1 minute)
+        mode: "fixed" or "sliding" (default: from environment variable RATE_LIMIT_MODE)
 
     Returns:
         Tuple of (is_allowed: bool, remaining_requests: Optional[int])
@@ -156,107 +367,134 @@ def check_rate_limit(
     if limit <= 0:
         return True, None
 
+    if mode is None:
+        mode = _get_mode()
+
     # Generate rate limit key
     rate_limit_key = _generate_rate_limit_key(team_id, user_id)
 
     # Get current timestamp (seconds since epoch)
-    current_time = int(time.time())
+    now = time.time()
+    current_time = int(now)
     window_start = (
         current_time // window_seconds
     ) * window_seconds  # Align to window boundary
 
+    try:
+        table = _get_rate_limit_table()
+    except Exception as e:
+        # Unexpected error - log and allow request (graceful degradation)
+        log_error(
+            "rate_limit_unexpected_error",
+            {
+                "rate_limit_key": rate_limit_key,
+            },
+            e,
+        )
+        return True, None
+    if not table:
+        # Table not configured - allow all requests (graceful degradation)
+        log_warn(
+            "rate_limit_table_not_configured",
+            {
+                "rate_limit_key": rate_limit_key,
+            },
+        )
+        return True, None
+
+    # Local bucket first: bursts beyond the limit never reach DynamoDB
+    if not _take_local_token(rate_limit_key, limit, window_seconds, now):
+        _reject(rate_limit_key, limit, window_seconds, window_start, "local_bucket")
+
+    remaining = _take_lease_token(rate_limit_key, window_start)
+    if remaining is not None:
+        log_info(
+            "rate_limit_check_allowed",
+            {
+                "rate_limit_key": rate_limit_key,
+                "limit": limit,
+                "remaining": remaining,
+                "window_start": window_start,
+                "source": "lease",
+            },
+        )
+        _emit_metric("RateLimitRequests", 1.0)
+        return True, remaining
+
     # Create item key with window timestamp
-    item_key = f"{rate_limit_key}#{window_start}"
+    scope = os.environ.get("RATE_LIMIT_SCOPE", "")
+    item_prefix = f"{scope}#{rate_limit_key}" if scope else rate_limit_key
+    item_key = f"{item_prefix}#{window_start}"
 
     try:
-        table = _get_rate_limit_table()
-        if not table:
-            # Table not configured - allow all requests (graceful degradation)
-            log_warn(
-                "rate_limit_table_not_configured",
-                {
-                    "rate_limit_key": rate_limit_key,
-                },
+        allowed_in_window = limit
+        # TTL = window_end + 5 minutes buffer
+        ttl = window_start + window_seconds + 300
+        if mode == RATE_LIMIT_MODE_SLIDING:
+            previous_count = _get_previous_window_count(
+                table, rate_limit_key, item_prefix, window_start, window_seconds
             )
-            return True, None
-
-        # Try to increment request count atomically
-        # Use conditional update to ensure we don't exceed the limit
-        # Note: 'ttl' is a reserved keyword in DynamoDB, so we use ExpressionAttributeNames to escape it
-        try:
-            response = table.update_item(
-                Key={"rate_limit_key": item_key},
-                UpdateExpression="SET request_count = if_not_exists(request_count, :zero) + :inc, #ttl = :ttl, window_start = :window_start",
-                ConditionExpression="attribute_not_exists(request_count) OR request_count < :limit",
-                ExpressionAttributeNames={
-                    "#ttl": "ttl",  # Escape reserved keyword 'ttl'
-                },
-                ExpressionAttributeValues={
-                    ":zero": 0,
-                    ":inc": 1,
-                    ":limit": limit,
-                    ":ttl": current_time
-                    + window_seconds
-                    + 300,  # TTL = window_end + 5 minutes buffer
-                    ":window_start": window_start,
-                },
-                ReturnValues="UPDATED_NEW",
+            overlap = 1.0 - (now - window_start) / window_seconds
+            allowed_in_window = limit - int(previous_count * overlap)
+            # The next window reads this item's count, so keep it one window longer
+            ttl += window_seconds
+
+        if allowed_in_window <= 0:
+            _refund_local_token(rate_limit_key, limit)
+            _reject(rate_limit_key, limit, window_seconds, window_start, "dynamodb")
+
+        lease_size = 1
+        if _has_window_history(rate_limit_key, window_start):
+            lease_size = min(_get_lease_size(), allowed_in_window)
+        new_count = _reserve_quota(
+            table, item_key, lease_size, allowed_in_window, window_start, ttl
+        )
+        if new_count is None and lease_size > 1:
+            # Not enough room for a full lease; take the last tokens one at a time
+            lease_size = 1
+            new_count = _reserve_quota(
+                table, item_key, 1, allowed_in_window, window_start, ttl
             )
+        if new_count is None:
+            _refund_local_token(rate_limit_key, limit)
+            _reject(rate_limit_key, limit, window_seconds, window_start, "dynamodb")
 
-            # Successfully incremented - request is allowed
-            new_count = response.get("Attributes", {}).get("request_count", 1)
-            remaining = max(0, limit - new_count)
+        _store_lease(rate_limit_key, window_start, lease_size - 1)
+        remaining = max(0, allowed_in_window - new_count) + lease_size - 1
 
-            log_info(
-                "rate_limit_check_allowed",
-                {
-                    "rate_limit_key": rate_limit_key,
-                    "request_count": new_count,
-                    "limit": limit,
-                    "remaining": remaining,
-                    "window_start": window_start,
-                },
-            )
+        log_info(
+            "rate_limit_check_allowed",
+            {
+                "rate_limit_key": rate_limit_key,
+                "request_count": new_count,
+                "limit": limit,
+                "remaining": remaining,
+                "window_start": window_start,
+                "lease_size": lease_size,
+                "mode": mode,
+                "source": "dynamodb",
+            },
+        )
+
+        # Emit metric for rate limit check
+        _emit_metric("RateLimitRequests", 1.0)
 
-            # Emit metric for rate limit check
-            _emit_metric("RateLimitRequests", 1.0)
-
-            return True, remaining
-
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "ConditionalCheckFailedException":
-                # Rate limit exceeded - request is rejected
-                log_error(
-                    "rate_limit_exceeded",
-                    {
-                        "rate_limit_key": rate_limit_key,
-                        "limit": limit,
-                        "window_start": window_start,
-                    },
-                )
-
-                # Emit metric for rate limit exceeded
-                _emit_metric("RateLimitExceeded", 1.0)
-
-                raise RateLimitExceededError(
-                    f"Rate limit exceeded: {limit} requests per {window_seconds} seconds"
-                )
-            else:
-                # Other DynamoDB error - log and allow request (graceful degradation)
-                log_error(
-                    "rate_limit_dynamodb_error",
-                    {
-                        "rate_limit_key": rate_limit_key,
-                        "error_code": error_code,
-                    },
-                    e,
-                )
-                return True, None
+        return True, remaining
 
     except RateLimitExceededError:
         # Re-raise rate limit exceeded errors
         raise
+    except ClientError as e:
+        # Other DynamoDB error - log and allow request (graceful degradation)
+        log_error(
+            "rate_limit_dynamodb_error",
+            {
+                "rate_limit_key": rate_limit_key,
+                "error_code": e.response.get("Error", {}).get("Code", ""),
+            },
+            e,
+        )
+        return True, None
     except Exception as e:
         # Unexpected error - log and allow request (graceful degradation)
         log_error(
@@ -0,0 +1,200 @@
+"""
+Slack Web API client for the Lambda (copy of the Verification Agent's slack_api).
+
+slack_sdk's ``WebClient`` opens a new urllib connection, and a new TLS
+handshake, for every call, so Slack calls of this Lambda go through here:
+
+- One process-wide ``requests.Session`` whose connection pool
+  (SLACK_HTTP_POOL_SIZE, default 10) keeps TLS connections to slack.com alive
+  across calls and warm invocations.
+- ``get_slack_client(bot_token)`` returns the cached ``SlackApiClient`` of a
+  token (up to SLACK_CLIENT_CACHE_SIZE tokens, least recently used evicted).
+- HTTP 429 waits for ``Retry-After`` and retries up to SLACK_API_MAX_RETRIES
+  times, unless the wait exceeds SLACK_API_MAX_RETRY_AFTER_SECONDS.
+- ``call()`` returns the response body; a call that stays rate limited returns
+  ``{"ok": False, "error": "ratelimited", "status_code": 429, "retry_after": s}``.
+  The WebClient-style methods (``chat_postMessage``, ``reactions_add``, ...)
+  raise ``slack_sdk.errors.SlackApiError`` when the body is not ok, as
+  ``WebClient`` does, so existing error handling keeps working.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from slack_sdk.errors import SlackApiError
+
+from logger import log_warn
+
+SLACK_API_BASE_URL = "https://slack.com/api/"
+SLACK_HTTP_POOL_SIZE = int(os.environ.get("SLACK_HTTP_POOL_SIZE", "10"))
+SLACK_CLIENT_CACHE_SIZE = int(os.environ.get("SLACK_CLIENT_CACHE_SIZE", "64"))
+SLACK_API_MAX_RETRIES = int(os.environ.get("SLACK_API_MAX_RETRIES", "2"))
+SLACK_API_MAX_RETRY_AFTER_SECONDS = float(os.environ.get("SLACK_API_MAX_RETRY_AFTER_SECONDS", "10"))
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_clients: "OrderedDict[str, SlackApiClient]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _log_rate_limited(data: dict) -> None:
+    log_warn("slack_api_rate_limited", data)
+
+
+def _get_session() -> requests.Session:
+    """Return the shared keep-alive session (created on first use)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SLACK_HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "1")))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _query_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode booleans the way Slack expects them in a query string."""
+    return {
+        key: ("true" if value else "false") if isinstance(value, bool) else value
+        for key, value in params.items()
+        if value is not None
+    }
+
+
+class SlackApiClient:
+    """Slack Web API calls for one bot token over the shared session."""
+
+    def __init__(self, bot_token: str):
+        self._headers = {"Authorization": f"Bearer {bot_token}"}
+
+    def _request(
+        self,
+        method: str,
+        http_method: str,
+        url: str,
+        timeout: float,
+        max_retries: Optional[int],
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request, waiting out HTTP 429 responses within the retry budget."""
+        retries = SLACK_API_MAX_RETRIES if max_retries is None else max_retries
+        session = _get_session()
+        attempt = 0
+        while True:
+            response = session.request(http_method, url, headers=self._headers, timeout=timeout, **kwargs)
+            if response.status_code != 429:
+                return response
+            retry_after = _retry_after_seconds(response)
+            if attempt >= retries or retry_after > SLACK_API_MAX_RETRY_AFTER_SECONDS:
+                return response
+            attempt += 1
+            _log_rate_limited({
+                "method": method,
+                "retry_after_seconds": retry_after,
+                "attempt": attempt,
+                "max_retries": retries,
+            })
+            response.close()
+            time.sleep(retry_after)
+
+    def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        http_method: str = "GET",
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_retries: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call a Slack Web API method and return the parsed JSON body.
+
+        Args:
+            method: Web API method name (e.g. "conversations.replies").
+            params: Query parameters (GET) or JSON body fields (POST).
+            http_method: "GET" or "POST".
+            timeout: Per-attempt timeout in seconds.
+            max_retries: 429 retries for this call (default SLACK_API_MAX_RETRIES;
+                0 returns the rate-limited result immediately).
+
+        Returns:
+            The response body. A response that stayed rate limited is returned as
+            ``{"ok": False, "error": "ratelimited", "status_code": 429, "retry_after": s}``.
+
+        Raises:
+            requests.RequestException: On transport errors and non-429 HTTP errors.
+        """
+        if http_method.upper() == "GET":
+            kwargs = {"params": _query_params(params or {})}
+        else:
+            kwargs = {"json": {k: v for k, v in (params or {}).items() if v is not None}}
+        response = self._request(
+            method, http_method, SLACK_API_BASE_URL + method, timeout, max_retries, **kwargs
+        )
+        if response.status_code == 429:
+            return {
+                "ok": False,
+                "error": "ratelimited",
+                "status_code": 429,
+                "retry_after": _retry_after_seconds(response),
+            }
+        response.raise_for_status()
+        return response.json()
+
+    def _checked_call(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        http_method: str,
+        timeout: float,
+        max_retries: Optional[int],
+    ) -> Dict[str, Any]:
+        """call(), raising SlackApiError when the body is not ok."""
+        data = self.call(method, params, http_method, timeout, max_retries)
+        if not data.get("ok"):
+            raise SlackApiError(f"The request to the Slack API failed. (url: {method})", data)
+        return data
+
+    def chat_postMessage(
+        self,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_retries: Optional[int] = None,
+        **params,
+    ) -> Dict[str, Any]:
+        return self._checked_call("chat.postMessage", params, "POST", timeout, max_retries)
+
+    def reactions_add(
+        self,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_retries: Optional[int] = None,
+        **params,
+    ) -> Dict[str, Any]:
+        return self._checked_call("reactions.add", params, "POST", timeout, max_retries)
+
+
+def get_slack_client(bot_token: str) -> SlackApiClient:
+    """Return the cached client for bot_token, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(bot_token)
+        if client is not None:
+            _clients.move_to_end(bot_token)
+            return client
+        client = SlackApiClient(bot_token)
+        _clients[bot_token] = client
+        while len(_clients) > max(1, SLACK_CLIENT_CACHE_SIZE):
+            _clients.popitem(last=False)
+        return client
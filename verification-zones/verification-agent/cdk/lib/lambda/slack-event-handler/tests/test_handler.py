@@ -695,7 +695,7 @@ class Test016AsyncSqsPath:
                                 ):
                                     with patch("handler.check_entity_existence", return_value=True):
                                         with patch("handler.check_rate_limit", return_value=(True, 10)):
-                                            with patch("handler.WebClient", return_value=Mock()):
+                                            with patch("handler.get_slack_client", return_value=Mock()):
                                                 with patch("handler.boto3.client", side_effect=boto_client):
                                                     context = Mock()
                                                     context.aws_request_id = "req-016-001"
@@ -763,7 +763,7 @@ class Test016AsyncSqsPath:
                                 ):
                                     with patch("handler.check_entity_existence", return_value=True):
                                         with patch("handler.check_rate_limit", return_value=(True, 10)):
-                                            with patch("handler.WebClient", return_value=Mock()):
+                                            with patch("handler.get_slack_client", return_value=Mock()):
                                                 with patch("handler.boto3.client", side_effect=boto_client):
                                                     context = Mock()
                                                     context.aws_request_id = "req-016-002"
@@ -915,7 +915,7 @@ class TestAutoReplyChannelFiltering:
                                 with patch("handler.authorize_request", return_value=Mock(authorized=True, unauthorized_entities=[])):
                                     with patch("handler.check_entity_existence", return_value=True):
                                         with patch("handler.check_rate_limit", return_value=(True, 10)):
-                                            with patch("handler.WebClient", return_value=Mock()):
+                                            with patch("handler.get_slack_client", return_value=Mock()):
                                                 with patch("handler.boto3.client") as mock_boto:
                                                     mock_sqs = Mock()
                                                     mock_boto.return_value = mock_sqs
@@ -938,7 +938,7 @@ class TestAutoReplyChannelFiltering:
                                 with patch("handler.authorize_request", return_value=Mock(authorized=True, unauthorized_entities=[])):
                                     with patch("handler.check_entity_existence", return_value=True):
                                         with patch("handler.check_rate_limit", return_value=(True, 10)):
-                                            with patch("handler.WebClient", return_value=Mock()):
+                                            with patch("handler.get_slack_client", return_value=Mock()):
                                                 with patch("handler.boto3.client") as mock_boto:
                                                     mock_sqs = Mock()
                                                     mock_boto.return_value = mock_sqs
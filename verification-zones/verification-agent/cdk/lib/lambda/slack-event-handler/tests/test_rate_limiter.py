@@ -0,0 +1,215 @@
+"""
+Unit tests for the local-first rate limiter (Slack Event Handler copy).
+
+Covers:
+- Local token bucket rejects bursts without DynamoDB calls
+- Opt-in lease reservation (RATE_LIMIT_LEASE_SIZE) for keys with local history in the
+  window, and single-token fallback near the limit
+- Sliding-window mode weighting the previous window's count
+- RATE_LIMIT_SCOPE key prefix
+- Fail-open behaviour on DynamoDB errors
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import rate_limiter
+from rate_limiter import RateLimitExceededError, check_rate_limit
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _FakeTable:
+    """In-memory stand-in for the rate limit table honouring the conditional update."""
+
+    def __init__(self, items=None):
+        self.items = dict(items or {})
+        self.update_calls = []
+        self.get_calls = []
+
+    def update_item(self, Key, ExpressionAttributeValues, **kwargs):
+        key = Key["rate_limit_key"]
+        values = ExpressionAttributeValues
+        self.update_calls.append((key, values[":inc"]))
+        current = self.items.get(key)
+        if current is not None and current > values[":max_before"]:
+            raise ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+            )
+        self.items[key] = (current or 0) + values[":inc"]
+        return {"Attributes": {"request_count": self.items[key]}}
+
+    def get_item(self, Key):
+        key = Key["rate_limit_key"]
+        self.get_calls.append(key)
+        if key in self.items:
+            return {"Item": {"rate_limit_key": key, "request_count": self.items[key]}}
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch):
+    rate_limiter._reset_local_state()
+    for name in ("RATE_LIMIT_LEASE_SIZE", "RATE_LIMIT_MODE", "RATE_LIMIT_SCOPE"):
+        monkeypatch.delenv(name, raising=False)
+    with patch("rate_limiter._emit_metric"):
+        yield
+    rate_limiter._reset_local_state()
+
+
+def _run(table, now, **kwargs):
+    with patch("rate_limiter._get_rate_limit_table", return_value=table), patch(
+        "rate_limiter.time.time", return_value=now
+    ):
+        return check_rate_limit("T1", "U1", **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Fixed window
+# ---------------------------------------------------------------------------
+
+class TestFixedWindow:
+    def test_allows_up_to_limit_then_rejects(self):
+        table = _FakeTable()
+        for i in range(3):
+            allowed, remaining = _run(table, 600.0 + i, limit=3)
+            assert allowed is True
+            assert remaining == 2 - i
+        with pytest.raises(RateLimitExceededError):
+            _run(table, 604.0, limit=3)
+
+    def test_local_bucket_rejects_without_dynamodb_call(self):
+        table = _FakeTable()
+        for _ in range(3):
+            _run(table, 600.0, limit=3)
+        calls_before = len(table.update_calls)
+        with pytest.raises(RateLimitExceededError):
+            _run(table, 600.0, limit=3)
+        assert len(table.update_calls) == calls_before
+
+    def test_shared_counter_rejection_refunds_local_token(self):
+        # Another container already used the whole window
+        table = _FakeTable({"T1#U1#600": 3})
+        with pytest.raises(RateLimitExceededError):
+            _run(table, 601.0, limit=3)
+        bucket = rate_limiter._buckets["T1#U1"]
+        assert bucket.tokens == 3.0
+
+    def test_scope_prefixes_item_key(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_SCOPE", "agent")
+        table = _FakeTable()
+        _run(table, 600.0, limit=3)
+        assert [key for key, _ in table.update_calls] == ["agent#T1#U1#600"]
+
+    def test_dynamodb_error_fails_open(self):
+        table = _FakeTable()
+        with patch.object(
+            table,
+            "update_item",
+            side_effect=ClientError({"Error": {"Code": "ProvisionedThroughputExceededException"}}, "UpdateItem"),
+        ):
+            assert _run(table, 600.0, limit=3) == (True, None)
+
+
+# ---------------------------------------------------------------------------
+# Leases
+# ---------------------------------------------------------------------------
+
+class TestLeases:
+    def test_leases_disabled_by_default(self):
+        table = _FakeTable()
+        for _ in range(2):
+            _run(table, 600.0, limit=10)
+        assert rate_limiter.DEFAULT_RATE_LIMIT_LEASE_SIZE == 1
+        assert table.update_calls == [("T1#U1#600", 1), ("T1#U1#600", 1)]
+
+    def test_first_request_in_window_reserves_single_token(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_LEASE_SIZE", "5")
+        table = _FakeTable()
+        _run(table, 600.0, limit=10)
+        assert table.update_calls == [("T1#U1#600", 1)]
+
+    def test_lease_size_one_disables_leases(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_LEASE_SIZE", "1")
+        table = _FakeTable()
+        for _ in range(2):
+            _run(table, 600.0, limit=10)
+        assert table.update_calls == [("T1#U1#600", 1), ("T1#U1#600", 1)]
+
+    def test_lease_serves_following_requests_locally(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_LEASE_SIZE", "3")
+        table = _FakeTable()
+        for _ in range(4):
+            assert _run(table, 600.0, limit=10)[0] is True
+        assert table.update_calls == [("T1#U1#600", 1), ("T1#U1#600", 3)]
+        _run(table, 600.0, limit=10)
+        assert table.update_calls[-1] == ("T1#U1#600", 3)
+        assert table.items["T1#U1#600"] == 7
+
+    def test_lease_falls_back_to_single_token_near_limit(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_LEASE_SIZE", "3")
+        table = _FakeTable({"T1#U1#600": 7})
+        _run(table, 600.0, limit=10)
+        allowed, remaining = _run(table, 600.0, limit=10)
+        assert allowed is True
+        assert remaining == 1
+        assert table.update_calls == [("T1#U1#600", 1), ("T1#U1#600", 3), ("T1#U1#600", 1)]
+
+    def test_lease_expires_with_window(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_LEASE_SIZE", "3")
+        table = _FakeTable()
+        _run(table, 600.0, limit=10)
+        _run(table, 660.0, limit=10)
+        assert [key for key, _ in table.update_calls] == ["T1#U1#600", "T1#U1#660"]
+
+    def test_fresh_containers_still_get_full_limit(self, monkeypatch):
+        # Each request lands on a new container (new AgentCore session / cold Lambda)
+        monkeypatch.setenv("RATE_LIMIT_LEASE_SIZE", "5")
+        table = _FakeTable()
+        for i in range(10):
+            rate_limiter._reset_local_state()
+            assert _run(table, 600.0 + i, limit=10)[0] is True
+        rate_limiter._reset_local_state()
+        with pytest.raises(RateLimitExceededError):
+            _run(table, 611.0, limit=10)
+        assert table.items["T1#U1#600"] == 10
+
+
+# ---------------------------------------------------------------------------
+# Sliding window
+# ---------------------------------------------------------------------------
+
+class TestSlidingWindow:
+    def test_previous_window_reduces_allowance(self):
+        # 15 seconds into the window: 75% of the previous window (8 requests) still counts
+        table = _FakeTable({"T1#U1#540": 8})
+        allowed, remaining = _run(table, 615.0, limit=10, mode="sliding")
+        assert allowed is True
+        assert remaining == 3  # allowance 10 - int(8 * 0.75) = 4, one used
+        assert table.get_calls == ["T1#U1#540"]
+
+    def test_rejects_when_previous_window_fills_allowance(self):
+        table = _FakeTable({"T1#U1#540": 10})
+        with pytest.raises(RateLimitExceededError):
+            _run(table, 600.0, limit=10, mode="sliding")
+        assert table.update_calls == []
+
+    def test_previous_window_count_cached_per_window(self):
+        table = _FakeTable({"T1#U1#540": 4})
+        _run(table, 630.0, limit=10, mode="sliding")
+        _run(table, 631.0, limit=10, mode="sliding")
+        assert table.get_calls == ["T1#U1#540"]
+
+    def test_mode_from_environment(self, monkeypatch):
+        monkeypatch.setenv("RATE_LIMIT_MODE", "sliding")
+        table = _FakeTable()
+        _run(table, 600.0, limit=10)
+        assert table.get_calls == ["T1#U1#540"]
@@ -0,0 +1,119 @@
+"""
+Unit tests for the Lambda's Slack Web API client.
+
+Covers:
+- One keep-alive session shared by all calls
+- Per-token client reuse with LRU eviction
+- HTTP 429 Retry-After handling
+- SlackApiError from the WebClient-style methods
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import slack_api
+from slack_api import get_slack_client
+
+
+def _response(status_code=200, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body or {}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients():
+    slack_api._clients.clear()
+    yield
+    slack_api._clients.clear()
+
+
+@pytest.fixture
+def session():
+    mock_session = MagicMock()
+    with patch("slack_api._get_session", return_value=mock_session), \
+         patch("slack_api.time.sleep") as mock_sleep:
+        mock_session.sleep = mock_sleep
+        yield mock_session
+
+
+class TestClientCache:
+    def test_same_token_reuses_client(self):
+        assert get_slack_client("xoxb-a") is get_slack_client("xoxb-a")
+        assert get_slack_client("xoxb-a") is not get_slack_client("xoxb-b")
+
+    def test_least_recently_used_token_evicted(self):
+        with patch.object(slack_api, "SLACK_CLIENT_CACHE_SIZE", 2):
+            get_slack_client("xoxb-1")
+            get_slack_client("xoxb-2")
+            get_slack_client("xoxb-1")
+            get_slack_client("xoxb-3")
+
+            assert list(slack_api._clients) == ["xoxb-1", "xoxb-3"]
+
+    def test_session_is_shared_and_pooled(self):
+        with patch.object(slack_api, "_session", None):
+            session = slack_api._get_session()
+            assert slack_api._get_session() is session
+            assert session.get_adapter("https://slack.com/api/")._pool_maxsize == slack_api.SLACK_HTTP_POOL_SIZE
+
+
+class TestCall:
+    def test_get_call_sends_token_and_query(self, session):
+        session.request.return_value = _response(body={"ok": True})
+
+        data = get_slack_client("xoxb-t").call("users.info", {"user": "U1", "include_locale": True}, timeout=2)
+
+        assert data == {"ok": True}
+        args, kwargs = session.request.call_args
+        assert args == ("GET", "https://slack.com/api/users.info")
+        assert kwargs["headers"] == {"Authorization": "Bearer xoxb-t"}
+        assert kwargs["params"] == {"user": "U1", "include_locale": "true"}
+        assert kwargs["timeout"] == 2
+
+    def test_rate_limited_call_waits_for_retry_after(self, session):
+        session.request.side_effect = [
+            _response(429, headers={"Retry-After": "3"}),
+            _response(body={"ok": True}),
+        ]
+
+        data = get_slack_client("xoxb-t").call("users.info", {"user": "U1"})
+
+        assert data == {"ok": True}
+        session.sleep.assert_called_once_with(3.0)
+
+    def test_no_retries_returns_rate_limited_result(self, session):
+        session.request.return_value = _response(429, headers={"Retry-After": "7"})
+
+        data = get_slack_client("xoxb-t").call("team.info", {"team": "T1"}, max_retries=0)
+
+        assert data == {"ok": False, "error": "ratelimited", "status_code": 429, "retry_after": 7.0}
+        session.sleep.assert_not_called()
+
+
+class TestWebClientStyleMethods:
+    def test_post_sends_json_body(self, session):
+        session.request.return_value = _response(body={"ok": True, "ts": "1.1"})
+
+        data = get_slack_client("xoxb-t").chat_postMessage(channel="C1", text="hi")
+
+        assert data["ts"] == "1.1"
+        args, kwargs = session.request.call_args
+        assert args == ("POST", "https://slack.com/api/chat.postMessage")
+        assert kwargs["json"] == {"channel": "C1", "text": "hi"}
+
+    def test_error_body_raises_slack_api_error(self, session):
+        session.request.return_value = _response(body={"ok": False, "error": "already_reacted"})
+
+        with pytest.raises(SlackApiError) as exc_info:
+            get_slack_client("xoxb-t").reactions_add(channel="C1", name="eyes", timestamp="1.0")
+
+        assert exc_info.value.response.get("error") == "already_reacted"
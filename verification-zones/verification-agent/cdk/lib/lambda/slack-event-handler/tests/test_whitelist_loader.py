@@ -583,3 +583,48 @@ class TestWhitelistManagement:
             assert "T123ABC" in result2["team_ids"]  # Still in cache
             assert mock_env.call_count == 1  # Should NOT call get_whitelist_from_env again
 
+
+
+class TestPaginationAndBackgroundRefresh:
+    """Test paginated DynamoDB loading and refresh-ahead caching."""
+
+    def setup_method(self):
+        import whitelist_loader
+        whitelist_loader._whitelist_cache = None
+        whitelist_loader._refresh_in_progress = False
+
+    @patch('whitelist_loader._get_dynamodb_client')
+    @patch.dict(os.environ, {'WHITELIST_TABLE_NAME': 'test-whitelist-table'})
+    def test_get_whitelist_from_dynamodb_follows_pagination(self, mock_get_client):
+        """Items on later pages (LastEvaluatedKey) are not dropped."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.query.side_effect = [
+            {"Items": [{"entity_id": {"S": "T1"}}], "LastEvaluatedKey": {"entity_id": {"S": "T1"}}},
+            {"Items": [{"entity_id": {"S": "T2"}}]},
+            {"Items": []},  # user_id
+            {"Items": []},  # channel_id
+        ]
+
+        result = get_whitelist_from_dynamodb()
+
+        assert result["team_ids"] == {"T1", "T2"}
+        assert mock_client.query.call_args_list[1][1]["ExclusiveStartKey"] == {"entity_id": {"S": "T1"}}
+
+    @patch('whitelist_loader._schedule_refresh')
+    @patch('whitelist_loader.get_whitelist_from_dynamodb')
+    def test_load_whitelist_near_expiry_serves_cache_and_refreshes_in_background(self, mock_dynamodb, mock_schedule):
+        """A cache close to expiry is served while a background refresh is scheduled."""
+        import whitelist_loader
+
+        whitelist_loader._whitelist_cache = whitelist_loader._build_cache_entry(
+            {"team_ids": {"T123ABC"}, "user_ids": set(), "channel_ids": set()},
+            "dynamodb",
+            int(time.time()) - whitelist_loader._cache_ttl + 1,
+        )
+
+        result = load_whitelist_config()
+
+        assert "T123ABC" in result["team_ids"]
+        mock_dynamodb.assert_not_called()
+        mock_schedule.assert_called_once()
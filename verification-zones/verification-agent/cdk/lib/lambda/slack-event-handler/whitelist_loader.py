@@ -6,62 +6,55 @@ This module loads whitelist configuration from multiple sources with priority:
 2. AWS Secrets Manager (secondary) - secure, encrypted, rotation support
 3. Environment variables (fallback) - simple, requires redeploy
 
-Configuration is cached in memory for 5 minutes to minimize latency.
+Configuration is cached in memory for 5 minutes to minimize latency and is
+refreshed in the background before it expires.
 The system follows fail-closed principle: all requests are rejected when
 configuration cannot be loaded or whitelist is empty.
 """
 
 import os
 import json
+import threading
 import time
 import boto3
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from botocore.exceptions import ClientError
+from cloudwatch_metrics import emit_metric
 from logger import log_info, log_warn, log_error
 
-# CloudWatch client for metrics
-_cloudwatch_client = None
-
-
-def _get_cloudwatch_client():
-    """Get CloudWatch client (singleton pattern)."""
-    global _cloudwatch_client
-    if _cloudwatch_client is None:
-        _cloudwatch_client = boto3.client("cloudwatch", region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"))
-    return _cloudwatch_client
-
-
+# CloudWatch metrics
 def _emit_metric(metric_name: str, value: float, unit: str = "Count") -> None:
     """
-    Emit CloudWatch custom metric.
-    
+    Emit CloudWatch custom metric (buffered and flushed in batches by cloudwatch_metrics).
+
     Args:
         metric_name: Metric name (e.g., "WhitelistConfigLoadErrors")
         value: Metric value
         unit: Metric unit (default: "Count")
     """
-    try:
-        client = _get_cloudwatch_client()
-        client.put_metric_data(
-            Namespace="SlackEventHandler",
-            MetricData=[
-                {
-                    "MetricName": metric_name,
-                    "Value": value,
-                    "Unit": unit,
-                }
-            ],
-        )
-    except Exception as e:
-        # Log but don't fail on metric emission errors
-        log_warn("cloudwatch_metric_emission_failed", {
-            "metric_name": metric_name,
-            "error": str(e),
-        })
+    emit_metric("SlackEventHandler", metric_name, value, unit)
 
 # In-memory cache for whitelist configuration
 _whitelist_cache: Optional[Dict[str, Any]] = None
 _cache_ttl: int = 300  # 5 minutes in seconds
+# Refresh in the background once the last full load is this close to expiry,
+# so no request has to wait for a reload while the cache is warm
+_refresh_ahead_seconds: int = int(os.environ.get("WHITELIST_REFRESH_AHEAD_SECONDS", "60"))
+# Apply DynamoDB changes (items whose updated_at is newer than the last load) this
+# often between full loads; 0 disables incremental refresh
+_incremental_refresh_seconds: int = int(os.environ.get("WHITELIST_INCREMENTAL_REFRESH_SECONDS", "0"))
+# updated_at watermark overlap to tolerate clock skew between writers
+_WATERMARK_OVERLAP_SECONDS = 60
+
+_refresh_lock = threading.Lock()
+_refresh_in_progress = False
+
+# DynamoDB entity_type -> (id set key, label dict key)
+_ENTITY_KEYS: Dict[str, Tuple[str, str]] = {
+    "team_id": ("team_ids", "team_labels"),
+    "user_id": ("user_ids", "user_labels"),
+    "channel_id": ("channel_ids", "channel_labels"),
+}
 
 
 class AuthorizationError(Exception):
@@ -82,37 +75,80 @@ def _get_secrets_manager_client():
 def _is_cache_valid() -> bool:
     """
     Check if cache is still valid (within TTL).
-    
+
     Returns:
         True if cache exists and is within TTL, False otherwise
     """
     global _whitelist_cache
     if _whitelist_cache is None:
         return False
-    
+
     cached_at = _whitelist_cache.get("cached_at", 0)
     current_time = int(time.time())
     return (current_time - cached_at) < _cache_ttl
 
 
+def _query_entity_items(
+    dynamodb, table_name: str, entity_type: str, since: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every whitelist item of one entity type, following LastEvaluatedKey.
+
+    Args:
+        dynamodb: boto3 DynamoDB client
+        table_name: Whitelist table name
+        entity_type: Partition key value (team_id, user_id, channel_id)
+        since: If set, only items with updated_at greater than this epoch second
+    """
+    kwargs: Dict[str, Any] = {
+        "TableName": table_name,
+        "KeyConditionExpression": "entity_type = :entity_type",
+        "ExpressionAttributeValues": {":entity_type": {"S": entity_type}},
+    }
+    if since is not None:
+        kwargs["FilterExpression"] = "updated_at > :since"
+        kwargs["ExpressionAttributeValues"][":since"] = {"N": str(since)}
+    while True:
+        response = dynamodb.query(**kwargs)
+        yield from response.get("Items", [])
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        kwargs["ExclusiveStartKey"] = last_key
+
+
+def _parse_whitelist_item(item: Dict[str, Any]) -> Tuple[Optional[str], str, bool, int]:
+    """Return (entity_id, label, deleted, updated_at) from a low-level DynamoDB item."""
+    entity_id = item.get("entity_id", {}).get("S")
+    label = item.get("label", {}).get("S", "")
+    deleted = bool(item.get("deleted", {}).get("BOOL", False))
+    try:
+        updated_at = int(item.get("updated_at", {}).get("N", "0"))
+    except ValueError:
+        updated_at = 0
+    return entity_id, label, deleted, updated_at
+
+
 def get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
     """
     Load whitelist configuration from DynamoDB table.
-    
-    Queries DynamoDB table for all entity types (team_id, user_id, channel_id)
-    and returns a dictionary with sets of allowed IDs.
-    
+
+    Queries DynamoDB table for all entity types (team_id, user_id, channel_id),
+    following pagination, and returns a dictionary with sets of allowed IDs.
+    Items marked ``deleted`` are skipped. The result also carries a
+    ``watermark`` (epoch seconds) from which incremental refresh continues.
+
     Returns:
         Dictionary with keys: "team_ids", "user_ids", "channel_ids"
         Each value is a set of allowed entity IDs
-        
+
     Raises:
         AuthorizationError: If DynamoDB access fails or table is empty
     """
     table_name = os.environ.get("WHITELIST_TABLE_NAME")
     if not table_name:
         raise AuthorizationError("WHITELIST_TABLE_NAME environment variable not set")
-    
+
     try:
         dynamodb = _get_dynamodb_client()
         whitelist: Dict[str, Any] = {
@@ -125,36 +161,15 @@ def get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
         }
 
         # Query each entity type
-        for entity_type in ["team_id", "user_id", "channel_id"]:
+        for entity_type, (ids_key, labels_key) in _ENTITY_KEYS.items():
             try:
-                response = dynamodb.query(
-                    TableName=table_name,
-                    KeyConditionExpression="entity_type = :entity_type",
-                    ExpressionAttributeValues={
-                        ":entity_type": {"S": entity_type}
-                    }
-                )
-
-                # Extract entity IDs from response
-                for item in response.get("Items", []):
-                    entity_id = item.get("entity_id", {}).get("S")
-                    if entity_id:
-                        # Map entity_type to dictionary key
-                        if entity_type == "team_id":
-                            whitelist["team_ids"].add(entity_id)
-                            label = item.get("label", {}).get("S", "")
-                            if label:
-                                whitelist["team_labels"][entity_id] = label
-                        elif entity_type == "user_id":
-                            whitelist["user_ids"].add(entity_id)
-                            label = item.get("label", {}).get("S", "")
-                            if label:
-                                whitelist["user_labels"][entity_id] = label
-                        elif entity_type == "channel_id":
-                            whitelist["channel_ids"].add(entity_id)
-                            label = item.get("label", {}).get("S", "")
-                            if label:
-                                whitelist["channel_labels"][entity_id] = label
+                for item in _query_entity_items(dynamodb, table_name, entity_type):
+                    entity_id, label, deleted, _ = _parse_whitelist_item(item)
+                    if not entity_id or deleted:
+                        continue
+                    whitelist[ids_key].add(entity_id)
+                    if label:
+                        whitelist[labels_key][entity_id] = label
             except ClientError as e:
                 error_code = e.response.get("Error", {}).get("Code", "")
                 if error_code == "ResourceNotFoundException":
@@ -165,16 +180,19 @@ def get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
                     })
                 else:
                     raise
-        
+
+        # Changes written after this point are picked up by incremental refresh
+        whitelist["watermark"] = int(time.time()) - _WATERMARK_OVERLAP_SECONDS
+
         log_info("whitelist_loaded_from_dynamodb", {
             "table_name": table_name,
             "team_ids_count": len(whitelist["team_ids"]),
             "user_ids_count": len(whitelist["user_ids"]),
             "channel_ids_count": len(whitelist["channel_ids"]),
         })
-        
+
         return whitelist
-        
+
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "")
         error_message = e.response.get("Error", {}).get("Message", str(e))
@@ -191,6 +209,36 @@ def get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
         raise AuthorizationError(f"Unexpected error loading whitelist from DynamoDB: {str(e)}")
 
 
+def get_whitelist_changes_from_dynamodb(since: int) -> List[Tuple[str, str, str, bool, int]]:
+    """
+    Read whitelist items changed after ``since`` (incremental refresh).
+
+    Only items that carry an ``updated_at`` epoch-second attribute are seen;
+    removals are picked up through ``deleted`` tombstones or the next full load.
+
+    Returns:
+        List of (entity_type, entity_id, label, deleted, updated_at)
+
+    Raises:
+        AuthorizationError: If DynamoDB access fails
+    """
+    table_name = os.environ.get("WHITELIST_TABLE_NAME")
+    if not table_name:
+        raise AuthorizationError("WHITELIST_TABLE_NAME environment variable not set")
+
+    try:
+        dynamodb = _get_dynamodb_client()
+        changes = []
+        for entity_type in _ENTITY_KEYS:
+            for item in _query_entity_items(dynamodb, table_name, entity_type, since=since):
+                entity_id, label, deleted, updated_at = _parse_whitelist_item(item)
+                if entity_id:
+                    changes.append((entity_type, entity_id, label, deleted, updated_at))
+        return changes
+    except Exception as e:
+        raise AuthorizationError(f"Failed to load whitelist changes from DynamoDB: {str(e)}")
+
+
 def get_whitelist_from_secrets_manager() -> Dict[str, Set[str]]:
     """
     Load whitelist configuration from AWS Secrets Manager.
@@ -385,79 +433,55 @@ def get_whitelist_from_env() -> Dict[str, Set[str]]:
     return whitelist
 
 
-def load_whitelist_config() -> Dict[str, Set[str]]:
+def _load_from_sources() -> Tuple[Dict[str, Any], str]:
     """
-    Load whitelist configuration with priority order and caching.
-    
-    Priority order:
-    1. DynamoDB (preferred)
-    2. AWS Secrets Manager (secondary)
-    3. Environment variables (fallback)
-    
-    Configuration is cached in memory for 5 minutes (300 seconds).
-    Cache is invalidated after TTL expires.
-    
+    Load whitelist configuration from the first source that succeeds.
+
     Returns:
-        Dictionary with keys: "team_ids", "user_ids", "channel_ids"
-        Each value is a set of allowed entity IDs
-        
+        Tuple of (whitelist dict, source name)
+
     Raises:
-        AuthorizationError: If all sources fail or whitelist is empty
+        AuthorizationError: If all sources fail
     """
-    global _whitelist_cache
-    
-    # Check cache first
-    if _is_cache_valid():
-        log_info("whitelist_cache_hit", {
-            "cached_at": _whitelist_cache.get("cached_at"),
-        })
-        return {
-            "team_ids": _whitelist_cache["team_ids"],
-            "user_ids": _whitelist_cache["user_ids"],
-            "channel_ids": _whitelist_cache["channel_ids"],
-            "team_labels": _whitelist_cache.get("team_labels", {}),
-            "user_labels": _whitelist_cache.get("user_labels", {}),
-            "channel_labels": _whitelist_cache.get("channel_labels", {}),
-        }
-    
-    # Cache miss or expired - load from source
-    log_info("whitelist_cache_miss", {})
-    
     whitelist: Optional[Dict[str, Set[str]]] = None
+    source = ""
     last_error: Optional[str] = None
-    
+
     # Try DynamoDB first (priority 1)
     try:
         whitelist = get_whitelist_from_dynamodb()
+        source = "dynamodb"
         log_info("whitelist_source_dynamodb", {})
     except AuthorizationError as e:
         last_error = str(e)
         log_warn("whitelist_dynamodb_failed", {
             "error": str(e),
         })
-    
+
     # Try Secrets Manager if DynamoDB failed (priority 2)
     if whitelist is None:
         try:
             whitelist = get_whitelist_from_secrets_manager()
+            source = "secrets_manager"
             log_info("whitelist_source_secrets_manager", {})
         except AuthorizationError as e:
             last_error = str(e)
             log_warn("whitelist_secrets_manager_failed", {
                 "error": str(e),
             })
-    
+
     # Try environment variables if both failed (priority 3)
     if whitelist is None:
         try:
             whitelist = get_whitelist_from_env()
+            source = "env"
             log_info("whitelist_source_env", {})
         except AuthorizationError as e:
             last_error = str(e)
             log_error("whitelist_env_failed", {
                 "error": str(e),
             })
-    
+
     # If all sources failed, raise error (fail-closed)
     if whitelist is None:
         error_message = f"Failed to load whitelist from all sources. Last error: {last_error}"
@@ -467,32 +491,187 @@ def load_whitelist_config() -> Dict[str, Set[str]]:
         # Emit metric for config load error
         _emit_metric("WhitelistConfigLoadErrors", 1.0)
         raise AuthorizationError(error_message)
-    
-    # Cache the whitelist
-    _whitelist_cache = {
-        "team_ids": whitelist["team_ids"],
-        "user_ids": whitelist["user_ids"],
-        "channel_ids": whitelist["channel_ids"],
-        "team_labels": whitelist.get("team_labels", {}),
-        "user_labels": whitelist.get("user_labels", {}),
-        "channel_labels": whitelist.get("channel_labels", {}),
-        "cached_at": int(time.time()),
+
+    return whitelist, source
+
+
+def _build_cache_entry(
+    whitelist: Dict[str, Any],
+    source: str,
+    now: int,
+    full_loaded_at: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Freeze a loaded whitelist into an immutable cache entry (frozenset ID index)."""
+    return {
+        "team_ids": frozenset(whitelist["team_ids"]),
+        "user_ids": frozenset(whitelist["user_ids"]),
+        "channel_ids": frozenset(whitelist["channel_ids"]),
+        "team_labels": dict(whitelist.get("team_labels", {})),
+        "user_labels": dict(whitelist.get("user_labels", {})),
+        "channel_labels": dict(whitelist.get("channel_labels", {})),
+        "cached_at": now,
         "ttl": _cache_ttl,
+        "source": source,
+        "full_loaded_at": now if full_loaded_at is None else full_loaded_at,
+        "watermark": whitelist.get("watermark"),
     }
 
-    log_info("whitelist_loaded_and_cached", {
-        "team_ids_count": len(whitelist["team_ids"]),
-        "user_ids_count": len(whitelist["user_ids"]),
-        "channel_ids_count": len(whitelist["channel_ids"]),
-        "cached_at": _whitelist_cache["cached_at"],
-    })
 
+def _cache_view(cache: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the public whitelist dict for a cache entry."""
     return {
-        "team_ids": whitelist["team_ids"],
-        "user_ids": whitelist["user_ids"],
-        "channel_ids": whitelist["channel_ids"],
-        "team_labels": whitelist.get("team_labels", {}),
-        "user_labels": whitelist.get("user_labels", {}),
-        "channel_labels": whitelist.get("channel_labels", {}),
+        "team_ids": cache["team_ids"],
+        "user_ids": cache["user_ids"],
+        "channel_ids": cache["channel_ids"],
+        "team_labels": cache.get("team_labels", {}),
+        "user_labels": cache.get("user_labels", {}),
+        "channel_labels": cache.get("channel_labels", {}),
     }
 
+
+def _apply_whitelist_changes(
+    base: Dict[str, Any], changes: List[Tuple[str, str, str, bool, int]], now: int
+) -> Dict[str, Any]:
+    """Build a new cache entry from ``base`` with incremental changes applied."""
+    whitelist: Dict[str, Any] = {}
+    for ids_key, labels_key in _ENTITY_KEYS.values():
+        whitelist[ids_key] = set(base[ids_key])
+        whitelist[labels_key] = dict(base.get(labels_key, {}))
+    for entity_type, entity_id, label, deleted, _ in changes:
+        ids_key, labels_key = _ENTITY_KEYS[entity_type]
+        if deleted:
+            whitelist[ids_key].discard(entity_id)
+            whitelist[labels_key].pop(entity_id, None)
+            continue
+        whitelist[ids_key].add(entity_id)
+        if label:
+            whitelist[labels_key][entity_id] = label
+        else:
+            whitelist[labels_key].pop(entity_id, None)
+    whitelist["watermark"] = now - _WATERMARK_OVERLAP_SECONDS
+    return _build_cache_entry(whitelist, base["source"], now, full_loaded_at=base["full_loaded_at"])
+
+
+def _full_reload_due(cache: Dict[str, Any], now: int) -> bool:
+    full_loaded_at = cache.get("full_loaded_at", cache.get("cached_at", 0))
+    return now - full_loaded_at >= _cache_ttl - _refresh_ahead_seconds
+
+
+def _incremental_refresh_due(cache: Dict[str, Any], now: int) -> bool:
+    return (
+        _incremental_refresh_seconds > 0
+        and cache.get("source") == "dynamodb"
+        and cache.get("watermark") is not None
+        and now - cache.get("cached_at", 0) >= _incremental_refresh_seconds
+    )
+
+
+def _refresh_whitelist_cache(base: Dict[str, Any]) -> None:
+    """
+    Background refresh: full reload near expiry, otherwise incremental changes.
+
+    The new entry is installed only if the cache still holds ``base``. On failure
+    the current entry keeps serving until it expires, after which the next request
+    reloads synchronously (fail-closed if every source fails).
+    """
+    global _whitelist_cache, _refresh_in_progress
+    try:
+        now = int(time.time())
+        if _full_reload_due(base, now):
+            mode = "full"
+            whitelist, source = _load_from_sources()
+            entry = _build_cache_entry(whitelist, source, now)
+        else:
+            mode = "incremental"
+            changes = get_whitelist_changes_from_dynamodb(base["watermark"])
+            entry = _apply_whitelist_changes(base, changes, now)
+
+        with _refresh_lock:
+            installed = _whitelist_cache is base
+            if installed:
+                _whitelist_cache = entry
+
+        log_info("whitelist_background_refresh_completed", {
+            "mode": mode,
+            "installed": installed,
+            "team_ids_count": len(entry["team_ids"]),
+            "user_ids_count": len(entry["user_ids"]),
+            "channel_ids_count": len(entry["channel_ids"]),
+        })
+    except Exception as e:
+        log_warn("whitelist_background_refresh_failed", {
+            "error": str(e),
+        })
+    finally:
+        with _refresh_lock:
+            _refresh_in_progress = False
+
+
+def _schedule_refresh(base: Dict[str, Any]) -> None:
+    """Start a background refresh unless one is already running."""
+    global _refresh_in_progress
+    with _refresh_lock:
+        if _refresh_in_progress:
+            return
+        _refresh_in_progress = True
+    threading.Thread(
+        target=_refresh_whitelist_cache,
+        args=(base,),
+        name="whitelist-refresh",
+        daemon=True,
+    ).start()
+
+
+def load_whitelist_config() -> Dict[str, Set[str]]:
+    """
+    Load whitelist configuration with priority order and caching.
+
+    Priority order:
+    1. DynamoDB (preferred)
+    2. AWS Secrets Manager (secondary)
+    3. Environment variables (fallback)
+
+    Configuration is cached in memory for 5 minutes (300 seconds) as frozensets.
+    Once the last full load is within WHITELIST_REFRESH_AHEAD_SECONDS of expiry,
+    the cached value keeps being served while a background thread reloads it;
+    with WHITELIST_INCREMENTAL_REFRESH_SECONDS set, DynamoDB changes are applied
+    in the background between full loads. Only a cold or expired cache blocks
+    the caller.
+
+    Returns:
+        Dictionary with keys: "team_ids", "user_ids", "channel_ids"
+        Each value is a set of allowed entity IDs
+
+    Raises:
+        AuthorizationError: If all sources fail or whitelist is empty
+    """
+    global _whitelist_cache
+
+    # Check cache first
+    cache = _whitelist_cache
+    if _is_cache_valid() and cache is not None:
+        log_info("whitelist_cache_hit", {
+            "cached_at": cache.get("cached_at"),
+        })
+        now = int(time.time())
+        if _full_reload_due(cache, now) or _incremental_refresh_due(cache, now):
+            _schedule_refresh(cache)
+        return _cache_view(cache)
+
+    # Cache miss or expired - load from source
+    log_info("whitelist_cache_miss", {})
+
+    whitelist, source = _load_from_sources()
+
+    # Cache the whitelist
+    cache = _build_cache_entry(whitelist, source, int(time.time()))
+    _whitelist_cache = cache
+
+    log_info("whitelist_loaded_and_cached", {
+        "team_ids_count": len(cache["team_ids"]),
+        "user_ids_count": len(cache["user_ids"]),
+        "channel_ids_count": len(cache["channel_ids"]),
+        "cached_at": cache["cached_at"],
+    })
+
+    return _cache_view(cache)
@@ -4,23 +4,40 @@ Slack Poster Lambda: consumes SQS messages from Verification Agent and posts to
 Verification Agent no longer calls Slack API; it sends a structured "post request" to this
 queue. This Lambda performs the actual chat.postMessage and files.upload.
 
-Message body (JSON): channel, thread_ts?, text?, file_artifact?, bot_token, correlation_id?
+Message body (JSON): channel, thread_ts?, text?, file_artifact?, bot_token, correlation_id?, stream?
 See contracts/slack-post-request.md in repo docs for the post-request schema.
 file_artifact supports s3PresignedUrl (fetch) or contentBase64 (inline).
+
+Streamed answers carry stream = {id, seq, final}. The first request of a stream is
+posted with Slack message metadata naming the stream; later requests edit that
+message with chat.update. The container remembers the message ts and last applied
+seq per stream id, so the thread is only scanned (conversations.replies) when a
+container sees a stream for the first time or an edit of the remembered message
+fails. Partials older than the last applied seq are dropped, and the final request
+replaces the partial text. A final request whose partial message is missing is
+posted as a new message tagged final, so partials redelivered later are dropped
+as stale.
+
+The queue is FIFO with one message group per answer: records of a group are
+applied in order, and once a record fails the group's later records in the batch
+are returned as failures without being processed, so they are retried in order.
 """
 
 import base64
 import json
+import os
 import re
 import time
 import traceback
 import urllib.request
+from collections import OrderedDict
 from typing import Any, List, Optional
 from urllib.parse import urlparse
 
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+from slack_api import SlackApiClient, get_slack_client
+
 
 def _log(level: str, event: str, data: Optional[dict] = None) -> None:
     entry = {"level": level, "event": event, "service": "slack-poster"}
@@ -57,7 +74,7 @@ def _split_message(text: str, max_length: int = 4000) -> List[str]:
 
 
 def _post_text(
-    client: WebClient,
+    client: SlackApiClient,
     channel: str,
     text: str,
     thread_ts: Optional[str],
@@ -69,6 +86,171 @@ def _post_text(
         client.chat_postMessage(**params)
 
 
+# Slack message metadata event type identifying a streamed answer
+STREAM_METADATA_EVENT_TYPE = "slack_ai_stream"
+# Partial text is truncated to one Slack message; the final text is split as usual
+_STREAM_PARTIAL_MAX_LENGTH = 4000
+
+
+# Stream id -> {"ts", "seq", "final"} of its message, kept across warm invocations.
+# The queue is FIFO per answer, so the remembered seq is the last one applied.
+STREAM_MESSAGE_CACHE_SIZE = int(os.environ.get("STREAM_MESSAGE_CACHE_SIZE", "256"))
+_stream_messages: "OrderedDict[str, dict]" = OrderedDict()
+
+
+def _remember_stream_message(stream_id: str, ts: Optional[str], seq: int, final: bool) -> None:
+    if not ts:
+        return
+    _stream_messages[stream_id] = {"ts": ts, "seq": seq, "final": final}
+    _stream_messages.move_to_end(stream_id)
+    while len(_stream_messages) > max(1, STREAM_MESSAGE_CACHE_SIZE):
+        _stream_messages.popitem(last=False)
+
+
+def _update_stream_message(
+    client: SlackApiClient,
+    channel: str,
+    stream_id: str,
+    ts: str,
+    text: str,
+    metadata: dict,
+) -> None:
+    try:
+        client.chat_update(channel=channel, ts=ts, text=text, metadata=metadata)
+    except SlackApiError:
+        # The remembered message may be gone: scan the thread again next time
+        _stream_messages.pop(stream_id, None)
+        raise
+
+
+def _stream_metadata(stream_id: str, seq: int, final: bool) -> dict:
+    return {
+        "event_type": STREAM_METADATA_EVENT_TYPE,
+        "event_payload": {"stream_id": stream_id, "seq": seq, "final": final},
+    }
+
+
+def _find_stream_message(
+    client: SlackApiClient,
+    channel: str,
+    thread_ts: str,
+    stream_id: str,
+    oldest: Optional[str],
+) -> Optional[dict]:
+    """
+    Return {"ts", "seq", "final"} for the thread message posted for stream_id, or None.
+    Only replies newer than oldest (the triggering message) are scanned.
+    """
+    params: dict = {
+        "channel": channel,
+        "ts": thread_ts,
+        "include_all_metadata": True,
+        "limit": 200,
+    }
+    if oldest and _is_valid_timestamp(oldest):
+        params["oldest"] = oldest
+    cursor = None
+    while True:
+        if cursor:
+            params["cursor"] = cursor
+        response = client.conversations_replies(**params)
+        for message in response.get("messages") or []:
+            metadata = message.get("metadata") or {}
+            if metadata.get("event_type") != STREAM_METADATA_EVENT_TYPE:
+                continue
+            payload = metadata.get("event_payload") or {}
+            if payload.get("stream_id") == stream_id:
+                return {
+                    "ts": message.get("ts"),
+                    "seq": int(payload.get("seq") or 0),
+                    "final": bool(payload.get("final")),
+                }
+        cursor = (response.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return None
+
+
+def _post_stream_text(
+    client: SlackApiClient,
+    channel: str,
+    text: str,
+    thread_ts: Optional[str],
+    message_ts: Optional[str],
+    stream: dict,
+    correlation_id: str = "",
+) -> bool:
+    """
+    Apply one request of a streamed answer.
+
+    Returns True when the text was handled here (posted, edited or dropped as stale)
+    and False when the caller should post it as an ordinary message.
+    """
+    stream_id = str(stream.get("id") or "")
+    try:
+        seq = int(stream.get("seq") or 0)
+    except (TypeError, ValueError):
+        seq = 0
+    final = bool(stream.get("final"))
+    if not stream_id or not thread_ts or not _is_valid_timestamp(thread_ts):
+        # Without a thread the message cannot be located again; only the final text is posted
+        return not final
+
+    existing = _stream_messages.get(stream_id)
+    if existing is None:
+        existing = _find_stream_message(client, channel, thread_ts, stream_id, message_ts or thread_ts)
+        if existing is not None:
+            _remember_stream_message(stream_id, existing["ts"], existing["seq"], existing["final"])
+
+    if not final:
+        if existing and (existing["final"] or existing["seq"] >= seq):
+            _log("INFO", "slack_stream_partial_stale", {
+                "correlation_id": correlation_id,
+                "seq": seq,
+                "applied_seq": existing["seq"],
+            })
+            return True
+        partial = text
+        if len(partial) > _STREAM_PARTIAL_MAX_LENGTH:
+            partial = partial[: _STREAM_PARTIAL_MAX_LENGTH - 1] + "…"
+        metadata = _stream_metadata(stream_id, seq, False)
+        if existing:
+            _update_stream_message(client, channel, stream_id, existing["ts"], partial, metadata)
+            ts = existing["ts"]
+        else:
+            response = client.chat_postMessage(channel=channel, thread_ts=thread_ts, text=partial, metadata=metadata)
+            ts = response.get("ts")
+        _remember_stream_message(stream_id, ts, seq, False)
+        _log("INFO", "slack_stream_partial_applied", {
+            "correlation_id": correlation_id,
+            "seq": seq,
+            "updated": existing is not None,
+        })
+        return True
+
+    if existing is not None and existing["final"]:
+        # Redelivered final request: the answer is already in place
+        return True
+    chunks = _split_message(text)
+    metadata = _stream_metadata(stream_id, seq, True)
+    if existing is None:
+        # The partial was never posted: post the answer tagged final
+        response = client.chat_postMessage(channel=channel, thread_ts=thread_ts, text=chunks[0], metadata=metadata)
+        ts = response.get("ts")
+    else:
+        _update_stream_message(client, channel, stream_id, existing["ts"], chunks[0], metadata)
+        ts = existing["ts"]
+    _remember_stream_message(stream_id, ts, seq, True)
+    for chunk in chunks[1:]:
+        client.chat_postMessage(channel=channel, thread_ts=thread_ts, text=chunk)
+    _log("INFO", "slack_stream_finalized", {
+        "correlation_id": correlation_id,
+        "seq": seq,
+        "chunks": len(chunks),
+        "updated": existing is not None,
+    })
+    return True
+
+
 # Max file size for S3-fetched artifacts (Lambda memory guard: 10 MB matches Slack workspace limit)
 _MAX_S3_FILE_FETCH_BYTES = 10 * 1024 * 1024
 
@@ -76,7 +258,7 @@ FILE_POST_ERROR_MESSAGE = "ファイルの投稿に失敗しました。しば
 
 
 def _post_file(
-    client: WebClient,
+    client: SlackApiClient,
     channel: str,
     file_bytes: bytes,
     file_name: str,
@@ -100,7 +282,7 @@ def _post_file(
 
 
 def _swap_reaction_to_checkmark(
-    client: WebClient,
+    client: SlackApiClient,
     channel: str,
     message_ts: str,
 ) -> None:
@@ -154,9 +336,45 @@ def _process_one(body: dict) -> None:
     if not text and not file_artifact:
         raise ValueError("at least one of text or file_artifact is required")
 
-    client = WebClient(token=bot_token)
+    client = get_slack_client(bot_token)
+    stream = body.get("stream")
+    if isinstance(stream, dict):
+        if not stream.get("final"):
+            # Partial updates are best-effort: a failed edit is superseded by the next one
+            if text and isinstance(text, str) and text.strip():
+                try:
+                    _post_stream_text(
+                        client, channel, text.strip(), thread_ts, message_ts, stream,
+                        body.get("correlation_id", ""),
+                    )
+                except Exception as e:
+                    _log("WARN", "slack_stream_partial_failed", {
+                        "channel": channel,
+                        "correlation_id": body.get("correlation_id", ""),
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    })
+            return
+    else:
+        stream = None
+
     if text and isinstance(text, str) and text.strip():
-        _post_text(client, channel, text.strip(), thread_ts)
+        handled = False
+        if stream is not None:
+            try:
+                handled = _post_stream_text(
+                    client, channel, text.strip(), thread_ts, message_ts, stream,
+                    body.get("correlation_id", ""),
+                )
+            except SlackApiError as e:
+                # Fall back to a new message so the final answer is never lost
+                _log("WARN", "slack_stream_finalize_failed", {
+                    "channel": channel,
+                    "correlation_id": body.get("correlation_id", ""),
+                    "error": e.response.get("error", ""),
+                })
+        if not handled:
+            _post_text(client, channel, text.strip(), thread_ts)
     if file_artifact and isinstance(file_artifact, dict):
         name = file_artifact.get("fileName")
         mime = file_artifact.get("mimeType")
@@ -220,10 +438,22 @@ def lambda_handler(event: dict, context: Any) -> dict:
     """
     Process SQS records: each record body is a Slack post request (JSON).
     Returns batchItemFailures for failed message IDs.
+
+    Records of a message group after a failed one are returned as failures
+    unprocessed, so the group is retried in order.
     """
     batch_item_failures: List[dict] = []
+    failed_groups = set()
     for record in event.get("Records", []):
         msg_id = record.get("messageId", "")
+        group_id = (record.get("attributes") or {}).get("MessageGroupId")
+        if group_id and group_id in failed_groups:
+            _log("WARN", "slack_post_skipped_after_group_failure", {
+                "message_id": msg_id,
+                "message_group_id": group_id,
+            })
+            batch_item_failures.append({"itemIdentifier": msg_id})
+            continue
         correlation_id = ""
         channel = ""
         try:
@@ -237,6 +467,8 @@ def lambda_handler(event: dict, context: Any) -> dict:
                     "error_type": type(e).__name__,
                 })
                 batch_item_failures.append({"itemIdentifier": msg_id})
+                if group_id:
+                    failed_groups.add(group_id)
                 continue
             correlation_id = body.get("correlation_id", "")
             channel = body.get("channel", "")
@@ -272,4 +504,6 @@ def lambda_handler(event: dict, context: Any) -> dict:
                 "traceback": traceback.format_exc(),
             })
             batch_item_failures.append({"itemIdentifier": msg_id})
+            if group_id:
+                failed_groups.add(group_id)
     return {"batchItemFailures": batch_item_failures}
@@ -0,0 +1,79 @@
+"""Tests for the Slack Poster's Slack Web API client."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+import slack_api
+from slack_api import get_slack_client
+
+
+def _response(status_code=200, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body or {}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients():
+    slack_api._clients.clear()
+    yield
+    slack_api._clients.clear()
+
+
+@pytest.fixture
+def session():
+    mock_session = MagicMock()
+    with patch("slack_api._get_session", return_value=mock_session), \
+         patch("slack_api.time.sleep"):
+        yield mock_session
+
+
+def test_same_token_reuses_client():
+    assert get_slack_client("xoxb-a") is get_slack_client("xoxb-a")
+
+
+def test_conversations_replies_encodes_booleans(session):
+    session.request.return_value = _response(body={"ok": True, "messages": []})
+
+    get_slack_client("xoxb-t").conversations_replies(channel="C1", ts="1.0", include_all_metadata=True)
+
+    args, kwargs = session.request.call_args
+    assert args == ("GET", "https://slack.com/api/conversations.replies")
+    assert kwargs["params"] == {"channel": "C1", "ts": "1.0", "include_all_metadata": "true"}
+
+
+def test_error_body_raises_slack_api_error(session):
+    session.request.return_value = _response(body={"ok": False, "error": "message_not_found"})
+
+    with pytest.raises(SlackApiError) as exc_info:
+        get_slack_client("xoxb-t").chat_update(channel="C1", ts="1.0", text="x")
+
+    assert exc_info.value.response.get("error") == "message_not_found"
+
+
+def test_files_upload_v2_uploads_then_completes(session):
+    session.request.side_effect = [
+        _response(body={"ok": True, "upload_url": "https://files.slack.com/upload/v1/abc", "file_id": "F1"}),
+        _response(),
+        _response(body={"ok": True, "files": [{"id": "F1"}]}),
+    ]
+
+    get_slack_client("xoxb-t").files_upload_v2(
+        channel="C1", filename="a.csv", content=b"a,b", title="a.csv", thread_ts="1.0"
+    )
+
+    reserve, upload, complete = session.request.call_args_list
+    assert reserve[0] == ("GET", "https://slack.com/api/files.getUploadURLExternal")
+    assert reserve[1]["params"] == {"filename": "a.csv", "length": 3}
+    assert upload[0] == ("POST", "https://files.slack.com/upload/v1/abc")
+    assert upload[1]["data"] == b"a,b"
+    assert complete[0] == ("POST", "https://slack.com/api/files.completeUploadExternal")
+    assert complete[1]["json"] == {
+        "files": [{"id": "F1", "title": "a.csv"}],
+        "channel_id": "C1",
+        "thread_ts": "1.0",
+    }
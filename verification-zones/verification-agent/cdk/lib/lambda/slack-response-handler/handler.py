@@ -7,11 +7,12 @@ and posts responses to Slack.
 
 import json
 from typing import Dict, Any, List
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_api import get_slack_client
 from response_handler import parse_execution_response, validate_execution_response
 from slack_poster import post_to_slack
 from metrics import emit_metric
+from cloudwatch_metrics import flush_metrics_after
 from logger import (
     set_correlation_id,
     set_lambda_context,
@@ -22,6 +23,7 @@ from logger import (
 )
 
 
+@flush_metrics_after
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Process SQS messages from execution zone and post to Slack.
@@ -133,10 +135,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     # Update reaction: Remove 👀 and add ✅ to indicate success
                     if parsed_response.get("original_message_ts"):
                         try:
-                            client = WebClient(token=parsed_response["bot_token"], timeout=2)
+                            client = get_slack_client(parsed_response["bot_token"])
                             # Remove 👀 reaction
                             try:
                                 client.reactions_remove(
+                                    timeout=2,
                                     channel=parsed_response["channel"],
                                     name="eyes",
                                     timestamp=parsed_response["original_message_ts"]
@@ -154,6 +157,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                             # Add ✅ reaction
                             try:
                                 client.reactions_add(
+                                    timeout=2,
                                     channel=parsed_response["channel"],
                                     name="white_check_mark",  # Slack API standard name for ✅ emoji
                                     timestamp=parsed_response["original_message_ts"]
@@ -198,10 +202,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     # Update reaction: Remove 👀 and add ❌ to indicate failure
                     if parsed_response.get("original_message_ts"):
                         try:
-                            client = WebClient(token=parsed_response["bot_token"], timeout=2)
+                            client = get_slack_client(parsed_response["bot_token"])
                             # Remove 👀 reaction
                             try:
                                 client.reactions_remove(
+                                    timeout=2,
                                     channel=parsed_response["channel"],
                                     name="eyes",
                                     timestamp=parsed_response["original_message_ts"]
@@ -219,6 +224,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                             # Add ❌ reaction
                             try:
                                 client.reactions_add(
+                                    timeout=2,
                                     channel=parsed_response["channel"],
                                     name="x",  # Slack API standard name for ❌ emoji
                                     timestamp=parsed_response["original_message_ts"]
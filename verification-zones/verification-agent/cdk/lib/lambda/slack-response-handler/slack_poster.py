@@ -8,10 +8,10 @@ Includes message size splitting for messages exceeding Slack's 4000 character li
 import re
 from typing import Optional, List
 
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from logger_util import get_logger, log
+from slack_api import get_slack_client
 
 _logger = get_logger()
 
@@ -144,8 +144,8 @@ def post_to_slack(
     if thread_ts and not _is_valid_timestamp(thread_ts):
         raise ValueError("thread_ts must be a valid Slack timestamp format")
 
-    # Create Slack client
-    client = WebClient(token=bot_token)
+    # Cached per bot token; calls share the keep-alive session of slack_api
+    client = get_slack_client(bot_token)
 
     # Split message if needed (Slack limit: 4000 characters)
     message_chunks = split_message_if_needed(text, max_length=4000)
@@ -1,7 +1,7 @@
 /**
  * DynamoDbExportJob CDK unit tests.
  *
- * Verifies: EventBridge Scheduler, Lambda, and IAM for daily DynamoDB-to-S3 export.
+ * Verifies: EventBridge Scheduler, Lambda, and IAM for the DynamoDB-to-S3 export job.
  */
 import * as cdk from "aws-cdk-lib";
 import { Template, Match } from "aws-cdk-lib/assertions";
@@ -54,9 +54,11 @@ describe("DynamoDbExportJob", () => {
   });
 
   describe("EventBridge Scheduler", () => {
-    it("should create a Schedule with cron(0 15 * * ? *) — JST 00:00 daily", () => {
+    it("should create a single 30-minute Schedule for export and conversion", () => {
+      const schedules = template.findResources("AWS::Scheduler::Schedule");
+      expect(Object.keys(schedules)).toHaveLength(1);
       template.hasResourceProperties("AWS::Scheduler::Schedule", {
-        ScheduleExpression: "cron(0 15 * * ? *)",
+        ScheduleExpression: "rate(30 minutes)",
         State: "ENABLED",
       });
     });
@@ -69,6 +71,12 @@ describe("DynamoDbExportJob", () => {
       });
     });
 
+    it("should serialize runs with reserved concurrency 1", () => {
+      template.hasResourceProperties("AWS::Lambda::Function", {
+        ReservedConcurrentExecutions: 1,
+      });
+    });
+
     it("should have TABLE_ARN and EXPORT_BUCKET_NAME env vars", () => {
       template.hasResourceProperties("AWS::Lambda::Function", {
         Environment: {
@@ -93,5 +101,11 @@ describe("DynamoDbExportJob", () => {
       const policies = template.findResources("AWS::IAM::Policy");
       expect(policyHasAction(policies, "s3:PutObject")).toBe(true);
     });
+
+    it("should have dynamodb:DescribeExport and s3:GetObject* for conversion", () => {
+      const policies = template.findResources("AWS::IAM::Policy");
+      expect(policyHasAction(policies, "dynamodb:DescribeExport")).toBe(true);
+      expect(policyHasAction(policies, "s3:GetObject*")).toBe(true);
+    });
   });
 });
@@ -125,6 +125,19 @@ describe("UsageHistoryBucket", () => {
             },
         });
     });
+    it("should have lifecycle rule for analytics/ prefix with 90-day expiration", () => {
+        template.hasResourceProperties("AWS::S3::Bucket", {
+            LifecycleConfiguration: {
+                Rules: assertions_1.Match.arrayWith([
+                    assertions_1.Match.objectLike({
+                        Prefix: "analytics/",
+                        ExpirationInDays: 90,
+                        Status: "Enabled",
+                    }),
+                ]),
+            },
+        });
+    });
     it("should have versioning enabled", () => {
         template.hasResourceProperties("AWS::S3::Bucket", {
             VersioningConfiguration: { Status: "Enabled" },
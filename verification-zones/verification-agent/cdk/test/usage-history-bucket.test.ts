@@ -102,6 +102,20 @@ describe("UsageHistoryBucket", () => {
     });
   });
 
+  it("should have lifecycle rule for analytics/ prefix with 90-day expiration", () => {
+    template.hasResourceProperties("AWS::S3::Bucket", {
+      LifecycleConfiguration: {
+        Rules: Match.arrayWith([
+          Match.objectLike({
+            Prefix: "analytics/",
+            ExpirationInDays: 90,
+            Status: "Enabled",
+          }),
+        ]),
+      },
+    });
+  });
+
   it("should have versioning enabled", () => {
     template.hasResourceProperties("AWS::S3::Bucket", {
       VersioningConfiguration: { Status: "Enabled" },
@@ -137,6 +137,13 @@ describe("VerificationStack", () => {
         }),
       });
     });
+
+    it("slack-post-request queue must be FIFO so streamed updates are applied in order", () => {
+      template.hasResourceProperties("AWS::SQS::Queue", {
+        QueueName: Match.stringLikeRegexp("slack-post-request\\.fifo"),
+        FifoQueue: true,
+      });
+    });
   });
 
   describe("SlackEventHandler Lambda", () => {
@@ -266,6 +273,20 @@ describe("VerificationStack", () => {
       });
     });
 
+    it("should have lifecycle rule for attachment_cache/ prefix with 7-day expiry", () => {
+      template.hasResourceProperties("AWS::S3::Bucket", {
+        LifecycleConfiguration: {
+          Rules: Match.arrayWith([
+            Match.objectLike({
+              Prefix: "attachment_cache/",
+              ExpirationInDays: 7,
+              Status: "Enabled",
+            }),
+          ]),
+        },
+      });
+    });
+
     it("should have SSE-S3 encryption (BucketEncryption with AES256)", () => {
       template.hasResourceProperties("AWS::S3::Bucket", {
         BucketEncryption: {
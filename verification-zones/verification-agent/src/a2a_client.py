@@ -9,18 +9,35 @@ Supports both synchronous and asynchronous response patterns:
 - Asynchronous: Execution Agent returns "accepted" with task_id,
   then client polls for completion via GetAsyncTaskResult
 
-Security: SigV4 authentication is handled automatically by boto3.
+I/O model: ``ainvoke_execution_agent`` is asyncio-native. Requests are signed
+with SigV4 (botocore) and sent with a shared httpx.AsyncClient whose keep-alive
+connection pool (A2A_MAX_CONNECTIONS, default 20) is reused by every request in
+the process. The client lives on one background event loop, so connections
+survive across the short-lived loops Strands creates per agent invocation;
+awaiting from any loop submits the work there, and cancelling the caller
+cancels the in-flight HTTP request or poll. The response body is read as a
+stream. ``invoke_execution_agent`` is the blocking wrapper for existing callers.
+
+Security: SigV4 authentication uses the boto3 default credential chain.
 Tracing: correlation_id is passed through for end-to-end tracing.
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import json
 import os
+import threading
 import time
 import traceback
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Dict, Optional
+from urllib.parse import quote
 
 import boto3
+import httpx
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
 from botocore.exceptions import ClientError
 
 try:
@@ -38,11 +55,38 @@ def _log(level: str, event_type: str, data: dict) -> None:
     log(_logger, level, event_type, data, service="verification-agent-a2a-client")
 
 
-# Singleton boto3 client
+# Singleton boto3 client (agent card discovery and GetAsyncTaskResult polling)
 _agentcore_client = None
 
-# Async polling configuration
-POLL_INTERVAL_SECONDS = 2.0
+# Shared async HTTP client for InvokeAgentRuntime (created on the I/O loop)
+_http_client: Optional[httpx.AsyncClient] = None
+_credentials = None
+_io_loop: Optional[asyncio.AbstractEventLoop] = None
+_io_loop_lock = threading.Lock()
+
+AGENTCORE_SERVICE_NAME = "bedrock-agentcore"
+SESSION_ID_HEADER = "X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"
+# Keep-alive connections shared by all in-flight A2A invocations
+A2A_MAX_CONNECTIONS = max(1, int(os.environ.get("A2A_MAX_CONNECTIONS", "20")))
+A2A_KEEPALIVE_EXPIRY_SECONDS = 60.0
+A2A_CONNECT_TIMEOUT_SECONDS = 10.0
+# get_agent_card may cold-start the target runtime
+AGENT_CARD_TIMEOUT_SECONDS = 30.0
+
+# HTTP status → AWS error code when the response carries no x-amzn-ErrorType
+_STATUS_ERROR_CODES = {
+    400: "ValidationException",
+    403: "AccessDeniedException",
+    404: "ResourceNotFoundException",
+    429: "ThrottlingException",
+    503: "ServiceUnavailableException",
+}
+
+# Async polling configuration. Each poll is one GetAsyncTaskResult call, so the
+# first interval bounds the call rate of short tasks; the cap bounds the delay
+# between completion and pickup for long ones.
+POLL_INTERVAL_SECONDS = float(os.environ.get("A2A_POLL_INTERVAL_SECONDS", "1.0"))
+POLL_MAX_INTERVAL_SECONDS = float(os.environ.get("A2A_POLL_MAX_INTERVAL_SECONDS", "5.0"))
 POLL_MAX_WAIT_SECONDS = 120.0  # Maximum total wait time for async tasks
 POLL_BACKOFF_FACTOR = 1.5  # Increase interval after each poll
 
@@ -69,23 +113,133 @@ def _get_agentcore_client():
     return _agentcore_client
 
 
-def _read_invoke_response(response: dict) -> str:
-    """
-    Read response body from InvokeAgentRuntime API response.
+def _get_io_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop that owns the shared HTTP client (started lazily)."""
+    global _io_loop
+    with _io_loop_lock:
+        if _io_loop is None or _io_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="a2a-io-loop", daemon=True).start()
+            _io_loop = loop
+        return _io_loop
+
 
-    API returns "response" (StreamingBody or chunks) and "contentType".
-    See: https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/runtime-invoke-agent.html
+async def _on_io_loop(coro: Awaitable):
+    """Await ``coro`` on the I/O loop from any event loop; cancellation propagates."""
+    loop = _get_io_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:  # pragma: no cover - only called from coroutines
+        running = None
+    if running is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def _run_sync(coro: Awaitable):
+    """Run ``coro`` on the I/O loop and block the calling thread until it finishes."""
+    loop = _get_io_loop()
+    if threading.current_thread().name == "a2a-io-loop":
+        raise RuntimeError("blocking A2A call made from the A2A I/O loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def _sleep(seconds: float) -> None:
+    """Non-blocking, cancellable delay (patched in tests)."""
+    await asyncio.sleep(seconds)
+
+
+async def _to_thread(func, *args, **kwargs):
+    """Run a short blocking call (boto3, S3 debug logging) without stalling the I/O loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled httpx client. Must be called on the I/O loop."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=A2A_MAX_CONNECTIONS,
+                max_keepalive_connections=A2A_MAX_CONNECTIONS,
+                keepalive_expiry=A2A_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+    return _http_client
+
+
+def _region_from_arn(agent_arn: str) -> str:
+    parts = agent_arn.split(":")
+    if len(parts) > 3 and parts[3]:
+        return parts[3]
+    return os.environ.get("AWS_REGION_NAME", "ap-northeast-1")
+
+
+def _sign_invoke_request(agent_arn: str, session_id: str, payload: bytes):
+    """Build the SigV4-signed InvokeAgentRuntime URL and headers."""
+    global _credentials
+    if _credentials is None:
+        _credentials = boto3.Session().get_credentials()
+    region = _region_from_arn(agent_arn)
+    endpoint = os.environ.get(
+        "AGENTCORE_ENDPOINT_URL", f"https://{AGENTCORE_SERVICE_NAME}.{region}.amazonaws.com"
+    )
+    url = f"{endpoint.rstrip('/')}/runtimes/{quote(agent_arn, safe='')}/invocations"
+    request = AWSRequest(
+        method="POST",
+        url=url,
+        data=payload,
+        headers={SESSION_ID_HEADER: session_id, "Content-Type": "application/json"},
+    )
+    SigV4Auth(_credentials.get_frozen_credentials(), AGENTCORE_SERVICE_NAME, region).add_auth(request)
+    return url, dict(request.headers.items())
+
+
+class ResponseReadError(Exception):
+    """The InvokeAgentRuntime response stream failed after the request succeeded."""
+
+
+def _http_client_error(status_code: int, headers, body: bytes) -> ClientError:
+    """Map an AgentCore HTTP error response to botocore's ClientError shape."""
+    message = ""
+    code = ""
+    try:
+        data = json.loads(body.decode("utf-8")) if body else {}
+        if isinstance(data, dict):
+            message = data.get("message") or data.get("Message") or ""
+            code = str(data.get("__type", "")).split("#")[-1]
+    except (UnicodeDecodeError, ValueError):
+        message = body[:200].decode("utf-8", errors="replace")
+    error_type = headers.get("x-amzn-errortype", "")
+    if error_type:
+        code = error_type.split(":")[0]
+    if not code:
+        code = _STATUS_ERROR_CODES.get(status_code, f"HTTP{status_code}")
+    return ClientError(
+        {"Error": {"Code": code, "Message": message}, "ResponseMetadata": {"HTTPStatusCode": status_code}},
+        "InvokeAgentRuntime",
+    )
+
+
+async def _invoke_runtime(agent_arn: str, session_id: str, payload: bytes, timeout_seconds: float) -> str:
+    """POST one InvokeAgentRuntime request and stream the response body.
+
+    Raises:
+        ClientError: AgentCore returned an HTTP error status.
+        ResponseReadError: The response stream broke while reading.
     """
-    body = response.get("response")
-    if body is None:
-        return ""
-    if hasattr(body, "read"):
-        return body.read().decode("utf-8")
-    if isinstance(body, (list, tuple)):
-        return "".join(chunk.decode("utf-8") if isinstance(chunk, bytes) else str(chunk) for chunk in body)
-    if isinstance(body, str):
-        return body
-    return str(body)
+    url, headers = _sign_invoke_request(agent_arn, session_id, payload)
+    timeout = httpx.Timeout(timeout_seconds, connect=A2A_CONNECT_TIMEOUT_SECONDS)
+    async with _get_http_client().stream("POST", url, content=payload, headers=headers, timeout=timeout) as response:
+        if response.status_code >= 400:
+            raise _http_client_error(response.status_code, response.headers, await response.aread())
+        chunks = []
+        try:
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+        except httpx.HTTPError as e:
+            raise ResponseReadError(str(e)) from e
+    return b"".join(chunks).decode("utf-8")
 
 
 def build_jsonrpc_request(task_payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -163,13 +317,26 @@ def _poll_async_task_result(
     task_id: str,
     correlation_id: str,
     max_wait_seconds: float = POLL_MAX_WAIT_SECONDS,
+) -> str:
+    """Blocking wrapper around ``_apoll_async_task_result``."""
+    return _run_sync(_apoll_async_task_result(agent_arn, task_id, correlation_id, max_wait_seconds))
+
+
+async def _apoll_async_task_result(
+    agent_arn: str,
+    task_id: str,
+    correlation_id: str,
+    max_wait_seconds: float = POLL_MAX_WAIT_SECONDS,
 ) -> str:
     """
     Poll for the result of an async task from the Execution Agent.
 
     Uses exponential backoff polling to wait for the background Bedrock
-    processing to complete. The Execution Agent calls complete_async_task
-    when done, which makes the result available via GetAsyncTaskResult.
+    processing to complete: the interval starts at POLL_INTERVAL_SECONDS and
+    grows by POLL_BACKOFF_FACTOR up to POLL_MAX_INTERVAL_SECONDS. The
+    Execution Agent calls complete_async_task when done, which makes the
+    result available via GetAsyncTaskResult. Waiting between polls does not
+    block the event loop, and cancelling the awaiting task stops polling.
 
     Args:
         agent_arn: ARN of the Execution Agent Runtime
@@ -193,10 +360,11 @@ def _poll_async_task_result(
 
     while (time.time() - start_time) < max_wait_seconds:
         poll_count += 1
-        time.sleep(poll_interval)
+        await _sleep(poll_interval)
 
         try:
-            result = client.get_async_task_result(
+            result = await _to_thread(
+                client.get_async_task_result,
                 agentRuntimeArn=agent_arn,
                 taskId=task_id,
             )
@@ -239,14 +407,14 @@ def _poll_async_task_result(
                 })
 
             # Task still in progress — increase poll interval (backoff)
-            poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, 10.0)
+            poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL_SECONDS)
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
 
             # Task not ready yet — keep polling
             if error_code in ("ResourceNotFoundException", "TaskNotReadyException"):
-                poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, 10.0)
+                poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL_SECONDS)
                 continue
 
             _log("ERROR", "async_poll_api_error", {
@@ -296,9 +464,17 @@ def _poll_async_task_result(
 
 
 def discover_agent_card(agent_arn: str) -> Optional[Dict[str, Any]]:
+    """Blocking wrapper around ``adiscover_agent_card``."""
+    return _run_sync(adiscover_agent_card(agent_arn))
+
+
+async def adiscover_agent_card(agent_arn: str) -> Optional[Dict[str, Any]]:
     """
     Discover Agent Card from a target AgentCore Runtime via JSON-RPC get_agent_card.
 
+    Uses the pooled async transport; may be awaited from any event loop and
+    cancelled (e.g. by a per-agent timeout).
+
     Args:
         agent_arn: Target agent runtime ARN.
 
@@ -307,9 +483,11 @@ def discover_agent_card(agent_arn: str) -> Optional[Dict[str, Any]]:
     """
     if not agent_arn or not isinstance(agent_arn, str):
         return None
+    return await _on_io_loop(_adiscover(agent_arn))
 
+
+async def _adiscover(agent_arn: str) -> Optional[Dict[str, Any]]:
     try:
-        client = _get_agentcore_client()
         session_id = str(uuid.uuid4())
         request_body = {
             "jsonrpc": "2.0",
@@ -317,12 +495,12 @@ def discover_agent_card(agent_arn: str) -> Optional[Dict[str, Any]]:
             "id": str(uuid.uuid4()),
         }
 
-        response = client.invoke_agent_runtime(
-            agentRuntimeArn=agent_arn,
-            runtimeSessionId=session_id,
-            payload=json.dumps(request_body).encode("utf-8"),
+        response_body = await _invoke_runtime(
+            agent_arn,
+            session_id,
+            json.dumps(request_body).encode("utf-8"),
+            AGENT_CARD_TIMEOUT_SECONDS,
         )
-        response_body = _read_invoke_response(response)
         response_data = json.loads(response_body) if response_body else {}
 
         result = response_data.get("result")
@@ -352,14 +530,36 @@ def discover_agent_card(agent_arn: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def submit_background(coro: Awaitable) -> "concurrent.futures.Future":
+    """Schedule ``coro`` on the A2A I/O loop without waiting for it."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_io_loop())
+
+
 def invoke_execution_agent(
     task_payload: Dict[str, Any],
     execution_agent_arn: Optional[str] = None,
     timeout_seconds: int = 120,
+) -> str:
+    """
+    Blocking wrapper around ``ainvoke_execution_agent`` for synchronous callers.
+
+    Raises:
+        ValueError: If no Execution Agent ARN is available.
+    """
+    return _run_sync(ainvoke_execution_agent(task_payload, execution_agent_arn, timeout_seconds))
+
+
+async def ainvoke_execution_agent(
+    task_payload: Dict[str, Any],
+    execution_agent_arn: Optional[str] = None,
+    timeout_seconds: int = 120,
 ) -> str:
     """
     Invoke the Execution Agent via AgentCore InvokeAgentRuntime API.
 
+    May be awaited from any event loop: the request runs on the shared A2A I/O
+    loop, and cancelling the awaiting task aborts the HTTP request or polling.
+
     Sends a JSON-RPC 2.0 message/send to the Execution Agent containing
     the task payload (channel, text, bot_token, etc.). Handles both
     synchronous and asynchronous response patterns:
@@ -380,7 +580,7 @@ def invoke_execution_agent(
         str: JSON string with ExecutionResponse (status, response_text, etc.)
 
     Security:
-        - SigV4 authentication is handled automatically by boto3
+        - Requests are SigV4-signed with the boto3 default credentials
         - Cross-account access requires resource-based policy on Execution Agent
     """
     # Get Execution Agent ARN
@@ -391,6 +591,11 @@ def invoke_execution_agent(
             "Set it to the ARN of the Execution Agent Runtime."
         )
 
+    return await _on_io_loop(_ainvoke(task_payload, agent_arn, timeout_seconds))
+
+
+async def _ainvoke(task_payload: Dict[str, Any], agent_arn: str, timeout_seconds: float) -> str:
+    """Body of ainvoke_execution_agent; runs on the A2A I/O loop."""
     correlation_id = task_payload.get("correlation_id", str(uuid.uuid4()))
     start_time = time.time()
 
@@ -403,8 +608,6 @@ def invoke_execution_agent(
     })
 
     try:
-        client = _get_agentcore_client()
-
         # Unique session ID per invocation (UUID recommended by AWS for InvokeAgentRuntime)
         session_id = str(uuid.uuid4())
 
@@ -414,11 +617,7 @@ def invoke_execution_agent(
         for attempt in range(1, INVOKE_RETRY_MAX_ATTEMPTS + 1):
             try:
                 # Invoke the Execution Agent via AgentCore Runtime (A2A API: runtimeSessionId + payload)
-                response = client.invoke_agent_runtime(
-                    agentRuntimeArn=agent_arn,
-                    runtimeSessionId=session_id,
-                    payload=payload_bytes,
-                )
+                response_body = await _invoke_runtime(agent_arn, session_id, payload_bytes, timeout_seconds)
             except ClientError as e:
                 if e.response["Error"]["Code"] == "ThrottlingException" and attempt < INVOKE_RETRY_MAX_ATTEMPTS:
                     delay = INVOKE_RETRY_BASE_DELAY_SECONDS * (
@@ -430,14 +629,10 @@ def invoke_execution_agent(
                         "max_attempts": INVOKE_RETRY_MAX_ATTEMPTS,
                         "delay_seconds": round(delay, 2),
                     })
-                    time.sleep(delay)
+                    await _sleep(delay)
                     continue
                 raise
-
-            # Parse response body (API returns "response" as StreamingBody, "contentType")
-            try:
-                response_body = _read_invoke_response(response)
-            except Exception as read_err:
+            except ResponseReadError as read_err:
                 _log("ERROR", "invoke_response_read_error", {
                     "correlation_id": correlation_id,
                     "execution_agent_arn": agent_arn,
@@ -446,7 +641,7 @@ def invoke_execution_agent(
                     "traceback": traceback.format_exc(),
                 })
                 if log_execution_error:
-                    log_execution_error(correlation_id, read_err, traceback.format_exc())
+                    await _to_thread(log_execution_error, correlation_id, read_err, traceback.format_exc())
                 return json.dumps({
                     "status": "error",
                     "error_code": "response_read_error",
@@ -485,7 +680,7 @@ def invoke_execution_agent(
                     "remaining_timeout": round(remaining_timeout, 2),
                 })
 
-                return _poll_async_task_result(
+                return await _apoll_async_task_result(
                     agent_arn=agent_arn,
                     task_id=task_id,
                     correlation_id=correlation_id,
@@ -518,7 +713,7 @@ def invoke_execution_agent(
 
         # Best-effort agent card verification on failure (helps detect stale/incorrect registry entries).
         try:
-            card = discover_agent_card(agent_arn)
+            card = await adiscover_agent_card(agent_arn)
             _log("INFO", "agent_card_verified_on_invoke_failure", {
                 "correlation_id": correlation_id,
                 "execution_agent_arn": agent_arn,
@@ -572,7 +767,7 @@ def invoke_execution_agent(
             "duration_ms": round(duration_ms, 2),
         })
         if log_execution_error:
-            log_execution_error(correlation_id, e, tb_str)
+            await _to_thread(log_execution_error, correlation_id, e, tb_str)
 
         return json.dumps({
             "status": "error",
@@ -2,24 +2,77 @@
 
 Reads all agent entries from a DynamoDB table at startup via a single Query
 on PK=env. Each item contains an agent's ARN, description, and skills.
+
+The registry carries a content version (hash of ARNs and cards) that changes
+only when a load returns different entries; consumers such as the
+orchestrator pool key cached objects by it. Loaded state is an immutable
+snapshot replaced with a single assignment, so readers never see ARNs from one
+load and cards from another. Listeners registered with
+``add_invalidation_listener`` run after every version change (the orchestrator
+pool drops instances built from the old cards).
+
+Invalidation: deploy scripts bump a version marker item
+(agent_id ``__registry_version__``) after writing an entry.
+``refresh_registry_if_stale`` reads only that item (GetItem, one attribute)
+every AGENT_REGISTRY_VERSION_CHECK_SECONDS (default 30) through the shared
+DynamoDB client and runs the full Query only when the marker changed, or every AGENT_REGISTRY_MAX_AGE_SECONDS
+(default 900) as a safety net. Tables without a marker fall back to a full
+reload every ``max_age_seconds``.
+
+Agent cards are verified against the runtimes themselves (JSON-RPC
+get_agent_card) in the background: ``start_card_verification`` queries every
+agent concurrently on the A2A I/O loop with a per-agent timeout
+(AGENT_CARD_DISCOVERY_TIMEOUT_SECONDS, default 10) and never blocks the caller.
+Verified cards are cached with an ETag (hash of the card); ``get_all_cards``
+overlays them on the registry entries, and the registry version changes only
+when a verified card's ETag does.
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 import boto3
 from boto3.dynamodb.conditions import Key
 from pydantic import BaseModel
 
+from aws_clients import get_client
 from logger_util import get_logger, log
 
 _logger = get_logger()
 DEFAULT_AGENT_ID = "file-creator"
 
-_AGENT_ARNS: Dict[str, str] = {}
-_AGENT_CARDS: Dict[str, Optional[dict]] = {}
+# Sort key of the item whose registry_version attribute deploy scripts increment
+REGISTRY_VERSION_ITEM_ID = "__registry_version__"
+# A registry change reaches each container within this many seconds; lower values
+# trade more GetItem calls per container for faster propagation.
+AGENT_REGISTRY_VERSION_CHECK_SECONDS = float(os.environ.get("AGENT_REGISTRY_VERSION_CHECK_SECONDS", "30"))
+AGENT_REGISTRY_MAX_AGE_SECONDS = float(os.environ.get("AGENT_REGISTRY_MAX_AGE_SECONDS", "900"))
+
+
+class _RegistrySnapshot(NamedTuple):
+    arns: Dict[str, str]
+    cards: Dict[str, Optional[dict]]
+    version: str
+    # Version marker seen before the load (None: table has no marker)
+    marker: Optional[str] = None
+
+
+_SNAPSHOT = _RegistrySnapshot({}, {}, "")
 _LAST_REFRESH_UNIX_S: float = 0.0
+_LAST_VERSION_CHECK_UNIX_S: float = 0.0
+_invalidation_listeners: List[Callable[[], None]] = []
+
+AGENT_CARD_DISCOVERY_TIMEOUT_SECONDS = float(os.environ.get("AGENT_CARD_DISCOVERY_TIMEOUT_SECONDS", "10"))
+
+# agent_id -> {"arn", "etag", "card", "verified_at"} from the runtime's get_agent_card
+_VERIFIED_CARDS: Dict[str, Dict[str, Any]] = {}
+_verification_lock = threading.Lock()
+_verification_future = None
 
 
 class AgentSkill(BaseModel):
@@ -83,7 +136,7 @@ def _load_from_dynamodb(
 
     for item in items:
         agent_id = item.get("agent_id", "")
-        if not agent_id:
+        if not agent_id or agent_id == REGISTRY_VERSION_ITEM_ID:
             continue
 
         try:
@@ -117,83 +170,206 @@ def _load_from_dynamodb(
     return arns, cards
 
 
+def _compute_version(arns: Dict[str, str], cards: Dict[str, Optional[dict]]) -> str:
+    """Return a short content hash of the registry entries."""
+    canonical = json.dumps({"arns": arns, "cards": cards}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _card_etag(card: dict) -> str:
+    """Return a short content hash of a verified agent card."""
+    canonical = json.dumps(card, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_region_name() -> str:
+    return (
+        os.environ.get("AWS_REGION_NAME")
+        or os.environ.get("AWS_REGION")
+        or "ap-northeast-1"
+    )
+
+
+def _read_version_marker(table_name: str, env: str) -> Optional[str]:
+    """Return the registry version marker, or None when the table has none.
+
+    Raises on DynamoDB errors so callers can fall back to a full reload.
+    """
+    response = get_client("dynamodb", region_name=_get_region_name()).get_item(
+        TableName=table_name,
+        Key={"env": {"S": env}, "agent_id": {"S": REGISTRY_VERSION_ITEM_ID}},
+        ProjectionExpression="registry_version",
+    )
+    attribute = (response.get("Item") or {}).get("registry_version")
+    if not attribute:
+        return None
+    # Low-level attribute value: {"N": "3"} (or {"S": ...} if written as a string)
+    return next(iter(attribute.values()))
+
+
+def add_invalidation_listener(listener: Callable[[], None]) -> None:
+    """Call listener (no arguments) whenever the registry version changes."""
+    if listener not in _invalidation_listeners:
+        _invalidation_listeners.append(listener)
+
+
+def _notify_invalidated() -> None:
+    for listener in list(_invalidation_listeners):
+        try:
+            listener()
+        except Exception as e:
+            _log("warning", "agent_registry_invalidation_listener_failed", {
+                "error": str(e),
+                "error_type": type(e).__name__,
+            })
+
+
+def _install(
+    arns: Dict[str, str],
+    cards: Dict[str, Optional[dict]],
+    marker: Optional[str] = None,
+) -> bool:
+    """Swap in a new snapshot when the content changed; return True if it did."""
+    global _SNAPSHOT
+
+    version = _compute_version(arns, cards)
+    if version == _SNAPSHOT.version:
+        if marker != _SNAPSHOT.marker:
+            _SNAPSHOT = _SNAPSHOT._replace(marker=marker)
+        return False
+    _SNAPSHOT = _RegistrySnapshot(arns, cards, version, marker)
+    _notify_invalidated()
+    return True
+
+
+def _registry_location() -> tuple[str, str]:
+    return (
+        os.environ.get("AGENT_REGISTRY_TABLE", "").strip(),
+        os.environ.get("AGENT_REGISTRY_ENV", "").strip(),
+    )
+
+
+def _try_read_version_marker(table_name: str, env: str) -> Optional[str]:
+    try:
+        return _read_version_marker(table_name, env)
+    except Exception as e:
+        _log("warning", "agent_registry_version_check_failed", {
+            "table": table_name,
+            "env": env,
+            "error": str(e),
+            "error_type": type(e).__name__,
+        })
+        return None
+
+
 def initialize_registry() -> None:
     """Initialize registry by querying all agent entries from DynamoDB."""
-    global _AGENT_ARNS, _AGENT_CARDS
 
-    table_name = os.environ.get("AGENT_REGISTRY_TABLE", "").strip()
-    env = os.environ.get("AGENT_REGISTRY_ENV", "").strip()
+    table_name, env = _registry_location()
 
     if not table_name or not env:
-        _AGENT_ARNS = {}
-        _AGENT_CARDS = {}
+        _install({}, {})
         _log("warning", "agent_registry_env_missing", {
             "message": "AGENT_REGISTRY_TABLE or AGENT_REGISTRY_ENV not set",
         })
         return
 
-    _AGENT_ARNS, _AGENT_CARDS = _load_from_dynamodb(table_name, env)
+    # Read the marker before the Query: a bump in between triggers another reload
+    marker = _try_read_version_marker(table_name, env)
+    _install(*_load_from_dynamodb(table_name, env), marker=marker)
+    global _LAST_REFRESH_UNIX_S, _LAST_VERSION_CHECK_UNIX_S
+    _LAST_REFRESH_UNIX_S = _LAST_VERSION_CHECK_UNIX_S = time.time()
 
+    snapshot = _SNAPSHOT
     _log("info", "agent_registry_initialized", {
-        "agent_ids": sorted(_AGENT_ARNS.keys()),
-        "agent_count": len(_AGENT_ARNS),
-        "multi_agent": len(_AGENT_ARNS) > 1,
+        "agent_ids": sorted(snapshot.arns.keys()),
+        "agent_count": len(snapshot.arns),
+        "multi_agent": len(snapshot.arns) > 1,
         "source": "dynamodb",
         "table": table_name,
         "env": env,
+        "version": snapshot.version,
+        "marker": snapshot.marker,
     })
 
 
-def refresh_registry() -> None:
-    """Re-query all agent entries from DynamoDB and replace registry state."""
-    global _AGENT_ARNS, _AGENT_CARDS
+def refresh_registry(marker: Optional[str] = None) -> None:
+    """Re-query all agent entries from DynamoDB and replace registry state if it changed.
 
-    table_name = os.environ.get("AGENT_REGISTRY_TABLE", "").strip()
-    env = os.environ.get("AGENT_REGISTRY_ENV", "").strip()
+    marker is the version marker read before this reload; when omitted it is
+    read here.
+    """
+
+    table_name, env = _registry_location()
 
     if not table_name or not env:
         return
 
-    _AGENT_ARNS, _AGENT_CARDS = _load_from_dynamodb(table_name, env)
-    global _LAST_REFRESH_UNIX_S
-    _LAST_REFRESH_UNIX_S = time.time()
+    if marker is None:
+        marker = _try_read_version_marker(table_name, env)
+    changed = _install(*_load_from_dynamodb(table_name, env), marker=marker)
+    global _LAST_REFRESH_UNIX_S, _LAST_VERSION_CHECK_UNIX_S
+    _LAST_REFRESH_UNIX_S = _LAST_VERSION_CHECK_UNIX_S = time.time()
 
+    snapshot = _SNAPSHOT
     _log("info", "agent_registry_refreshed", {
-        "agent_ids": sorted(_AGENT_ARNS.keys()),
-        "agent_count": len(_AGENT_ARNS),
+        "agent_ids": sorted(snapshot.arns.keys()),
+        "agent_count": len(snapshot.arns),
+        "changed": changed,
+        "version": snapshot.version,
+        "marker": snapshot.marker,
     })
 
 
 def refresh_registry_if_stale(max_age_seconds: int = 60) -> bool:
-    """Refresh registry if the last refresh is older than max_age_seconds.
+    """Reload the registry when the version marker changed or the snapshot is too old.
 
     Purpose:
       Keep the in-memory registry consistent with DynamoDB even when the runtime
-      stays warm across deployments.
+      stays warm across deployments, without re-querying every entry on each
+      check.
 
     Parameters:
-      max_age_seconds: Minimum seconds between refreshes (>= 1 recommended).
+      max_age_seconds: Full reload interval for tables without a version
+        marker (>= 1 recommended). With a marker, the full reload runs when the
+        marker changes or after AGENT_REGISTRY_MAX_AGE_SECONDS.
 
     Returns:
-      True when a refresh was attempted (success or fail-open), False otherwise.
+      True when a full reload was attempted (success or fail-open), False otherwise.
 
     Side effects:
-      May call DynamoDB Query and update the module-level caches.
+      May call DynamoDB GetItem (marker) and Query, and swap the registry snapshot.
 
     Error handling:
       Fail-open: any exception is logged and returns True (attempted) while
-      keeping the previous cache.
+      keeping the previous snapshot. A failed marker read counts as "no marker".
     """
+    global _LAST_VERSION_CHECK_UNIX_S
+
     if not isinstance(max_age_seconds, int) or max_age_seconds < 1:
         max_age_seconds = 60
 
-    now = time.time()
-    age = now - _LAST_REFRESH_UNIX_S
-    if _LAST_REFRESH_UNIX_S > 0 and age < max_age_seconds:
+    table_name, env = _registry_location()
+    if not table_name or not env:
         return False
 
+    now = time.time()
+    if _LAST_REFRESH_UNIX_S > 0:
+        if now - _LAST_VERSION_CHECK_UNIX_S < AGENT_REGISTRY_VERSION_CHECK_SECONDS:
+            return False
+        _LAST_VERSION_CHECK_UNIX_S = now
+        marker = _try_read_version_marker(table_name, env)
+        age = now - _LAST_REFRESH_UNIX_S
+        if marker is None:
+            if age < max_age_seconds:
+                return False
+        elif marker == _SNAPSHOT.marker and age < AGENT_REGISTRY_MAX_AGE_SECONDS:
+            return False
+    else:
+        marker = None
+
     try:
-        refresh_registry()
+        refresh_registry(marker)
     except Exception as e:
         _log("warning", "agent_registry_refresh_failed", {
             "error": str(e),
@@ -202,26 +378,133 @@ def refresh_registry_if_stale(max_age_seconds: int = 60) -> bool:
     return True
 
 
+def get_registry_version() -> str:
+    """Return the content version of the current registry ("" before the first load).
+
+    Includes the ETags of verified cards so cached consumers are rebuilt when
+    a runtime starts advertising a different card.
+    """
+    snapshot, verified = _SNAPSHOT, _VERIFIED_CARDS
+    if not snapshot.version or not verified:
+        return snapshot.version
+    etags = {agent_id: v["etag"] for agent_id, v in verified.items() if snapshot.arns.get(agent_id) == v["arn"]}
+    if not etags:
+        return snapshot.version
+    canonical = json.dumps({"registry": snapshot.version, "verified": etags}, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+async def _verify_card(agent_id: str, arn: str, timeout_seconds: float) -> str:
+    """Fetch one agent's card and cache it; return the outcome for logging."""
+    from a2a_client import adiscover_agent_card
+
+    try:
+        card = await asyncio.wait_for(adiscover_agent_card(arn), timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        return "timed_out"
+    if not isinstance(card, dict) or not card:
+        return "failed"
+
+    global _VERIFIED_CARDS
+
+    etag = _card_etag(card)
+    cached = _VERIFIED_CARDS.get(agent_id)
+    if cached and cached["arn"] == arn and cached["etag"] == etag:
+        cached["verified_at"] = time.time()
+        return "verified"
+    # Copy-on-write so readers iterating the previous dict are unaffected
+    _VERIFIED_CARDS = {
+        **_VERIFIED_CARDS,
+        agent_id: {"arn": arn, "etag": etag, "card": card, "verified_at": time.time()},
+    }
+    return "changed"
+
+
+async def _verify_cards(arns: Dict[str, str], timeout_seconds: float) -> Dict[str, str]:
+    """Verify all agent cards concurrently; one slow runtime does not delay the rest."""
+    agent_ids = sorted(arns)
+    outcomes = await asyncio.gather(
+        *(_verify_card(agent_id, arns[agent_id], timeout_seconds) for agent_id in agent_ids),
+        return_exceptions=True,
+    )
+    global _VERIFIED_CARDS
+
+    results = {
+        agent_id: (outcome if isinstance(outcome, str) else "failed")
+        for agent_id, outcome in zip(agent_ids, outcomes)
+    }
+    # Drop cards of agents that left the registry
+    current = _SNAPSHOT.arns
+    if any(agent_id not in current for agent_id in _VERIFIED_CARDS):
+        _VERIFIED_CARDS = {a: v for a, v in _VERIFIED_CARDS.items() if a in current}
+
+    changed = sorted(a for a, r in results.items() if r == "changed")
+    if changed:
+        _notify_invalidated()
+    _log("info", "agent_card_verification_completed", {
+        "verified": sum(1 for r in results.values() if r in ("verified", "changed")),
+        "failed": sorted(a for a, r in results.items() if r == "failed"),
+        "timed_out": sorted(a for a, r in results.items() if r == "timed_out"),
+        "changed": changed,
+        "version": get_registry_version(),
+    })
+    return results
+
+
+def start_card_verification(timeout_seconds: Optional[float] = None) -> bool:
+    """Schedule background verification of every registered agent card.
+
+    Returns immediately. At most one verification runs at a time; a call made
+    while one is in flight is ignored.
+
+    Returns:
+      True when a verification was scheduled, False otherwise.
+    """
+    global _verification_future
+
+    arns = dict(_SNAPSHOT.arns)
+    if not arns:
+        return False
+    with _verification_lock:
+        if _verification_future is not None and not _verification_future.done():
+            return False
+        from a2a_client import submit_background
+
+        _verification_future = submit_background(_verify_cards(
+            arns,
+            AGENT_CARD_DISCOVERY_TIMEOUT_SECONDS if timeout_seconds is None else timeout_seconds,
+        ))
+    return True
+
+
 def get_agent_arn(agent_id: str) -> str:
     """Return runtime ARN for the given agent id; empty string when missing."""
-    if agent_id in _AGENT_ARNS:
-        return _AGENT_ARNS[agent_id]
-
-    return ""
+    return _SNAPSHOT.arns.get(agent_id, "")
 
 
 def is_multi_agent() -> bool:
     """True when more than one execution agent is configured."""
-    return len(_AGENT_ARNS) > 1
+    return len(_SNAPSHOT.arns) > 1
 
 
 def get_all_cards() -> Dict[str, Optional[dict]]:
-    """Return discovered cards keyed by agent id."""
-    return dict(_AGENT_CARDS)
+    """Return discovered cards keyed by agent id.
+
+    Fields of a card verified from the runtime override the registry entry's,
+    except ``arn``; a verified card is ignored once the agent's ARN changed.
+    """
+    snapshot = _SNAPSHOT
+    cards = dict(snapshot.cards)
+    for agent_id, verified in _VERIFIED_CARDS.items():
+        entry = cards.get(agent_id)
+        if entry is None or verified["arn"] != snapshot.arns.get(agent_id):
+            continue
+        merged = {**entry, **verified["card"]}
+        merged["arn"] = entry.get("arn", verified["arn"])
+        cards[agent_id] = merged
+    return cards
 
 
 def get_agent_ids() -> list[str]:
     """Return configured agent ids."""
-    if _AGENT_ARNS:
-        return sorted(_AGENT_ARNS.keys())
-    return []
+    return sorted(_SNAPSHOT.arns.keys())
@@ -1,6 +1,15 @@
-"""Dynamic tool generation for execution agents used by OrchestrationAgent."""
+"""Dynamic tool generation for execution agents used by OrchestrationAgent.
+
+Tool calls requested in the same model turn are run concurrently by the Strands
+tool executor. Each call awaits the asyncio-native A2A client, whose shared
+connection pool (A2A_MAX_CONNECTIONS) bounds concurrent specialist
+invocations. A call is cancelled after ORCHESTRATOR_TOOL_TIMEOUT_SECONDS, which
+aborts the in-flight request, so a slow specialist cannot hold up the rest of
+the turn.
+"""
 import asyncio
 import json
+import os
 
 try:
     from strands import tool
@@ -8,7 +17,7 @@ except ImportError:  # pragma: no cover
     def tool(func):
         return func
 
-from a2a_client import invoke_execution_agent
+from a2a_client import ainvoke_execution_agent
 from agent_registry import get_agent_arn
 from logger_util import get_logger, log
 
@@ -19,6 +28,17 @@ def _log(level, event_type, data):
     log(_logger, level, event_type, data, service="verification-agent")
 
 
+def _env_number(name: str, default: float, minimum: float) -> float:
+    try:
+        return max(minimum, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+# Slightly above ainvoke_execution_agent's own 120-second budget
+TOOL_TIMEOUT_SECONDS = _env_number("ORCHESTRATOR_TOOL_TIMEOUT_SECONDS", 150, 1)
+
+
 def make_agent_tool(agent_id: str, card: dict, file_artifact_store: dict = None):
     """Create a Strands @tool for a single registered execution agent."""
     safe_name = "invoke_" + agent_id.replace("-", "_")
@@ -39,12 +59,11 @@ def make_agent_tool(agent_id: str, card: dict, file_artifact_store: dict = None)
         if not target_arn:
             return f"ERROR: agent_not_found — No ARN found for agent '{agent_id}'"
         try:
-            raw = await asyncio.to_thread(
-                invoke_execution_agent,
-                {"text": task},
-                target_arn,
+            raw = await asyncio.wait_for(
+                ainvoke_execution_agent({"text": task}, target_arn),
+                timeout=TOOL_TIMEOUT_SECONDS,
             )
-            # invoke_execution_agent returns JSON; extract plain response_text for the LLM.
+            # ainvoke_execution_agent returns JSON; extract plain response_text for the LLM.
             # file_artifact (if any) is stored out-of-band in file_artifact_store.
             try:
                 parsed = json.loads(raw)
@@ -57,6 +76,15 @@ def make_agent_tool(agent_id: str, card: dict, file_artifact_store: dict = None)
                 return parsed.get("response_text", raw)
             except (json.JSONDecodeError, AttributeError):
                 return raw
+        except asyncio.TimeoutError:
+            _log("WARN", "agent_tool_timeout", {
+                "agent_id": agent_id,
+                "timeout_seconds": TOOL_TIMEOUT_SECONDS,
+            })
+            return (
+                f"ERROR: timeout — '{agent_id}' did not respond within "
+                f"{int(TOOL_TIMEOUT_SECONDS)} seconds"
+            )
         except Exception as e:
             _log("WARN", "agent_tool_error", {
                 "agent_id": agent_id,
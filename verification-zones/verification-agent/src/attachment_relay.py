@@ -0,0 +1,206 @@
+"""
+Attachment relay for Verification Agent: Slack files → S3 pre-signed URLs.
+
+Each attachment is relayed in three steps: ``files.info`` for a fresh download
+URL (event payload URLs may be stale), a streamed download from Slack piped
+into ``upload_stream_to_s3`` (multipart upload, one part in memory per file),
+and a pre-signed GET URL for the execution zone.
+
+Attachments of one request are relayed concurrently on a shared pool
+(ATTACHMENT_RELAY_MAX_WORKERS, default 10). Files larger than
+ATTACHMENT_MAX_BYTES (default 10 MB, the largest size the execution agents
+accept) are rejected from the ``files.info`` size and, should that be wrong,
+while streaming.
+
+Files already in the attachment cache (same file_id, files.info version and
+size, see s3_file_manager) are pre-signed from the cached object without downloading or
+uploading; newly relayed files are copied into the cache. The content SHA-256
+is passed on as ``content_sha256`` so execution agents can cache extraction
+results per (file_id, content_sha256).
+
+Fail-open per file: a file that cannot be downloaded or uploaded is logged and
+left out of the result; the request continues with the remaining files.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from typing import List, Optional
+
+from botocore.exceptions import ClientError
+
+from logger_util import get_logger, log
+from s3_file_manager import (
+    FileTooLargeError,
+    find_cached_attachment,
+    generate_presigned_url,
+    store_cached_attachment,
+    upload_stream_to_s3,
+)
+from slack_api import get_slack_client
+
+_logger = get_logger()
+
+ATTACHMENT_MAX_BYTES = int(os.environ.get("ATTACHMENT_MAX_BYTES", str(10 * 1024 * 1024)))
+ATTACHMENT_RELAY_MAX_WORKERS = int(os.environ.get("ATTACHMENT_RELAY_MAX_WORKERS", "10"))
+# Read size of the Slack download stream
+DOWNLOAD_CHUNK_BYTES = 256 * 1024
+DOWNLOAD_TIMEOUT_SECONDS = 30.0
+
+_relay_executor = ThreadPoolExecutor(
+    max_workers=ATTACHMENT_RELAY_MAX_WORKERS, thread_name_prefix="attachment-relay"
+)
+
+
+def _log(level: str, event_type: str, data: dict) -> None:
+    log(_logger, level, event_type, data, service="verification-agent")
+
+
+@dataclass
+class RelayedAttachment:
+    """Attachment stored in S3 and ready for the execution zone."""
+    file_id: str
+    name: str
+    mimetype: str
+    size: int
+    s3_key: str
+    presigned_url: str
+    content_sha256: str = ""
+    cache_hit: bool = False
+
+    def to_file_reference(self) -> dict:
+        """Attachment entry of the execution payload (presigned_url contract)."""
+        reference = {
+            "id": self.file_id,
+            "name": self.name,
+            "mimetype": self.mimetype,
+            "size": self.size,
+            "presigned_url": self.presigned_url,
+        }
+        if self.content_sha256:
+            reference["content_sha256"] = self.content_sha256
+        return reference
+
+
+def _file_version(file_info: dict) -> str:
+    """files.info change indicator: edit time when the file was edited, else creation time."""
+    return str(file_info.get("updated") or file_info.get("timestamp") or "")
+
+
+def relay_attachment(bot_token: str, attachment: dict, correlation_id: str) -> Optional[RelayedAttachment]:
+    """
+    Stream one Slack attachment to S3 and pre-sign it.
+
+    Returns:
+        RelayedAttachment, or None when the file was skipped (logged).
+    """
+    file_id = attachment.get("id")
+    file_name = attachment.get("name", "unknown")
+    mimetype = attachment.get("mimetype", "application/octet-stream")
+    if not bot_token or not file_id:
+        return None
+
+    client = get_slack_client(bot_token)
+    try:
+        data = client.call("files.info", {"file": file_id})
+        file_info = data.get("file", {}) if data.get("ok") else {}
+        download_url = file_info.get("url_private_download") or file_info.get("url_private")
+        if not download_url:
+            _log("WARN", "attachment_slack_download_failed", {
+                "correlation_id": correlation_id,
+                "file_id": file_id,
+                "error": data.get("error") or "no_download_url",
+            })
+            return None
+
+        declared_size = file_info.get("size") or attachment.get("size") or 0
+        if declared_size > ATTACHMENT_MAX_BYTES:
+            raise FileTooLargeError(ATTACHMENT_MAX_BYTES)
+
+        version = _file_version(file_info)
+        cached = find_cached_attachment(file_id, version, declared_size)
+        if cached is not None:
+            _log("INFO", "attachment_cache_hit", {
+                "correlation_id": correlation_id,
+                "file_id": file_id,
+                "key": cached.key,
+            })
+            return RelayedAttachment(
+                file_id=file_id,
+                name=file_name,
+                mimetype=mimetype,
+                size=declared_size,
+                s3_key=cached.key,
+                presigned_url=generate_presigned_url(cached.key),
+                content_sha256=cached.sha256,
+                cache_hit=True,
+            )
+
+        with closing(client.open_download(download_url, timeout=DOWNLOAD_TIMEOUT_SECONDS)) as response:
+            stored = upload_stream_to_s3(
+                response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES),
+                correlation_id,
+                file_id,
+                file_name,
+                mimetype,
+                max_bytes=ATTACHMENT_MAX_BYTES,
+            )
+        presigned_url = generate_presigned_url(stored.key)
+        store_cached_attachment(stored.key, file_id, version, stored.sha256, file_name)
+    except FileTooLargeError as e:
+        _log("WARN", "attachment_too_large", {
+            "correlation_id": correlation_id,
+            "file_id": file_id,
+            "max_bytes": e.max_bytes,
+        })
+        return None
+    except ClientError as e:
+        _log("ERROR", "attachment_s3_upload_failed", {
+            "correlation_id": correlation_id,
+            "file_id": file_id,
+            "error": str(e),
+        })
+        return None
+    except Exception as e:
+        _log("WARN", "attachment_slack_download_failed", {
+            "correlation_id": correlation_id,
+            "file_id": file_id,
+            "error": str(e),
+            "error_type": type(e).__name__,
+        })
+        return None
+
+    return RelayedAttachment(
+        file_id=file_id,
+        name=file_name,
+        mimetype=mimetype,
+        size=stored.size,
+        s3_key=stored.key,
+        presigned_url=presigned_url,
+        content_sha256=stored.sha256,
+    )
+
+
+def relay_attachments(
+    attachments: List[dict],
+    bot_token: str,
+    correlation_id: str,
+) -> List[RelayedAttachment]:
+    """
+    Relay attachments concurrently.
+
+    Returns:
+        The relayed attachments in input order; skipped files are left out.
+    """
+    if not attachments:
+        return []
+    if len(attachments) == 1:
+        relayed = [relay_attachment(bot_token, attachments[0], correlation_id)]
+    else:
+        futures = [
+            _relay_executor.submit(relay_attachment, bot_token, att, correlation_id)
+            for att in attachments
+        ]
+        relayed = [future.result() for future in futures]
+    return [r for r in relayed if r is not None]
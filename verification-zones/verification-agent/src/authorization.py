@@ -17,15 +17,19 @@ Manager, or environment variables) so it is self-contained without importing
 from the Lambda-specific whitelist_loader module.
 """
 
+import hashlib
 import json
 import os
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, List, Mapping, Optional, Set, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
+from cloudwatch_metrics import emit_metric
 from logger_util import get_logger, log
 
 _logger = get_logger()
@@ -63,44 +67,16 @@ def log_error(
 # ---------------------------------------------------------------------------
 # CloudWatch metrics
 # ---------------------------------------------------------------------------
-_cloudwatch_client = None
-
-
-def _get_cloudwatch_client():
-    """Get CloudWatch client (singleton pattern)."""
-    global _cloudwatch_client
-    if _cloudwatch_client is None:
-        _cloudwatch_client = boto3.client("cloudwatch", region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"))
-    return _cloudwatch_client
-
-
 def _emit_metric(metric_name: str, value: float, unit: str = "Count") -> None:
     """
-    Emit CloudWatch custom metric.
+    Emit CloudWatch custom metric (buffered and flushed in batches by cloudwatch_metrics).
 
     Args:
         metric_name: Metric name (e.g., "WhitelistAuthorizationSuccess")
         value: Metric value
         unit: Metric unit (default: "Count")
     """
-    try:
-        client = _get_cloudwatch_client()
-        client.put_metric_data(
-            Namespace="SlackEventHandler",
-            MetricData=[
-                {
-                    "MetricName": metric_name,
-                    "Value": value,
-                    "Unit": unit,
-                }
-            ],
-        )
-    except Exception as e:
-        # Log but don't fail on metric emission errors
-        log_error("cloudwatch_metric_emission_failed", {
-            "metric_name": metric_name,
-            "error": str(e),
-        }, include_stack_trace=False)
+    emit_metric("SlackEventHandler", metric_name, value, unit)
 
 
 # ---------------------------------------------------------------------------
@@ -110,6 +86,24 @@ def _emit_metric(metric_name: str, value: float, unit: str = "Count") -> None:
 # In-memory cache for whitelist configuration
 _whitelist_cache: Optional[Dict[str, Any]] = None
 _cache_ttl: int = 300  # 5 minutes in seconds
+# Refresh in the background once the last full load is this close to expiry,
+# so no request has to wait for a reload while the cache is warm
+_refresh_ahead_seconds: int = int(os.environ.get("WHITELIST_REFRESH_AHEAD_SECONDS", "60"))
+# Apply DynamoDB changes (items whose updated_at is newer than the last load) this
+# often between full loads; 0 disables incremental refresh
+_incremental_refresh_seconds: int = int(os.environ.get("WHITELIST_INCREMENTAL_REFRESH_SECONDS", "0"))
+# updated_at watermark overlap to tolerate clock skew between writers
+_WATERMARK_OVERLAP_SECONDS = 60
+
+_refresh_lock = threading.Lock()
+_refresh_in_progress = False
+
+# DynamoDB entity_type -> (id set key, label dict key)
+_ENTITY_KEYS: Dict[str, Tuple[str, str]] = {
+    "team_id": ("team_ids", "team_labels"),
+    "user_id": ("user_ids", "user_labels"),
+    "channel_id": ("channel_ids", "channel_labels"),
+}
 
 
 class WhitelistLoaderError(Exception):
@@ -133,12 +127,55 @@ def _is_cache_valid() -> bool:
     return (current_time - cached_at) < _cache_ttl
 
 
+def _query_entity_items(
+    dynamodb, table_name: str, entity_type: str, since: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every whitelist item of one entity type, following LastEvaluatedKey.
+
+    Args:
+        dynamodb: boto3 DynamoDB client
+        table_name: Whitelist table name
+        entity_type: Partition key value (team_id, user_id, channel_id)
+        since: If set, only items with updated_at greater than this epoch second
+    """
+    kwargs: Dict[str, Any] = {
+        "TableName": table_name,
+        "KeyConditionExpression": "entity_type = :entity_type",
+        "ExpressionAttributeValues": {":entity_type": {"S": entity_type}},
+    }
+    if since is not None:
+        kwargs["FilterExpression"] = "updated_at > :since"
+        kwargs["ExpressionAttributeValues"][":since"] = {"N": str(since)}
+    while True:
+        response = dynamodb.query(**kwargs)
+        yield from response.get("Items", [])
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        kwargs["ExclusiveStartKey"] = last_key
+
+
+def _parse_whitelist_item(item: Dict[str, Any]) -> Tuple[Optional[str], str, bool, int]:
+    """Return (entity_id, label, deleted, updated_at) from a low-level DynamoDB item."""
+    entity_id = item.get("entity_id", {}).get("S")
+    label = item.get("label", {}).get("S", "")
+    deleted = bool(item.get("deleted", {}).get("BOOL", False))
+    try:
+        updated_at = int(item.get("updated_at", {}).get("N", "0"))
+    except ValueError:
+        updated_at = 0
+    return entity_id, label, deleted, updated_at
+
+
 def _get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
     """
     Load whitelist configuration from DynamoDB table.
 
-    Queries DynamoDB table for all entity types (team_id, user_id, channel_id)
-    and returns a dictionary with sets of allowed IDs.
+    Queries DynamoDB table for all entity types (team_id, user_id, channel_id),
+    following pagination, and returns a dictionary with sets of allowed IDs.
+    Items marked ``deleted`` are skipped. The result also carries a
+    ``watermark`` (epoch seconds) from which incremental refresh continues.
 
     Returns:
         Dictionary with keys: "team_ids", "user_ids", "channel_ids"
@@ -163,36 +200,15 @@ def _get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
         }
 
         # Query each entity type
-        for entity_type in ["team_id", "user_id", "channel_id"]:
+        for entity_type, (ids_key, labels_key) in _ENTITY_KEYS.items():
             try:
-                response = dynamodb.query(
-                    TableName=table_name,
-                    KeyConditionExpression="entity_type = :entity_type",
-                    ExpressionAttributeValues={
-                        ":entity_type": {"S": entity_type}
-                    }
-                )
-
-                # Extract entity IDs from response
-                for item in response.get("Items", []):
-                    entity_id = item.get("entity_id", {}).get("S")
-                    if entity_id:
-                        # Map entity_type to dictionary key
-                        if entity_type == "team_id":
-                            whitelist["team_ids"].add(entity_id)
-                            label = item.get("label", {}).get("S", "")
-                            if label:
-                                whitelist["team_labels"][entity_id] = label
-                        elif entity_type == "user_id":
-                            whitelist["user_ids"].add(entity_id)
-                            label = item.get("label", {}).get("S", "")
-                            if label:
-                                whitelist["user_labels"][entity_id] = label
-                        elif entity_type == "channel_id":
-                            whitelist["channel_ids"].add(entity_id)
-                            label = item.get("label", {}).get("S", "")
-                            if label:
-                                whitelist["channel_labels"][entity_id] = label
+                for item in _query_entity_items(dynamodb, table_name, entity_type):
+                    entity_id, label, deleted, _ = _parse_whitelist_item(item)
+                    if not entity_id or deleted:
+                        continue
+                    whitelist[ids_key].add(entity_id)
+                    if label:
+                        whitelist[labels_key][entity_id] = label
             except ClientError as e:
                 error_code = e.response.get("Error", {}).get("Code", "")
                 if error_code == "ResourceNotFoundException":
@@ -204,6 +220,9 @@ def _get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
                 else:
                     raise
 
+        # Changes written after this point are picked up by incremental refresh
+        whitelist["watermark"] = int(time.time()) - _WATERMARK_OVERLAP_SECONDS
+
         log_info("whitelist_loaded_from_dynamodb", {
             "table_name": table_name,
             "team_ids_count": len(whitelist["team_ids"]),
@@ -229,6 +248,36 @@ def _get_whitelist_from_dynamodb() -> Dict[str, Set[str]]:
         raise WhitelistLoaderError(f"Unexpected error loading whitelist from DynamoDB: {str(e)}")
 
 
+def _get_whitelist_changes_from_dynamodb(since: int) -> List[Tuple[str, str, str, bool, int]]:
+    """
+    Read whitelist items changed after ``since`` (incremental refresh).
+
+    Only items that carry an ``updated_at`` epoch-second attribute are seen;
+    removals are picked up through ``deleted`` tombstones or the next full load.
+
+    Returns:
+        List of (entity_type, entity_id, label, deleted, updated_at)
+
+    Raises:
+        WhitelistLoaderError: If DynamoDB access fails
+    """
+    table_name = os.environ.get("WHITELIST_TABLE_NAME")
+    if not table_name:
+        raise WhitelistLoaderError("WHITELIST_TABLE_NAME environment variable not set")
+
+    try:
+        dynamodb = boto3.client("dynamodb", region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"))
+        changes = []
+        for entity_type in _ENTITY_KEYS:
+            for item in _query_entity_items(dynamodb, table_name, entity_type, since=since):
+                entity_id, label, deleted, updated_at = _parse_whitelist_item(item)
+                if entity_id:
+                    changes.append((entity_type, entity_id, label, deleted, updated_at))
+        return changes
+    except Exception as e:
+        raise WhitelistLoaderError(f"Failed to load whitelist changes from DynamoDB: {str(e)}")
+
+
 def _get_whitelist_from_secrets_manager() -> Dict[str, Set[str]]:
     """
     Load whitelist configuration from AWS Secrets Manager.
@@ -420,50 +469,24 @@ def _get_whitelist_from_env() -> Dict[str, Set[str]]:
     return whitelist
 
 
-def load_whitelist_config() -> Dict[str, Set[str]]:
+def _load_from_sources() -> Tuple[Dict[str, Any], str]:
     """
-    Load whitelist configuration with priority order and caching.
-
-    Priority order:
-    1. DynamoDB (preferred)
-    2. AWS Secrets Manager (secondary)
-    3. Environment variables (fallback)
-
-    Configuration is cached in memory for 5 minutes (300 seconds).
-    Cache is invalidated after TTL expires.
+    Load whitelist configuration from the first source that succeeds.
 
     Returns:
-        Dictionary with keys: "team_ids", "user_ids", "channel_ids"
-        Each value is a set of allowed entity IDs
+        Tuple of (whitelist dict, source name)
 
     Raises:
         WhitelistLoaderError: If all sources fail
     """
-    global _whitelist_cache
-
-    # Check cache first
-    if _is_cache_valid():
-        log_info("whitelist_cache_hit", {
-            "cached_at": _whitelist_cache.get("cached_at"),
-        })
-        return {
-            "team_ids": _whitelist_cache["team_ids"],
-            "user_ids": _whitelist_cache["user_ids"],
-            "channel_ids": _whitelist_cache["channel_ids"],
-            "team_labels": _whitelist_cache.get("team_labels", {}),
-            "user_labels": _whitelist_cache.get("user_labels", {}),
-            "channel_labels": _whitelist_cache.get("channel_labels", {}),
-        }
-
-    # Cache miss or expired - load from source
-    log_info("whitelist_cache_miss", {})
-
     whitelist: Optional[Dict[str, Set[str]]] = None
+    source = ""
     last_error: Optional[str] = None
 
     # Try DynamoDB first (priority 1)
     try:
         whitelist = _get_whitelist_from_dynamodb()
+        source = "dynamodb"
         log_info("whitelist_source_dynamodb", {})
     except WhitelistLoaderError as e:
         last_error = str(e)
@@ -475,6 +498,7 @@ def load_whitelist_config() -> Dict[str, Set[str]]:
     if whitelist is None:
         try:
             whitelist = _get_whitelist_from_secrets_manager()
+            source = "secrets_manager"
             log_info("whitelist_source_secrets_manager", {})
         except WhitelistLoaderError as e:
             last_error = str(e)
@@ -486,6 +510,7 @@ def load_whitelist_config() -> Dict[str, Set[str]]:
     if whitelist is None:
         try:
             whitelist = _get_whitelist_from_env()
+            source = "env"
             log_info("whitelist_source_env", {})
         except WhitelistLoaderError as e:
             last_error = str(e)
@@ -502,32 +527,471 @@ def load_whitelist_config() -> Dict[str, Set[str]]:
         _emit_metric("WhitelistConfigLoadErrors", 1.0)
         raise WhitelistLoaderError(error_message)
 
-    # Cache the whitelist
-    _whitelist_cache = {
-        "team_ids": whitelist["team_ids"],
-        "user_ids": whitelist["user_ids"],
-        "channel_ids": whitelist["channel_ids"],
-        "team_labels": whitelist.get("team_labels", {}),
-        "user_labels": whitelist.get("user_labels", {}),
-        "channel_labels": whitelist.get("channel_labels", {}),
-        "cached_at": int(time.time()),
+    return whitelist, source
+
+
+def _build_cache_entry(
+    whitelist: Dict[str, Any],
+    source: str,
+    now: int,
+    full_loaded_at: Optional[int] = None,
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Freeze a loaded whitelist into an immutable cache entry around a compiled index.
+
+    If the content is unchanged from ``previous`` (same version), its index is reused.
+    """
+    index = whitelist.get("index") or AuthorizationIndex.from_whitelist(whitelist)
+    previous_index = previous.get("index") if previous else None
+    if previous_index is not None and previous_index.version == index.version:
+        index = previous_index
+    return {
+        **_index_view(index),
+        "index": index,
+        "cached_at": now,
         "ttl": _cache_ttl,
+        "source": source,
+        "full_loaded_at": now if full_loaded_at is None else full_loaded_at,
+        "watermark": whitelist.get("watermark"),
+    }
+
+
+def _cache_view(cache: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the public whitelist dict for a cache entry."""
+    return {
+        "team_ids": cache["team_ids"],
+        "user_ids": cache["user_ids"],
+        "channel_ids": cache["channel_ids"],
+        "team_labels": cache.get("team_labels", {}),
+        "user_labels": cache.get("user_labels", {}),
+        "channel_labels": cache.get("channel_labels", {}),
     }
 
+
+def _apply_whitelist_changes(
+    base: Dict[str, Any], changes: List[Tuple[str, str, str, bool, int]], now: int
+) -> Dict[str, Any]:
+    """Build a new cache entry from ``base`` with incremental changes applied."""
+    whitelist: Dict[str, Any] = {}
+    for ids_key, labels_key in _ENTITY_KEYS.values():
+        whitelist[ids_key] = set(base[ids_key])
+        whitelist[labels_key] = dict(base.get(labels_key, {}))
+    for entity_type, entity_id, label, deleted, _ in changes:
+        ids_key, labels_key = _ENTITY_KEYS[entity_type]
+        if deleted:
+            whitelist[ids_key].discard(entity_id)
+            whitelist[labels_key].pop(entity_id, None)
+            continue
+        whitelist[ids_key].add(entity_id)
+        if label:
+            whitelist[labels_key][entity_id] = label
+        else:
+            whitelist[labels_key].pop(entity_id, None)
+    whitelist["watermark"] = now - _WATERMARK_OVERLAP_SECONDS
+    return _build_cache_entry(
+        whitelist, base["source"], now, full_loaded_at=base["full_loaded_at"], previous=base
+    )
+
+
+def _full_reload_due(cache: Dict[str, Any], now: int) -> bool:
+    full_loaded_at = cache.get("full_loaded_at", cache.get("cached_at", 0))
+    return now - full_loaded_at >= _cache_ttl - _refresh_ahead_seconds
+
+
+def _incremental_refresh_due(cache: Dict[str, Any], now: int) -> bool:
+    return (
+        _incremental_refresh_seconds > 0
+        and cache.get("source") == "dynamodb"
+        and cache.get("watermark") is not None
+        and now - cache.get("cached_at", 0) >= _incremental_refresh_seconds
+    )
+
+
+def _refresh_whitelist_cache(base: Dict[str, Any]) -> None:
+    """
+    Background refresh: full reload near expiry, otherwise incremental changes.
+
+    The new entry is installed only if the cache still holds ``base``. On failure
+    the current entry keeps serving until it expires, after which the next request
+    reloads synchronously (fail-closed if every source fails).
+    """
+    global _whitelist_cache, _refresh_in_progress
+    try:
+        now = int(time.time())
+        if _full_reload_due(base, now):
+            mode = "full"
+            whitelist, source = _load_from_sources()
+            entry = _build_cache_entry(whitelist, source, now, previous=base)
+        else:
+            mode = "incremental"
+            changes = _get_whitelist_changes_from_dynamodb(base["watermark"])
+            entry = _apply_whitelist_changes(base, changes, now)
+
+        with _refresh_lock:
+            installed = _whitelist_cache is base
+            if installed:
+                _whitelist_cache = entry
+        if installed and mode == "full":
+            _maybe_write_snapshot(entry)
+
+        log_info("whitelist_background_refresh_completed", {
+            "mode": mode,
+            "installed": installed,
+            "version": entry["index"].version,
+            "team_ids_count": len(entry["team_ids"]),
+            "user_ids_count": len(entry["user_ids"]),
+            "channel_ids_count": len(entry["channel_ids"]),
+        })
+    except Exception as e:
+        log_warn("whitelist_background_refresh_failed", {
+            "error": str(e),
+        })
+    finally:
+        with _refresh_lock:
+            _refresh_in_progress = False
+
+
+def _schedule_refresh(base: Dict[str, Any]) -> None:
+    """Start a background refresh unless one is already running."""
+    global _refresh_in_progress
+    with _refresh_lock:
+        if _refresh_in_progress:
+            return
+        _refresh_in_progress = True
+    threading.Thread(
+        target=_refresh_whitelist_cache,
+        args=(base,),
+        name="whitelist-refresh",
+        daemon=True,
+    ).start()
+
+
+def load_whitelist_config() -> Dict[str, Set[str]]:
+    """
+    Load whitelist configuration with priority order and caching.
+
+    Priority order:
+    1. DynamoDB (preferred)
+    2. AWS Secrets Manager (secondary)
+    3. Environment variables (fallback)
+
+    Configuration is cached in memory for 5 minutes (300 seconds) as a compiled
+    AuthorizationIndex. On a cold start, a snapshot from WHITELIST_SNAPSHOT_PATH or
+    WHITELIST_SNAPSHOT_S3_URI (if configured and fresh) is served instead of
+    querying the sources.
+    Once the last full load is within WHITELIST_REFRESH_AHEAD_SECONDS of expiry,
+    the cached value keeps being served while a background thread reloads it;
+    with WHITELIST_INCREMENTAL_REFRESH_SECONDS set, DynamoDB changes are applied
+    in the background between full loads. Only a cold or expired cache blocks
+    the caller.
+
+    Returns:
+        Dictionary with keys: "team_ids", "user_ids", "channel_ids"
+        Each value is a set of allowed entity IDs
+
+    Raises:
+        WhitelistLoaderError: If all sources fail
+    """
+    global _whitelist_cache
+
+    # Check cache first
+    cache = _whitelist_cache
+    if _is_cache_valid() and cache is not None:
+        log_info("whitelist_cache_hit", {
+            "cached_at": cache.get("cached_at"),
+        })
+        now = int(time.time())
+        if _full_reload_due(cache, now) or _incremental_refresh_due(cache, now):
+            _schedule_refresh(cache)
+        return _cache_view(cache)
+
+    # Cache miss or expired - load from source
+    log_info("whitelist_cache_miss", {})
+    now = int(time.time())
+
+    # Cold start: serve a fresh snapshot (if configured) and reload in the background
+    if cache is None:
+        snapshot_entry = _load_snapshot_entry(now)
+        if snapshot_entry is not None:
+            _whitelist_cache = snapshot_entry
+            if _full_reload_due(snapshot_entry, now):
+                _schedule_refresh(snapshot_entry)
+            return _cache_view(snapshot_entry)
+
+    whitelist, source = _load_from_sources()
+
+    # Cache the whitelist
+    cache = _build_cache_entry(whitelist, source, now, previous=cache)
+    _whitelist_cache = cache
+    _maybe_write_snapshot(cache)
+
     log_info("whitelist_loaded_and_cached", {
-        "team_ids_count": len(whitelist["team_ids"]),
-        "user_ids_count": len(whitelist["user_ids"]),
-        "channel_ids_count": len(whitelist["channel_ids"]),
-        "cached_at": _whitelist_cache["cached_at"],
+        "team_ids_count": len(cache["team_ids"]),
+        "user_ids_count": len(cache["user_ids"]),
+        "channel_ids_count": len(cache["channel_ids"]),
+        "cached_at": cache["cached_at"],
+        "version": cache["index"].version,
+    })
+
+    return _cache_view(cache)
+
+
+# ---------------------------------------------------------------------------
+# Authorization index (compiled once per whitelist version)
+# ---------------------------------------------------------------------------
+
+# Optional snapshot locations for cold starts (local file first, then S3)
+WHITELIST_SNAPSHOT_PATH = os.environ.get("WHITELIST_SNAPSHOT_PATH", "")
+WHITELIST_SNAPSHOT_S3_URI = os.environ.get("WHITELIST_SNAPSHOT_S3_URI", "")
+# Snapshots older than this are ignored
+WHITELIST_SNAPSHOT_MAX_AGE_SECONDS = int(os.environ.get("WHITELIST_SNAPSHOT_MAX_AGE_SECONDS", "3600"))
+_SNAPSHOT_FORMAT = 1
+
+_snapshot_attempted = False
+_snapshot_version: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class IndexLookup:
+    """Result of one AuthorizationIndex.lookup call."""
+    unauthorized_entities: Tuple[str, ...]
+    checked_entities: Tuple[str, ...]
+    skipped_entities: Tuple[str, ...]
+    team_label: Optional[str] = None
+    user_label: Optional[str] = None
+    channel_label: Optional[str] = None
+
+    @property
+    def authorized(self) -> bool:
+        return not self.unauthorized_entities
+
+
+@dataclass(frozen=True)
+class AuthorizationIndex:
+    """
+    Immutable whitelist index built once per whitelist version.
+
+    ID sets are frozensets and label maps are read-only, so one instance can be
+    shared across threads and reused by every request until the whitelist changes.
+    """
+    team_ids: FrozenSet[str]
+    user_ids: FrozenSet[str]
+    channel_ids: FrozenSet[str]
+    team_labels: Mapping[str, str]
+    user_labels: Mapping[str, str]
+    channel_labels: Mapping[str, str]
+    version: str
+
+    @classmethod
+    def from_whitelist(cls, whitelist: Dict[str, Any]) -> "AuthorizationIndex":
+        """Compile an index from a whitelist dict (ID sets plus optional label dicts)."""
+        fields: Dict[str, Any] = {}
+        for ids_key, labels_key in _ENTITY_KEYS.values():
+            fields[ids_key] = frozenset(whitelist.get(ids_key, ()))
+            fields[labels_key] = MappingProxyType(dict(whitelist.get(labels_key, {})))
+        canonical = json.dumps(
+            {k: sorted(v) if isinstance(v, frozenset) else dict(sorted(v.items())) for k, v in fields.items()},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return cls(version=hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16], **fields)
+
+    @property
+    def allow_all(self) -> bool:
+        """True when no entity type is configured (empty whitelist allows every request)."""
+        return not (self.team_ids or self.user_ids or self.channel_ids)
+
+    def is_channel_allowed(self, channel_id: str) -> bool:
+        """Channel membership; an unconfigured channel whitelist allows all channels."""
+        return not self.channel_ids or channel_id in self.channel_ids
+
+    def lookup(
+        self,
+        team_id: Optional[str],
+        user_id: Optional[str],
+        channel_id: Optional[str],
+    ) -> IndexLookup:
+        """
+        Check all three entities and resolve their labels in one call.
+
+        Only configured entity types (non-empty ID sets) are checked; a configured
+        entity that is missing or not in its set is reported as unauthorized.
+        """
+        unauthorized: List[str] = []
+        checked: List[str] = []
+        skipped: List[str] = []
+        for name, value, ids in (
+            ("team_id", team_id, self.team_ids),
+            ("user_id", user_id, self.user_ids),
+            ("channel_id", channel_id, self.channel_ids),
+        ):
+            if not ids:
+                skipped.append(name)
+                continue
+            checked.append(name)
+            if not value or value not in ids:
+                unauthorized.append(name)
+        return IndexLookup(
+            unauthorized_entities=tuple(unauthorized),
+            checked_entities=tuple(checked),
+            skipped_entities=tuple(skipped),
+            team_label=self.team_labels.get(team_id) if team_id else None,
+            user_label=self.user_labels.get(user_id) if user_id else None,
+            channel_label=self.channel_labels.get(channel_id) if channel_id else None,
+        )
+
+    def to_snapshot(self, generated_at: int) -> Dict[str, Any]:
+        """Serialize to the JSON snapshot format."""
+        snapshot: Dict[str, Any] = {
+            "format": _SNAPSHOT_FORMAT,
+            "version": self.version,
+            "generated_at": generated_at,
+        }
+        for ids_key, labels_key in _ENTITY_KEYS.values():
+            snapshot[ids_key] = sorted(getattr(self, ids_key))
+            snapshot[labels_key] = dict(getattr(self, labels_key))
+        return snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "AuthorizationIndex":
+        """Rebuild an index from a snapshot; raises ValueError on an unknown format or version mismatch."""
+        if snapshot.get("format") != _SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported whitelist snapshot format: {snapshot.get('format')}")
+        index = cls.from_whitelist(snapshot)
+        if snapshot.get("version") and snapshot["version"] != index.version:
+            raise ValueError("Whitelist snapshot version does not match its content")
+        return index
+
+
+def _index_for_whitelist(whitelist: Dict[str, Any]) -> AuthorizationIndex:
+    """Return the cached index when ``whitelist`` is the current cache view, else compile one."""
+    cache = _whitelist_cache
+    index = cache.get("index") if cache else None
+    if (
+        index is not None
+        and whitelist.get("team_ids") is index.team_ids
+        and whitelist.get("user_ids") is index.user_ids
+        and whitelist.get("channel_ids") is index.channel_ids
+    ):
+        return index
+    return AuthorizationIndex.from_whitelist(whitelist)
+
+
+def get_authorization_index() -> AuthorizationIndex:
+    """
+    Return the compiled authorization index for the current whitelist.
+
+    Raises:
+        WhitelistLoaderError: If whitelist configuration cannot be loaded
+    """
+    return _index_for_whitelist(load_whitelist_config())
+
+
+def _parse_s3_uri(uri: str) -> Tuple[str, str]:
+    """Split ``s3://bucket/key`` into (bucket, key)."""
+    if not uri.startswith("s3://") or "/" not in uri[5:]:
+        raise ValueError(f"Invalid S3 URI: {uri}")
+    bucket, key = uri[5:].split("/", 1)
+    return bucket, key
+
+
+def _read_snapshot() -> Optional[Dict[str, Any]]:
+    """Read the snapshot from WHITELIST_SNAPSHOT_PATH, then WHITELIST_SNAPSHOT_S3_URI."""
+    if WHITELIST_SNAPSHOT_PATH and os.path.exists(WHITELIST_SNAPSHOT_PATH):
+        with open(WHITELIST_SNAPSHOT_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    if WHITELIST_SNAPSHOT_S3_URI:
+        bucket, key = _parse_s3_uri(WHITELIST_SNAPSHOT_S3_URI)
+        s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"))
+        try:
+            body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") in ("NoSuchKey", "404"):
+                return None
+            raise
+        return json.loads(body)
+    return None
+
+
+def _load_snapshot_entry(now: int) -> Optional[Dict[str, Any]]:
+    """
+    Build a cache entry from the cold-start snapshot, if one is configured and fresh.
+
+    Attempted once per process. The entry's full_loaded_at is the snapshot's
+    generated_at, so a snapshot close to expiry triggers a background reload
+    from the configured sources straight away.
+    """
+    global _snapshot_attempted, _snapshot_version
+    if _snapshot_attempted or not (WHITELIST_SNAPSHOT_PATH or WHITELIST_SNAPSHOT_S3_URI):
+        return None
+    _snapshot_attempted = True
+    try:
+        snapshot = _read_snapshot()
+        if snapshot is None:
+            return None
+        generated_at = int(snapshot.get("generated_at", 0))
+        if now - generated_at > WHITELIST_SNAPSHOT_MAX_AGE_SECONDS:
+            log_info("whitelist_snapshot_stale", {"generated_at": generated_at})
+            return None
+        index = AuthorizationIndex.from_snapshot(snapshot)
+    except Exception as e:
+        log_warn("whitelist_snapshot_load_failed", {"error": str(e)})
+        return None
+
+    _snapshot_version = index.version
+    log_info("whitelist_snapshot_loaded", {
+        "version": index.version,
+        "generated_at": generated_at,
     })
+    return _build_cache_entry(
+        {**_index_view(index), "index": index}, "snapshot", now, full_loaded_at=generated_at
+    )
 
+
+def _write_snapshot(index: AuthorizationIndex, generated_at: int) -> None:
+    """Write the snapshot to every configured location; never raises."""
+    global _snapshot_version
+    body = json.dumps(index.to_snapshot(generated_at), ensure_ascii=False)
+    try:
+        if WHITELIST_SNAPSHOT_PATH:
+            tmp_path = f"{WHITELIST_SNAPSHOT_PATH}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(body)
+            os.replace(tmp_path, WHITELIST_SNAPSHOT_PATH)
+        if WHITELIST_SNAPSHOT_S3_URI:
+            bucket, key = _parse_s3_uri(WHITELIST_SNAPSHOT_S3_URI)
+            s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"))
+            s3.put_object(Bucket=bucket, Key=key, Body=body.encode("utf-8"), ContentType="application/json")
+        _snapshot_version = index.version
+        log_info("whitelist_snapshot_written", {"version": index.version})
+    except Exception as e:
+        log_warn("whitelist_snapshot_write_failed", {"error": str(e)})
+
+
+def _maybe_write_snapshot(entry: Dict[str, Any]) -> None:
+    """Publish a DynamoDB-sourced whitelist as a snapshot when its version changed."""
+    if not (WHITELIST_SNAPSHOT_PATH or WHITELIST_SNAPSHOT_S3_URI):
+        return
+    index = entry["index"]
+    if entry.get("source") != "dynamodb" or index.version == _snapshot_version:
+        return
+    threading.Thread(
+        target=_write_snapshot,
+        args=(index, entry["full_loaded_at"]),
+        name="whitelist-snapshot",
+        daemon=True,
+    ).start()
+
+
+def _index_view(index: AuthorizationIndex) -> Dict[str, Any]:
     return {
-        "team_ids": whitelist["team_ids"],
-        "user_ids": whitelist["user_ids"],
-        "channel_ids": whitelist["channel_ids"],
-        "team_labels": whitelist.get("team_labels", {}),
-        "user_labels": whitelist.get("user_labels", {}),
-        "channel_labels": whitelist.get("channel_labels", {}),
+        "team_ids": index.team_ids,
+        "user_ids": index.user_ids,
+        "channel_ids": index.channel_ids,
+        "team_labels": index.team_labels,
+        "user_labels": index.user_labels,
+        "channel_labels": index.channel_labels,
     }
 
 
@@ -622,9 +1086,10 @@ def authorize_request(
             timestamp=timestamp,
         )
 
+    index = _index_for_whitelist(whitelist)
+
     # Check if whitelist is completely empty (all entities unset) - allow all requests
-    total_entries = len(whitelist["team_ids"]) + len(whitelist["user_ids"]) + len(whitelist["channel_ids"])
-    if total_entries == 0:
+    if index.allow_all:
         # Empty whitelist means allow all requests
         log_info("whitelist_authorization_success_empty_whitelist", {
             "team_id": team_id,
@@ -643,50 +1108,18 @@ def authorize_request(
         )
 
     # Check each entity against whitelist (conditional AND condition - only check configured entities)
-    unauthorized_entities: List[str] = []
-
-    # Track which entities were checked vs skipped for logging
-    checked_entities: List[str] = []
-    skipped_entities: List[str] = []
-
-    # Check team_id (only if whitelist has team_ids configured)
-    if len(whitelist["team_ids"]) > 0:
-        checked_entities.append("team_id")
-        if not team_id:
-            unauthorized_entities.append("team_id")
-        elif team_id not in whitelist["team_ids"]:
-            unauthorized_entities.append("team_id")
-    else:
-        skipped_entities.append("team_id")
-
-    # Check user_id (only if whitelist has user_ids configured)
-    if len(whitelist["user_ids"]) > 0:
-        checked_entities.append("user_id")
-        if not user_id:
-            unauthorized_entities.append("user_id")
-        elif user_id not in whitelist["user_ids"]:
-            unauthorized_entities.append("user_id")
-    else:
-        skipped_entities.append("user_id")
-
-    # Check channel_id (only if whitelist has channel_ids configured)
-    if len(whitelist["channel_ids"]) > 0:
-        checked_entities.append("channel_id")
-        if not channel_id:
-            unauthorized_entities.append("channel_id")
-        elif channel_id not in whitelist["channel_ids"]:
-            unauthorized_entities.append("channel_id")
-    else:
-        skipped_entities.append("channel_id")
+    # and resolve labels for logging and result in one index lookup
+    lookup = index.lookup(team_id, user_id, channel_id)
+    unauthorized_entities: List[str] = list(lookup.unauthorized_entities)
+    checked_entities: List[str] = list(lookup.checked_entities)
+    skipped_entities: List[str] = list(lookup.skipped_entities)
+    team_label: Optional[str] = lookup.team_label
+    user_label: Optional[str] = lookup.user_label
+    channel_label: Optional[str] = lookup.channel_label
 
     # Calculate latency
     elapsed_time = (time.time() - start_time) * 1000  # Convert to milliseconds
 
-    # Resolve labels for logging and result
-    team_label: Optional[str] = whitelist.get("team_labels", {}).get(team_id) if team_id else None
-    user_label: Optional[str] = whitelist.get("user_labels", {}).get(user_id) if user_id else None
-    channel_label: Optional[str] = whitelist.get("channel_labels", {}).get(channel_id) if channel_id else None
-
     # Determine authorization result
     if len(unauthorized_entities) == 0:
         # All checked entities are authorized
@@ -0,0 +1,63 @@
+"""
+Shared boto3 client factory for the Verification Agent.
+
+``get_client(service, region_name=None, **config)`` returns one client per
+(service, region, config) for the lifetime of the container instead of a new
+client per call, so client construction (endpoint and model loading) and TLS
+setup are paid once. boto3 clients are thread-safe once created; creation is
+serialized with a lock because boto3's default session is not.
+
+- region_name defaults to AWS_REGION_NAME (then ap-northeast-1), so every
+  client is pinned to an explicit region.
+- Every client gets a connection pool of AWS_CLIENT_MAX_POOL_CONNECTIONS
+  (default 32; botocore's default of 10 queues requests from the pipeline's
+  thread pools). Extra botocore Config options can be passed as keywords.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+DEFAULT_REGION = "ap-northeast-1"
+AWS_CLIENT_MAX_POOL_CONNECTIONS = int(os.environ.get("AWS_CLIENT_MAX_POOL_CONNECTIONS", "32"))
+
+_clients: Dict[Tuple[str, str, str], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def default_region() -> str:
+    """Region used when a caller does not pin one."""
+    return os.environ.get("AWS_REGION_NAME", DEFAULT_REGION)
+
+
+def get_client(service_name: str, region_name: Optional[str] = None, **config_options: Any):
+    """
+    Return the shared boto3 client for service_name in region_name.
+
+    Args:
+        service_name: boto3 service name (e.g. "s3", "sqs").
+        region_name: AWS region (default: default_region()).
+        **config_options: botocore Config options (e.g. connect_timeout=2);
+            clients with different options are cached separately.
+    """
+    region = region_name or default_region()
+    key = (service_name, region, repr(sorted(config_options.items())))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            options = {"max_pool_connections": AWS_CLIENT_MAX_POOL_CONNECTIONS, **config_options}
+            client = boto3.client(service_name, region_name=region, config=Config(**options))
+            _clients[key] = client
+        return client
+
+
+def clear_clients() -> None:
+    """Drop all cached clients (tests, credential rotation)."""
+    with _clients_lock:
+        _clients.clear()
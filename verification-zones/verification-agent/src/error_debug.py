@@ -10,14 +10,14 @@ import json
 import os
 import time
 
-import boto3
 from botocore.exceptions import ClientError
 
+from aws_clients import get_client
+
 
 def _get_logs_client():
-    """Get CloudWatch Logs client."""
-    region = os.environ.get("AWS_REGION_NAME", "ap-northeast-1")
-    return boto3.client("logs", region_name=region)
+    """Get the shared CloudWatch Logs client."""
+    return get_client("logs")
 
 
 def log_execution_error(
@@ -25,28 +25,47 @@ def _log(level, event_type, data):
 
 
 class MaxTurnsHook(HookProvider):
-    """Enforces maximum agentic loop turns (tool calls) per request (FR-006)."""
+    """Enforces maximum agentic loop turns per request (FR-006).
+
+    A turn is one model response that requests tools. Tool calls requested in
+    the same response share an event loop cycle and run concurrently, so they
+    count as a single turn; once the limit is reached every call of that turn
+    is cancelled.
+    """
 
     def __init__(self, max_turns: int = 5):
         self.max_turns = max_turns
         self._tool_call_count = 0
+        self._turn_count = 0
+        self._current_cycle = None
         self._fired = False
 
     @property
     def fired(self) -> bool:
         return self._fired
 
+    @property
+    def turn_count(self) -> int:
+        """Number of tool-requesting model turns in the current invocation."""
+        return self._turn_count
+
     def register_hooks(self, registry) -> None:
         registry.add_callback(BeforeInvocationEvent, self._reset)
         registry.add_callback(BeforeToolCallEvent, self._check)
 
     def _reset(self, event) -> None:
         self._tool_call_count = 0
+        self._turn_count = 0
+        self._current_cycle = None
         self._fired = False
 
     def _check(self, event) -> None:
         self._tool_call_count += 1
-        if self._tool_call_count >= self.max_turns:
+        cycle_id = _event_loop_cycle_id(event)
+        if cycle_id is None or cycle_id != self._current_cycle:
+            self._turn_count += 1
+            self._current_cycle = cycle_id
+        if self._turn_count >= self.max_turns:
             self._fired = True
             event.cancel_tool = (
                 "Maximum reasoning turns reached. "
@@ -54,13 +73,27 @@ class MaxTurnsHook(HookProvider):
             )
 
 
+def _event_loop_cycle_id(event):
+    """Return the Strands event loop cycle ID of a tool call event, or None if unknown."""
+    invocation_state = getattr(event, "invocation_state", None)
+    if isinstance(invocation_state, dict):
+        return invocation_state.get("event_loop_cycle_id")
+    return None
+
+
 class ToolLoggingHook(HookProvider):
-    """Emits structured log entry for every tool call (FR-009)."""
+    """Emits structured log entry for every tool call (FR-009).
+
+    Tool calls of one turn may run concurrently; starts are tracked per
+    toolUseId and the number of calls in flight is recorded.
+    """
 
     def __init__(self, correlation_id: str = ""):
         self.correlation_id = correlation_id
         self._agents_called: list = []
         self._call_starts: dict = {}
+        self._call_concurrency: dict = {}
+        self._peak_concurrency = 0
 
     @property
     def agents_called(self) -> list:
@@ -71,6 +104,11 @@ class ToolLoggingHook(HookProvider):
                 seen.append(a)
         return seen
 
+    @property
+    def peak_concurrency(self) -> int:
+        """Largest number of tool calls in flight at once during the loop."""
+        return self._peak_concurrency
+
     def register_hooks(self, registry) -> None:
         registry.add_callback(BeforeInvocationEvent, self._reset)
         registry.add_callback(BeforeToolCallEvent, self._before_tool)
@@ -79,10 +117,14 @@ class ToolLoggingHook(HookProvider):
     def _reset(self, event) -> None:
         self._agents_called = []
         self._call_starts = {}
+        self._call_concurrency = {}
+        self._peak_concurrency = 0
 
     def _before_tool(self, event) -> None:
         tool_use_id = event.tool_use.get("toolUseId", event.tool_use.get("name", ""))
         self._call_starts[tool_use_id] = time.time()
+        self._peak_concurrency = max(self._peak_concurrency, len(self._call_starts))
+        self._call_concurrency[tool_use_id] = len(self._call_starts)
 
     def _after_tool(self, event) -> None:
         tool_name = event.tool_use.get("name", "unknown")
@@ -90,6 +132,7 @@ class ToolLoggingHook(HookProvider):
         tool_input = event.tool_use.get("input", {})
 
         start = self._call_starts.pop(tool_use_id, time.time())
+        concurrent_calls = self._call_concurrency.pop(tool_use_id, 1)
         duration_ms = int((time.time() - start) * 1000)
 
         result = event.result
@@ -109,5 +152,6 @@ class ToolLoggingHook(HookProvider):
             "tool_input": tool_input if isinstance(tool_input, dict) else {},
             "status": status,
             "duration_ms": duration_ms,
+            "concurrent_calls": concurrent_calls,
             "correlation_id": self.correlation_id,
         })
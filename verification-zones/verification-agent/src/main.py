@@ -5,7 +5,7 @@ Amazon Bedrock AgentCore Runtime の A2A プロトコル契約に従う。
 invoke_agent_runtime API は raw JSON ペイロードを POST / に送信するため、
 FastAPI で直接ルーティングする。
 
-- POST / : invoke_agent_runtime ペイロード受信 → pipeline.run()
+- POST / : invoke_agent_runtime ペイロード受信 → pipeline.run()（InvocationPool のワーカースレッドで実行）
 - GET /.well-known/agent-card.json : Agent Card
 - GET /ping : ヘルスチェック
 
@@ -21,8 +21,9 @@ from fastapi.responses import JSONResponse
 import uvicorn
 
 from agent_card import get_agent_card, get_health_status
+from invocation_pool import InvocationPool
 from logger_util import get_logger, log
-from pipeline import run as run_pipeline, is_processing
+from pipeline import run as run_pipeline
 
 _logger = get_logger()
 
@@ -33,12 +34,15 @@ def _log(level: str, event_type: str, data: dict) -> None:
 
 
 app = FastAPI()
+# pipeline.run blocks for the whole orchestration; it runs on this pool so the
+# event loop keeps serving /ping and overlapping invocations.
+_invocation_pool = InvocationPool()
 
 
 @app.get("/ping")
 def ping_endpoint():
     """Health check (required by AgentCore service contract)."""
-    return get_health_status(is_busy=is_processing)
+    return get_health_status(is_busy=_invocation_pool.is_busy)
 
 
 @app.get("/.well-known/agent-card.json")
@@ -70,7 +74,7 @@ async def handle_invocation(request: Request):
             "payload_bytes": len(body),
         })
 
-        result = run_pipeline(payload)
+        result = await _invocation_pool.run(run_pipeline, payload)
         duration_ms = (time.time() - start_time) * 1000
 
         result_data = json.loads(result) if isinstance(result, str) else result
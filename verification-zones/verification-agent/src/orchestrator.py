@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import agent_registry as _agent_registry_module
+import os
 import sys
+import threading
 import traceback
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
@@ -15,7 +17,14 @@ except ImportError:  # pragma: no cover
     Agent = None
     BedrockModel = None
 
+try:
+    from strands.tools.executors import ConcurrentToolExecutor, SequentialToolExecutor
+except ImportError:  # pragma: no cover
+    ConcurrentToolExecutor = None
+    SequentialToolExecutor = None
+
 from logger_util import get_logger, log
+from prompt_cache import cached_system_prompt, record_prompt_cache_usage
 
 _logger = get_logger()
 
@@ -24,6 +33,18 @@ def _log(level, event_type, data):
     log(_logger, level, event_type, data, service="verification-agent")
 
 
+def _parallel_tools_enabled() -> bool:
+    """Read ORCHESTRATOR_PARALLEL_TOOLS (default true): run one turn's tool calls concurrently."""
+    return os.environ.get("ORCHESTRATOR_PARALLEL_TOOLS", "true").strip().lower() not in ("0", "false", "no")
+
+
+def _build_tool_executor():
+    """Return the Strands tool executor for the configured dispatch mode."""
+    if _parallel_tools_enabled():
+        return ConcurrentToolExecutor() if ConcurrentToolExecutor else None
+    return SequentialToolExecutor() if SequentialToolExecutor else None
+
+
 def _clamp_max_turns(value: int) -> int:
     """Clamp max_turns to valid range 1-10, defaulting to 5 if out of range."""
     if isinstance(value, int) and 1 <= value <= 10:
@@ -101,8 +122,10 @@ mentions a Slack message URL, or asks for channel or thread history. Pass the fu
 `query`.
 - **Other capabilities** (e.g. file generation): Use the tool whose description matches the task. \
 Prefer **one** specialist when a single domain clearly covers the request; call **multiple** tools \
-only when the user explicitly needs separate domains (e.g. docs plus Slack search). Invoke tools \
-**one at a time** as needed across turns; merge results yourself—true parallelism is not guaranteed.
+only when the user explicitly needs separate domains (e.g. docs plus Slack search).
+- **Parallel dispatch**: When sub-tasks are independent, request all of their tool calls in the \
+**same turn**; they run in parallel and each call counts toward the same turn. Call tools in \
+later turns only when a task depends on an earlier tool's result.
 
 ## Instructions
 
@@ -153,6 +176,7 @@ class OrchestrationAgent:
         channel: str = "",
         bot_token: str = "",
         correlation_id: str = "",
+        callback_handler=None,
     ):
         from agent_tools import build_agent_tools
         from hooks import MaxTurnsHook, ToolLoggingHook
@@ -161,26 +185,67 @@ class OrchestrationAgent:
         self._registry = agent_registry
         self._model = bedrock_model
         self._file_artifact_store: dict = {}
+        # Per-request values read by tools at call time (rebound by bind_request)
+        self._request_context = {
+            "channel": channel,
+            "bot_token": bot_token,
+            "correlation_id": correlation_id,
+        }
         self._tools = build_agent_tools(agent_registry, self._file_artifact_store)
 
         # Add Slack Search tool when registered in S3 registry and request context is available
-        if channel and bot_token and _agent_registry_module.get_agent_arn("slack-search"):
+        self.has_slack_search = bool(
+            channel and bot_token and _agent_registry_module.get_agent_arn("slack-search")
+        )
+        if self.has_slack_search:
             from slack_search_tool import make_slack_search_tool
-            slack_tool = make_slack_search_tool(channel, bot_token, correlation_id)
+            slack_tool = make_slack_search_tool(
+                channel, bot_token, correlation_id, context=self._request_context
+            )
             self._tools.append(slack_tool)
 
         self._max_turns_hook = MaxTurnsHook(self._max_turns)
         self._logging_hook = ToolLoggingHook()
 
         if Agent is not None:
+            agent_kwargs = {}
+            tool_executor = _build_tool_executor()
+            if tool_executor is not None:
+                agent_kwargs["tool_executor"] = tool_executor
+            # Streaming: receive the model's text deltas (see slack_response_stream)
+            if callback_handler is not None:
+                agent_kwargs["callback_handler"] = callback_handler
             self._agent = Agent(
                 model=bedrock_model,
                 tools=self._tools,
-                system_prompt=ORCHESTRATOR_SYSTEM_PROMPT,
+                system_prompt=cached_system_prompt(ORCHESTRATOR_SYSTEM_PROMPT),
                 hooks=[self._max_turns_hook, self._logging_hook],
+                **agent_kwargs,
             )
+            self._default_callback_handler = self._agent.callback_handler
         else:  # pragma: no cover
             self._agent = None
+            self._default_callback_handler = None
+
+    def bind_request(self, request: OrchestrationRequest, callback_handler=None) -> None:
+        """Reset per-request state so a pooled instance can serve a new request.
+
+        Clears the conversation, metrics and file artifact store left by the
+        previous run and rebinds the Slack context, max_turns and callback handler.
+        """
+        self._file_artifact_store.clear()
+        self._request_context.update(
+            channel=request.channel,
+            bot_token=request.bot_token,
+            correlation_id=request.correlation_id,
+        )
+        self._max_turns = request.max_turns
+        self._max_turns_hook.max_turns = request.max_turns
+        self._logging_hook.correlation_id = request.correlation_id
+        if self._agent is not None:
+            self._agent.messages = []
+            self._agent.event_loop_metrics = type(self._agent.event_loop_metrics)()
+            self._agent.callback_handler = callback_handler or self._default_callback_handler
 
     def run(self, request: OrchestrationRequest) -> OrchestrationResult:
         """Execute the agentic loop for the given orchestration request."""
@@ -199,7 +264,14 @@ class OrchestrationAgent:
 
         try:
             result = self._agent(prompt)
+            record_prompt_cache_usage(result, "orchestrator", request.correlation_id)
             file_artifact = self._file_artifact_store.get("file_artifact")
+            _log("INFO", "orchestration_tool_usage", {
+                "correlation_id": request.correlation_id,
+                "tool_calls": self._max_turns_hook._tool_call_count,
+                "turns": self._max_turns_hook.turn_count,
+                "peak_concurrency": self._logging_hook.peak_concurrency,
+            })
             return _parse_result(result, self._max_turns_hook, self._logging_hook, file_artifact)
         except Exception as e:
             tb_str = traceback.format_exc()
@@ -287,18 +359,121 @@ def _parse_result(result, max_turns_hook, logging_hook, file_artifact=None) -> O
     )
 
 
+class OrchestratorPool:
+    """Idle OrchestrationAgent instances keyed by registry version.
+
+    Building an orchestrator creates every specialist tool, the hooks and a
+    Strands Agent with the full system prompt. Instances are therefore reused
+    across requests: checkout() rebinds per-request state on an idle instance
+    (or builds one), and checkin() returns it. A Strands Agent serves one
+    invocation at a time, so concurrent requests each hold their own instance.
+    When the registry version changes, idle instances built from the old cards
+    are discarded.
+    """
+
+    def __init__(self, max_idle: int = 4):
+        self._max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: dict = {}
+        self._version = None
+
+    def _key(self, registry_version: str, request: OrchestrationRequest, bedrock_model) -> tuple:
+        has_slack_search = bool(
+            request.channel
+            and request.bot_token
+            and _agent_registry_module.get_agent_arn("slack-search")
+        )
+        return (registry_version, has_slack_search, id(bedrock_model), _parallel_tools_enabled())
+
+    def checkout(
+        self,
+        request: OrchestrationRequest,
+        agent_registry: dict,
+        bedrock_model,
+        registry_version: str,
+        callback_handler=None,
+    ) -> OrchestrationAgent:
+        """Return an orchestrator bound to request, reusing an idle instance when possible."""
+        key = self._key(registry_version, request, bedrock_model)
+        orchestrator = None
+        with self._lock:
+            if registry_version != self._version:
+                if self._idle:
+                    _log("INFO", "orchestrator_pool_invalidated", {
+                        "previous_version": self._version,
+                        "version": registry_version,
+                    })
+                self._idle.clear()
+                self._version = registry_version
+            idle = self._idle.get(key)
+            if idle:
+                orchestrator = idle.pop()
+        if orchestrator is None:
+            orchestrator = OrchestrationAgent(
+                agent_registry,
+                bedrock_model,
+                request.max_turns,
+                channel=request.channel,
+                bot_token=request.bot_token,
+                correlation_id=request.correlation_id,
+            )
+            orchestrator._pool_key = key
+        orchestrator.bind_request(request, callback_handler)
+        return orchestrator
+
+    def checkin(self, orchestrator: OrchestrationAgent) -> None:
+        """Return an orchestrator after its run; dropped if stale or the pool is full."""
+        key = getattr(orchestrator, "_pool_key", None)
+        orchestrator.bind_request(
+            OrchestrationRequest("", None, [], {}, "", orchestrator._max_turns)
+        )
+        with self._lock:
+            if key is None or key[0] != self._version:
+                return
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(orchestrator)
+
+    def clear(self) -> None:
+        """Discard every idle instance (e.g. after a registry invalidation)."""
+        with self._lock:
+            self._idle.clear()
+            self._version = None
+
+
+def _get_pool_max_idle() -> int:
+    """Read ORCHESTRATOR_POOL_MAX_IDLE (default 4); 0 disables pooling."""
+    try:
+        return max(0, int(os.environ.get("ORCHESTRATOR_POOL_MAX_IDLE", "4")))
+    except ValueError:
+        return 4
+
+
+_orchestrator_pool = OrchestratorPool(_get_pool_max_idle())
+# Drop idle instances as soon as a registry reload changes the cards
+_agent_registry_module.add_invalidation_listener(_orchestrator_pool.clear)
+
+
 def run_orchestration_loop(
     request: OrchestrationRequest,
     agent_registry: dict,
     bedrock_model,
+    callback_handler=None,
 ) -> OrchestrationResult:
-    """Thin wrapper used by pipeline.py to run the orchestration loop."""
-    orchestrator = OrchestrationAgent(
+    """Thin wrapper used by pipeline.py to run the orchestration loop.
+
+    The orchestrator comes from the process-wide pool keyed by the registry
+    version. callback_handler, when given, receives the Strands streaming
+    events (e.g. SlackResponseStream.callback_handler).
+    """
+    orchestrator = _orchestrator_pool.checkout(
+        request,
         agent_registry,
         bedrock_model,
-        request.max_turns,
-        channel=request.channel,
-        bot_token=request.bot_token,
-        correlation_id=request.correlation_id,
+        _agent_registry_module.get_registry_version(),
+        callback_handler=callback_handler,
     )
-    return orchestrator.run(request)
+    try:
+        return orchestrator.run(request)
+    finally:
+        _orchestrator_pool.checkin(orchestrator)
@@ -11,15 +11,16 @@ import os
 import time
 import traceback
 import uuid
-from typing import Optional, Tuple
-
-import requests
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
 
 from existence_check import check_entity_existence, ExistenceCheckError
 from authorization import authorize_request
 from rate_limiter import check_rate_limit, RateLimitExceededError
 from agent_registry import (
     initialize_registry,
+    start_card_verification,
     get_all_cards,
 )
 from orchestrator import OrchestrationRequest, run_orchestration_loop
@@ -28,13 +29,14 @@ from slack_post_request import (
     build_file_artifact,
     build_file_artifact_s3,
 )
+from attachment_relay import relay_attachments
 from error_debug import log_execution_error
 from logger_util import get_logger, log
+from prompt_cache import bedrock_cache_config
 from slack_url_resolver import resolve_slack_urls
+from slack_response_stream import SlackResponseStream, is_streaming_enabled
 from slack_thread_context import build_current_thread_context
 from s3_file_manager import (
-    upload_file_to_s3,
-    generate_presigned_url,
     generate_presigned_url_for_generated_file,
     upload_generated_file_to_s3,
     cleanup_request_files,
@@ -52,8 +54,14 @@ except ImportError:  # pragma: no cover
 # 028: Threshold for SQS message size; files > 200KB use S3-backed delivery
 SQS_FILE_ARTIFACT_SIZE_THRESHOLD = 200 * 1024
 
-# Used by main.py for /ping HealthyBusy
-is_processing = False
+# Shared pool for the concurrent pre-check stage (security checks + context fetches).
+# Up to 4 tasks per request; sized so a few overlapping requests do not queue.
+PRECHECK_MAX_WORKERS = int(os.environ.get("PRECHECK_MAX_WORKERS", "16"))
+_precheck_executor = ThreadPoolExecutor(
+    max_workers=PRECHECK_MAX_WORKERS, thread_name_prefix="precheck"
+)
+
+_RATE_LIMIT_ERROR_MESSAGE = "Rate limit exceeded. Please try again in a moment."
 
 _logger = get_logger()
 _FALLBACK_MODEL_ID = os.environ.get(
@@ -92,20 +100,48 @@ def _log(level: str, event_type: str, data: dict) -> None:
     log(_logger, level, event_type, data, service="verification-agent")
 
 
-def _save_usage_record(record: UsageRecord) -> None:
-    """Fail-open wrapper: save usage record; never raises."""
+def _save_usage_record(
+    record: UsageRecord,
+    on_persisted: Optional[Callable[[], None]] = None,
+) -> bool:
+    """
+    Fail-open wrapper: queue the usage record on the background writer; never raises.
+
+    Args:
+        on_persisted: Called by the writer once the record (including its
+            attachment copies) has been written.
+
+    Returns:
+        True when queued (on_persisted will be called); False otherwise.
+    """
     table_name = os.environ.get("USAGE_HISTORY_TABLE_NAME", "")
     history_bucket = os.environ.get("USAGE_HISTORY_BUCKET_NAME", "")
     temp_bucket = os.environ.get("FILE_EXCHANGE_BUCKET", "")
     if not table_name or not history_bucket:
-        return
-    usage_history.save(table_name, history_bucket, temp_bucket, record)
+        return False
+    return usage_history.submit(table_name, history_bucket, temp_bucket, record, on_done=on_persisted)
+
+
+def _cleanup_request_files(correlation_id: str) -> None:
+    """Fail-open wrapper: delete the request's temporary S3 files; never raises."""
+    try:
+        cleanup_request_files(correlation_id)
+    except Exception as cleanup_err:
+        _log(
+            "WARN",
+            "s3_cleanup_failed",
+            {
+                "correlation_id": correlation_id,
+                "error": str(cleanup_err),
+            },
+        )
 
 
 # Initialize execution agent registry once at module import (container startup path).
 # Fail-open: keep pipeline runnable even when discovery fails.
 try:
     initialize_registry()
+    start_card_verification()
 except Exception as e:
     _log(
         "WARN",
@@ -117,7 +153,173 @@ except Exception as e:
     )
 
 # Initialize BedrockModel for orchestration loop (fail-open).
-_bedrock_model = BedrockModel(model_id=_FALLBACK_MODEL_ID) if BedrockModel else None
+# Prompt caching adds a Bedrock cache checkpoint after the tool specs (see prompt_cache).
+_bedrock_model = (
+    BedrockModel(model_id=_FALLBACK_MODEL_ID, **bedrock_cache_config()) if BedrockModel else None
+)
+
+
+
+@dataclass
+class _PrecheckRejection:
+    """Outcome of a failed security pre-check.
+
+    ``stage`` is the usage-history rejection stage; empty when the original
+    serial pipeline did not record a usage row for this failure.
+    """
+
+    error_code: str
+    error_message: str
+    stage: str = ""
+    reason: str = ""
+
+
+def _precheck_existence(
+    bot_token: str, team_id: str, user_id: str, channel: str, correlation_id: str
+) -> Optional[_PrecheckRejection]:
+    """Existence check (two-key defense). Fail-closed on ExistenceCheckError."""
+    try:
+        check_entity_existence(
+            bot_token=bot_token,
+            team_id=team_id,
+            user_id=user_id,
+            channel_id=channel,
+        )
+    except ExistenceCheckError as e:
+        _log(
+            "ERROR",
+            "existence_check_failed",
+            {
+                "correlation_id": correlation_id,
+                "team_id": team_id,
+                "error": str(e),
+            },
+        )
+        return _PrecheckRejection(
+            error_code="existence_check_failed",
+            error_message="Entity verification failed",
+            stage="existence_check",
+            reason=str(e),
+        )
+    _log(
+        "INFO",
+        "existence_check_passed",
+        {"correlation_id": correlation_id, "team_id": team_id},
+    )
+    return None
+
+
+def _precheck_authorization(
+    team_id: str, user_id: str, channel: str, correlation_id: str
+) -> Optional[_PrecheckRejection]:
+    """Whitelist authorization. Fail-closed on denial and on unexpected errors."""
+    try:
+        auth_result = authorize_request(
+            team_id=team_id, user_id=user_id, channel_id=channel
+        )
+    except Exception as e:
+        _log(
+            "ERROR",
+            "authorization_error",
+            {
+                "correlation_id": correlation_id,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "traceback": traceback.format_exc(),
+            },
+        )
+        return _PrecheckRejection(
+            error_code="authorization_error",
+            error_message="Authorization check failed",
+        )
+    if not auth_result.authorized:
+        _log(
+            "ERROR",
+            "authorization_failed",
+            {
+                "correlation_id": correlation_id,
+                "team_id": team_id,
+                "unauthorized_entities": auth_result.unauthorized_entities,
+            },
+        )
+        return _PrecheckRejection(
+            error_code="authorization_failed",
+            error_message="Authorization failed",
+            stage="authorization",
+            reason="authorization_failed",
+        )
+    return None
+
+
+def _precheck_rate_limit(
+    team_id: str, user_id: str, correlation_id: str
+) -> Optional[_PrecheckRejection]:
+    """Rate limit. Rejects when exceeded; fail-open on infrastructure errors."""
+    try:
+        is_allowed, _ = check_rate_limit(team_id=team_id, user_id=user_id)
+    except RateLimitExceededError:
+        return _PrecheckRejection(
+            error_code="rate_limit_exceeded",
+            error_message=_RATE_LIMIT_ERROR_MESSAGE,
+        )
+    except Exception as e:
+        # Intentional fail-open: rate limit infra failure should not block user requests.
+        _log(
+            "WARN",
+            "rate_limit_check_error",
+            {
+                "correlation_id": correlation_id,
+                "error": str(e),
+                "error_type": type(e).__name__,
+            },
+        )
+        return None
+    if not is_allowed:
+        _log(
+            "ERROR",
+            "rate_limit_exceeded",
+            {
+                "correlation_id": correlation_id,
+                "team_id": team_id,
+                "user_id": user_id,
+            },
+        )
+        return _PrecheckRejection(
+            error_code="rate_limit_exceeded",
+            error_message=_RATE_LIMIT_ERROR_MESSAGE,
+            stage="rate_limit",
+            reason="rate_limit_exceeded",
+        )
+    return None
+
+
+def _await_security_prechecks(security_futures: List[Future]) -> Optional[_PrecheckRejection]:
+    """
+    Wait for concurrently running security pre-checks in completion order.
+
+    Fail-closed: the first rejection (or unexpected exception) cancels every
+    other pending pre-check. Checks already running on a worker thread finish
+    in the background and their results are discarded.
+
+    Returns:
+        The first rejection, or None when every security check passed.
+    """
+    try:
+        for future in as_completed(security_futures):
+            rejection = future.result()
+            if rejection is not None:
+                _cancel_futures(security_futures)
+                return rejection
+    except BaseException:
+        _cancel_futures(security_futures)
+        raise
+    return None
+
+
+def _cancel_futures(*groups) -> None:
+    for group in groups:
+        for future in group:
+            future.cancel()
 
 
 def _get_user_friendly_error(error_code: str, fallback_message: str = "") -> str:
@@ -253,52 +455,6 @@ def parse_file_artifact(result_data: dict) -> Optional[Tuple[bytes, str, str]]:
     return (file_bytes, name, mime)
 
 
-def _get_slack_file_bytes(bot_token: str, file_id: str) -> Optional[bytes]:
-    """
-    Get file bytes from Slack: files.info for fresh download URL, then GET with bot token.
-
-    Per Slack best practice: event payload URLs may be stale; use files.info for fresh URL.
-    """
-    if not bot_token or not file_id:
-        return None
-    try:
-        info_resp = requests.get(
-            "https://slack.com/api/files.info",
-            headers={"Authorization": f"Bearer {bot_token}"},
-            params={"file": file_id},
-            timeout=10,
-        )
-        info_resp.raise_for_status()
-        data = info_resp.json()
-        if not data.get("ok"):
-            return None
-        file_info = data.get("file", {})
-        download_url = file_info.get("url_private_download") or file_info.get(
-            "url_private"
-        )
-        if not download_url:
-            return None
-        down_resp = requests.get(
-            download_url,
-            headers={"Authorization": f"Bearer {bot_token}"},
-            timeout=30,
-            stream=True,
-        )
-        down_resp.raise_for_status()
-        return down_resp.content
-    except Exception as e:
-        _log(
-            "WARN",
-            "slack_file_download_failed",
-            {
-                "file_id": file_id,
-                "error": str(e),
-                "error_type": type(e).__name__,
-            },
-        )
-        return None
-
-
 def run(payload: dict) -> str:
     """
     Run the full verification pipeline. Called from main.py entrypoint only.
@@ -309,7 +465,6 @@ def run(payload: dict) -> str:
     Returns:
         JSON string: {"status": "completed"|"error", "correlation_id": ..., ...}
     """
-    global is_processing
     correlation_id = str(uuid.uuid4())
     start_time = time.time()
 
@@ -361,68 +516,53 @@ def run(payload: dict) -> str:
             },
         )
 
-        # 1. Existence Check
+        # 1-3.6. Pre-check stage: the read-only security checks (existence check,
+        # whitelist authorization) run concurrently and the first rejection wins.
+        # Context enrichment (thread history, Slack URLs) reads Slack on the
+        # caller's behalf, so it starts only once both have passed; it overlaps
+        # the rate limit check, which consumes quota and therefore runs last.
+        security_futures = []
         if bot_token and (team_id or user_id or channel):
-            try:
-                check_entity_existence(
+            security_futures.append(_precheck_executor.submit(
+                _precheck_existence, bot_token, team_id, user_id, channel, correlation_id
+            ))
+        security_futures.append(_precheck_executor.submit(
+            _precheck_authorization, team_id, user_id, channel, correlation_id
+        ))
+        rejection = _await_security_prechecks(security_futures)
+
+        thread_context_future = None
+        resolved_text_future = None
+        if rejection is None:
+            if bot_token and channel and thread_ts:
+                thread_context_future = _precheck_executor.submit(
+                    build_current_thread_context,
                     bot_token=bot_token,
-                    team_id=team_id,
-                    user_id=user_id,
-                    channel_id=channel,
-                )
-                _log(
-                    "INFO",
-                    "existence_check_passed",
-                    {"correlation_id": correlation_id, "team_id": team_id},
-                )
-            except ExistenceCheckError as e:
-                _log(
-                    "ERROR",
-                    "existence_check_failed",
-                    {
-                        "correlation_id": correlation_id,
-                        "team_id": team_id,
-                        "error": str(e),
-                    },
-                )
-                _pipeline_result.existence_check = False
-                _pipeline_result.rejection_stage = "existence_check"
-                _pipeline_result.rejection_reason = str(e)
-                _save_usage_record(UsageRecord(
                     channel_id=channel,
+                    thread_ts=thread_ts,
                     correlation_id=correlation_id,
-                    team_id=team_id,
-                    user_id=user_id,
-                    pipeline_result=_pipeline_result,
-                    duration_ms=int((time.time() - start_time) * 1000),
-                ))
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error_code": "existence_check_failed",
-                        "error_message": "Entity verification failed",
-                        "correlation_id": correlation_id,
-                    }
+                    current_message_ts=current_message_ts,
                 )
-
-        # 2. Whitelist Authorization
-        try:
-            auth_result = authorize_request(
-                team_id=team_id, user_id=user_id, channel_id=channel
-            )
-            if not auth_result.authorized:
-                _log(
-                    "ERROR",
-                    "authorization_failed",
-                    {
-                        "correlation_id": correlation_id,
-                        "team_id": team_id,
-                        "unauthorized_entities": auth_result.unauthorized_entities,
-                    },
+            if text and bot_token:
+                resolved_text_future = _precheck_executor.submit(
+                    resolve_slack_urls, text, bot_token, correlation_id
                 )
-                _pipeline_result.authorization = False
-                _pipeline_result.rejection_stage = "authorization"
-                _pipeline_result.rejection_reason = "authorization_failed"
+            if team_id or user_id:
+                rejection = _precheck_rate_limit(team_id, user_id, correlation_id)
+                if rejection is not None:
+                    _cancel_futures(
+                        [f for f in (thread_context_future, resolved_text_future) if f is not None]
+                    )
+        if rejection is not None:
+            if rejection.stage:
+                if rejection.stage == "existence_check":
+                    _pipeline_result.existence_check = False
+                elif rejection.stage == "authorization":
+                    _pipeline_result.authorization = False
+                elif rejection.stage == "rate_limit":
+                    _pipeline_result.rate_limited = True
+                _pipeline_result.rejection_stage = rejection.stage
+                _pipeline_result.rejection_reason = rejection.reason
                 _save_usage_record(UsageRecord(
                     channel_id=channel,
                     correlation_id=correlation_id,
@@ -431,102 +571,23 @@ def run(payload: dict) -> str:
                     pipeline_result=_pipeline_result,
                     duration_ms=int((time.time() - start_time) * 1000),
                 ))
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "error_code": "authorization_failed",
-                        "error_message": "Authorization failed",
-                        "correlation_id": correlation_id,
-                    }
-                )
-        except Exception as e:
-            _log(
-                "ERROR",
-                "authorization_error",
-                {
-                    "correlation_id": correlation_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "traceback": traceback.format_exc(),
-                },
-            )
             return json.dumps(
                 {
                     "status": "error",
-                    "error_code": "authorization_error",
-                    "error_message": "Authorization check failed",
+                    "error_code": rejection.error_code,
+                    "error_message": rejection.error_message,
                     "correlation_id": correlation_id,
                 }
             )
 
-        # 3. Rate Limiting
-        try:
-            if team_id or user_id:
-                is_allowed, _ = check_rate_limit(team_id=team_id, user_id=user_id)
-                if not is_allowed:
-                    _log(
-                        "ERROR",
-                        "rate_limit_exceeded",
-                        {
-                            "correlation_id": correlation_id,
-                            "team_id": team_id,
-                            "user_id": user_id,
-                        },
-                    )
-                    _pipeline_result.rate_limited = True
-                    _pipeline_result.rejection_stage = "rate_limit"
-                    _pipeline_result.rejection_reason = "rate_limit_exceeded"
-                    _save_usage_record(UsageRecord(
-                        channel_id=channel,
-                        correlation_id=correlation_id,
-                        team_id=team_id,
-                        user_id=user_id,
-                        pipeline_result=_pipeline_result,
-                        duration_ms=int((time.time() - start_time) * 1000),
-                    ))
-                    return json.dumps(
-                        {
-                            "status": "error",
-                            "error_code": "rate_limit_exceeded",
-                            "error_message": "Rate limit exceeded. Please try again in a moment.",
-                            "correlation_id": correlation_id,
-                        }
-                    )
-        except RateLimitExceededError:
-            return json.dumps(
-                {
-                    "status": "error",
-                    "error_code": "rate_limit_exceeded",
-                    "error_message": "Rate limit exceeded. Please try again in a moment.",
-                    "correlation_id": correlation_id,
-                }
-            )
-        except Exception as e:
-            # Intentional fail-open: rate limit infra failure should not block user requests.
-            _log(
-                "WARN",
-                "rate_limit_check_error",
-                {
-                    "correlation_id": correlation_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
-            )
-
-        # 3.5. Fetch current Slack thread context and inject into prompt text
+        # 3.5. Current Slack thread context (fail-open).
+        # thread_context is passed separately to OrchestrationRequest;
+        # _build_prompt injects it as ## スレッドコンテキスト.
+        # Do NOT prepend to text to avoid duplication in the LLM prompt.
         thread_context = None
-        if bot_token and channel and thread_ts:
+        if thread_context_future is not None:
             try:
-                thread_context = build_current_thread_context(
-                    bot_token=bot_token,
-                    channel_id=channel,
-                    thread_ts=thread_ts,
-                    correlation_id=correlation_id,
-                    current_message_ts=current_message_ts,
-                )
-                # thread_context is passed separately to OrchestrationRequest;
-                # _build_prompt injects it as ## スレッドコンテキスト.
-                # Do NOT prepend here to avoid duplication in the LLM prompt.
+                thread_context = thread_context_future.result()
             except Exception as e:
                 _log(
                     "WARN",
@@ -537,12 +598,11 @@ def run(payload: dict) -> str:
                         "error_type": type(e).__name__,
                     },
                 )
-                # Fail-open: continue with original text
 
-        # 3.6. Resolve Slack message URLs in text
-        if text and bot_token:
+        # 3.6. Slack message URLs resolved in text (fail-open: keep original text)
+        if resolved_text_future is not None:
             try:
-                text = resolve_slack_urls(text, bot_token, correlation_id)
+                text = resolved_text_future.result()
             except Exception as e:
                 _log(
                     "WARN",
@@ -553,13 +613,13 @@ def run(payload: dict) -> str:
                         "error_type": type(e).__name__,
                     },
                 )
-                # Fail-open: continue with original text
 
-        # Enrich attachments with S3 pre-signed URLs: download from Slack, upload to S3
+        # Enrich attachments with S3 pre-signed URLs: stream from Slack into S3 (concurrently)
         # Max 5 files per request; excess are skipped with warning
         MAX_FILES_PER_REQUEST = 5
         execution_attachments = attachments
         did_s3_upload = False
+        cleanup_deferred = False
         if attachments and bot_token:
             if len(attachments) > MAX_FILES_PER_REQUEST:
                 _log(
@@ -573,54 +633,14 @@ def run(payload: dict) -> str:
                     },
                 )
                 attachments = attachments[:MAX_FILES_PER_REQUEST]
-            enriched = []
-            for att in attachments:
-                file_id = att.get("id")
-                file_name = att.get("name", "unknown")
-                mimetype = att.get("mimetype", "application/octet-stream")
-                size = att.get("size", 0)
-                file_bytes = _get_slack_file_bytes(bot_token, file_id)
-                if not file_bytes:
-                    _log(
-                        "WARN",
-                        "attachment_slack_download_failed",
-                        {
-                            "correlation_id": correlation_id,
-                            "file_id": file_id,
-                        },
-                    )
-                    continue
-                try:
-                    s3_key = upload_file_to_s3(
-                        file_bytes, correlation_id, file_id, file_name, mimetype
-                    )
-                    presigned_url = generate_presigned_url(s3_key)
-                    enriched.append(
-                        {
-                            "id": file_id,
-                            "name": file_name,
-                            "mimetype": mimetype,
-                            "size": size,
-                            "presigned_url": presigned_url,
-                        }
-                    )
-                    _temp_attachment_keys.append(s3_key)
-                except Exception as e:
-                    _log(
-                        "ERROR",
-                        "attachment_s3_upload_failed",
-                        {
-                            "correlation_id": correlation_id,
-                            "file_id": file_id,
-                            "error": str(e),
-                        },
-                    )
+            relayed = relay_attachments(attachments, bot_token, correlation_id)
+            enriched = [r.to_file_reference() for r in relayed]
+            _temp_attachment_keys.extend(r.s3_key for r in relayed)
             if enriched:
                 execution_attachments = enriched
                 did_s3_upload = True
 
         # Orchestration loop — dispatches to multiple execution agents via A2A, iterates until done
-        is_processing = True
         _log(
             "INFO",
             "delegating_to_orchestration_loop",
@@ -635,30 +655,15 @@ def run(payload: dict) -> str:
             if did_refresh:
                 try:
                     # Verify agent cards from the actual runtimes (best-effort).
-                    # This is intentionally not per-request; it only runs after refresh (TTL-gated).
-                    from a2a_client import discover_agent_card
-                    from agent_registry import get_agent_ids, get_agent_arn
-
-                    verified = 0
-                    failed = 0
-                    for agent_id in get_agent_ids():
-                        arn = get_agent_arn(agent_id)
-                        if not arn:
-                            continue
-                        card = discover_agent_card(arn)
-                        if isinstance(card, dict) and card:
-                            verified += 1
-                        else:
-                            failed += 1
-                    _log(
-                        "INFO",
-                        "agent_card_verification_completed",
-                        {
-                            "correlation_id": correlation_id,
-                            "verified": verified,
-                            "failed": failed,
-                        },
-                    )
+                    # Runs concurrently in the background; this request keeps the current cards.
+                    from agent_registry import start_card_verification
+
+                    if start_card_verification():
+                        _log(
+                            "INFO",
+                            "agent_card_verification_scheduled",
+                            {"correlation_id": correlation_id},
+                        )
                 except Exception as e:
                     _log(
                         "WARN",
@@ -692,8 +697,28 @@ def run(payload: dict) -> str:
             bot_token=bot_token,
         )
 
+        # Streaming mode: partial text is posted while the loop runs, then edited
+        # into the final answer (requires a thread to locate the message in)
+        response_stream = None
+        if is_streaming_enabled() and thread_ts:
+            response_stream = SlackResponseStream(
+                channel=channel,
+                thread_ts=thread_ts,
+                bot_token=bot_token,
+                correlation_id=correlation_id,
+                message_ts=message_ts,
+            )
+
+        def _final_stream_marker():
+            return response_stream.finish() if response_stream is not None else None
+
         try:
-            orch_result = run_orchestration_loop(orch_request, get_all_cards(), _bedrock_model)
+            orch_result = run_orchestration_loop(
+                orch_request,
+                get_all_cards(),
+                _bedrock_model,
+                callback_handler=response_stream.callback_handler if response_stream else None,
+            )
             response_text = orch_result.synthesized_text
             if orch_result.completion_status == "partial":
                 response_text += "\n（注: 制限により一部のタスクを完了できませんでした）"
@@ -733,8 +758,8 @@ def run(payload: dict) -> str:
                                 bot_token=bot_token,
                                 correlation_id=correlation_id,
                                 message_ts=message_ts,
+                                stream=_final_stream_marker(),
                             )
-                            is_processing = False
                             return json.dumps(
                                 {
                                     "status": "error",
@@ -763,6 +788,7 @@ def run(payload: dict) -> str:
                 bot_token=bot_token,
                 correlation_id=correlation_id,
                 message_ts=message_ts,
+                stream=_final_stream_marker(),
             )
             _log(
                 "INFO",
@@ -776,7 +802,6 @@ def run(payload: dict) -> str:
             )
 
             duration_ms = (time.time() - start_time) * 1000
-            is_processing = False
             _log(
                 "INFO",
                 "orchestration_completed",
@@ -788,7 +813,9 @@ def run(payload: dict) -> str:
                 },
             )
             try:
-                _save_usage_record(UsageRecord(
+                # Attachments are copied into usage history by the background
+                # writer, so temp files are deleted once the record is written.
+                cleanup_deferred = _save_usage_record(UsageRecord(
                     channel_id=channel,
                     correlation_id=correlation_id,
                     team_id=team_id,
@@ -803,7 +830,9 @@ def run(payload: dict) -> str:
                     ),
                     duration_ms=int(duration_ms),
                     attachment_keys=_temp_attachment_keys,
-                ))
+                ), on_persisted=(
+                    (lambda: _cleanup_request_files(correlation_id)) if did_s3_upload else None
+                )) and did_s3_upload
             except Exception as _save_err:
                 _log(
                     "WARN",
@@ -817,7 +846,6 @@ def run(payload: dict) -> str:
             return json.dumps({"status": "completed", "correlation_id": correlation_id})
 
         except Exception as e:
-            is_processing = False
             tb_str = traceback.format_exc()
             _log(
                 "ERROR",
@@ -837,6 +865,7 @@ def run(payload: dict) -> str:
                 bot_token=bot_token,
                 correlation_id=correlation_id,
                 message_ts=message_ts,
+                stream=_final_stream_marker(),
             )
             return json.dumps(
                 {
@@ -847,21 +876,10 @@ def run(payload: dict) -> str:
                 }
             )
         finally:
-            if did_s3_upload:
-                try:
-                    cleanup_request_files(correlation_id)
-                except Exception as cleanup_err:
-                    _log(
-                        "WARN",
-                        "s3_cleanup_failed",
-                        {
-                            "correlation_id": correlation_id,
-                            "error": str(cleanup_err),
-                        },
-                    )
+            if did_s3_upload and not cleanup_deferred:
+                _cleanup_request_files(correlation_id)
 
     except Exception as e:
-        is_processing = False
         tb_str = traceback.format_exc()
         _log(
             "ERROR",
@@ -0,0 +1,90 @@
+"""
+Bedrock prompt caching for the verification agent's Strands agents.
+
+The orchestrator resends the same system prompt and tool specifications on
+every model call of every request. With BEDROCK_PROMPT_CACHE enabled (default)
+the static prefix is marked with Bedrock cache checkpoints:
+
+- ``cached_system_prompt`` turns the system prompt into content blocks ending
+  with a ``cachePoint`` block.
+- ``bedrock_cache_config`` returns the BedrockModel config that adds a
+  ``cachePoint`` after the tool specifications (``cache_tools``).
+
+Bedrock reports the tokens read from and written to the cache in the usage of
+each call; ``record_prompt_cache_usage`` logs the accumulated counts of an
+agent invocation and emits them as CloudWatch metrics.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Union
+
+from cloudwatch_metrics import emit_metric
+from logger_util import get_logger, log
+
+_logger = get_logger()
+
+METRICS_NAMESPACE = "SlackAI/PromptCache"
+METRIC_CACHE_READ_TOKENS = "PromptCacheReadInputTokens"
+METRIC_CACHE_WRITE_TOKENS = "PromptCacheWriteInputTokens"
+METRIC_UNCACHED_INPUT_TOKENS = "PromptUncachedInputTokens"
+
+_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+
+def is_prompt_cache_enabled() -> bool:
+    """Read BEDROCK_PROMPT_CACHE (default true)."""
+    return os.environ.get("BEDROCK_PROMPT_CACHE", "true").strip().lower() not in ("0", "false", "no")
+
+
+def bedrock_cache_config() -> Dict[str, Any]:
+    """BedrockModel keyword arguments that place a cache checkpoint after the tool specs."""
+    if not is_prompt_cache_enabled():
+        return {}
+    return {"cache_tools": "default"}
+
+
+def cached_system_prompt(prompt: str) -> Union[str, List[Dict[str, Any]]]:
+    """Return the system prompt as content blocks ending with a cache checkpoint.
+
+    Returns the plain string when caching is disabled.
+    """
+    if not is_prompt_cache_enabled():
+        return prompt
+    return [{"text": prompt}, dict(_CACHE_POINT)]
+
+
+def _accumulated_usage(result: Any) -> Optional[Dict[str, Any]]:
+    metrics = getattr(result, "metrics", None)
+    usage = getattr(metrics, "accumulated_usage", None)
+    return usage if isinstance(usage, dict) else None
+
+
+def record_prompt_cache_usage(result: Any, agent_name: str, correlation_id: str = "") -> Optional[Dict[str, int]]:
+    """Log and emit the prompt cache token counts of one agent invocation.
+
+    Args:
+        result: Strands AgentResult (``result.metrics.accumulated_usage``).
+        agent_name: Value of the ``Agent`` metric dimension.
+        correlation_id: Request correlation ID for the log entry.
+
+    Returns:
+        The recorded counts, or None when the result carries no usage.
+    """
+    usage = _accumulated_usage(result)
+    if usage is None:
+        return None
+    counts = {
+        "cache_read_input_tokens": int(usage.get("cacheReadInputTokens", 0) or 0),
+        "cache_write_input_tokens": int(usage.get("cacheWriteInputTokens", 0) or 0),
+        "uncached_input_tokens": int(usage.get("inputTokens", 0) or 0),
+    }
+    log(_logger, "INFO", "bedrock_prompt_cache_usage", {
+        "correlation_id": correlation_id,
+        "agent": agent_name,
+        **counts,
+    }, service="verification-agent")
+    dimensions = [{"Name": "Agent", "Value": agent_name}]
+    emit_metric(METRICS_NAMESPACE, METRIC_CACHE_READ_TOKENS, counts["cache_read_input_tokens"], dimensions=dimensions)
+    emit_metric(METRICS_NAMESPACE, METRIC_CACHE_WRITE_TOKENS, counts["cache_write_input_tokens"], dimensions=dimensions)
+    emit_metric(METRICS_NAMESPACE, METRIC_UNCACHED_INPUT_TOKENS, counts["uncached_input_tokens"], dimensions=dimensions)
+    return counts
@@ -1,23 +1,43 @@
 """
 S3 file manager for temporary file exchange between verification and execution zones.
 
-Two prefixes:
+Three prefixes:
   - attachments/{correlation_id}/{file_id}/{file_name} — Slack → Execution Agent
   - generated_files/{correlation_id}/{file_name} — Execution Agent → Slack
+  - attachment_cache/{file_id}/{sha256}/{file_name} — Slack files reused across requests
 
 Large file artifacts (> 200 KB) are uploaded under generated_files/ and delivered
 to Slack Poster via pre-signed URL in the SQS message (bypasses SQS 256 KB limit).
 
 Pre-signed URL expiry: 15 min (default). Lifecycle: 1-day safety net on both prefixes.
+
+Attachments are streamed from Slack with ``upload_stream_to_s3``: chunks are
+buffered up to S3_MULTIPART_PART_SIZE (default 5 MB, the S3 minimum part size)
+and sent as multipart upload parts, so at most one part per file is held in
+memory. Streams that fit into one part are stored with a single PutObject.
+
+Attachment cache: after a Slack file was relayed, the object is copied
+(server-side) to a content-addressed key under
+attachment_cache/{file_id}/{version}/, where version is the files.info change
+indicator (``updated``, else ``timestamp``). A later request referencing the
+same file_id, version and size reuses that object instead of downloading and
+uploading it again; an edited file gets a new version and is fetched afresh. Cached objects are not request
+files: ``cleanup_request_files`` never deletes them; they expire through the
+bucket lifecycle rule (7 days) and are not reused after
+ATTACHMENT_CACHE_TTL_SECONDS (default 6 days, so a URL is never pre-signed
+for an object about to expire).
 """
 
+import hashlib
 import os
 import re
 import time
+from datetime import datetime, timezone
+from typing import Iterable, NamedTuple, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
+from aws_clients import get_client
 from logger_util import get_logger, log
 
 # Default prefix and expiry; overridable via env (set by CDK)
@@ -27,12 +47,44 @@ PRESIGNED_URL_EXPIRY_DEFAULT = int(os.environ.get("PRESIGNED_URL_EXPIRY", "900")
 # 028: Prefix for generated files (Execution → Slack, large file artifact)
 GENERATED_FILES_PREFIX = "generated_files/"
 
+# Content-addressed cache of relayed Slack files (lifecycle: 7 days)
+ATTACHMENT_CACHE_PREFIX = "attachment_cache/"
+ATTACHMENT_CACHE_TTL_SECONDS = int(os.environ.get("ATTACHMENT_CACHE_TTL_SECONDS", str(6 * 24 * 3600)))
+
+# Multipart part size for streamed uploads (S3 requires >= 5 MB for all but the last part)
+_S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_MULTIPART_PART_SIZE = max(
+    _S3_MIN_PART_SIZE,
+    int(os.environ.get("S3_MULTIPART_PART_SIZE", str(_S3_MIN_PART_SIZE))),
+)
+
 # 027: Windows forbidden chars for S3 key sanitization
 _FORBIDDEN_CHARS_RE = re.compile(r'[\\/:*?"<>|]')
 
 _logger = get_logger()
 
 
+class StreamedObject(NamedTuple):
+    """Result of upload_stream_to_s3."""
+    key: str
+    size: int
+    sha256: str
+
+
+class CachedAttachment(NamedTuple):
+    """Object in the attachment cache."""
+    key: str
+    sha256: str
+
+
+class FileTooLargeError(ValueError):
+    """Raised when a streamed upload exceeds its size limit (the upload is aborted)."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File exceeds maximum allowed size ({max_bytes} bytes)")
+        self.max_bytes = max_bytes
+
+
 def _log(level: str, event_type: str, data: dict) -> None:
     """Structured JSON logging with correlation_id when available."""
     log(_logger, level, event_type, data, service="verification-agent-s3-file-manager")
@@ -49,8 +101,8 @@ def _get_bucket_name() -> str:
 
 
 def _s3_client():
-    """Get boto3 S3 client (new each time to avoid thread/env issues)."""
-    return boto3.client("s3", region_name=os.environ.get("AWS_REGION_NAME", "ap-northeast-1"))
+    """Get the shared S3 client (aws_clients: cached per region, pooled connections)."""
+    return get_client("s3")
 
 
 def _sanitize_filename_for_s3(filename: str) -> str:
@@ -174,8 +226,7 @@ def upload_file_to_s3(
         ClientError: On S3 PutObject failure.
     """
     bucket = _get_bucket_name()
-    prefix = FILE_EXCHANGE_PREFIX.rstrip("/")
-    key = f"{prefix}/{correlation_id}/{file_id}/{file_name}"
+    key = _attachment_key(correlation_id, file_id, file_name)
 
     try:
         client = _s3_client()
@@ -206,6 +257,190 @@ def upload_file_to_s3(
     return key
 
 
+def _attachment_key(correlation_id: str, file_id: str, file_name: str) -> str:
+    prefix = FILE_EXCHANGE_PREFIX.rstrip("/")
+    return f"{prefix}/{correlation_id}/{file_id}/{file_name}"
+
+
+def upload_stream_to_s3(
+    chunks: Iterable[bytes],
+    correlation_id: str,
+    file_id: str,
+    file_name: str,
+    mimetype: str,
+    max_bytes: Optional[int] = None,
+) -> StreamedObject:
+    """
+    Stream chunks to S3 under attachments/{correlation_id}/{file_id}/{file_name}.
+
+    Chunks are grouped into S3_MULTIPART_PART_SIZE parts and uploaded as they
+    arrive; a stream smaller than one part is stored with PutObject. The size
+    limit is checked while streaming, so an oversized file is never read in full.
+
+    Args:
+        chunks: File content, e.g. ``response.iter_content(chunk_size)``.
+        correlation_id: Request correlation ID for grouping and cleanup.
+        file_id: Slack file ID (e.g. F01234567).
+        file_name: Original filename.
+        mimetype: MIME type for ContentType.
+        max_bytes: Abort once more than this many bytes were received (None: no limit).
+
+    Returns:
+        StreamedObject with the S3 key, the number of bytes, and their SHA-256.
+
+    Raises:
+        ValueError: If FILE_EXCHANGE_BUCKET is not set.
+        FileTooLargeError: If the stream exceeds max_bytes (multipart upload aborted).
+        ClientError: On S3 failure (multipart upload aborted).
+    """
+    bucket = _get_bucket_name()
+    key = _attachment_key(correlation_id, file_id, file_name)
+    content_type = mimetype or "application/octet-stream"
+    client = _s3_client()
+
+    buffer = bytearray()
+    total = 0
+    digest = hashlib.sha256()
+    upload_id: Optional[str] = None
+    parts = []
+
+    def _upload_part(body: bytes) -> None:
+        nonlocal upload_id
+        if upload_id is None:
+            upload_id = client.create_multipart_upload(
+                Bucket=bucket, Key=key, ContentType=content_type
+            )["UploadId"]
+        part_number = len(parts) + 1
+        resp = client.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body
+        )
+        parts.append({"ETag": resp["ETag"], "PartNumber": part_number})
+
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            total += len(chunk)
+            if max_bytes is not None and total > max_bytes:
+                raise FileTooLargeError(max_bytes)
+            digest.update(chunk)
+            buffer += chunk
+            while len(buffer) >= S3_MULTIPART_PART_SIZE:
+                _upload_part(bytes(buffer[:S3_MULTIPART_PART_SIZE]))
+                del buffer[:S3_MULTIPART_PART_SIZE]
+
+        if upload_id is None:
+            client.put_object(Bucket=bucket, Key=key, Body=bytes(buffer), ContentType=content_type)
+        else:
+            if buffer:
+                _upload_part(bytes(buffer))
+            client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+    except Exception as e:
+        if upload_id is not None:
+            try:
+                client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            except ClientError:
+                pass  # lifecycle rule aborts incomplete uploads after 1 day
+        if isinstance(e, ClientError):
+            _log("ERROR", "s3_upload_failed", {
+                "correlation_id": correlation_id,
+                "file_id": file_id,
+                "key": key,
+                "size": total,
+                "error": str(e),
+                "error_code": e.response.get("Error", {}).get("Code"),
+            })
+        raise
+
+    _log("INFO", "s3_upload_success", {
+        "correlation_id": correlation_id,
+        "file_id": file_id,
+        "key": key,
+        "size": total,
+        "parts": len(parts) or 1,
+    })
+
+    return StreamedObject(key, total, digest.hexdigest())
+
+
+def _cache_prefix(file_id: str, version: str) -> str:
+    return f"{ATTACHMENT_CACHE_PREFIX}{file_id}/{version}/"
+
+
+def find_cached_attachment(file_id: str, version: str, size: int) -> Optional[CachedAttachment]:
+    """
+    Look up a cached copy of a Slack file.
+
+    Only an object of the same file version (files.info change indicator) and
+    expected size stored within ATTACHMENT_CACHE_TTL_SECONDS is returned
+    (newest first). Fail-open: S3 errors are logged and return None.
+    """
+    if not file_id or not version or not size:
+        return None
+    bucket = _get_bucket_name()
+    now = datetime.now(timezone.utc)
+    prefix = _cache_prefix(file_id, version)
+    try:
+        resp = _s3_client().list_objects_v2(Bucket=bucket, Prefix=prefix)
+    except ClientError as e:
+        _log("WARN", "attachment_cache_lookup_failed", {
+            "file_id": file_id,
+            "error": str(e),
+            "error_code": e.response.get("Error", {}).get("Code"),
+        })
+        return None
+
+    candidates = [
+        obj for obj in resp.get("Contents") or []
+        if obj.get("Size") == size
+        and (now - obj["LastModified"]).total_seconds() < ATTACHMENT_CACHE_TTL_SECONDS
+    ]
+    if not candidates:
+        return None
+    newest = max(candidates, key=lambda obj: obj["LastModified"])
+    # attachment_cache/{file_id}/{version}/{sha256}/{file_name}
+    parts = newest["Key"][len(prefix):].split("/")
+    if len(parts) < 2:
+        return None
+    return CachedAttachment(newest["Key"], parts[0])
+
+
+def store_cached_attachment(
+    source_key: str, file_id: str, version: str, sha256: str, file_name: str
+) -> Optional[str]:
+    """
+    Copy a relayed attachment into the attachment cache (server-side copy).
+
+    Returns:
+        The cache key, or None when the file has no version or the copy failed
+        (logged; the request keeps using source_key).
+    """
+    if not version:
+        return None
+    bucket = _get_bucket_name()
+    key = f"{_cache_prefix(file_id, version)}{sha256}/{file_name}"
+    try:
+        _s3_client().copy_object(
+            CopySource={"Bucket": bucket, "Key": source_key},
+            Bucket=bucket,
+            Key=key,
+        )
+    except ClientError as e:
+        _log("WARN", "attachment_cache_store_failed", {
+            "file_id": file_id,
+            "key": key,
+            "error": str(e),
+            "error_code": e.response.get("Error", {}).get("Code"),
+        })
+        return None
+    return key
+
+
 def generate_presigned_url(s3_key: str, expiry: int = PRESIGNED_URL_EXPIRY_DEFAULT) -> str:
     """
     Generate a pre-signed GET URL for the S3 object.
@@ -236,6 +471,9 @@ def cleanup_request_files(correlation_id: str) -> None:
     """
     List and delete all S3 objects under attachments/{correlation_id}/.
 
+    Objects in the attachment cache live under attachment_cache/, outside the
+    listed prefix, so they are never deleted here.
+
     Idempotent: no error if prefix has no objects. Logs and continues on delete failure.
 
     Args:
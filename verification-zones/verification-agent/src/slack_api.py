@@ -0,0 +1,221 @@
+"""
+Shared Slack Web API client layer for the Verification Agent.
+
+Every Slack Web API call of the pipeline goes through this module:
+
+- One process-wide ``requests.Session`` whose connection pool
+  (SLACK_HTTP_POOL_SIZE, default 20) keeps TLS connections to slack.com alive
+  and reuses them across requests and threads.
+- ``get_slack_client(bot_token)`` returns the cached ``SlackApiClient`` of a
+  token (up to SLACK_CLIENT_CACHE_SIZE tokens, least recently used evicted).
+- HTTP 429 is handled the same way everywhere: the call waits for
+  ``Retry-After`` and retries up to SLACK_API_MAX_RETRIES times, unless the
+  wait exceeds SLACK_API_MAX_RETRY_AFTER_SECONDS. A call that stays rate
+  limited returns ``{"ok": False, "error": "ratelimited", "status_code": 429,
+  "retry_after": <seconds>}`` so callers with their own deadline can decide.
+- The latency of every call is emitted per Slack method to CloudWatch
+  (namespace ``SlackAI/SlackApi``, metric ``SlackApiLatency``, dimension
+  ``Method``); rate-limited responses are counted as ``SlackApiRateLimited``.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cloudwatch_metrics import emit_metric
+from logger_util import get_logger, log
+
+_logger = get_logger()
+
+SLACK_API_BASE_URL = "https://slack.com/api/"
+SLACK_HTTP_POOL_SIZE = int(os.environ.get("SLACK_HTTP_POOL_SIZE", "20"))
+SLACK_CLIENT_CACHE_SIZE = int(os.environ.get("SLACK_CLIENT_CACHE_SIZE", "64"))
+SLACK_API_MAX_RETRIES = int(os.environ.get("SLACK_API_MAX_RETRIES", "2"))
+SLACK_API_MAX_RETRY_AFTER_SECONDS = float(os.environ.get("SLACK_API_MAX_RETRY_AFTER_SECONDS", "10"))
+
+METRICS_NAMESPACE = "SlackAI/SlackApi"
+METRIC_LATENCY = "SlackApiLatency"
+METRIC_RATE_LIMITED = "SlackApiRateLimited"
+
+# Metric dimension for requests that are not Web API methods (file downloads)
+FILE_DOWNLOAD_METHOD = "files.download"
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_clients: "OrderedDict[str, SlackApiClient]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _log(level: str, event_type: str, data: dict) -> None:
+    log(_logger, level, event_type, data, service="verification-agent")
+
+
+def _get_session() -> requests.Session:
+    """Return the shared keep-alive session (created on first use)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SLACK_HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "1")))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _record_latency(method: str, started: float) -> None:
+    emit_metric(
+        METRICS_NAMESPACE,
+        METRIC_LATENCY,
+        (time.monotonic() - started) * 1000,
+        unit="Milliseconds",
+        dimensions=[{"Name": "Method", "Value": method}],
+    )
+
+
+class SlackApiClient:
+    """Slack Web API calls for one bot token over the shared session."""
+
+    def __init__(self, bot_token: str):
+        self._headers = {"Authorization": f"Bearer {bot_token}"}
+
+    def _request(
+        self,
+        metric_method: str,
+        http_method: str,
+        url: str,
+        timeout: float,
+        max_retries: Optional[int],
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request, waiting out HTTP 429 responses within the retry budget."""
+        retries = SLACK_API_MAX_RETRIES if max_retries is None else max_retries
+        session = _get_session()
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            response = session.request(http_method, url, headers=self._headers, timeout=timeout, **kwargs)
+            _record_latency(metric_method, started)
+            if response.status_code != 429:
+                return response
+            retry_after = _retry_after_seconds(response)
+            emit_metric(
+                METRICS_NAMESPACE,
+                METRIC_RATE_LIMITED,
+                1,
+                dimensions=[{"Name": "Method", "Value": metric_method}],
+            )
+            if attempt >= retries or retry_after > SLACK_API_MAX_RETRY_AFTER_SECONDS:
+                return response
+            attempt += 1
+            _log("WARN", "slack_api_rate_limited", {
+                "method": metric_method,
+                "retry_after_seconds": retry_after,
+                "attempt": attempt,
+                "max_retries": retries,
+            })
+            response.close()
+            time.sleep(retry_after)
+
+    def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        http_method: str = "GET",
+        timeout: float = 10.0,
+        max_retries: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call a Slack Web API method and return the parsed JSON body.
+
+        Args:
+            method: Web API method name (e.g. "conversations.replies").
+            params: Query parameters (GET) or form fields (POST).
+            http_method: "GET" or "POST".
+            timeout: Per-attempt timeout in seconds.
+            max_retries: 429 retries for this call (default SLACK_API_MAX_RETRIES;
+                0 returns the rate-limited result immediately).
+
+        Returns:
+            The response body. A response that stayed rate limited is returned as
+            ``{"ok": False, "error": "ratelimited", "status_code": 429, "retry_after": s}``.
+
+        Raises:
+            requests.RequestException: On transport errors and non-429 HTTP errors.
+        """
+        key = "params" if http_method.upper() == "GET" else "data"
+        response = self._request(
+            method,
+            http_method,
+            SLACK_API_BASE_URL + method,
+            timeout,
+            max_retries,
+            **{key: params or {}},
+        )
+        if response.status_code == 429:
+            return {
+                "ok": False,
+                "error": "ratelimited",
+                "status_code": 429,
+                "retry_after": _retry_after_seconds(response),
+            }
+        response.raise_for_status()
+        return response.json()
+
+    def download(self, url: str, timeout: float = 30.0) -> bytes:
+        """
+        Download a private Slack file URL (url_private / url_private_download).
+
+        Raises:
+            requests.RequestException: On transport errors, HTTP errors, or when
+                the download stays rate limited.
+        """
+        response = self._request(FILE_DOWNLOAD_METHOD, "GET", url, timeout, None)
+        response.raise_for_status()
+        return response.content
+
+    def open_download(self, url: str, timeout: float = 30.0) -> requests.Response:
+        """
+        Start a streamed download of a private Slack file URL.
+
+        The body is not read: iterate ``response.iter_content()`` and close the
+        response when done (use ``contextlib.closing``) so the connection returns
+        to the pool.
+
+        Raises:
+            requests.RequestException: On transport errors, HTTP errors, or when
+                the download stays rate limited.
+        """
+        response = self._request(FILE_DOWNLOAD_METHOD, "GET", url, timeout, None, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            response.close()
+            raise
+        return response
+
+
+def get_slack_client(bot_token: str) -> SlackApiClient:
+    """Return the cached client for bot_token, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(bot_token)
+        if client is not None:
+            _clients.move_to_end(bot_token)
+            return client
+        client = SlackApiClient(bot_token)
+        _clients[bot_token] = client
+        while len(_clients) > max(1, SLACK_CLIENT_CACHE_SIZE):
+            _clients.popitem(last=False)
+        return client
@@ -4,6 +4,10 @@ Send Slack post requests to SQS for Slack Poster Lambda.
 Verification Agent does not call Slack API directly. It enqueues a structured
 message to SLACK_POST_REQUEST_QUEUE_URL. Slack Poster Lambda consumes and posts.
 
+The queue is FIFO. Requests of one answer share a MessageGroupId (the
+correlation id, or the channel when there is none), so Slack Poster applies
+them in order; every request gets its own deduplication id.
+
 file_artifact supports two delivery modes:
   - inline: contentBase64 + fileName + mimeType (files <= 200 KB)
   - s3: s3PresignedUrl + fileName + mimeType (files > 200 KB)
@@ -13,10 +17,10 @@ import base64
 import json
 import os
 import traceback
+import uuid
 from typing import Optional
 
-import boto3
-
+from aws_clients import get_client
 from logger_util import get_logger, log
 
 _logger = get_logger()
@@ -35,21 +39,32 @@ def send_slack_post_request(
     bot_token: Optional[str] = None,
     correlation_id: str = "",
     message_ts: Optional[str] = None,
-) -> None:
+    stream: Optional[dict] = None,
+) -> bool:
     """
     Enqueue a Slack post request to SQS. No-op if SLACK_POST_REQUEST_QUEUE_URL
     is unset or if channel/bot_token are missing for posting.
+
+    ``stream`` ({id, seq, final}) marks the request as part of a streamed
+    answer; Slack Poster edits the stream's message instead of posting a new one
+    (see slack_response_stream).
+
+    Returns:
+        True when the request was enqueued, False when it was skipped.
+
+    Raises:
+        Exception: The SQS error when sending fails.
     """
     queue_url = (os.environ.get("SLACK_POST_REQUEST_QUEUE_URL") or "").strip()
     if not queue_url:
         _log("WARN", "slack_post_request_skipped", {"reason": "SLACK_POST_REQUEST_QUEUE_URL not set"})
-        return
+        return False
     if not channel or not bot_token or not bot_token.strip():
         _log("WARN", "slack_post_request_skipped", {"reason": "channel or bot_token missing"})
-        return
+        return False
     if not text and not file_artifact:
         _log("WARN", "slack_post_request_skipped", {"reason": "no text or file_artifact"})
-        return
+        return False
 
     body = {
         "channel": channel,
@@ -60,13 +75,24 @@ def send_slack_post_request(
         "bot_token": bot_token,
         "correlation_id": correlation_id,
     }
+    if stream:
+        body["stream"] = stream
     if not body["text"] and not body["file_artifact"]:
-        return
+        return False
     try:
-        region = os.environ.get("AWS_REGION_NAME", "ap-northeast-1")
-        sqs = boto3.client("sqs", region_name=region)
-        sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(body))
-        _log("INFO", "slack_post_request_enqueued", {"channel": channel, "correlation_id": correlation_id})
+        sqs = get_client("sqs")
+        sqs.send_message(
+            QueueUrl=queue_url,
+            MessageBody=json.dumps(body),
+            MessageGroupId=correlation_id or channel,
+            MessageDeduplicationId=str(uuid.uuid4()),
+        )
+        _log("INFO", "slack_post_request_enqueued", {
+            "channel": channel,
+            "correlation_id": correlation_id,
+            "stream_seq": stream.get("seq") if stream else None,
+        })
+        return True
     except Exception as e:
         _log("ERROR", "slack_post_request_enqueue_failed", {
             "channel": channel,
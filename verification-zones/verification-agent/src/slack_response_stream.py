@@ -0,0 +1,170 @@
+"""
+Incremental delivery of the orchestrator's answer to Slack.
+
+When SLACK_STREAMING_ENABLED is true, pipeline.py attaches a SlackResponseStream
+to the orchestration run. The stream receives the model's text deltas through
+the Strands callback handler and, at most every
+SLACK_STREAMING_FLUSH_INTERVAL_SECONDS, enqueues the text generated so far as a
+partial post request. The final answer is enqueued with ``stream.final`` set so
+Slack Poster replaces the partial message with the complete text.
+
+Every request of a stream carries ``stream = {id, seq, final}``. Slack Poster
+posts the first partial, tags it with Slack message metadata, and edits that
+message with chat.update for later requests. The FIFO queue delivers the
+requests of a stream in order; ``seq`` additionally lets Slack Poster drop
+redelivered partials.
+
+Partial updates are best-effort: a partial that cannot be enqueued (SQS error,
+or the request was skipped) disables the stream for the rest of the request and
+the final answer is posted as usual.
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+from logger_util import get_logger, log
+from slack_post_request import send_slack_post_request
+
+_logger = get_logger()
+
+# Appended to partial text so users can tell the answer is still being written
+PARTIAL_SUFFIX = " …"
+
+
+def _log(level: str, event: str, data: Optional[dict] = None) -> None:
+    log(_logger, level, event, data or {}, service="verification-agent")
+
+
+def is_streaming_enabled() -> bool:
+    """Read SLACK_STREAMING_ENABLED (default false)."""
+    return os.environ.get("SLACK_STREAMING_ENABLED", "false").strip().lower() in ("1", "true", "yes")
+
+
+def _get_flush_interval() -> float:
+    """Read SLACK_STREAMING_FLUSH_INTERVAL_SECONDS (default 2.0, minimum 1.0).
+
+    chat.update is a Tier 3 Slack method (~50 calls/minute per workspace), so
+    intervals below one second are clamped.
+    """
+    try:
+        return max(1.0, float(os.environ.get("SLACK_STREAMING_FLUSH_INTERVAL_SECONDS", "2")))
+    except ValueError:
+        return 2.0
+
+
+def _get_min_chars() -> int:
+    """Read SLACK_STREAMING_MIN_CHARS: text needed before the first partial is posted."""
+    try:
+        return max(1, int(os.environ.get("SLACK_STREAMING_MIN_CHARS", "40")))
+    except ValueError:
+        return 40
+
+
+class SlackResponseStream:
+    """Collects model text deltas and flushes them to Slack as partial post requests."""
+
+    def __init__(
+        self,
+        channel: str,
+        thread_ts: Optional[str],
+        bot_token: str,
+        correlation_id: str,
+        message_ts: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        min_chars: Optional[int] = None,
+    ):
+        self.channel = channel
+        self.thread_ts = thread_ts
+        self.bot_token = bot_token
+        self.correlation_id = correlation_id
+        self.message_ts = message_ts
+        self._flush_interval = _get_flush_interval() if flush_interval is None else flush_interval
+        self._min_chars = _get_min_chars() if min_chars is None else min_chars
+        self._lock = threading.Lock()
+        self._text = ""
+        self._sent_text = ""
+        self._seq = 0
+        self._last_flush = float("-inf")
+        self._disabled = False
+        self._closed = False
+
+    @property
+    def started(self) -> bool:
+        """True once at least one partial has been enqueued."""
+        return self._seq > 0
+
+    def callback_handler(self, **kwargs) -> None:
+        """Strands callback handler: consume text deltas and tool-use boundaries."""
+        if "current_tool_use" in kwargs:
+            self.on_tool_use()
+            return
+        data = kwargs.get("data")
+        if isinstance(data, str) and data:
+            self.on_text(data)
+
+    def on_text(self, delta: str) -> None:
+        """Append a text delta from the model and flush if the interval has elapsed."""
+        with self._lock:
+            if self._closed:
+                return
+            self._text += delta
+        self.flush()
+
+    def on_tool_use(self) -> None:
+        """Start a new model turn: the next turn's text replaces the current one."""
+        with self._lock:
+            self._text = ""
+
+    def flush(self, force: bool = False) -> None:
+        """Enqueue the current text as a partial post request when it is due."""
+        with self._lock:
+            if self._closed or self._disabled:
+                return
+            text = self._text.strip()
+            now = time.monotonic()
+            if not text or text == self._sent_text:
+                return
+            if not self.started and len(text) < self._min_chars and not force:
+                return
+            if not force and now - self._last_flush < self._flush_interval:
+                return
+            self._seq += 1
+            seq = self._seq
+            self._sent_text = text
+            self._last_flush = now
+        try:
+            enqueued = send_slack_post_request(
+                channel=self.channel,
+                thread_ts=self.thread_ts,
+                text=text + PARTIAL_SUFFIX,
+                bot_token=self.bot_token,
+                correlation_id=self.correlation_id,
+                message_ts=self.message_ts,
+                stream={"id": self.correlation_id, "seq": seq, "final": False},
+            )
+        except Exception as e:
+            enqueued = False
+            _log("WARN", "slack_stream_partial_failed", {
+                "correlation_id": self.correlation_id,
+                "seq": seq,
+                "error": str(e),
+                "error_type": type(e).__name__,
+            })
+        if not enqueued:
+            with self._lock:
+                self._disabled = True
+
+    def finish(self) -> Optional[dict]:
+        """Close the stream and return the ``stream`` marker for the final post request.
+
+        Returns None when no partial was posted, so the final answer is sent as
+        an ordinary post request.
+        """
+        with self._lock:
+            self._closed = True
+            if not self.started:
+                return None
+            self._seq += 1
+            return {"id": self.correlation_id, "seq": self._seq, "final": True}
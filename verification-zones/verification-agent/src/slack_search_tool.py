@@ -5,7 +5,7 @@ Creates a @tool function bound to the calling channel and bot token so the
 orchestration LLM can search Slack without managing credentials itself.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 try:
     from strands import tool
@@ -16,7 +16,12 @@ except ImportError:  # pragma: no cover
 from slack_search_client import SlackSearchClient
 
 
-def make_slack_search_tool(channel: str, bot_token: str, correlation_id: str = ""):
+def make_slack_search_tool(
+    channel: str,
+    bot_token: str,
+    correlation_id: str = "",
+    context: Optional[dict] = None,
+):
     """
     Create a Strands @tool that searches Slack via the Slack Search Agent.
 
@@ -27,11 +32,17 @@ def make_slack_search_tool(channel: str, bot_token: str, correlation_id: str = "
         channel: Slack channel ID that originated the request.
         bot_token: Slack bot token for Slack API access.
         correlation_id: Optional trace ID passed through to the agent.
+        context: Optional mutable dict with channel, bot_token and
+            correlation_id keys, read on every call. Pooled orchestrators
+            rebind it per request instead of rebuilding the tool.
 
     Returns:
         A Strands @tool-decorated function with signature (query: str) -> str.
     """
 
+    if context is None:
+        context = {"channel": channel, "bot_token": bot_token, "correlation_id": correlation_id}
+
     @tool
     def slack_search(query: str) -> str:
         """
@@ -51,9 +62,9 @@ def make_slack_search_tool(channel: str, bot_token: str, correlation_id: str = "
         try:
             return client.search(
                 text=query,
-                channel=channel,
-                bot_token=bot_token,
-                correlation_id=correlation_id or None,
+                channel=context.get("channel", ""),
+                bot_token=context.get("bot_token", ""),
+                correlation_id=context.get("correlation_id") or None,
             )
         except Exception as e:
             return f"Slack 検索中にエラーが発生しました: {e}"
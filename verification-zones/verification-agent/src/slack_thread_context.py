@@ -2,50 +2,303 @@
 Slack thread context retrieval for Verification Agent preprocessing.
 
 Fetches the current Slack thread (conversations.replies) and formats it into
-an instruction-safe context block that can be prepended to user text.
+an instruction-safe context block that can be prepended to user text. The
+block is fitted to a character budget (THREAD_CONTEXT_MAX_CHARS, see
+thread_context_budget): the thread parent and the most recent messages are
+kept, long messages are truncated, and omitted messages are reported.
+
+Threads are cached per (channel, thread_ts): each entry keeps the formatted
+messages and the newest ts seen. A later mention in the same thread fetches
+only replies newer than that ts (``oldest``) and appends them. Entries expire
+after THREAD_CONTEXT_CACHE_TTL_SECONDS (default 300, bounds how long edits and
+deletions can go unnoticed) and at most THREAD_CONTEXT_CACHE_SIZE threads
+(default 256) are kept per container, least recently used evicted. When
+THREAD_CONTEXT_CACHE_TABLE is set, entries are also shared across containers
+through DynamoDB (``cache_key`` partition key, ``ttl`` expiry attribute — the
+layout of the existence check cache table, which the runtime can already write).
+``load_thread`` exposes the cached fetch to other modules (referenced threads in
+slack_url_resolver).
 """
 
-from typing import Optional
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
-import requests
+import boto3
 
 from logger_util import get_logger, log
+from slack_api import get_slack_client
+from thread_context_budget import THREAD_CONTEXT_MAX_CHARS, budget_thread_lines
 
 _logger = get_logger()
 
-MAX_THREAD_MESSAGES = 20
+# conversations.replies page size and pages fetched per request
+REPLIES_PAGE_SIZE = 200
+REPLIES_MAX_PAGES = int(os.environ.get("THREAD_CONTEXT_MAX_PAGES", "5"))
+
+THREAD_CONTEXT_CACHE_TTL_SECONDS = int(os.environ.get("THREAD_CONTEXT_CACHE_TTL_SECONDS", "300"))
+THREAD_CONTEXT_CACHE_SIZE = int(os.environ.get("THREAD_CONTEXT_CACHE_SIZE", "256"))
+# Messages kept per cached thread (parent plus the most recent replies)
+THREAD_CONTEXT_CACHE_MAX_MESSAGES = int(os.environ.get("THREAD_CONTEXT_CACHE_MAX_MESSAGES", "200"))
+
+# (ts, formatted line such as "User: text")
+_Message = Tuple[str, str]
 
 
 def _log(level: str, event_type: str, data: dict) -> None:
     log(_logger, level, event_type, data, service="verification-agent")
 
 
+@dataclass
+class _CachedThread:
+    messages: List[_Message] = field(default_factory=list)
+    latest_ts: str = ""
+    expires_at: float = 0.0
+    # time.time() of the last successful fetch (0 for entries read from DynamoDB)
+    refreshed_at: float = 0.0
+
+
+@dataclass
+class LoadedThread:
+    """Formatted messages of a thread as returned by ``load_thread``."""
+    messages: List[_Message] = field(default_factory=list)
+    source: str = "slack"  # "memory" | "dynamodb" | "slack"
+    fetched_count: int = 0
+    error: Optional[str] = None
+
+
+class _ThreadContextCache:
+    """In-process TTL/LRU cache of formatted thread messages keyed by (channel, thread_ts)."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], _CachedThread]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[_CachedThread]:
+        """Return the cached thread, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[str, str], entry: _CachedThread) -> None:
+        """Store entry, evicting least recently used threads beyond the size limit."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def new_expiry(self) -> float:
+        return time.time() + self._ttl_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_thread_cache = _ThreadContextCache(THREAD_CONTEXT_CACHE_SIZE, THREAD_CONTEXT_CACHE_TTL_SECONDS)
+
+
+def _get_cache_table():
+    """Return the shared DynamoDB cache table, or None when not configured."""
+    table_name = os.environ.get("THREAD_CONTEXT_CACHE_TABLE")
+    if not table_name:
+        return None
+    return boto3.resource("dynamodb").Table(table_name)
+
+
+def _dynamodb_key(channel_id: str, thread_ts: str) -> str:
+    return f"thread#{channel_id}#{thread_ts}"
+
+
+def _load_shared(channel_id: str, thread_ts: str) -> Optional[_CachedThread]:
+    """Read a cached thread from DynamoDB (fail-open: None on any error)."""
+    try:
+        table = _get_cache_table()
+        if table is None:
+            return None
+        item = table.get_item(Key={"cache_key": _dynamodb_key(channel_id, thread_ts)}).get("Item")
+        if not item or int(item.get("ttl", 0)) <= int(time.time()):
+            return None
+        return _CachedThread(
+            messages=[tuple(m) for m in json.loads(item.get("messages", "[]"))],
+            latest_ts=str(item.get("latest_ts", "")),
+            expires_at=float(item["ttl"]),
+        )
+    except Exception as e:
+        _log("WARN", "thread_context_cache_read_failed", {
+            "channel_id": channel_id,
+            "thread_ts": thread_ts,
+            "error": str(e),
+            "error_type": type(e).__name__,
+        })
+        return None
+
+
+def _save_shared(channel_id: str, thread_ts: str, entry: _CachedThread) -> None:
+    """Write a cached thread to DynamoDB (fail-open)."""
+    try:
+        table = _get_cache_table()
+        if table is None:
+            return
+        table.put_item(Item={
+            "cache_key": _dynamodb_key(channel_id, thread_ts),
+            "messages": json.dumps(entry.messages, ensure_ascii=False),
+            "latest_ts": entry.latest_ts,
+            "ttl": int(entry.expires_at),
+        })
+    except Exception as e:
+        _log("WARN", "thread_context_cache_write_failed", {
+            "channel_id": channel_id,
+            "thread_ts": thread_ts,
+            "error": str(e),
+            "error_type": type(e).__name__,
+        })
+
+
+def _format_message(msg: dict) -> Optional[str]:
+    text = (msg.get("text") or "").strip()
+    if not text:
+        return None
+    role = (
+        "Assistant"
+        if msg.get("bot_id") or msg.get("subtype") == "bot_message"
+        else "User"
+    )
+    return f"{role}: {text}"
+
+
+def _ts_key(ts: str) -> float:
+    try:
+        return float(ts)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def fetch_replies(bot_token: str, channel_id: str, thread_ts: str, oldest: Optional[str] = None) -> dict:
+    """
+    Fetch a thread with conversations.replies, following pagination cursors.
+
+    Returns:
+        ``{"ok": True, "messages": [...]}`` (up to REPLIES_MAX_PAGES pages,
+        oldest first) or the first error response.
+    """
+    client = get_slack_client(bot_token)
+    params = {"channel": channel_id, "ts": thread_ts, "limit": str(REPLIES_PAGE_SIZE)}
+    if oldest:
+        params["oldest"] = oldest
+    messages: List[dict] = []
+    for _ in range(max(1, REPLIES_MAX_PAGES)):
+        data = client.call("conversations.replies", params)
+        if not data.get("ok"):
+            return data
+        messages.extend(data.get("messages", []))
+        cursor = (data.get("response_metadata") or {}).get("next_cursor")
+        if not data.get("has_more") or not cursor:
+            break
+        params = {**params, "cursor": cursor}
+    return {"ok": True, "messages": messages}
+
+
+def _merge(entry: Optional[_CachedThread], fetched: List[dict], thread_ts: str) -> _CachedThread:
+    """Append fetched messages newer than the cached ones and advance latest_ts."""
+    messages = list(entry.messages) if entry else []
+    latest_ts = entry.latest_ts if entry else ""
+    seen = {ts for ts, _ in messages}
+    for msg in fetched:
+        ts = msg.get("ts") or ""
+        if not ts or ts in seen:
+            continue
+        seen.add(ts)
+        if _ts_key(ts) > _ts_key(latest_ts):
+            latest_ts = ts
+        line = _format_message(msg)
+        if line is not None:
+            messages.append((ts, line))
+    messages.sort(key=lambda m: _ts_key(m[0]))
+    limit = max(2, THREAD_CONTEXT_CACHE_MAX_MESSAGES)
+    if len(messages) > limit:
+        # Keep the parent and the most recent replies
+        parent = messages[:1] if messages[0][0] == thread_ts else []
+        messages = parent + messages[-(limit - len(parent)):]
+    return _CachedThread(
+        messages=messages,
+        latest_ts=latest_ts,
+        expires_at=entry.expires_at if entry else _thread_cache.new_expiry(),
+        refreshed_at=time.time(),
+    )
+
+
+def load_thread(
+    bot_token: str,
+    channel_id: str,
+    thread_ts: str,
+    max_staleness_seconds: float = 0.0,
+) -> LoadedThread:
+    """
+    Return the formatted messages of a thread, using the thread cache.
+
+    A cached entry refreshed within max_staleness_seconds is returned without
+    calling Slack; otherwise only replies newer than the cached ones are
+    fetched. Slack API errors are returned in ``error``; transport errors raise.
+    """
+    key = (channel_id, thread_ts)
+    entry = _thread_cache.get(key)
+    source = "memory"
+    if entry is None:
+        entry = _load_shared(channel_id, thread_ts)
+        source = "dynamodb" if entry is not None else "slack"
+    if entry is not None and max_staleness_seconds > 0 and time.time() - entry.refreshed_at < max_staleness_seconds:
+        return LoadedThread(messages=entry.messages, source=source)
+
+    data = fetch_replies(
+        bot_token, channel_id, thread_ts, oldest=entry.latest_ts if entry is not None else None
+    )
+    if not data.get("ok"):
+        return LoadedThread(source=source, error=data.get("error", "unknown"))
+
+    fetched = data.get("messages", [])
+    merged = _merge(entry, fetched, thread_ts)
+    _thread_cache.put(key, merged)
+    if entry is None or len(merged.messages) != len(entry.messages):
+        _save_shared(channel_id, thread_ts, merged)
+    return LoadedThread(messages=merged.messages, source=source, fetched_count=len(fetched))
+
+
 def build_current_thread_context(
     bot_token: str,
     channel_id: str,
     thread_ts: str,
     correlation_id: str,
     current_message_ts: Optional[str] = None,
-    limit: int = MAX_THREAD_MESSAGES,
+    max_chars: Optional[int] = None,
 ) -> str:
     """
     Fetch and format current thread context.
 
-    Returns an empty string when context is unavailable so callers can fail-open.
+    Uses the thread cache: on a hit only replies newer than the cached ones are
+    fetched. The block is fitted to max_chars (default THREAD_CONTEXT_MAX_CHARS).
+    Returns an empty string when context is unavailable so callers can
+    fail-open.
     """
     if not bot_token or not channel_id or not thread_ts:
         return ""
 
     try:
-        resp = requests.get(
-            "https://slack.com/api/conversations.replies",
-            headers={"Authorization": f"Bearer {bot_token}"},
-            params={"channel": channel_id, "ts": thread_ts, "limit": str(limit)},
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        if not data.get("ok"):
+        loaded = load_thread(bot_token, channel_id, thread_ts)
+        if loaded.error:
             _log(
                 "WARN",
                 "thread_context_fetch_failed",
@@ -53,30 +306,25 @@ def build_current_thread_context(
                     "correlation_id": correlation_id,
                     "channel_id": channel_id,
                     "thread_ts": thread_ts,
-                    "error": data.get("error", "unknown"),
+                    "error": loaded.error,
                 },
             )
             return ""
 
-        messages = data.get("messages", [])
-        lines = []
-        for msg in messages:
-            ts = msg.get("ts")
-            if current_message_ts and ts == current_message_ts:
-                # Skip current inbound message to avoid duplicate injection.
-                continue
-            text = (msg.get("text") or "").strip()
-            if not text:
-                continue
-            role = (
-                "Assistant"
-                if msg.get("bot_id") or msg.get("subtype") == "bot_message"
-                else "User"
-            )
-            lines.append(f"{role}: {text}")
-
-        if not lines:
+        # Skip current inbound message to avoid duplicate injection.
+        messages = [
+            (ts, line)
+            for ts, line in loaded.messages
+            if not (current_message_ts and ts == current_message_ts)
+        ]
+        if not messages:
             return ""
+        budgeted = budget_thread_lines(
+            [line for _, line in messages],
+            THREAD_CONTEXT_MAX_CHARS if max_chars is None else max_chars,
+            keep_first=messages[0][0] == thread_ts,
+        )
+        lines = budgeted.lines
 
         _log(
             "INFO",
@@ -85,7 +333,12 @@ def build_current_thread_context(
                 "correlation_id": correlation_id,
                 "channel_id": channel_id,
                 "thread_ts": thread_ts,
-                "message_count": len(lines),
+                "message_count": budgeted.total_messages - budgeted.dropped_messages,
+                "dropped_messages": budgeted.dropped_messages,
+                "truncated_messages": budgeted.truncated_messages,
+                "context_chars": budgeted.chars,
+                "cache_source": loaded.source,
+                "fetched_count": loaded.fetched_count,
             },
         )
         return (
@@ -8,21 +8,46 @@ the thread context into the text before delegation to the Execution Agent.
 Fail-open per URL: whitelist miss, API errors, or network failures skip the
 URL with a warning log. Successfully resolved URLs are removed from the user
 text so downstream agents do not fetch the same thread again.
+
+Each referenced thread is fitted to REFERENCED_THREAD_MAX_CHARS (see
+thread_context_budget): the first message and the most recent replies are
+kept and omitted messages are reported in the block and the log.
+
+Referenced threads are fetched concurrently: URLs that point to the same
+(channel, ts) share one fetch, and all fetches share one deadline
+(SLACK_URL_RESOLVE_TIMEOUT_SECONDS, default 8). Threads still loading at the
+deadline are skipped like any other failure. Fetches go through the thread
+context cache (slack_thread_context.load_thread); a cached thread refreshed
+within REFERENCED_THREAD_FRESH_SECONDS (default 60) is used without calling
+Slack, an older one fetches only newer replies.
 """
 
+import os
 import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List, Optional
-
-import requests
+from typing import Dict, List, Optional, Tuple
 
-from authorization import load_whitelist_config
+from authorization import AuthorizationIndex, get_authorization_index
 from logger_util import get_logger, log
+from slack_thread_context import load_thread
+from thread_context_budget import REFERENCED_THREAD_MAX_CHARS, BudgetedThread, budget_thread_lines
 
 _logger = get_logger()
 
 MAX_URLS_PER_MESSAGE = 3
-MAX_REPLIES_PER_THREAD = 20
+
+# Shared deadline for fetching all referenced threads of one message
+SLACK_URL_RESOLVE_TIMEOUT_SECONDS = float(os.environ.get("SLACK_URL_RESOLVE_TIMEOUT_SECONDS", "8"))
+# Cached referenced threads younger than this are used without calling Slack
+REFERENCED_THREAD_FRESH_SECONDS = float(os.environ.get("REFERENCED_THREAD_FRESH_SECONDS", "60"))
+
+# Thread fetches run here so referenced URLs resolve in parallel; threads still
+# running after the deadline finish in the background and warm the cache.
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=MAX_URLS_PER_MESSAGE * 4, thread_name_prefix="slack-url"
+)
 
 # Matches URLs like https://workspace.slack.com/archives/C0ABC/p1706123456789012
 _SLACK_URL_RE = re.compile(
@@ -51,6 +76,8 @@ class ResolvedThread:
     """Result of fetching a Slack thread."""
     channel_id: str
     messages: List[dict] = field(default_factory=list)
+    # Formatted lines ("User: ...") when the thread came from load_thread
+    lines: List[str] = field(default_factory=list)
     error: Optional[str] = None
 
 
@@ -88,19 +115,19 @@ def parse_slack_urls(text: str) -> List[SlackUrlMatch]:
 # Whitelist check
 # ---------------------------------------------------------------------------
 
-def check_channel_whitelisted(channel_id: str) -> bool:
+def check_channel_whitelisted(channel_id: str, index: Optional[AuthorizationIndex] = None) -> bool:
     """
     Check if a channel is allowed by the whitelist.
 
     Returns True if:
     - channel_ids whitelist is empty (unconfigured → allow all)
     - channel_id is in the whitelist
+
+    Pass ``index`` to reuse one compiled authorization index across several checks.
     """
-    whitelist = load_whitelist_config()
-    channel_ids = whitelist.get("channel_ids", set())
-    if not channel_ids:
-        return True
-    return channel_id in channel_ids
+    if index is None:
+        index = get_authorization_index()
+    return index.is_channel_allowed(channel_id)
 
 
 # ---------------------------------------------------------------------------
@@ -111,30 +138,25 @@ def fetch_thread_replies(
     bot_token: str,
     channel_id: str,
     thread_ts: str,
-    limit: int = MAX_REPLIES_PER_THREAD,
 ) -> ResolvedThread:
     """
     Fetch thread replies from Slack using conversations.replies API.
 
-    Uses requests (not slack_sdk WebClient) to match existing pipeline patterns.
+    Goes through the thread context cache (load_thread): the shared Slack API
+    client, pagination, and incremental fetches of cached threads.
     """
     try:
-        resp = requests.get(
-            "https://slack.com/api/conversations.replies",
-            headers={"Authorization": f"Bearer {bot_token}"},
-            params={"channel": channel_id, "ts": thread_ts, "limit": str(limit)},
-            timeout=10,
+        loaded = load_thread(
+            bot_token, channel_id, thread_ts, max_staleness_seconds=REFERENCED_THREAD_FRESH_SECONDS
         )
-        resp.raise_for_status()
-        data = resp.json()
-        if not data.get("ok"):
+        if loaded.error:
             return ResolvedThread(
                 channel_id=channel_id,
-                error=f"Slack API error: {data.get('error', 'unknown')}",
+                error=f"Slack API error: {loaded.error}",
             )
         return ResolvedThread(
             channel_id=channel_id,
-            messages=data.get("messages", []),
+            lines=[line for _, line in loaded.messages],
         )
     except Exception as e:
         return ResolvedThread(
@@ -147,14 +169,14 @@ def fetch_thread_replies(
 # Formatting
 # ---------------------------------------------------------------------------
 
-def format_thread_context(resolved: ResolvedThread) -> str:
+def budget_thread_context(resolved: ResolvedThread, max_chars: Optional[int] = None) -> BudgetedThread:
     """
-    Format resolved thread messages into human-readable context block.
+    Select the messages of a resolved thread that fit into max_chars.
 
     Bot messages (bot_id or subtype=="bot_message") → "Assistant: ..."
     Other messages → "User: ..."
     """
-    lines = []
+    lines = list(resolved.lines)
     for msg in resolved.messages:
         text = (msg.get("text") or "").strip()
         if not text:
@@ -163,12 +185,67 @@ def format_thread_context(resolved: ResolvedThread) -> str:
             lines.append(f"Assistant: {text}")
         else:
             lines.append(f"User: {text}")
+    return budget_thread_lines(
+        lines, REFERENCED_THREAD_MAX_CHARS if max_chars is None else max_chars
+    )
+
+
+def format_thread_context(resolved: ResolvedThread, budgeted: Optional[BudgetedThread] = None) -> str:
+    """
+    Format resolved thread messages into human-readable context block.
+
+    Pass ``budgeted`` to reuse a selection made by budget_thread_context.
+    """
+    if budgeted is None:
+        budgeted = budget_thread_context(resolved)
+    lines = budgeted.lines
 
     header = f"[Referenced Slack Thread ({resolved.channel_id})]"
     footer = "[End Referenced Thread]"
     return f"{header}\n" + "\n".join(lines) + f"\n{footer}"
 
 
+# ---------------------------------------------------------------------------
+# Concurrent fetching
+# ---------------------------------------------------------------------------
+
+_ThreadKey = Tuple[str, str]  # (channel_id, message_ts)
+
+
+def _fetch_threads(
+    keys: List[_ThreadKey],
+    bot_token: str,
+    correlation_id: str,
+    timeout_seconds: float,
+) -> Dict[_ThreadKey, ResolvedThread]:
+    """
+    Fetch each thread once, in parallel, waiting at most timeout_seconds in total.
+
+    Threads not fetched by the deadline are logged and left out of the result.
+    """
+    futures: Dict[Future, _ThreadKey] = {
+        _fetch_executor.submit(fetch_thread_replies, bot_token, channel_id, message_ts): (channel_id, message_ts)
+        for channel_id, message_ts in keys
+    }
+    results: Dict[_ThreadKey, ResolvedThread] = {}
+    deadline = time.monotonic() + timeout_seconds
+    pending = set(futures)
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[futures[future]] = future.result()
+    for future in pending:
+        _log("WARN", "slack_url_fetch_timeout", {
+            "correlation_id": correlation_id,
+            "channel_id": futures[future][0],
+            "timeout_seconds": timeout_seconds,
+        })
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -200,12 +277,14 @@ def resolve_slack_urls(text: str, bot_token: str, correlation_id: str) -> str:
             "max_processed": MAX_URLS_PER_MESSAGE,
         })
 
-    context_blocks = []
-    resolved_urls = []  # URLs successfully resolved (to remove from text)
+    allowed: List[SlackUrlMatch] = []
+    whitelist_index: Optional[AuthorizationIndex] = None
     for url_match in urls:
-        # Whitelist check
+        # Whitelist check (index loaded once per message)
         try:
-            if not check_channel_whitelisted(url_match.channel_id):
+            if whitelist_index is None:
+                whitelist_index = get_authorization_index()
+            if not check_channel_whitelisted(url_match.channel_id, whitelist_index):
                 _log("WARN", "slack_url_channel_not_whitelisted", {
                     "correlation_id": correlation_id,
                     "channel_id": url_match.channel_id,
@@ -218,9 +297,24 @@ def resolve_slack_urls(text: str, bot_token: str, correlation_id: str) -> str:
                 "error": str(e),
             })
             continue
+        allowed.append(url_match)
+
+    # One fetch per distinct thread, all in parallel under one deadline
+    keys = list(dict.fromkeys((m.channel_id, m.message_ts) for m in allowed))
+    threads = _fetch_threads(keys, bot_token, correlation_id, SLACK_URL_RESOLVE_TIMEOUT_SECONDS) if keys else {}
 
-        # Fetch thread
-        resolved = fetch_thread_replies(bot_token, url_match.channel_id, url_match.message_ts)
+    context_blocks = []
+    resolved_urls = []  # URLs successfully resolved (to remove from text)
+    emitted = set()
+    for url_match in allowed:
+        key = (url_match.channel_id, url_match.message_ts)
+        resolved = threads.get(key)
+        if resolved is None:
+            continue
+        if key in emitted:
+            # Same thread pasted again: one context block, every copy removed
+            resolved_urls.append(url_match.original_url)
+            continue
         if resolved.error:
             _log("WARN", "slack_url_fetch_error", {
                 "correlation_id": correlation_id,
@@ -229,19 +323,24 @@ def resolve_slack_urls(text: str, bot_token: str, correlation_id: str) -> str:
             })
             continue
 
-        if not resolved.messages:
+        if not resolved.messages and not resolved.lines:
             _log("WARN", "slack_url_empty_thread", {
                 "correlation_id": correlation_id,
                 "channel_id": url_match.channel_id,
             })
             continue
 
-        context_blocks.append(format_thread_context(resolved))
+        budgeted = budget_thread_context(resolved)
+        context_blocks.append(format_thread_context(resolved, budgeted))
         resolved_urls.append(url_match.original_url)
+        emitted.add(key)
         _log("INFO", "slack_url_resolved", {
             "correlation_id": correlation_id,
             "channel_id": url_match.channel_id,
-            "message_count": len(resolved.messages),
+            "message_count": budgeted.total_messages,
+            "dropped_messages": budgeted.dropped_messages,
+            "truncated_messages": budgeted.truncated_messages,
+            "context_chars": budgeted.chars,
         })
 
     if not context_blocks:
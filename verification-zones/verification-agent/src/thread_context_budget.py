@@ -0,0 +1,100 @@
+"""
+Character-budgeted selection of Slack thread messages for prompt context.
+
+Thread context (the current thread and referenced threads) is prepended to the
+user text, so its size drives Bedrock latency and cost. ``budget_thread_lines``
+fits formatted lines ("User: ...", "Assistant: ...") into a character budget:
+
+- Every message longer than THREAD_MESSAGE_MAX_CHARS (default 2000) is cut and
+  marked with the number of characters removed.
+- The thread parent (first line) is always kept.
+- The remaining budget is filled with the most recent messages, walking
+  backwards; older messages that do not fit are replaced by one
+  ``[... N earlier messages omitted ...]`` line.
+
+Budgets are in characters (roughly one token per character for Japanese text,
+about four for English), so they bound the prompt size without a tokenizer.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import List
+
+# Budget for the current thread context block
+THREAD_CONTEXT_MAX_CHARS = int(os.environ.get("THREAD_CONTEXT_MAX_CHARS", "12000"))
+# Budget for each referenced thread (Slack message URLs in the user text)
+REFERENCED_THREAD_MAX_CHARS = int(os.environ.get("REFERENCED_THREAD_MAX_CHARS", "6000"))
+# Longest single message kept in full
+THREAD_MESSAGE_MAX_CHARS = int(os.environ.get("THREAD_MESSAGE_MAX_CHARS", "2000"))
+
+
+@dataclass
+class BudgetedThread:
+    """Lines selected for a thread and what was left out."""
+    lines: List[str] = field(default_factory=list)
+    total_messages: int = 0
+    dropped_messages: int = 0
+    truncated_messages: int = 0
+
+    @property
+    def chars(self) -> int:
+        return sum(len(line) + 1 for line in self.lines)
+
+
+def truncate_line(line: str, max_chars: int) -> str:
+    """Cut line to max_chars, ending with a marker that states how much was removed."""
+    if len(line) <= max_chars:
+        return line
+    removed = len(line) - max_chars
+    marker = f" …[{removed} chars truncated]"
+    return line[: max(0, max_chars - len(marker))] + marker
+
+
+def budget_thread_lines(
+    lines: List[str],
+    max_chars: int,
+    max_message_chars: int = THREAD_MESSAGE_MAX_CHARS,
+    keep_first: bool = True,
+) -> BudgetedThread:
+    """
+    Select the lines of a thread that fit into max_chars.
+
+    Args:
+        lines: Formatted messages in chronological order.
+        max_chars: Character budget for the selected lines.
+        max_message_chars: Longest single line kept in full.
+        keep_first: Treat lines[0] as the thread parent and always keep it.
+
+    Returns:
+        BudgetedThread with the selected lines in chronological order (plus an
+        omission marker when older messages were dropped).
+    """
+    result = BudgetedThread(total_messages=len(lines))
+    if not lines:
+        return result
+
+    cut = [truncate_line(line, max_message_chars) for line in lines]
+    result.truncated_messages = sum(1 for line in lines if len(line) > max_message_chars)
+
+    head: List[str] = []
+    rest = cut
+    if keep_first:
+        head, rest = cut[:1], cut[1:]
+    used = sum(len(line) + 1 for line in head)
+
+    recent: List[str] = []
+    for line in reversed(rest):
+        if used + len(line) + 1 > max_chars:
+            break
+        recent.append(line)
+        used += len(line) + 1
+    recent.reverse()
+
+    result.dropped_messages = len(rest) - len(recent)
+    omitted = (
+        [f"[... {result.dropped_messages} earlier messages omitted ...]"]
+        if result.dropped_messages
+        else []
+    )
+    result.lines = head + omitted + recent
+    return result
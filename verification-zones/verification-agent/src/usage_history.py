@@ -9,23 +9,48 @@ Architecture (confidentiality separation):
   S3 content/ prefix  — input/output text (sensitive; write-only from agent)
   S3 attachments/     — attachment files copied from temp exchange bucket
   DynamoDB            — metadata + s3_content_prefix pointer (no text content)
+
+Records are written off the request path by a background writer (``submit``):
+S3 writes run concurrently and DynamoDB items are batched with BatchWriteItem.
+Queued records are flushed at interpreter exit.
 """
 
+import atexit
 import json
 import logging
 import os
+import queue
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-import boto3
+from aws_clients import get_client
+from cloudwatch_metrics import emit_metric
 
 _logger = logging.getLogger(__name__)
 
 # Default retention period in days (aligned with DynamoDB TTL and S3 lifecycle)
 _DEFAULT_TTL_DAYS = 90
 
+# Background writer
+USAGE_HISTORY_QUEUE_SIZE = int(os.environ.get("USAGE_HISTORY_QUEUE_SIZE", "1000"))
+USAGE_HISTORY_S3_WORKERS = int(os.environ.get("USAGE_HISTORY_S3_WORKERS", "8"))
+# How long the writer waits for more records before writing a partial batch
+USAGE_HISTORY_BATCH_LINGER_SECONDS = float(os.environ.get("USAGE_HISTORY_BATCH_LINGER_SECONDS", "0.2"))
+USAGE_HISTORY_SHUTDOWN_TIMEOUT_SECONDS = float(os.environ.get("USAGE_HISTORY_SHUTDOWN_TIMEOUT_SECONDS", "10"))
+BATCH_WRITE_MAX_ITEMS = 25  # DynamoDB BatchWriteItem limit
+BATCH_WRITE_MAX_ATTEMPTS = 4
+BATCH_WRITE_BACKOFF_SECONDS = 0.1
+
+METRICS_NAMESPACE = "SlackAI/UsageHistory"
+METRIC_QUEUE_DEPTH = "UsageHistoryQueueDepth"
+METRIC_DROPPED = "UsageHistoryDropped"
+METRIC_WRITE_FAILED = "UsageHistoryWriteFailed"
+
 
 # ---------------------------------------------------------------------------
 # Value objects
@@ -86,6 +111,159 @@ def _attachment_dest_key(channel_id: str, correlation_id: str, src_key: str) ->
     return f"attachments/{channel_id}/{_date_path()}/{correlation_id}/{filename}"
 
 
+# ---------------------------------------------------------------------------
+# Record writing (shared by save() and the background writer)
+# ---------------------------------------------------------------------------
+
+
+def _ensure_correlation_id(record: UsageRecord) -> str:
+    correlation_id = record.correlation_id
+    if not correlation_id:
+        correlation_id = str(uuid.uuid4())
+        _logger.warning(
+            "usage_history.save: correlation_id was empty, generated fallback",
+            extra={"correlation_id": correlation_id},
+        )
+    return correlation_id
+
+
+def _region() -> str:
+    return os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION", "ap-northeast-1")
+
+
+def _put_text(s3, bucket: str, key: str, text: str, correlation_id: str, name: str) -> None:
+    try:
+        s3.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=json.dumps({"text": text}).encode("utf-8"),
+            ContentType="application/json",
+        )
+    except Exception as exc:
+        _logger.warning(
+            f"usage_history: failed to write {name} to S3",
+            extra={
+                "correlation_id": correlation_id,
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            },
+        )
+
+
+def _copy_attachment(s3, temp_bucket: str, history_bucket: str, src_key: str, dest_key: str,
+                     correlation_id: str) -> Optional[str]:
+    """Copy one attachment; return the failure reason, or None on success."""
+    try:
+        s3.copy_object(
+            CopySource={"Bucket": temp_bucket, "Key": src_key},
+            Bucket=history_bucket,
+            Key=dest_key,
+        )
+        return None
+    except Exception as exc:
+        _logger.warning(
+            "usage_history: failed to copy attachment",
+            extra={
+                "correlation_id": correlation_id,
+                "src_key": src_key,
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            },
+        )
+        return f"{type(exc).__name__}: {exc}"
+
+
+def _s3_tasks(s3, history_bucket: str, temp_bucket: str, record: UsageRecord,
+              correlation_id: str, prefix: str) -> List[Tuple[str, Callable[[], Optional[str]]]]:
+    """
+    The independent S3 writes of one record as (attachment src_key or "", task).
+
+    Tasks for attachments return the copy failure reason (None on success).
+    """
+    tasks: List[Tuple[str, Callable[[], Optional[str]]]] = []
+    if record.input_text:
+        tasks.append(("", lambda: _put_text(
+            s3, history_bucket, f"{prefix}input.json", record.input_text, correlation_id, "input.json")))
+    if record.output_text:
+        tasks.append(("", lambda: _put_text(
+            s3, history_bucket, f"{prefix}output.json", record.output_text, correlation_id, "output.json")))
+    for src_key in record.attachment_keys:
+        dest_key = _attachment_dest_key(record.channel_id, correlation_id, src_key)
+        tasks.append((src_key, lambda src_key=src_key, dest_key=dest_key: _copy_attachment(
+            s3, temp_bucket, history_bucket, src_key, dest_key, correlation_id)))
+    return tasks
+
+
+def _collect_attachments(record: UsageRecord, correlation_id: str,
+                         results: List[Tuple[str, Optional[str]]]) -> List[str]:
+    """Set record.skipped_attachments from task results; return the saved destination keys."""
+    saved: List[str] = []
+    skipped: List[dict] = []
+    for src_key, reason in results:
+        if not src_key:
+            continue
+        if reason is None:
+            saved.append(_attachment_dest_key(record.channel_id, correlation_id, src_key))
+        else:
+            skipped.append({"key": src_key, "reason": reason})
+    record.skipped_attachments = skipped
+    return saved
+
+
+def _build_item(record: UsageRecord, correlation_id: str, prefix: str,
+                saved_attachment_keys: List[str]) -> dict:
+    """DynamoDB item for a record: metadata + s3_content_prefix (NO input_text/output_text)."""
+    now = datetime.now(timezone.utc)
+    ttl_epoch = int((now + timedelta(days=record.ttl_days)).timestamp())
+    request_id = f"{int(now.timestamp() * 1000)}#{correlation_id}"
+
+    pipeline = record.pipeline_result
+    pipeline_item = {
+        "M": {
+            "existence_check": {"BOOL": pipeline.existence_check},
+            "authorization": {"BOOL": pipeline.authorization},
+            "rate_limited": {"BOOL": pipeline.rate_limited},
+            "rejection_stage": {"S": pipeline.rejection_stage},
+            "rejection_reason": {"S": pipeline.rejection_reason},
+        }
+    }
+
+    item: dict = {
+        "channel_id": {"S": record.channel_id},
+        "request_id": {"S": request_id},
+        "correlation_id": {"S": correlation_id},
+        "team_id": {"S": record.team_id},
+        "user_id": {"S": record.user_id},
+        "created_at": {"S": now.isoformat()},
+        "s3_content_prefix": {"S": prefix},
+        "pipeline_result": pipeline_item,
+        "duration_ms": {"N": str(record.duration_ms)},
+        "attachment_keys": {
+            "L": [{"S": k} for k in saved_attachment_keys]
+        },
+        "skipped_attachments": {
+            "L": [
+                {"M": {"key": {"S": s["key"]}, "reason": {"S": s["reason"]}}}
+                for s in record.skipped_attachments
+            ]
+        },
+        "ttl": {"N": str(ttl_epoch)},
+    }
+
+    if record.orchestration:
+        orch = record.orchestration
+        item["orchestration"] = {
+            "M": {
+                "agents_called": {
+                    "L": [{"S": a} for a in orch.agents_called]
+                },
+                "turns_used": {"N": str(orch.turns_used)},
+                "success": {"BOOL": orch.success},
+            }
+        }
+    return item
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -98,169 +276,271 @@ def save(
     record: UsageRecord,
 ) -> None:
     """
-    Write usage history. Fail-open — never raises.
+    Write usage history synchronously. Fail-open — never raises.
 
     Steps:
     1. s3.put_object content/.../input.json   (if input_text non-empty)
     2. s3.put_object content/.../output.json  (if output_text non-empty)
     3. s3.copy_object per attachment key      (temp_bucket → history_bucket)
     4. dynamodb.put_item metadata + s3_content_prefix (NO input_text/output_text)
+
+    The pipeline uses ``submit`` (background writer) instead.
     """
     try:
-        # Ensure correlation_id is non-empty
-        correlation_id = record.correlation_id
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
+        correlation_id = _ensure_correlation_id(record)
+        s3 = get_client("s3", region_name=_region())
+        dynamodb = get_client("dynamodb", region_name=_region())
+        prefix = _content_prefix(record.channel_id, correlation_id)
+
+        results = [
+            (src_key, task())
+            for src_key, task in _s3_tasks(s3, history_bucket, temp_bucket, record, correlation_id, prefix)
+        ]
+        saved = _collect_attachments(record, correlation_id, results)
+        item = _build_item(record, correlation_id, prefix, saved)
+
+        try:
+            dynamodb.put_item(TableName=table_name, Item=item)
+        except Exception as exc:
             _logger.warning(
-                "usage_history.save: correlation_id was empty, generated fallback",
-                extra={"correlation_id": correlation_id},
+                "usage_history: failed to write DynamoDB record",
+                extra={
+                    "correlation_id": correlation_id,
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
             )
 
-        region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION", "ap-northeast-1")
-        s3 = boto3.client("s3", region_name=region)
-        dynamodb = boto3.client("dynamodb", region_name=region)
+    except Exception as exc:
+        _logger.warning(
+            "usage_history.save: unexpected error (fail-open)",
+            extra={
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+            },
+        )
+
+
+# ---------------------------------------------------------------------------
+# Background writer
+# ---------------------------------------------------------------------------
 
-        channel_id = record.channel_id
-        prefix = _content_prefix(channel_id, correlation_id)
 
-        # ------------------------------------------------------------------
-        # 1+2. Write text content to S3 (confidentiality separation)
-        # ------------------------------------------------------------------
-        if record.input_text:
+@dataclass
+class _Job:
+    table_name: str
+    history_bucket: str
+    temp_bucket: str
+    record: UsageRecord
+    on_done: Optional[Callable[[], None]] = None
+
+
+class UsageHistoryWriter:
+    """
+    Writes usage records on a background thread, off the request path.
+
+    Records are queued (at most USAGE_HISTORY_QUEUE_SIZE; further records are
+    dropped and counted) and written in batches of up to 25: the S3 writes of
+    all records in a batch run concurrently on USAGE_HISTORY_S3_WORKERS threads,
+    then the DynamoDB items are written with BatchWriteItem (unprocessed items
+    retried with backoff). ``flush`` waits for queued records; it runs at
+    interpreter exit so a shutting-down container persists what it accepted.
+
+    Metrics (namespace SlackAI/UsageHistory): UsageHistoryQueueDepth per batch,
+    UsageHistoryDropped, UsageHistoryWriteFailed (records whose item could not
+    be written).
+    """
+
+    def __init__(
+        self,
+        max_queue: int = USAGE_HISTORY_QUEUE_SIZE,
+        s3_workers: int = USAGE_HISTORY_S3_WORKERS,
+        linger_seconds: float = USAGE_HISTORY_BATCH_LINGER_SECONDS,
+    ):
+        self._queue: "queue.Queue[_Job]" = queue.Queue(maxsize=max(1, max_queue))
+        self._s3_executor = ThreadPoolExecutor(
+            max_workers=max(1, s3_workers), thread_name_prefix="usage-history-s3"
+        )
+        self._linger_seconds = linger_seconds
+        self._unfinished = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(
+        self,
+        table_name: str,
+        history_bucket: str,
+        temp_bucket: str,
+        record: UsageRecord,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """
+        Queue a record. Never raises.
+
+        Args:
+            on_done: Called on the writer thread after the record was written
+                (or failed); e.g. deleting the temp attachments it copies.
+
+        Returns:
+            True when queued (on_done will be called); False when dropped.
+        """
+        job = _Job(table_name, history_bucket, temp_bucket, record, on_done)
+        with self._cond:
             try:
-                s3.put_object(
-                    Bucket=history_bucket,
-                    Key=f"{prefix}input.json",
-                    Body=json.dumps({"text": record.input_text}).encode("utf-8"),
-                    ContentType="application/json",
-                )
-            except Exception as exc:
+                self._queue.put_nowait(job)
+            except queue.Full:
                 _logger.warning(
-                    "usage_history: failed to write input.json to S3",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "error": str(exc),
-                        "error_type": type(exc).__name__,
-                    },
+                    "usage_history: writer queue full, record dropped",
+                    extra={"correlation_id": record.correlation_id, "queue_size": self._queue.maxsize},
                 )
-
-        if record.output_text:
+                emit_metric(METRICS_NAMESPACE, METRIC_DROPPED, 1)
+                return False
+            self._unfinished += 1
+            self._ensure_thread()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued records are written. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._unfinished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _ensure_thread(self) -> None:
+        """Start the writer thread on first use. Caller holds the condition."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="usage-history-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._linger_seconds
+            while len(batch) < BATCH_WRITE_MAX_ITEMS:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, remaining)) if remaining > 0
+                                 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            emit_metric(METRICS_NAMESPACE, METRIC_QUEUE_DEPTH, self._queue.qsize() + len(batch))
             try:
-                s3.put_object(
-                    Bucket=history_bucket,
-                    Key=f"{prefix}output.json",
-                    Body=json.dumps({"text": record.output_text}).encode("utf-8"),
-                    ContentType="application/json",
-                )
+                self._write_batch(batch)
             except Exception as exc:
                 _logger.warning(
-                    "usage_history: failed to write output.json to S3",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "error": str(exc),
-                        "error_type": type(exc).__name__,
-                    },
+                    "usage_history: batch write failed (fail-open)",
+                    extra={"records": len(batch), "error": str(exc), "error_type": type(exc).__name__},
                 )
+            finally:
+                for job in batch:
+                    self._finish(job)
 
-        # ------------------------------------------------------------------
-        # 3. Copy attachments from temp exchange bucket to history bucket
-        # ------------------------------------------------------------------
-        saved_attachment_keys: List[str] = []
-        skipped: List[dict] = []
-
-        for src_key in record.attachment_keys:
-            dest_key = _attachment_dest_key(channel_id, correlation_id, src_key)
+    def _finish(self, job: _Job) -> None:
+        if job.on_done is not None:
             try:
-                s3.copy_object(
-                    CopySource={"Bucket": temp_bucket, "Key": src_key},
-                    Bucket=history_bucket,
-                    Key=dest_key,
-                )
-                saved_attachment_keys.append(dest_key)
+                job.on_done()
             except Exception as exc:
-                reason = f"{type(exc).__name__}: {exc}"
                 _logger.warning(
-                    "usage_history: failed to copy attachment",
-                    extra={
-                        "correlation_id": correlation_id,
-                        "src_key": src_key,
-                        "error": str(exc),
-                        "error_type": type(exc).__name__,
-                    },
+                    "usage_history: on_done callback failed",
+                    extra={"correlation_id": job.record.correlation_id, "error": str(exc)},
                 )
-                skipped.append({"key": src_key, "reason": reason})
+        with self._cond:
+            self._unfinished -= 1
+            self._cond.notify_all()
 
-        record.skipped_attachments = skipped
+    def _run_tasks(self, tasks: List[Callable[[], Optional[str]]]) -> List[Optional[str]]:
+        """Run S3 tasks concurrently; serially once the interpreter is shutting down."""
+        try:
+            futures = [self._s3_executor.submit(task) for task in tasks]
+        except RuntimeError:
+            return [task() for task in tasks]
+        return [future.result() for future in futures]
+
+    def _write_batch(self, batch: List[_Job]) -> None:
+        s3 = get_client("s3", region_name=_region())
+        dynamodb = get_client("dynamodb", region_name=_region())
+
+        prepared = []
+        tasks: List[Callable[[], Optional[str]]] = []
+        for job in batch:
+            correlation_id = _ensure_correlation_id(job.record)
+            prefix = _content_prefix(job.record.channel_id, correlation_id)
+            job_tasks = _s3_tasks(s3, job.history_bucket, job.temp_bucket, job.record, correlation_id, prefix)
+            prepared.append((job, correlation_id, prefix, [src for src, _ in job_tasks], len(tasks)))
+            tasks.extend(task for _, task in job_tasks)
+        results = self._run_tasks(tasks)
+
+        items_by_table: Dict[str, List[Tuple[str, dict]]] = {}
+        for job, correlation_id, prefix, sources, offset in prepared:
+            job_results = list(zip(sources, results[offset:offset + len(sources)]))
+            saved = _collect_attachments(job.record, correlation_id, job_results)
+            item = _build_item(job.record, correlation_id, prefix, saved)
+            items_by_table.setdefault(job.table_name, []).append((correlation_id, item))
+
+        for table_name, items in items_by_table.items():
+            _batch_write(dynamodb, table_name, items)
+
+
+def _batch_write(dynamodb, table_name: str, items: List[Tuple[str, dict]]) -> None:
+    """BatchWriteItem with retries of unprocessed items; failures are logged and counted."""
+    for start in range(0, len(items), BATCH_WRITE_MAX_ITEMS):
+        chunk = items[start:start + BATCH_WRITE_MAX_ITEMS]
+        requests = [{"PutRequest": {"Item": item}} for _, item in chunk]
+        error: Optional[Exception] = None
+        for attempt in range(BATCH_WRITE_MAX_ATTEMPTS):
+            try:
+                resp = dynamodb.batch_write_item(RequestItems={table_name: requests})
+            except Exception as exc:
+                error = exc
+                break
+            requests = (resp.get("UnprocessedItems") or {}).get(table_name) or []
+            if not requests:
+                break
+            if attempt + 1 < BATCH_WRITE_MAX_ATTEMPTS:
+                time.sleep(BATCH_WRITE_BACKOFF_SECONDS * (2 ** attempt))
+        if error is None and not requests:
+            continue
+        failed_ids = (
+            [cid for cid, _ in chunk]
+            if error is not None
+            else [item["correlation_id"]["S"] for item in (r["PutRequest"]["Item"] for r in requests)]
+        )
+        _logger.warning(
+            "usage_history: failed to write DynamoDB record",
+            extra={
+                "correlation_ids": failed_ids,
+                "error": str(error) if error else "unprocessed_items",
+                "error_type": type(error).__name__ if error else "UnprocessedItems",
+            },
+        )
+        emit_metric(METRICS_NAMESPACE, METRIC_WRITE_FAILED, len(failed_ids))
 
-        # ------------------------------------------------------------------
-        # 4. Write metadata to DynamoDB (NO input_text / output_text)
-        # ------------------------------------------------------------------
-        now = datetime.now(timezone.utc)
-        ttl_epoch = int((now + timedelta(days=record.ttl_days)).timestamp())
-        request_id = f"{int(now.timestamp() * 1000)}#{correlation_id}"
 
-        pipeline = record.pipeline_result
-        pipeline_item = {
-            "M": {
-                "existence_check": {"BOOL": pipeline.existence_check},
-                "authorization": {"BOOL": pipeline.authorization},
-                "rate_limited": {"BOOL": pipeline.rate_limited},
-                "rejection_stage": {"S": pipeline.rejection_stage},
-                "rejection_reason": {"S": pipeline.rejection_reason},
-            }
-        }
+_writer = UsageHistoryWriter()
+atexit.register(lambda: _writer.flush(timeout=USAGE_HISTORY_SHUTDOWN_TIMEOUT_SECONDS))
 
-        item: dict = {
-            "channel_id": {"S": channel_id},
-            "request_id": {"S": request_id},
-            "correlation_id": {"S": correlation_id},
-            "team_id": {"S": record.team_id},
-            "user_id": {"S": record.user_id},
-            "created_at": {"S": now.isoformat()},
-            "s3_content_prefix": {"S": prefix},
-            "pipeline_result": pipeline_item,
-            "duration_ms": {"N": str(record.duration_ms)},
-            "attachment_keys": {
-                "L": [{"S": k} for k in saved_attachment_keys]
-            },
-            "skipped_attachments": {
-                "L": [
-                    {"M": {"key": {"S": s["key"]}, "reason": {"S": s["reason"]}}}
-                    for s in skipped
-                ]
-            },
-            "ttl": {"N": str(ttl_epoch)},
-        }
 
-        if record.orchestration:
-            orch = record.orchestration
-            item["orchestration"] = {
-                "M": {
-                    "agents_called": {
-                        "L": [{"S": a} for a in orch.agents_called]
-                    },
-                    "turns_used": {"N": str(orch.turns_used)},
-                    "success": {"BOOL": orch.success},
-                }
-            }
+def submit(
+    table_name: str,
+    history_bucket: str,
+    temp_bucket: str,
+    record: UsageRecord,
+    on_done: Optional[Callable[[], None]] = None,
+) -> bool:
+    """Queue a record on the shared background writer (see UsageHistoryWriter.submit)."""
+    return _writer.submit(table_name, history_bucket, temp_bucket, record, on_done)
 
-        try:
-            dynamodb.put_item(TableName=table_name, Item=item)
-        except Exception as exc:
-            _logger.warning(
-                "usage_history: failed to write DynamoDB record",
-                extra={
-                    "correlation_id": correlation_id,
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                },
-            )
 
-    except Exception as exc:
-        _logger.warning(
-            "usage_history.save: unexpected error (fail-open)",
-            extra={
-                "error": str(exc),
-                "error_type": type(exc).__name__,
-            },
-        )
+def flush(timeout: Optional[float] = None) -> bool:
+    """Wait for the shared background writer to write all queued records."""
+    return _writer.flush(timeout)
@@ -73,3 +73,18 @@ errors_module.SlackApiError = SlackApiError
 mock_slack_sdk.errors = errors_module
 sys.modules["slack_sdk"] = mock_slack_sdk
 sys.modules["slack_sdk.errors"] = errors_module
+
+
+# ─── Shared AWS clients ───
+# aws_clients caches boto3 clients per process; tests that patch boto3 need a fresh cache.
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_aws_clients():
+    import aws_clients
+
+    aws_clients.clear_clients()
+    yield
+    aws_clients.clear_clients()
@@ -7,13 +7,16 @@ Tests:
 - Error handling for AWS ClientError (returns JSON, does not raise)
 - Polling with exponential backoff
 - Timeout handling
+- asyncio-native invocation: cancellation, SigV4-signed pooled HTTP transport
 """
 
+import asyncio
+import itertools
 import json
 import os
 import sys
 import time
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import AsyncMock, Mock, patch, MagicMock, call
 
 import pytest
 
@@ -21,25 +24,23 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
+ARN = "arn:aws:bedrock-agentcore:us-east-1:111111111111:runtime/exec-001"
+
+
+def _jsonrpc_body(result, req_id="req-1"):
+    return json.dumps({"jsonrpc": "2.0", "result": result, "id": req_id})
+
+
 class TestInvokeExecutionAgent:
     """Test the main invocation function."""
 
-    @patch("a2a_client._get_agentcore_client")
-    def test_synchronous_response_returned_directly(self, mock_get_client):
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_synchronous_response_returned_directly(self, mock_invoke):
         """When Execution Agent returns immediate result (JSON-RPC result), return it directly."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-
         # 032: Execution returns JSON-RPC 2.0 Response with result
-        success_body = json.dumps({
-            "jsonrpc": "2.0",
-            "result": {"status": "success", "response_text": "Hello from AI"},
-            "id": "req-sync-1",
-        })
-
-        mock_client.invoke_agent_runtime.return_value = {
-            "response": success_body,
-        }
+        mock_invoke.return_value = _jsonrpc_body(
+            {"status": "success", "response_text": "Hello from AI"}, "req-sync-1"
+        )
 
         from a2a_client import invoke_execution_agent
 
@@ -50,29 +51,21 @@ class TestInvokeExecutionAgent:
                 "bot_token": "xoxb-test",
                 "correlation_id": "corr-sync-001",
             },
-            execution_agent_arn="arn:aws:bedrock-agentcore:us-east-1:111111111111:runtime/exec-001",
+            execution_agent_arn=ARN,
         )
 
         result_data = json.loads(result)
         assert result_data["status"] == "success"
         assert result_data["response_text"] == "Hello from AI"
 
-    @patch("a2a_client._poll_async_task_result")
-    @patch("a2a_client._get_agentcore_client")
-    def test_async_response_triggers_polling(self, mock_get_client, mock_poll):
+    @patch("a2a_client._apoll_async_task_result", new_callable=AsyncMock)
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_async_response_triggers_polling(self, mock_invoke, mock_poll):
         """When 'accepted' status is returned, should poll for final result."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-
         # 032: Execution returns JSON-RPC 2.0 Response with result.status "accepted"
-        accepted_body = json.dumps({
-            "jsonrpc": "2.0",
-            "result": {"status": "accepted", "task_id": "async-task-789"},
-            "id": "req-async-1",
-        })
-        mock_client.invoke_agent_runtime.return_value = {
-            "response": accepted_body,
-        }
+        mock_invoke.return_value = _jsonrpc_body(
+            {"status": "accepted", "task_id": "async-task-789"}, "req-async-1"
+        )
 
         # Polling returns final result
         mock_poll.return_value = json.dumps({
@@ -89,21 +82,20 @@ class TestInvokeExecutionAgent:
                 "bot_token": "xoxb-test",
                 "correlation_id": "corr-async-001",
             },
-            execution_agent_arn="arn:aws:bedrock-agentcore:us-east-1:111111111111:runtime/exec-001",
+            execution_agent_arn=ARN,
         )
 
-        mock_poll.assert_called_once()
+        mock_poll.assert_awaited_once()
         result_data = json.loads(result)
         assert result_data["status"] == "success"
 
-    @patch("a2a_client._get_agentcore_client")
-    def test_client_error_returns_json_error(self, mock_get_client):
+    @patch("a2a_client.adiscover_agent_card", new_callable=AsyncMock, return_value=None)
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_client_error_returns_json_error(self, mock_invoke, _mock_discover):
         """AWS ClientError should return error JSON (not raise)."""
         from botocore.exceptions import ClientError
 
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        mock_client.invoke_agent_runtime.side_effect = ClientError(
+        mock_invoke.side_effect = ClientError(
             {"Error": {"Code": "ResourceNotFoundException", "Message": "Runtime not found"}},
             "InvokeAgentRuntime",
         )
@@ -123,15 +115,14 @@ class TestInvokeExecutionAgent:
         assert result_data["status"] == "error"
         assert "resourcenotfoundexception" in result_data["error_code"]
 
-    @patch("a2a_client.time.sleep")
-    @patch("a2a_client._get_agentcore_client")
-    def test_throttling_error_returns_throttling_code_after_retries(self, mock_get_client, mock_sleep):
+    @patch("a2a_client.adiscover_agent_card", new_callable=AsyncMock, return_value=None)
+    @patch("a2a_client._sleep", new_callable=AsyncMock)
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_throttling_error_returns_throttling_code_after_retries(self, mock_invoke, mock_sleep, _mock_discover):
         """ThrottlingException: retry with backoff, then return throttling error code."""
         from botocore.exceptions import ClientError
 
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        mock_client.invoke_agent_runtime.side_effect = ClientError(
+        mock_invoke.side_effect = ClientError(
             {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
             "InvokeAgentRuntime",
         )
@@ -149,21 +140,13 @@ class TestInvokeExecutionAgent:
         result_data = json.loads(result)
         assert result_data["status"] == "error"
         assert result_data["error_code"] == "throttling"
-        assert mock_client.invoke_agent_runtime.call_count == INVOKE_RETRY_MAX_ATTEMPTS
-        assert mock_sleep.call_count == INVOKE_RETRY_MAX_ATTEMPTS - 1
+        assert mock_invoke.await_count == INVOKE_RETRY_MAX_ATTEMPTS
+        assert mock_sleep.await_count == INVOKE_RETRY_MAX_ATTEMPTS - 1
 
-    @patch("a2a_client._get_agentcore_client")
-    def test_arn_from_env_used_as_fallback(self, mock_get_client):
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_arn_from_env_used_as_fallback(self, mock_invoke):
         """When no ARN passed, should use EXECUTION_AGENT_ARN env var."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        mock_client.invoke_agent_runtime.return_value = {
-            "response": json.dumps({
-                "jsonrpc": "2.0",
-                "result": {"status": "success", "response_text": "ok"},
-                "id": "req-env-1",
-            })
-        }
+        mock_invoke.return_value = _jsonrpc_body({"status": "success", "response_text": "ok"}, "req-env-1")
 
         from a2a_client import invoke_execution_agent
 
@@ -172,10 +155,10 @@ class TestInvokeExecutionAgent:
                 task_payload={"channel": "C01", "text": "Hi", "bot_token": "xoxb"},
             )
 
-        call_kwargs = mock_client.invoke_agent_runtime.call_args[1]
-        assert "env-agent" in call_kwargs.get("agentRuntimeArn", "")
+        agent_arn, _session_id, payload_bytes, _timeout = mock_invoke.call_args[0]
+        assert "env-agent" in agent_arn
         # 032: payload must be JSON-RPC 2.0 Request
-        payload = json.loads(call_kwargs.get("payload", b"{}").decode("utf-8"))
+        payload = json.loads(payload_bytes.decode("utf-8"))
         assert payload.get("jsonrpc") == "2.0"
         assert payload.get("method") == "execute_task"
         assert "params" in payload
@@ -192,12 +175,10 @@ class TestInvokeExecutionAgent:
                     execution_agent_arn="",
                 )
 
-    @patch("a2a_client._get_agentcore_client")
-    def test_generic_exception_returns_internal_error(self, mock_get_client):
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_generic_exception_returns_internal_error(self, mock_invoke):
         """Non-ClientError exceptions should return internal_error JSON."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        mock_client.invoke_agent_runtime.side_effect = ConnectionError("Network down")
+        mock_invoke.side_effect = ConnectionError("Network down")
 
         from a2a_client import invoke_execution_agent
 
@@ -213,11 +194,122 @@ class TestInvokeExecutionAgent:
         assert result_data["status"] == "error"
         assert result_data["error_code"] == "internal_error"
 
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_response_read_error_returns_response_read_error(self, mock_invoke):
+        """A broken response stream maps to response_read_error."""
+        from a2a_client import ResponseReadError, invoke_execution_agent
+
+        mock_invoke.side_effect = ResponseReadError("connection reset")
+
+        result = invoke_execution_agent(
+            task_payload={"text": "Hi", "correlation_id": "corr-read-001"},
+            execution_agent_arn=ARN,
+        )
+
+        assert json.loads(result)["error_code"] == "response_read_error"
+
+
+class TestAsyncInvocation:
+    """asyncio-native invocation: any event loop, cancellation, pooled HTTP transport."""
+
+    def test_ainvoke_awaitable_from_caller_loop(self):
+        from a2a_client import ainvoke_execution_agent
+
+        with patch("a2a_client._invoke_runtime", new_callable=AsyncMock) as mock_invoke:
+            mock_invoke.return_value = _jsonrpc_body({"status": "success", "response_text": "hi"})
+            result = asyncio.run(ainvoke_execution_agent({"text": "Hi"}, ARN))
+
+        assert json.loads(result)["response_text"] == "hi"
+
+    def test_cancelling_caller_cancels_in_flight_request(self):
+        import threading
+
+        from a2a_client import ainvoke_execution_agent
+
+        cancelled = threading.Event()
+
+        async def _hanging(*args):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def _scenario():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(ainvoke_execution_agent({"text": "Hi"}, ARN), timeout=0.05)
+
+        with patch("a2a_client._invoke_runtime", side_effect=_hanging):
+            asyncio.run(_scenario())
+
+        assert cancelled.wait(1.0)
+
+    def test_invoke_runtime_signs_and_streams_response(self):
+        import httpx
+
+        import a2a_client
+
+        captured = {}
+
+        async def _chunks():
+            yield b'{"jsonrpc": "2.0", '
+            yield b'"result": {}, "id": "1"}'
+
+        async def _handler(request):
+            captured["url"] = str(request.url)
+            captured["headers"] = request.headers
+            captured["body"] = await request.aread()
+            return httpx.Response(200, content=_chunks())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        credentials = Mock()
+        credentials.get_frozen_credentials.return_value = Mock(access_key="AK", secret_key="SK", token=None)
+
+        async def _scenario():
+            return await a2a_client._invoke_runtime(ARN, "s" * 36, b'{"a": 1}', 30)
+
+        with patch("a2a_client._get_http_client", return_value=client), \
+             patch("a2a_client._credentials", credentials), \
+             patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("AGENTCORE_ENDPOINT_URL", None)
+            body = asyncio.run(_scenario())
+
+        assert body == '{"jsonrpc": "2.0", "result": {}, "id": "1"}'
+        assert captured["url"] == (
+            "https://bedrock-agentcore.us-east-1.amazonaws.com/runtimes/"
+            "arn%3Aaws%3Abedrock-agentcore%3Aus-east-1%3A111111111111%3Aruntime%2Fexec-001/invocations"
+        )
+        assert captured["headers"]["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"] == "s" * 36
+        assert captured["headers"]["Authorization"].startswith("AWS4-HMAC-SHA256 Credential=AK/")
+        assert "/us-east-1/bedrock-agentcore/aws4_request" in captured["headers"]["Authorization"]
+        assert captured["body"] == b'{"a": 1}'
+
+    def test_http_error_maps_to_client_error(self):
+        from a2a_client import _http_client_error
+
+        error = _http_client_error(
+            429, {"x-amzn-errortype": "ThrottlingException:http://internal.amazon.com/"}, b'{"message": "Rate exceeded"}'
+        )
+        assert error.response["Error"] == {"Code": "ThrottlingException", "Message": "Rate exceeded"}
+
+        error = _http_client_error(403, {}, b"")
+        assert error.response["Error"]["Code"] == "AccessDeniedException"
+
+    def test_http_client_pool_size_from_environment(self):
+        import a2a_client
+
+        async def _scenario():
+            return a2a_client._get_http_client()
+
+        with patch("a2a_client._http_client", None), patch("a2a_client.A2A_MAX_CONNECTIONS", 7):
+            client = asyncio.run(_scenario())
+            assert client._transport._pool._max_connections == 7
+
 
 class TestPollAsyncTaskResult:
     """Test the async task polling function."""
 
-    @patch("a2a_client.time.sleep")
+    @patch("a2a_client._sleep", new_callable=AsyncMock)
     @patch("a2a_client._get_agentcore_client")
     def test_returns_result_when_completed(self, mock_get_client, mock_sleep):
         """Should return result when task status becomes 'completed'."""
@@ -245,7 +337,7 @@ class TestPollAsyncTaskResult:
         result_data = json.loads(result)
         assert result_data["status"] == "success"
 
-    @patch("a2a_client.time.sleep")
+    @patch("a2a_client._sleep", new_callable=AsyncMock)
     @patch("a2a_client.time.time")
     @patch("a2a_client._get_agentcore_client")
     def test_timeout_returns_async_timeout_error(self, mock_get_client, mock_time, mock_sleep):
@@ -256,8 +348,8 @@ class TestPollAsyncTaskResult:
         # Always return processing
         mock_client.get_async_task_result.return_value = {"status": "processing"}
 
-        # Simulate time progressing beyond timeout (need enough values for all time.time() calls)
-        mock_time.side_effect = [0, 0.5, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50]
+        # Simulate time progressing beyond timeout
+        mock_time.side_effect = itertools.count(0, 5)
 
         from a2a_client import _poll_async_task_result
 
@@ -272,7 +364,7 @@ class TestPollAsyncTaskResult:
         assert result_data["status"] == "error"
         assert result_data["error_code"] == "async_timeout"
 
-    @patch("a2a_client.time.sleep")
+    @patch("a2a_client._sleep", new_callable=AsyncMock)
     @patch("a2a_client._get_agentcore_client")
     def test_exponential_backoff_between_polls(self, mock_get_client, mock_sleep):
         """Polling intervals should increase (exponential backoff)."""
@@ -299,13 +391,13 @@ class TestPollAsyncTaskResult:
         )
 
         # Verify that sleep was called with increasing intervals
-        sleep_calls = [c[0][0] for c in mock_sleep.call_args_list]
+        sleep_calls = [c[0][0] for c in mock_sleep.await_args_list]
         assert len(sleep_calls) >= 3
         # Each interval should be >= previous (backoff)
         for i in range(1, len(sleep_calls)):
             assert sleep_calls[i] >= sleep_calls[i - 1]
 
-    @patch("a2a_client.time.sleep")
+    @patch("a2a_client._sleep", new_callable=AsyncMock)
     @patch("a2a_client._get_agentcore_client")
     def test_failed_status_returns_error(self, mock_get_client, mock_sleep):
         """Task with 'failed' status should return error result."""
@@ -333,6 +425,48 @@ class TestPollAsyncTaskResult:
         result_data = json.loads(result)
         assert result_data["status"] == "error"
 
+    def test_cancellation_stops_polling(self):
+        """Cancelling the awaiting task stops polling between polls."""
+        from a2a_client import _apoll_async_task_result
+
+        client = Mock()
+        client.get_async_task_result.return_value = {"status": "processing"}
+
+        async def _scenario():
+            task = asyncio.ensure_future(
+                _apoll_async_task_result("arn:aws:test", "task-cancel", "corr-cancel", 60)
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch("a2a_client._get_agentcore_client", return_value=client), \
+             patch("a2a_client.POLL_INTERVAL_SECONDS", 0.01):
+            asyncio.run(_scenario())
+        calls = client.get_async_task_result.call_count
+        assert calls >= 1
+        time.sleep(0.05)
+        assert client.get_async_task_result.call_count == calls
+
+    @patch("a2a_client._sleep", new_callable=AsyncMock)
+    @patch("a2a_client._get_agentcore_client")
+    def test_poll_interval_capped(self, mock_get_client, mock_wait):
+        """Polling starts at POLL_INTERVAL_SECONDS and never waits longer than POLL_MAX_INTERVAL_SECONDS."""
+        from a2a_client import POLL_INTERVAL_SECONDS, POLL_MAX_INTERVAL_SECONDS, _poll_async_task_result
+
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_async_task_result.side_effect = [{"status": "processing"}] * 12 + [
+            {"status": "completed", "result": "{}"}
+        ]
+
+        _poll_async_task_result("arn:aws:test", "task-cap", "corr-cap", max_wait_seconds=120)
+
+        waits = [c[0][0] for c in mock_wait.await_args_list]
+        assert waits[0] == POLL_INTERVAL_SECONDS >= 1.0
+        assert max(waits) == POLL_MAX_INTERVAL_SECONDS
+
 
 class TestJsonRpcZoneConnection:
     """JSON-RPC 2.0 Request build and Response parse."""
@@ -386,17 +520,15 @@ class TestJsonRpcZoneConnection:
         assert data.get("error_message") == "Invalid params"
         assert data.get("correlation_id") == "corr-2"
 
-    @patch("a2a_client._get_agentcore_client")
-    def test_invoke_execution_agent_jsonrpc_error_returns_user_facing_error_json(self, mock_get_client):
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_invoke_execution_agent_jsonrpc_error_returns_user_facing_error_json(self, mock_invoke):
         """When response contains JSON-RPC error, return user-facing JSON (status, error_code, error_message, correlation_id)."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
         error_body = json.dumps({
             "jsonrpc": "2.0",
             "error": {"code": -32602, "message": "Invalid params", "data": {}},
             "id": "req-err-1",
         })
-        mock_client.invoke_agent_runtime.return_value = {"response": error_body}
+        mock_invoke.return_value = error_body
 
         from a2a_client import invoke_execution_agent
 
@@ -419,18 +551,14 @@ class TestJsonRpcZoneConnection:
 class TestAgentCardDiscovery:
     """Tests for discover_agent_card helper."""
 
-    @patch("a2a_client._get_agentcore_client")
-    def test_discover_agent_card_returns_result(self, mock_get_client):
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_discover_agent_card_returns_result(self, mock_invoke):
         """discover_agent_card should return response.result for valid JSON-RPC response."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        mock_client.invoke_agent_runtime.return_value = {
-            "response": json.dumps({
-                "jsonrpc": "2.0",
-                "result": {"name": "SlackAI-ExecutionAgent"},
-                "id": "card-1",
-            }),
-        }
+        mock_invoke.return_value = json.dumps({
+            "jsonrpc": "2.0",
+            "result": {"name": "SlackAI-ExecutionAgent"},
+            "id": "card-1",
+        })
 
         from a2a_client import discover_agent_card
 
@@ -439,19 +567,17 @@ class TestAgentCardDiscovery:
         )
         assert isinstance(card, dict)
         assert card.get("name") == "SlackAI-ExecutionAgent"
+        sent = json.loads(mock_invoke.await_args.args[2])
+        assert sent["method"] == "get_agent_card"
 
-    @patch("a2a_client._get_agentcore_client")
-    def test_discover_agent_card_returns_none_on_jsonrpc_error(self, mock_get_client):
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_discover_agent_card_returns_none_on_jsonrpc_error(self, mock_invoke):
         """discover_agent_card should return None when response contains JSON-RPC error."""
-        mock_client = Mock()
-        mock_get_client.return_value = mock_client
-        mock_client.invoke_agent_runtime.return_value = {
-            "response": json.dumps({
-                "jsonrpc": "2.0",
-                "error": {"code": -32601, "message": "Method not found"},
-                "id": "card-2",
-            }),
-        }
+        mock_invoke.return_value = json.dumps({
+            "jsonrpc": "2.0",
+            "error": {"code": -32601, "message": "Method not found"},
+            "id": "card-2",
+        })
 
         from a2a_client import discover_agent_card
 
@@ -460,6 +586,16 @@ class TestAgentCardDiscovery:
         )
         assert card is None
 
+    @patch("a2a_client._invoke_runtime", new_callable=AsyncMock)
+    def test_adiscover_agent_card_can_be_awaited_from_caller_loop(self, mock_invoke):
+        """adiscover_agent_card runs on the shared I/O loop when awaited elsewhere."""
+        mock_invoke.return_value = json.dumps({"jsonrpc": "2.0", "result": {"name": "x"}, "id": "1"})
+
+        from a2a_client import adiscover_agent_card
+
+        card = asyncio.run(adiscover_agent_card("arn:aws:bedrock-agentcore:ap-northeast-1:1:runtime/a"))
+        assert card == {"name": "x"}
+
 
 class TestA2AClientSigV4:
     """Test that the client uses SigV4 authentication (boto3 default)."""
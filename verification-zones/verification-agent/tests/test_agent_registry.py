@@ -492,3 +492,184 @@ class TestSlackSearchRegistry:
         cards = get_all_cards()
         assert "slack-search" in cards
         assert cards["slack-search"]["description"] == "Slack Search"
+
+
+class TestRegistryVersion:
+    def test_version_changes_only_when_entries_change(self):
+        from agent_registry import initialize_registry, refresh_registry, get_registry_version, get_all_cards
+
+        items_a = [_make_dynamo_item("time", "arn:t", "T")]
+        items_b = [_make_dynamo_item("time", "arn:t", "T"), _make_dynamo_item("docs", "arn:d", "D")]
+        mock_table = MagicMock()
+        mock_table.query.side_effect = [
+            _make_dynamo_query_response(items_a),
+            _make_dynamo_query_response(items_a),
+            _make_dynamo_query_response(items_b),
+        ]
+
+        with patch.dict(os.environ, {
+            "AGENT_REGISTRY_TABLE": "my-table",
+            "AGENT_REGISTRY_ENV": "dev",
+        }, clear=True), patch("agent_registry.boto3") as mock_boto3:
+            mock_boto3.resource.return_value.Table.return_value = mock_table
+            initialize_registry()
+            version_a = get_registry_version()
+            cards_a = get_all_cards()
+
+            refresh_registry()
+            assert get_registry_version() == version_a
+            assert get_all_cards() == cards_a
+
+            refresh_registry()
+            assert get_registry_version() != version_a
+            assert "docs" in get_all_cards()
+
+
+class TestCardVerification:
+    @pytest.fixture(autouse=True)
+    def _registry(self):
+        import agent_registry
+
+        mock_table = MagicMock()
+        mock_table.query.return_value = _make_dynamo_query_response([
+            _make_dynamo_item("time", "arn:t", "Time from registry"),
+            _make_dynamo_item("docs", "arn:d", "Docs from registry"),
+        ])
+        agent_registry._VERIFIED_CARDS.clear()
+        with patch.dict(os.environ, {
+            "AGENT_REGISTRY_TABLE": "my-table",
+            "AGENT_REGISTRY_ENV": "dev",
+        }, clear=True), patch("agent_registry.boto3") as mock_boto3:
+            mock_boto3.resource.return_value.Table.return_value = mock_table
+            agent_registry.initialize_registry()
+            yield
+        agent_registry._VERIFIED_CARDS.clear()
+
+    def test_verified_cards_merged_and_version_tracks_etag(self):
+        import asyncio
+        import agent_registry
+        from unittest.mock import AsyncMock
+
+        base_version = agent_registry.get_registry_version()
+        cards = {"arn:t": {"name": "Time", "description": "Time from runtime"}, "arn:d": None}
+        with patch("a2a_client.adiscover_agent_card", new=AsyncMock(side_effect=lambda arn: cards[arn])):
+            results = asyncio.run(agent_registry._verify_cards(dict(agent_registry._SNAPSHOT.arns), 1.0))
+
+        assert results == {"docs": "failed", "time": "changed"}
+        merged = agent_registry.get_all_cards()
+        assert merged["time"]["description"] == "Time from runtime"
+        assert merged["time"]["arn"] == "arn:t"
+        assert merged["docs"]["description"] == "Docs from registry"
+        version = agent_registry.get_registry_version()
+        assert version != base_version
+
+        with patch("a2a_client.adiscover_agent_card", new=AsyncMock(side_effect=lambda arn: cards[arn])):
+            results = asyncio.run(agent_registry._verify_cards(dict(agent_registry._SNAPSHOT.arns), 1.0))
+        assert results["time"] == "verified"
+        assert agent_registry.get_registry_version() == version
+
+    def test_slow_agent_times_out_without_blocking_others(self):
+        import asyncio
+        import agent_registry
+
+        async def discover(arn):
+            if arn == "arn:d":
+                await asyncio.sleep(5)
+            return {"name": arn}
+
+        with patch("a2a_client.adiscover_agent_card", new=discover):
+            results = asyncio.run(agent_registry._verify_cards(dict(agent_registry._SNAPSHOT.arns), 0.05))
+
+        assert results == {"docs": "timed_out", "time": "changed"}
+
+    def test_start_card_verification_is_single_flight(self):
+        import concurrent.futures
+        import agent_registry
+
+        pending = concurrent.futures.Future()
+        with patch("a2a_client.submit_background", return_value=pending) as mock_submit:
+            assert agent_registry.start_card_verification() is True
+            assert agent_registry.start_card_verification() is False
+            pending.set_result({})
+            assert agent_registry.start_card_verification() is True
+
+        assert mock_submit.call_count == 2
+        for call_args in mock_submit.call_args_list:
+            call_args.args[0].close()
+        agent_registry._verification_future = None
+
+
+class TestVersionMarkerInvalidation:
+    @pytest.fixture()
+    def registry(self):
+        import agent_registry
+
+        mock_table = MagicMock()
+        mock_table.query.return_value = _make_dynamo_query_response([
+            _make_dynamo_item("time", "arn:t", "T"),
+            {"env": "dev", "agent_id": agent_registry.REGISTRY_VERSION_ITEM_ID, "registry_version": 1},
+        ])
+        # The marker is read through the shared low-level client (GetItem)
+        mock_table.get_item.return_value = {"Item": {"registry_version": {"N": "1"}}}
+        clock = [1000.0]
+        with patch.dict(os.environ, {
+            "AGENT_REGISTRY_TABLE": "my-table",
+            "AGENT_REGISTRY_ENV": "dev",
+        }, clear=True), patch("agent_registry.boto3") as mock_boto3, \
+                patch("agent_registry.get_client", return_value=mock_table), \
+                patch("agent_registry.time.time", side_effect=lambda: clock[0]):
+            mock_boto3.resource.return_value.Table.return_value = mock_table
+            agent_registry.initialize_registry()
+            yield agent_registry, mock_table, clock
+
+    def test_marker_item_is_not_an_agent(self, registry):
+        agent_registry, _, _ = registry
+        assert agent_registry.get_agent_ids() == ["time"]
+
+    def test_marker_read_uses_shared_client(self, registry):
+        agent_registry, mock_table, _ = registry
+        kwargs = mock_table.get_item.call_args[1]
+        assert kwargs["TableName"] == "my-table"
+        assert kwargs["Key"] == {"env": {"S": "dev"}, "agent_id": {"S": agent_registry.REGISTRY_VERSION_ITEM_ID}}
+
+    def test_unchanged_marker_skips_query(self, registry):
+        agent_registry, mock_table, clock = registry
+        clock[0] += agent_registry.AGENT_REGISTRY_VERSION_CHECK_SECONDS + 120
+
+        assert agent_registry.refresh_registry_if_stale(max_age_seconds=60) is False
+        assert mock_table.query.call_count == 1
+        assert mock_table.get_item.call_count == 2
+
+    def test_check_interval_limits_marker_reads(self, registry):
+        agent_registry, mock_table, clock = registry
+        clock[0] += agent_registry.AGENT_REGISTRY_VERSION_CHECK_SECONDS / 2
+
+        assert agent_registry.refresh_registry_if_stale() is False
+        assert mock_table.get_item.call_count == 1
+
+    def test_changed_marker_reloads_and_notifies_listeners(self, registry):
+        agent_registry, mock_table, clock = registry
+        listener = MagicMock()
+        agent_registry.add_invalidation_listener(listener)
+        try:
+            mock_table.get_item.return_value = {"Item": {"registry_version": {"N": "2"}}}
+            mock_table.query.return_value = _make_dynamo_query_response([
+                _make_dynamo_item("time", "arn:t", "T"),
+                _make_dynamo_item("docs", "arn:d", "D"),
+            ])
+            clock[0] += agent_registry.AGENT_REGISTRY_VERSION_CHECK_SECONDS
+
+            assert agent_registry.refresh_registry_if_stale() is True
+            assert agent_registry.get_agent_ids() == ["docs", "time"]
+            listener.assert_called_once_with()
+        finally:
+            agent_registry._invalidation_listeners.remove(listener)
+
+    def test_missing_marker_falls_back_to_max_age(self, registry):
+        agent_registry, mock_table, clock = registry
+        mock_table.get_item.return_value = {}
+        clock[0] += 30
+        assert agent_registry.refresh_registry_if_stale(max_age_seconds=60) is False
+        clock[0] += 31
+        assert agent_registry.refresh_registry_if_stale(max_age_seconds=60) is True
+        assert mock_table.query.call_count == 2
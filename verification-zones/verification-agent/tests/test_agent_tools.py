@@ -73,7 +73,7 @@ def test_build_agent_tools_tools_are_async_callable():
 
 @pytest.mark.anyio
 async def test_build_agent_tools_error_return_on_failure():
-    """When invoke_execution_agent raises, the tool must return a string starting with 'ERROR:'."""
+    """When ainvoke_execution_agent raises, the tool must return a string starting with 'ERROR:'."""
     from agent_tools import build_agent_tools
 
     registry = {
@@ -84,7 +84,7 @@ async def test_build_agent_tools_error_return_on_failure():
         }
     }
 
-    with patch("agent_tools.invoke_execution_agent", side_effect=RuntimeError("network error")), \
+    with patch("agent_tools.ainvoke_execution_agent", side_effect=RuntimeError("network error")), \
          patch("agent_tools.get_agent_arn", return_value="arn:aws:bedrock:us-east-1:123456789:agent-runtime/abc"):
         tools = build_agent_tools(registry)
         assert len(tools) == 1
@@ -160,7 +160,7 @@ async def test_file_artifact_store_populated_when_agent_returns_artifact():
     })
     file_artifact_store: dict = {}
 
-    with patch("agent_tools.invoke_execution_agent", return_value=response_json), \
+    with patch("agent_tools.ainvoke_execution_agent", return_value=response_json), \
          patch("agent_tools.get_agent_arn", return_value="arn:aws:bedrock:us-east-1:123:agent/abc"):
         tool_fn = make_agent_tool("file-creator-agent", card, file_artifact_store)
         result = await tool_fn("Create hello.txt")
@@ -187,7 +187,7 @@ async def test_file_artifact_store_none_does_not_raise_when_artifact_present():
         "file_artifact": sample_artifact,
     })
 
-    with patch("agent_tools.invoke_execution_agent", return_value=response_json), \
+    with patch("agent_tools.ainvoke_execution_agent", return_value=response_json), \
          patch("agent_tools.get_agent_arn", return_value="arn:aws:bedrock:us-east-1:123:agent/abc"):
         tool_fn = make_agent_tool("file-creator-agent", card, None)  # store is None
         result = await tool_fn("Create world.txt")
@@ -208,10 +208,61 @@ async def test_file_artifact_store_not_modified_when_no_artifact_in_response():
     })
     file_artifact_store: dict = {}
 
-    with patch("agent_tools.invoke_execution_agent", return_value=response_json), \
+    with patch("agent_tools.ainvoke_execution_agent", return_value=response_json), \
          patch("agent_tools.get_agent_arn", return_value="arn:aws:bedrock:us-east-1:123:agent/time"):
         tool_fn = make_agent_tool("time-agent", card, file_artifact_store)
         result = await tool_fn("What time is it?")
 
     assert result == "現在時刻は 14:00 です。"
     assert "file_artifact" not in file_artifact_store
+
+
+# ── parallel dispatch tests ────────────────────────────────────────────────────
+
+
+def test_agent_tools_run_concurrently():
+    """Tool calls from one turn overlap: two slow invocations take about one invocation's latency."""
+    import json
+    import time
+    from agent_tools import build_agent_tools
+
+    async def _slow_invoke(payload, arn):
+        await asyncio.sleep(0.3)
+        return json.dumps({"status": "success", "response_text": arn})
+
+    with patch("agent_tools.ainvoke_execution_agent", side_effect=_slow_invoke), \
+         patch("agent_tools.get_agent_arn", side_effect=lambda agent_id: f"arn-{agent_id}"):
+        tools = build_agent_tools(SAMPLE_REGISTRY)
+
+        async def _fan_out():
+            return await asyncio.gather(*(t("task") for t in tools))
+
+        started = time.monotonic()
+        results = asyncio.run(_fan_out())
+        elapsed = time.monotonic() - started
+
+    assert sorted(results) == ["arn-docs-agent", "arn-time-agent"]
+    assert elapsed < 0.55
+
+
+def test_agent_tool_returns_error_on_timeout_and_cancels_invocation():
+    """A specialist slower than ORCHESTRATOR_TOOL_TIMEOUT_SECONDS yields ERROR: timeout and is cancelled."""
+    from agent_tools import make_agent_tool
+
+    cancelled = []
+
+    async def _hanging_invoke(payload, arn):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(arn)
+            raise
+
+    with patch("agent_tools.ainvoke_execution_agent", side_effect=_hanging_invoke), \
+         patch("agent_tools.get_agent_arn", return_value="arn-docs"), \
+         patch("agent_tools.TOOL_TIMEOUT_SECONDS", 0.05):
+        tool_fn = make_agent_tool("docs-agent", {"description": "Docs"})
+        result = asyncio.run(tool_fn("task"))
+
+    assert result.startswith("ERROR: timeout")
+    assert cancelled == ["arn-docs"]
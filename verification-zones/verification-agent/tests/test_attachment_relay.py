@@ -0,0 +1,161 @@
+"""
+Unit tests for attachment_relay (Slack files → S3 pre-signed URLs).
+
+Covers:
+- files.info → streamed download → upload_stream_to_s3 → pre-signed URL
+- Size limit from files.info and while streaming
+- Fail-open per file and concurrent relay of several files
+- Attachment cache hits skip download and upload
+"""
+
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import attachment_relay
+from attachment_relay import relay_attachment, relay_attachments
+from s3_file_manager import CachedAttachment, FileTooLargeError, StreamedObject
+
+
+def _att(file_id="F1", name="doc.pdf", size=3):
+    return {"id": file_id, "name": name, "mimetype": "application/pdf", "size": size}
+
+
+@pytest.fixture
+def slack():
+    client = MagicMock()
+    client.call.side_effect = lambda method, params: {
+        "ok": True,
+        "file": {
+            "id": params["file"],
+            "size": 3,
+            "timestamp": 1700000000,
+            "url_private_download": f"https://files.slack.com/{params['file']}",
+        },
+    }
+    client.open_download.return_value.iter_content.return_value = iter([b"abc"])
+    with patch("attachment_relay.get_slack_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def s3():
+    def upload(chunks, correlation_id, file_id, file_name, mimetype, max_bytes=None):
+        size = sum(len(c) for c in chunks)
+        return StreamedObject(f"attachments/{correlation_id}/{file_id}/{file_name}", size, "sha-1")
+
+    with patch("attachment_relay.upload_stream_to_s3", side_effect=upload) as mock_upload, \
+         patch("attachment_relay.generate_presigned_url", side_effect=lambda key: f"https://s3/{key}"), \
+         patch("attachment_relay.find_cached_attachment", return_value=None) as mock_find, \
+         patch("attachment_relay.store_cached_attachment") as mock_store:
+        mock_upload.find = mock_find
+        mock_upload.store = mock_store
+        yield mock_upload
+
+
+class TestRelayAttachment:
+    def test_streams_download_into_s3(self, slack, s3):
+        result = relay_attachment("xoxb-t", _att(), "corr-1")
+
+        assert result.s3_key == "attachments/corr-1/F1/doc.pdf"
+        assert result.presigned_url == "https://s3/attachments/corr-1/F1/doc.pdf"
+        assert result.size == 3
+        slack.open_download.assert_called_once_with("https://files.slack.com/F1", timeout=30.0)
+        slack.open_download.return_value.close.assert_called_once()
+        assert s3.call_args.kwargs["max_bytes"] == attachment_relay.ATTACHMENT_MAX_BYTES
+        assert result.to_file_reference() == {
+            "id": "F1",
+            "name": "doc.pdf",
+            "mimetype": "application/pdf",
+            "size": 3,
+            "presigned_url": "https://s3/attachments/corr-1/F1/doc.pdf",
+            "content_sha256": "sha-1",
+        }
+        s3.store.assert_called_once_with("attachments/corr-1/F1/doc.pdf", "F1", "1700000000", "sha-1", "doc.pdf")
+
+    def test_cached_file_skips_download_and_upload(self, slack, s3):
+        s3.find.return_value = CachedAttachment("attachment_cache/F1/1700000000/h1/doc.pdf", "h1")
+
+        result = relay_attachment("xoxb-t", _att(), "corr-2")
+
+        assert result.cache_hit is True
+        assert result.s3_key == "attachment_cache/F1/1700000000/h1/doc.pdf"
+        assert result.presigned_url == "https://s3/attachment_cache/F1/1700000000/h1/doc.pdf"
+        assert result.content_sha256 == "h1"
+        s3.find.assert_called_once_with("F1", "1700000000", 3)
+        slack.open_download.assert_not_called()
+        s3.assert_not_called()
+        s3.store.assert_not_called()
+
+    def test_edited_file_looked_up_by_updated_time(self, slack, s3):
+        slack.call.side_effect = None
+        slack.call.return_value = {"ok": True, "file": {
+            "size": 3, "timestamp": 1700000000, "updated": 1700000500, "url_private_download": "u",
+        }}
+
+        relay_attachment("xoxb-t", _att(), "corr-1")
+
+        s3.find.assert_called_once_with("F1", "1700000500", 3)
+
+    def test_declared_size_over_limit_skips_download(self, slack, s3):
+        slack.call.side_effect = None
+        slack.call.return_value = {
+            "ok": True,
+            "file": {"size": attachment_relay.ATTACHMENT_MAX_BYTES + 1, "url_private_download": "u"},
+        }
+
+        assert relay_attachment("xoxb-t", _att(), "corr-1") is None
+        slack.open_download.assert_not_called()
+
+    def test_limit_exceeded_while_streaming_returns_none(self, slack, s3):
+        s3.side_effect = FileTooLargeError(10)
+
+        assert relay_attachment("xoxb-t", _att(), "corr-1") is None
+        slack.open_download.return_value.close.assert_called_once()
+
+    def test_files_info_error_returns_none(self, slack, s3):
+        slack.call.side_effect = None
+        slack.call.return_value = {"ok": False, "error": "file_not_found"}
+
+        assert relay_attachment("xoxb-t", _att(), "corr-1") is None
+        s3.assert_not_called()
+
+    def test_s3_error_returns_none(self, slack, s3):
+        s3.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+
+        assert relay_attachment("xoxb-t", _att(), "corr-1") is None
+
+
+class TestRelayAttachments:
+    def test_relays_concurrently_in_input_order(self, slack, s3):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def upload(chunks, correlation_id, file_id, file_name, mimetype, max_bytes=None):
+            barrier.wait()  # only passes when all three uploads run at the same time
+            return StreamedObject(f"attachments/{correlation_id}/{file_id}/{file_name}", 3, "sha")
+
+        s3.side_effect = upload
+        slack.open_download.side_effect = lambda url, timeout: MagicMock()
+
+        result = relay_attachments([_att("F1"), _att("F2"), _att("F3")], "xoxb-t", "corr-1")
+
+        assert [r.file_id for r in result] == ["F1", "F2", "F3"]
+
+    def test_failed_file_left_out(self, slack, s3):
+        def call(method, params):
+            if params["file"] == "F2":
+                return {"ok": False, "error": "file_not_found"}
+            return {"ok": True, "file": {"size": 3, "url_private_download": "u"}}
+
+        slack.call.side_effect = call
+        slack.open_download.side_effect = lambda url, timeout: MagicMock()
+
+        result = relay_attachments([_att("F1"), _att("F2"), _att("F3")], "xoxb-t", "corr-1")
+
+        assert [r.file_id for r in result] == ["F1", "F3"]
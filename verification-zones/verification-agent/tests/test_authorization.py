@@ -10,8 +10,10 @@ Covers:
 - Environment variable ID:label format parsing
 """
 
+import json
 import os
 import sys
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -798,3 +800,328 @@ class TestEnvVarEntityLabelParsing:
         result = _get_whitelist_from_env()
         assert result["team_labels"] == {}
         assert result["user_labels"] == {}
+
+
+# ---------------------------------------------------------------------------
+# Paginated loading, background refresh and incremental updates
+# ---------------------------------------------------------------------------
+
+class TestWhitelistPaginationAndRefresh:
+    """DynamoDB pagination, refresh-ahead and incremental refresh of the whitelist cache."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        import authorization
+
+        authorization._whitelist_cache = None
+        authorization._refresh_in_progress = False
+        yield
+        authorization._whitelist_cache = None
+        authorization._refresh_in_progress = False
+
+    @patch.dict(os.environ, {"WHITELIST_TABLE_NAME": "wl"})
+    @patch("authorization.boto3")
+    def test_dynamodb_follows_last_evaluated_key(self, mock_boto3):
+        client = MagicMock()
+        pages = {
+            "team_id": [
+                {"Items": [{"entity_id": {"S": "T1"}}], "LastEvaluatedKey": {"k": {"S": "1"}}},
+                {"Items": [{"entity_id": {"S": "T2"}}]},
+            ],
+        }
+
+        def query(**kwargs):
+            entity_type = kwargs["ExpressionAttributeValues"][":entity_type"]["S"]
+            remaining = pages.get(entity_type, [{"Items": []}])
+            return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+        client.query.side_effect = query
+        mock_boto3.client.return_value = client
+
+        result = _get_whitelist_from_dynamodb()
+
+        assert result["team_ids"] == {"T1", "T2"}
+        second_page_call = client.query.call_args_list[1][1]
+        assert second_page_call["ExclusiveStartKey"] == {"k": {"S": "1"}}
+
+    @patch.dict(os.environ, {"WHITELIST_TABLE_NAME": "wl"})
+    @patch("authorization.boto3")
+    def test_dynamodb_skips_tombstones(self, mock_boto3):
+        items = {
+            "user_id": [
+                {"entity_id": {"S": "U1"}},
+                {"entity_id": {"S": "U2"}, "deleted": {"BOOL": True}},
+            ],
+        }
+        mock_boto3.client.return_value = _mock_dynamodb_responses(items)
+
+        result = _get_whitelist_from_dynamodb()
+
+        assert result["user_ids"] == {"U1"}
+
+    @patch("authorization._get_whitelist_from_dynamodb")
+    def test_cached_ids_are_frozensets(self, mock_dynamodb):
+        mock_dynamodb.return_value = {"team_ids": {"T1"}, "user_ids": set(), "channel_ids": set()}
+
+        result = load_whitelist_config()
+
+        assert isinstance(result["team_ids"], frozenset)
+
+    @patch("authorization._schedule_refresh")
+    @patch("authorization._get_whitelist_from_dynamodb")
+    def test_refresh_ahead_serves_cache_and_schedules_refresh(self, mock_dynamodb, mock_schedule):
+        import authorization
+
+        now = int(time.time())
+        authorization._whitelist_cache = authorization._build_cache_entry(
+            {"team_ids": {"T1"}, "user_ids": set(), "channel_ids": set()},
+            "dynamodb",
+            now - (authorization._cache_ttl - authorization._refresh_ahead_seconds),
+        )
+
+        result = load_whitelist_config()
+
+        assert "T1" in result["team_ids"]
+        mock_dynamodb.assert_not_called()
+        mock_schedule.assert_called_once_with(authorization._whitelist_cache)
+
+    @patch("authorization._schedule_refresh")
+    def test_fresh_cache_does_not_schedule_refresh(self, mock_schedule):
+        import authorization
+
+        authorization._whitelist_cache = authorization._build_cache_entry(
+            {"team_ids": {"T1"}, "user_ids": set(), "channel_ids": set()},
+            "dynamodb",
+            int(time.time()),
+        )
+
+        load_whitelist_config()
+
+        mock_schedule.assert_not_called()
+
+    @patch("authorization._load_from_sources")
+    def test_background_full_refresh_installs_new_entry(self, mock_load):
+        import authorization
+
+        base = authorization._build_cache_entry(
+            {"team_ids": {"T1"}, "user_ids": set(), "channel_ids": set()},
+            "dynamodb",
+            int(time.time()) - authorization._cache_ttl + 1,
+        )
+        authorization._whitelist_cache = base
+        mock_load.return_value = ({"team_ids": {"T2"}, "user_ids": set(), "channel_ids": set()}, "dynamodb")
+
+        authorization._refresh_whitelist_cache(base)
+
+        assert authorization._whitelist_cache["team_ids"] == frozenset({"T2"})
+        assert authorization._refresh_in_progress is False
+
+    @patch("authorization._load_from_sources")
+    def test_background_refresh_failure_keeps_current_entry(self, mock_load):
+        import authorization
+
+        base = authorization._build_cache_entry(
+            {"team_ids": {"T1"}, "user_ids": set(), "channel_ids": set()},
+            "dynamodb",
+            int(time.time()) - authorization._cache_ttl + 1,
+        )
+        authorization._whitelist_cache = base
+        mock_load.side_effect = authorization.WhitelistLoaderError("boom")
+
+        authorization._refresh_whitelist_cache(base)
+
+        assert authorization._whitelist_cache is base
+
+    @patch("authorization._get_whitelist_changes_from_dynamodb")
+    def test_incremental_refresh_applies_upserts_and_tombstones(self, mock_changes):
+        import authorization
+
+        now = int(time.time())
+        base = authorization._build_cache_entry(
+            {
+                "team_ids": {"T1"},
+                "user_ids": {"U1", "U2"},
+                "channel_ids": set(),
+                "user_labels": {"U2": "Bob"},
+                "watermark": now - 120,
+            },
+            "dynamodb",
+            now,
+        )
+        authorization._whitelist_cache = base
+        mock_changes.return_value = [
+            ("user_id", "U2", "", True, now),
+            ("channel_id", "C9", "#new", False, now),
+        ]
+
+        authorization._refresh_whitelist_cache(base)
+
+        mock_changes.assert_called_once_with(now - 120)
+        entry = authorization._whitelist_cache
+        assert entry["user_ids"] == frozenset({"U1"})
+        assert "U2" not in entry["user_labels"]
+        assert entry["channel_labels"] == {"C9": "#new"}
+        assert entry["full_loaded_at"] == base["full_loaded_at"]
+
+    @patch.dict(os.environ, {"WHITELIST_TABLE_NAME": "wl"})
+    @patch("authorization.boto3")
+    def test_changes_query_filters_on_updated_at(self, mock_boto3):
+        import authorization
+
+        client = MagicMock()
+        client.query.return_value = {
+            "Items": [{"entity_id": {"S": "U5"}, "updated_at": {"N": "1700000100"}}],
+        }
+        mock_boto3.client.return_value = client
+
+        changes = authorization._get_whitelist_changes_from_dynamodb(1700000000)
+
+        call = client.query.call_args_list[0][1]
+        assert call["FilterExpression"] == "updated_at > :since"
+        assert call["ExpressionAttributeValues"][":since"] == {"N": "1700000000"}
+        assert ("team_id", "U5", "", False, 1700000100) in changes
+
+
+# ---------------------------------------------------------------------------
+# Compiled authorization index and cold-start snapshots
+# ---------------------------------------------------------------------------
+
+class TestAuthorizationIndex:
+    """AuthorizationIndex answers all memberships and labels in one lookup."""
+
+    def _index(self, **whitelist):
+        from authorization import AuthorizationIndex
+
+        return AuthorizationIndex.from_whitelist(whitelist)
+
+    def test_lookup_checks_only_configured_entities(self):
+        index = self._index(team_ids={"T1"}, channel_ids={"C1"}, channel_labels={"C1": "#general"})
+
+        result = index.lookup("T1", "U_ANY", "C1")
+
+        assert result.authorized is True
+        assert result.checked_entities == ("team_id", "channel_id")
+        assert result.skipped_entities == ("user_id",)
+        assert result.channel_label == "#general"
+
+    def test_lookup_reports_missing_and_unknown_entities(self):
+        index = self._index(team_ids={"T1"}, user_ids={"U1"})
+
+        result = index.lookup(None, "U2", "C1")
+
+        assert result.unauthorized_entities == ("team_id", "user_id")
+
+    def test_index_is_immutable(self):
+        index = self._index(user_ids={"U1"}, user_labels={"U1": "Alice"})
+
+        with pytest.raises(TypeError):
+            index.user_labels["U2"] = "Bob"
+        with pytest.raises(Exception):
+            index.user_ids = frozenset()
+
+    def test_version_depends_only_on_content(self):
+        a = self._index(team_ids={"T1", "T2"}, team_labels={"T1": "Acme"})
+        b = self._index(team_ids=["T2", "T1"], team_labels={"T1": "Acme"})
+        c = self._index(team_ids={"T1"}, team_labels={"T1": "Acme"})
+
+        assert a.version == b.version
+        assert a.version != c.version
+
+    def test_snapshot_round_trip(self):
+        from authorization import AuthorizationIndex
+
+        index = self._index(channel_ids={"C1"}, channel_labels={"C1": "#general"})
+
+        restored = AuthorizationIndex.from_snapshot(json.loads(json.dumps(index.to_snapshot(123))))
+
+        assert restored == index
+
+    def test_snapshot_with_tampered_content_rejected(self):
+        from authorization import AuthorizationIndex
+
+        snapshot = self._index(user_ids={"U1"}).to_snapshot(123)
+        snapshot["user_ids"].append("U_EVIL")
+
+        with pytest.raises(ValueError):
+            AuthorizationIndex.from_snapshot(snapshot)
+
+
+class TestWhitelistSnapshot:
+    """Cold starts load a fresh snapshot instead of querying the sources."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch, tmp_path):
+        import authorization
+
+        self.path = tmp_path / "whitelist.json"
+        monkeypatch.setattr(authorization, "WHITELIST_SNAPSHOT_PATH", str(self.path))
+        monkeypatch.setattr(authorization, "WHITELIST_SNAPSHOT_S3_URI", "")
+        monkeypatch.setattr(authorization, "_whitelist_cache", None)
+        monkeypatch.setattr(authorization, "_snapshot_attempted", False)
+        monkeypatch.setattr(authorization, "_snapshot_version", None)
+        monkeypatch.setattr(authorization, "_refresh_in_progress", False)
+
+    def _write(self, generated_at, **whitelist):
+        from authorization import AuthorizationIndex
+
+        index = AuthorizationIndex.from_whitelist(whitelist)
+        self.path.write_text(json.dumps(index.to_snapshot(generated_at)))
+        return index
+
+    @patch("authorization._schedule_refresh")
+    @patch("authorization._load_from_sources")
+    def test_cold_start_serves_fresh_snapshot(self, mock_load, mock_schedule):
+        self._write(int(time.time()), channel_ids={"C1"})
+
+        result = load_whitelist_config()
+
+        assert result["channel_ids"] == frozenset({"C1"})
+        mock_load.assert_not_called()
+        mock_schedule.assert_not_called()
+
+    @patch("authorization._schedule_refresh")
+    @patch("authorization._load_from_sources")
+    def test_snapshot_near_expiry_triggers_background_reload(self, mock_load, mock_schedule):
+        import authorization
+
+        self._write(int(time.time()) - authorization._cache_ttl, channel_ids={"C1"})
+
+        load_whitelist_config()
+
+        mock_load.assert_not_called()
+        mock_schedule.assert_called_once()
+
+    @patch("authorization._load_from_sources")
+    def test_stale_snapshot_ignored(self, mock_load):
+        import authorization
+
+        self._write(int(time.time()) - authorization.WHITELIST_SNAPSHOT_MAX_AGE_SECONDS - 1, channel_ids={"C1"})
+        mock_load.return_value = ({"team_ids": set(), "user_ids": set(), "channel_ids": {"C2"}}, "env")
+
+        result = load_whitelist_config()
+
+        assert result["channel_ids"] == frozenset({"C2"})
+
+    def test_write_snapshot_creates_loadable_file(self):
+        import authorization
+
+        index = authorization.AuthorizationIndex.from_whitelist({"user_ids": {"U1"}})
+
+        authorization._write_snapshot(index, 456)
+
+        restored = authorization.AuthorizationIndex.from_snapshot(json.loads(self.path.read_text()))
+        assert restored == index
+        assert authorization._snapshot_version == index.version
+
+    @patch("authorization._load_from_sources")
+    def test_unchanged_reload_reuses_compiled_index(self, mock_load):
+        import authorization
+
+        mock_load.return_value = ({"team_ids": {"T1"}, "user_ids": set(), "channel_ids": set()}, "env")
+        load_whitelist_config()
+        first = authorization._whitelist_cache["index"]
+        authorization._whitelist_cache["cached_at"] = 0  # force expiry
+
+        load_whitelist_config()
+
+        assert authorization._whitelist_cache["index"] is first
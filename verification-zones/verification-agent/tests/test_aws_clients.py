@@ -0,0 +1,59 @@
+"""
+Unit tests for the shared boto3 client factory (aws_clients.py).
+
+Covers:
+- One client per (service, region, config), reused across calls and threads
+- Region pinning (explicit region and AWS_REGION_NAME default)
+- Connection pool size applied to every client
+"""
+
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import aws_clients
+from aws_clients import get_client
+
+
+class TestGetClient:
+    def test_same_service_and_region_reuses_client(self):
+        assert get_client("s3", region_name="ap-northeast-1") is get_client("s3", region_name="ap-northeast-1")
+
+    def test_region_and_options_cached_separately(self):
+        base = get_client("s3", region_name="ap-northeast-1")
+
+        assert get_client("s3", region_name="us-east-1") is not base
+        assert get_client("s3", region_name="ap-northeast-1", connect_timeout=2) is not base
+        assert get_client("sqs", region_name="ap-northeast-1") is not base
+
+    def test_default_region_from_env(self):
+        with patch.dict(os.environ, {"AWS_REGION_NAME": "eu-west-1"}):
+            assert get_client("sqs").meta.region_name == "eu-west-1"
+
+    def test_pool_size_and_options_applied(self):
+        client = get_client("s3", region_name="ap-northeast-1", connect_timeout=2)
+
+        assert client.meta.config.max_pool_connections == aws_clients.AWS_CLIENT_MAX_POOL_CONNECTIONS
+        assert client.meta.config.connect_timeout == 2
+
+    def test_concurrent_callers_share_one_client(self):
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(get_client("logs", region_name="ap-northeast-1"))
+
+        with patch("aws_clients.boto3") as mock_boto3:
+            mock_boto3.client.side_effect = lambda *a, **kw: object()
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len({id(c) for c in results}) == 1
+        assert mock_boto3.client.call_count == 1
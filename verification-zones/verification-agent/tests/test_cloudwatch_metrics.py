@@ -5,8 +5,11 @@ Tests:
 - Metric emission with correct namespace
 - Silent failure handling
 - Singleton client behavior
+- Buffering, statistic-set aggregation and batched flushes
+- Embedded Metric Format output
 """
 
+import json
 import os
 import sys
 from unittest.mock import Mock, patch
@@ -26,9 +29,10 @@ class TestVerificationMetrics:
         mock_cw = Mock()
         mock_get_client.return_value = mock_cw
 
-        from cloudwatch_metrics import emit_metric
+        from cloudwatch_metrics import emit_metric, flush_metrics
 
         emit_metric("SlackAI/VerificationAgent", "A2ATaskReceived", 1.0)
+        flush_metrics()
 
         mock_cw.put_metric_data.assert_called_once()
         call_kwargs = mock_cw.put_metric_data.call_args[1]
@@ -42,10 +46,11 @@ class TestVerificationMetrics:
         mock_cw.put_metric_data.side_effect = Exception("NetworkError")
         mock_get_client.return_value = mock_cw
 
-        from cloudwatch_metrics import emit_metric
+        from cloudwatch_metrics import emit_metric, flush_metrics
 
         # Should not raise
         emit_metric("SlackAI/VerificationAgent", "RateLimitExceeded", 1.0)
+        flush_metrics()
 
     @patch("cloudwatch_metrics.boto3.client")
     def test_singleton_client_reused(self, mock_boto_client):
@@ -79,3 +84,106 @@ class TestVerificationMetrics:
         assert METRIC_WHITELIST_AUTHORIZATION_FAILED == "WhitelistAuthorizationFailed"
         assert METRIC_A2A_TASK_RECEIVED == "A2ATaskReceived"
         assert METRIC_SLACK_RESPONSE_POSTED == "SlackResponsePosted"
+
+
+class TestBufferedEmission:
+    """Datapoints are buffered, aggregated into statistic sets and flushed in batches."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_buffer(self, monkeypatch):
+        import cloudwatch_metrics
+
+        monkeypatch.delenv("METRICS_OUTPUT", raising=False)
+        cloudwatch_metrics._buffer._drain()
+        yield
+        cloudwatch_metrics._buffer._drain()
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_emit_does_not_call_api_until_flush(self, mock_get_client):
+        from cloudwatch_metrics import emit_metric
+
+        emit_metric("SlackEventHandler", "RateLimitRequests", 1.0)
+
+        mock_get_client.return_value.put_metric_data.assert_not_called()
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_datapoints_aggregated_into_statistic_set(self, mock_get_client):
+        from cloudwatch_metrics import emit_metric, flush_metrics
+
+        for value in (120.0, 80.0, 40.0):
+            emit_metric("SlackEventHandler", "SlackAPILatency", value, "Milliseconds")
+        flush_metrics()
+
+        datum = mock_get_client.return_value.put_metric_data.call_args[1]["MetricData"][0]
+        assert datum["StatisticValues"] == {
+            "SampleCount": 3.0,
+            "Sum": 240.0,
+            "Minimum": 40.0,
+            "Maximum": 120.0,
+        }
+        assert datum["Unit"] == "Milliseconds"
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_dimensions_are_separate_series(self, mock_get_client):
+        from cloudwatch_metrics import emit_metric, flush_metrics
+
+        emit_metric("NS", "Calls", 1.0, dimensions=[{"Name": "Method", "Value": "a"}])
+        emit_metric("NS", "Calls", 1.0, dimensions=[{"Name": "Method", "Value": "b"}])
+        flush_metrics()
+
+        data = mock_get_client.return_value.put_metric_data.call_args[1]["MetricData"]
+        assert sorted(d["Dimensions"][0]["Value"] for d in data) == ["a", "b"]
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_flush_batches_per_namespace_up_to_1000(self, mock_get_client):
+        from cloudwatch_metrics import emit_metric, flush_metrics
+
+        for i in range(1500):
+            emit_metric("NS", f"Metric{i}", 1.0)
+        emit_metric("Other", "Metric", 1.0)
+        flush_metrics()
+
+        calls = mock_get_client.return_value.put_metric_data.call_args_list
+        sizes = sorted((c[1]["Namespace"], len(c[1]["MetricData"])) for c in calls)
+        assert sizes == [("NS", 500), ("NS", 1000), ("Other", 1)]
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_emf_output_writes_stdout_instead_of_api(self, mock_get_client, monkeypatch, capsys):
+        from cloudwatch_metrics import emit_metric, flush_metrics
+
+        monkeypatch.setenv("METRICS_OUTPUT", "emf")
+        emit_metric("SlackEventHandler", "RateLimitRequests", 1.0)
+        emit_metric("SlackEventHandler", "RateLimitRequests", 1.0)
+        flush_metrics()
+
+        mock_get_client.return_value.put_metric_data.assert_not_called()
+        document = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert document["RateLimitRequests"] == [1.0, 1.0]
+        directive = document["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == "SlackEventHandler"
+        assert directive["Metrics"] == [{"Name": "RateLimitRequests", "Unit": "Count"}]
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_full_buffer_drops_new_datapoints(self, mock_get_client, monkeypatch):
+        import cloudwatch_metrics
+
+        monkeypatch.setattr(cloudwatch_metrics._buffer, "_max_datapoints", 2)
+        for _ in range(3):
+            cloudwatch_metrics.emit_metric("NS", "Calls", 1.0)
+        cloudwatch_metrics.flush_metrics()
+
+        datum = mock_get_client.return_value.put_metric_data.call_args[1]["MetricData"][0]
+        assert datum["StatisticValues"]["SampleCount"] == 2.0
+
+    @patch("cloudwatch_metrics._get_cloudwatch_client")
+    def test_flush_metrics_after_flushes_on_exception(self, mock_get_client):
+        from cloudwatch_metrics import emit_metric, flush_metrics_after
+
+        @flush_metrics_after
+        def handler(event, context):
+            emit_metric("NS", "Calls", 1.0)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            handler({}, None)
+        mock_get_client.return_value.put_metric_data.assert_called_once()
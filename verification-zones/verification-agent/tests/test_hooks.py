@@ -152,6 +152,41 @@ class TestMaxTurnsHook:
         assert "BeforeToolCallEvent" in type_names
 
 
+    def test_parallel_calls_in_one_cycle_count_as_one_turn(self):
+        """Tool calls sharing an event loop cycle count as a single turn."""
+        MaxTurnsHook = self._get_hook()
+        hook = MaxTurnsHook(max_turns=3)
+
+        for cycle in ("cycle-1", "cycle-1", "cycle-2"):
+            event = MockBeforeToolCallEvent()
+            event.invocation_state = {"event_loop_cycle_id": cycle}
+            hook._check(event)
+            assert event.cancel_tool is None
+
+        assert hook._tool_call_count == 3
+        assert hook.turn_count == 2
+
+    def test_limit_cancels_every_call_of_the_turn(self):
+        """When the limit is reached, all parallel calls of that turn are cancelled."""
+        MaxTurnsHook = self._get_hook()
+        hook = MaxTurnsHook(max_turns=2)
+
+        first = MockBeforeToolCallEvent()
+        first.invocation_state = {"event_loop_cycle_id": "cycle-1"}
+        hook._check(first)
+
+        parallel = []
+        for _ in range(2):
+            event = MockBeforeToolCallEvent()
+            event.invocation_state = {"event_loop_cycle_id": "cycle-2"}
+            hook._check(event)
+            parallel.append(event)
+
+        assert first.cancel_tool is None
+        assert all(isinstance(e.cancel_tool, str) for e in parallel)
+        assert hook.fired is True
+
+
 # ---------------------------------------------------------------------------
 # ToolLoggingHook tests
 # ---------------------------------------------------------------------------
@@ -270,3 +305,18 @@ class TestToolLoggingHook:
 
         data = mock_log.call_args[0][2]
         assert data["status"] == "success"
+
+    def test_tool_logging_hook_records_concurrency(self):
+        """Overlapping tool calls are timed separately and concurrency is recorded."""
+        from src.hooks import ToolLoggingHook
+
+        hook = ToolLoggingHook(correlation_id="corr-par")
+        with patch("src.hooks._log") as mock_log:
+            hook._before_tool(MockBeforeToolCallEvent(tool_name="invoke_docs", tool_use_id="a"))
+            hook._before_tool(MockBeforeToolCallEvent(tool_name="slack_search", tool_use_id="b"))
+            hook._after_tool(MockAfterToolCallEvent(tool_name="slack_search", tool_use_id="b"))
+            hook._after_tool(MockAfterToolCallEvent(tool_name="invoke_docs", tool_use_id="a"))
+
+        assert hook.peak_concurrency == 2
+        assert [c[0][2]["concurrent_calls"] for c in mock_log.call_args_list] == [2, 1]
+        assert hook.agents_called == ["docs"]
@@ -0,0 +1,83 @@
+"""
+Unit tests for the invocation worker pool.
+
+Covers:
+- Blocking handlers run off the event loop (the loop keeps serving other work)
+- AGENT_MAX_CONCURRENT_INVOCATIONS bounds concurrent handlers
+- in_flight / is_busy track queued and running invocations, including failures
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from invocation_pool import InvocationPool, get_max_concurrent_invocations
+
+
+class TestMaxConcurrentInvocations:
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("AGENT_MAX_CONCURRENT_INVOCATIONS", raising=False)
+        assert get_max_concurrent_invocations() == 4
+
+    def test_from_environment(self, monkeypatch):
+        monkeypatch.setenv("AGENT_MAX_CONCURRENT_INVOCATIONS", "2")
+        assert get_max_concurrent_invocations() == 2
+
+    def test_invalid_values(self, monkeypatch):
+        monkeypatch.setenv("AGENT_MAX_CONCURRENT_INVOCATIONS", "0")
+        assert get_max_concurrent_invocations() == 1
+        monkeypatch.setenv("AGENT_MAX_CONCURRENT_INVOCATIONS", "many")
+        assert get_max_concurrent_invocations() == 4
+
+
+class TestInvocationPool:
+    def test_event_loop_not_blocked_while_handler_runs(self):
+        pool = InvocationPool(max_workers=1)
+        release = threading.Event()
+
+        async def scenario():
+            task = asyncio.ensure_future(pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            # The loop is free: this coroutine runs while the handler blocks
+            busy_during = pool.is_busy
+            release.set()
+            await task
+            return busy_during
+
+        assert asyncio.run(scenario()) is True
+        assert pool.in_flight == 0
+
+    def test_concurrency_is_bounded(self):
+        pool = InvocationPool(max_workers=2)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def handler():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            threading.Event().wait(0.05)
+            with lock:
+                state["running"] -= 1
+            return "ok"
+
+        async def scenario():
+            return await asyncio.gather(*(pool.run(handler) for _ in range(5)))
+
+        assert asyncio.run(scenario()) == ["ok"] * 5
+        assert state["peak"] == 2
+
+    def test_exception_propagates_and_clears_in_flight(self):
+        pool = InvocationPool(max_workers=1)
+
+        def handler():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(pool.run(handler))
+        assert pool.is_busy is False
@@ -761,6 +761,13 @@ class TestNormalFlowDelegation:
 class TestSecurityCheckPipeline:
     """Security check pipeline order and failure isolation with echo mode off."""
 
+    @pytest.fixture(autouse=True)
+    def enrichment(self):
+        """Stub the Slack context fetchers so no test reaches the Slack API."""
+        with patch("pipeline.build_current_thread_context", return_value=None) as thread_context, \
+                patch("pipeline.resolve_slack_urls", side_effect=lambda text, *a, **kw: text) as resolve_urls:
+            yield Mock(thread_context=thread_context, resolve_urls=resolve_urls)
+
     def _make_payload(self, team_id="T1234", user_id="U1234"):
         return {
             "prompt": json.dumps({
@@ -778,12 +785,13 @@ class TestSecurityCheckPipeline:
     @patch("pipeline.check_rate_limit")
     @patch("pipeline.authorize_request")
     @patch("pipeline.check_entity_existence")
-    def test_existence_check_runs_before_authorization(
+    def test_existence_check_failure_blocks_rate_limit(
         self, mock_existence, mock_auth, mock_rate, mock_send, mock_routing_defaults
     ):
-        """When existence check fails, authorization is NOT called."""
+        """When existence check fails, rate_limit is NOT called (authorization runs concurrently)."""
         from existence_check import ExistenceCheckError
         mock_existence.side_effect = ExistenceCheckError("Not found")
+        mock_auth.return_value = Mock(authorized=True, unauthorized_entities=[])
 
         from main import handle_message
 
@@ -791,10 +799,48 @@ class TestSecurityCheckPipeline:
 
         result_data = json.loads(result)
         assert result_data["error_code"] == "existence_check_failed"
-        mock_auth.assert_not_called()
         mock_rate.assert_not_called()
         mock_routing_defaults.assert_not_called()
 
+    @patch("pipeline.send_slack_post_request")
+    @patch("pipeline.check_rate_limit")
+    @patch("pipeline.authorize_request")
+    @patch("pipeline.check_entity_existence")
+    def test_rejected_request_does_not_fetch_slack_context(
+        self, mock_existence, mock_auth, mock_rate, mock_send, mock_routing_defaults, enrichment
+    ):
+        """Thread history and Slack URLs are fetched only after existence and authorization pass."""
+        from existence_check import ExistenceCheckError
+        from main import handle_message
+
+        mock_existence.side_effect = ExistenceCheckError("Not found")
+        mock_auth.return_value = Mock(authorized=True, unauthorized_entities=[])
+        handle_message(self._make_payload())
+
+        mock_existence.side_effect = None
+        mock_auth.return_value = Mock(authorized=False, unauthorized_entities=["T_BAD"])
+        handle_message(self._make_payload())
+
+        enrichment.thread_context.assert_not_called()
+        enrichment.resolve_urls.assert_not_called()
+
+    @patch("pipeline.send_slack_post_request")
+    @patch("pipeline.check_rate_limit")
+    @patch("pipeline.authorize_request")
+    @patch("pipeline.check_entity_existence")
+    def test_slack_context_fetched_after_security_checks_pass(
+        self, mock_existence, mock_auth, mock_rate, mock_send, mock_routing_defaults, enrichment
+    ):
+        mock_auth.return_value = Mock(authorized=True, unauthorized_entities=[])
+        mock_rate.return_value = (True, 9)
+
+        from main import handle_message
+
+        handle_message(self._make_payload())
+
+        enrichment.thread_context.assert_called_once()
+        enrichment.resolve_urls.assert_called_once()
+
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.check_rate_limit")
     @patch("pipeline.authorize_request")
@@ -943,26 +989,6 @@ class TestExecutionErrorPaths:
         assert "Traceback" not in posted_text, f"Stack trace leaked in Slack message: {posted_text}"
         assert "xoxb-" not in posted_text, f"Bot token leaked in Slack message: {posted_text}"
 
-    @patch("pipeline.send_slack_post_request")
-    @patch("pipeline.check_rate_limit")
-    @patch("pipeline.authorize_request")
-    @patch("pipeline.check_entity_existence")
-    def test_is_processing_reset_on_execution_exception(
-        self, mock_existence, mock_auth, mock_rate, mock_send, mock_routing_defaults
-    ):
-        """pipeline.is_processing is False after execution agent raises exception."""
-        import pipeline
-
-        mock_auth.return_value = Mock(authorized=True, unauthorized_entities=[])
-        mock_rate.return_value = (True, 9)
-        mock_routing_defaults.side_effect = RuntimeError("Connection timeout")
-
-        from main import handle_message
-
-        handle_message(self._make_payload())
-
-        assert pipeline.is_processing is False, "is_processing should be reset to False after exception"
-
 
 # ─── Echo mode off — structured logging ───
 
@@ -1093,3 +1119,27 @@ class TestStructuredLogging:
             assert bot_token not in line, (
                 f"Bot token leaked in log line {i}: {line}"
             )
+
+
+class TestPingBusyStatus:
+    """/ping reports HealthyBusy while an invocation is queued or running."""
+
+    def test_ping_busy_while_invocation_in_flight(self):
+        import asyncio
+        import threading
+
+        import main
+
+        release = threading.Event()
+        ping = main.app._routes[("GET", "/ping")]
+
+        async def scenario():
+            task = asyncio.ensure_future(main._invocation_pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            status = ping()["status"]
+            release.set()
+            await task
+            return status
+
+        assert asyncio.run(scenario()) == "HealthyBusy"
+        assert ping()["status"] == "Healthy"
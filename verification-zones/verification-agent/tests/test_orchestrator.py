@@ -560,3 +560,165 @@ class TestOrchestrationFileArtifactPropagation:
 
         assert result.file_artifact is None
         assert result.completion_status == "complete"
+
+
+class TestOrchestrationAgentKwargs:
+    """Streaming callback and tool executor are forwarded to the Strands Agent."""
+
+    def _build(self, **kwargs):
+        from src.orchestrator import OrchestrationAgent
+
+        with patch("src.orchestrator.Agent") as MockAgent, \
+             patch("hooks.MaxTurnsHook"), \
+             patch("hooks.ToolLoggingHook"), \
+             patch("agent_tools.build_agent_tools", return_value=[]):
+            OrchestrationAgent({}, MagicMock(), **kwargs)
+        return MockAgent.call_args[1]
+
+    def test_callback_handler_passed_to_agent(self):
+        handler = MagicMock()
+        assert self._build(callback_handler=handler)["callback_handler"] is handler
+
+    def test_default_callback_handler_left_untouched(self):
+        assert "callback_handler" not in self._build()
+
+    def test_parallel_tool_executor_by_default(self, monkeypatch):
+        from strands.tools.executors import ConcurrentToolExecutor
+
+        monkeypatch.delenv("ORCHESTRATOR_PARALLEL_TOOLS", raising=False)
+        assert isinstance(self._build()["tool_executor"], ConcurrentToolExecutor)
+
+    def test_sequential_tool_executor_when_disabled(self, monkeypatch):
+        from strands.tools.executors import SequentialToolExecutor
+
+        monkeypatch.setenv("ORCHESTRATOR_PARALLEL_TOOLS", "false")
+        assert isinstance(self._build()["tool_executor"], SequentialToolExecutor)
+
+    def test_system_prompt_ends_with_cache_point(self, monkeypatch):
+        from src.orchestrator import ORCHESTRATOR_SYSTEM_PROMPT
+
+        monkeypatch.delenv("BEDROCK_PROMPT_CACHE", raising=False)
+        assert self._build()["system_prompt"] == [
+            {"text": ORCHESTRATOR_SYSTEM_PROMPT},
+            {"cachePoint": {"type": "default"}},
+        ]
+
+    def test_plain_system_prompt_when_cache_disabled(self, monkeypatch):
+        from src.orchestrator import ORCHESTRATOR_SYSTEM_PROMPT
+
+        monkeypatch.setenv("BEDROCK_PROMPT_CACHE", "false")
+        assert self._build()["system_prompt"] == ORCHESTRATOR_SYSTEM_PROMPT
+
+
+class TestOrchestratorPool:
+    """Pooled orchestrators are reused per registry version and rebound per request."""
+
+    def _request(self, correlation_id="corr-1", channel="C01", bot_token="xoxb-1"):
+        from src.orchestrator import OrchestrationRequest
+
+        return OrchestrationRequest(
+            user_text="hi",
+            thread_context=None,
+            file_references=[],
+            available_agents={},
+            correlation_id=correlation_id,
+            channel=channel,
+            bot_token=bot_token,
+        )
+
+    def _patches(self):
+        return (
+            patch("src.orchestrator.Agent"),
+            patch("agent_tools.build_agent_tools", return_value=[]),
+            patch("src.orchestrator._agent_registry_module.get_agent_arn", return_value=""),
+        )
+
+    def test_checkin_then_checkout_reuses_instance(self):
+        from src.orchestrator import OrchestratorPool
+
+        pool = OrchestratorPool(max_idle=2)
+        model = MagicMock()
+        p_agent, p_tools, p_arn = self._patches()
+        with p_agent as MockAgent, p_tools as mock_build, p_arn:
+            first = pool.checkout(self._request("corr-1"), {}, model, "v1")
+            first._file_artifact_store["file_artifact"] = {"x": 1}
+            pool.checkin(first)
+            second = pool.checkout(self._request("corr-2", bot_token="xoxb-2"), {}, model, "v1")
+
+        assert second is first
+        assert MockAgent.call_count == 1
+        assert mock_build.call_count == 1
+        assert second._file_artifact_store == {}
+        assert second._agent.messages == []
+        assert second._request_context["correlation_id"] == "corr-2"
+        assert second._request_context["bot_token"] == "xoxb-2"
+
+    def test_registry_version_change_rebuilds(self):
+        from src.orchestrator import OrchestratorPool
+
+        pool = OrchestratorPool(max_idle=2)
+        model = MagicMock()
+        p_agent, p_tools, p_arn = self._patches()
+        with p_agent, p_tools as mock_build, p_arn:
+            first = pool.checkout(self._request(), {}, model, "v1")
+            pool.checkin(first)
+            second = pool.checkout(self._request(), {"docs": {}}, model, "v2")
+            pool.checkin(first)  # stale instance returned late is dropped
+            third = pool.checkout(self._request(), {"docs": {}}, model, "v2")
+
+        assert second is not first
+        assert third is not first
+        assert mock_build.call_count == 3
+
+    def test_registry_invalidation_clears_module_pool(self):
+        from src import orchestrator
+
+        p_agent, p_tools, p_arn = self._patches()
+        with p_agent, p_tools, p_arn:
+            orch = orchestrator._orchestrator_pool.checkout(self._request(), {}, MagicMock(), "v1")
+            orchestrator._orchestrator_pool.checkin(orch)
+            assert orchestrator._orchestrator_pool._idle
+
+            orchestrator._agent_registry_module._notify_invalidated()
+
+        assert orchestrator._orchestrator_pool._idle == {}
+
+    def test_concurrent_checkouts_get_distinct_instances(self):
+        from src.orchestrator import OrchestratorPool
+
+        pool = OrchestratorPool(max_idle=2)
+        model = MagicMock()
+        p_agent, p_tools, p_arn = self._patches()
+        with p_agent, p_tools, p_arn:
+            first = pool.checkout(self._request(), {}, model, "v1")
+            second = pool.checkout(self._request(), {}, model, "v1")
+
+        assert first is not second
+
+    def test_checkin_clears_request_credentials(self):
+        from src.orchestrator import OrchestratorPool
+
+        pool = OrchestratorPool(max_idle=2)
+        p_agent, p_tools, p_arn = self._patches()
+        with p_agent, p_tools, p_arn:
+            orch = pool.checkout(self._request(bot_token="xoxb-secret"), {}, MagicMock(), "v1")
+            pool.checkin(orch)
+
+        assert orch._request_context["bot_token"] == ""
+
+    def test_run_orchestration_loop_returns_instance_to_pool(self):
+        from src import orchestrator
+
+        pool = orchestrator.OrchestratorPool(max_idle=2)
+        p_agent, p_tools, p_arn = self._patches()
+        with p_agent as MockAgent, p_tools, p_arn, \
+             patch.object(orchestrator, "_orchestrator_pool", pool), \
+             patch("src.orchestrator._agent_registry_module.get_registry_version", return_value="v1"):
+            MockAgent.return_value.return_value = "回答"
+            model = MagicMock()
+            orchestrator.run_orchestration_loop(self._request("corr-1"), {}, model)
+            result = orchestrator.run_orchestration_loop(self._request("corr-2"), {}, model)
+
+        assert result.synthesized_text == "回答"
+        assert MockAgent.call_count == 1
+        assert sum(len(v) for v in pool._idle.values()) == 1
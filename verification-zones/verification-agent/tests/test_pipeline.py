@@ -2,7 +2,7 @@
 Unit tests for pipeline S3 integration (Secure Cross-Zone File Transfer).
 
 Tests:
-- Slack file download + S3 upload flow (mocked)
+- Attachment relay (Slack → S3) results in the execution payload (relay mocked)
 - Pre-signed URL generation and inclusion in execution payload
 - S3 cleanup after successful response and on error (try/finally)
 - Payload does not contain bot_token for file operations; contains presigned_url per contract
@@ -57,6 +57,25 @@ def _payload(
     }
 
 
+def _relayed(file_id, name="f.pdf", mimetype="application/pdf", size=1, correlation_id="corr-001", url=None):
+    from attachment_relay import RelayedAttachment
+    return RelayedAttachment(
+        file_id=file_id,
+        name=name,
+        mimetype=mimetype,
+        size=size,
+        s3_key=f"attachments/{correlation_id}/{file_id}/{name}",
+        presigned_url=url or f"https://bucket.s3.amazonaws.com/{file_id}?X-Amz-Signature=...",
+    )
+
+
+def _relay_all(attachments, _bot_token, correlation_id):
+    return [
+        _relayed(a["id"], a["name"], a["mimetype"], a["size"], correlation_id)
+        for a in attachments
+    ]
+
+
 class TestPipelineS3Integration:
     """Pipeline must enrich attachments with presigned_url and cleanup S3."""
 
@@ -73,39 +92,40 @@ class TestPipelineS3Integration:
         with patch("pipeline.check_rate_limit") as mock_rate:
             mock_rate.return_value = (True, None)
             with patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False):
-                with patch("pipeline.upload_file_to_s3") as mock_upload:
-                    mock_upload.return_value = "attachments/corr-001/F1/doc.pdf"
-                    with patch("pipeline.generate_presigned_url") as mock_presign:
-                        mock_presign.return_value = "https://bucket.s3.amazonaws.com/key?X-Amz-Signature=..."
-                        with patch("pipeline.cleanup_request_files") as mock_cleanup:
-                            with patch("pipeline._get_slack_file_bytes") as mock_slack_bytes:
-                                mock_slack_bytes.return_value = b"file bytes"
-
-                                from pipeline import run
-
-                                payload = _payload(
-                                    attachments=[
-                                        {
-                                            "id": "F1",
-                                            "name": "doc.pdf",
-                                            "mimetype": "application/pdf",
-                                            "size": 9,
-                                            "url_private_download": "https://files.slack.com/old",
-                                        },
-                                    ],
-                                )
-                                run({"prompt": json.dumps(payload)})
-
-                                # OrchestrationRequest must contain file_references with presigned_url per contract
-                                orch_req = mock_routing_defaults.call_args[0][0]
-                                assert len(orch_req.file_references) == 1
-                                assert orch_req.file_references[0].get("presigned_url") == "https://bucket.s3.amazonaws.com/key?X-Amz-Signature=..."
-                                assert orch_req.file_references[0].get("id") == "F1"
-                                assert orch_req.file_references[0].get("name") == "doc.pdf"
-                                assert orch_req.file_references[0].get("mimetype") == "application/pdf"
-                                assert orch_req.file_references[0].get("size") == 9
-
-                                mock_cleanup.assert_called_once_with("corr-001")
+                with patch("pipeline.relay_attachments") as mock_relay:
+                    mock_relay.return_value = [
+                        _relayed(
+                            "F1", "doc.pdf", size=9,
+                            url="https://bucket.s3.amazonaws.com/key?X-Amz-Signature=...",
+                        )
+                    ]
+                    with patch("pipeline.cleanup_request_files") as mock_cleanup:
+                        from pipeline import run
+
+                        payload = _payload(
+                            attachments=[
+                                {
+                                    "id": "F1",
+                                    "name": "doc.pdf",
+                                    "mimetype": "application/pdf",
+                                    "size": 9,
+                                    "url_private_download": "https://files.slack.com/old",
+                                },
+                            ],
+                        )
+                        run({"prompt": json.dumps(payload)})
+
+                        # OrchestrationRequest must contain file_references with presigned_url per contract
+                        orch_req = mock_routing_defaults.call_args[0][0]
+                        assert len(orch_req.file_references) == 1
+                        assert orch_req.file_references[0].get("presigned_url") == "https://bucket.s3.amazonaws.com/key?X-Amz-Signature=..."
+                        assert orch_req.file_references[0].get("id") == "F1"
+                        assert orch_req.file_references[0].get("name") == "doc.pdf"
+                        assert orch_req.file_references[0].get("mimetype") == "application/pdf"
+                        assert orch_req.file_references[0].get("size") == 9
+                        assert mock_relay.call_args[0][1:] == ("xoxb-test", "corr-001")
+
+                        mock_cleanup.assert_called_once_with("corr-001")
 
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.authorize_request")
@@ -118,17 +138,14 @@ class TestPipelineS3Integration:
         with patch("pipeline.check_rate_limit") as mock_rate:
             mock_rate.return_value = (True, None)
             with patch("pipeline.cleanup_request_files") as mock_cleanup:
-                with patch("pipeline.upload_file_to_s3"), patch("pipeline.generate_presigned_url"):
-                    with patch("pipeline._get_slack_file_bytes") as mock_slack_bytes:
-                        mock_slack_bytes.return_value = b"x" * 5
-
-                        from pipeline import run
+                with patch("pipeline.relay_attachments", side_effect=_relay_all):
+                    from pipeline import run
 
-                        run({"prompt": json.dumps(_payload(attachments=[
-                            {"id": "F1", "name": "f.txt", "mimetype": "text/plain", "size": 5, "url_private_download": "u"},
-                        ]))})
+                    run({"prompt": json.dumps(_payload(attachments=[
+                        {"id": "F1", "name": "f.txt", "mimetype": "text/plain", "size": 5, "url_private_download": "u"},
+                    ]))})
 
-                        mock_cleanup.assert_called_once()
+                    mock_cleanup.assert_called_once()
 
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.authorize_request")
@@ -142,18 +159,15 @@ class TestPipelineS3Integration:
         with patch("pipeline.check_rate_limit") as mock_rate:
             mock_rate.return_value = (True, None)
             with patch("pipeline.cleanup_request_files") as mock_cleanup:
-                with patch("pipeline.upload_file_to_s3"), patch("pipeline.generate_presigned_url"):
-                    with patch("pipeline._get_slack_file_bytes") as mock_slack_bytes:
-                        mock_slack_bytes.return_value = b"x" * 5
+                with patch("pipeline.relay_attachments", side_effect=_relay_all):
+                    from pipeline import run
 
-                        from pipeline import run
+                    run({"prompt": json.dumps(_payload(attachments=[
+                        {"id": "F1", "name": "f.txt", "mimetype": "text/plain", "size": 5, "url_private_download": "u"},
+                    ]))})
 
-                        run({"prompt": json.dumps(_payload(attachments=[
-                            {"id": "F1", "name": "f.txt", "mimetype": "text/plain", "size": 5, "url_private_download": "u"},
-                        ]))})
-
-                        # Cleanup must be called despite exception
-                        mock_cleanup.assert_called_once()
+                    # Cleanup must be called despite exception
+                    mock_cleanup.assert_called_once()
 
 
 class TestPipelineMultipleAttachments:
@@ -162,52 +176,38 @@ class TestPipelineMultipleAttachments:
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.authorize_request")
     @patch("pipeline.check_entity_existence")
-    def test_multiple_attachments_uploaded_to_s3_same_correlation_id(
+    def test_multiple_attachments_relayed_with_same_correlation_id(
         self, mock_existence, mock_auth, mock_slack_post, mock_routing_defaults
     ):
-        """Multiple attachments (2-5) must all be uploaded to S3 under same correlation_id."""
+        """Multiple attachments (2-5) must all be relayed to S3 under same correlation_id in one batch."""
         mock_auth.return_value = MagicMock(authorized=True, unauthorized_entities=[])
         mock_slack_post.return_value = None
 
         with patch("pipeline.check_rate_limit") as mock_rate:
             mock_rate.return_value = (True, None)
             with patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False):
-                with patch("pipeline.upload_file_to_s3") as mock_upload:
-                    with patch("pipeline.generate_presigned_url") as mock_presign:
-                        with patch("pipeline.cleanup_request_files") as mock_cleanup:
-                            with patch("pipeline._get_slack_file_bytes") as mock_slack_bytes:
-                                mock_slack_bytes.return_value = b"file content"
-                                mock_upload.side_effect = [
-                                    "attachments/corr-multi/F1/a.pdf",
-                                    "attachments/corr-multi/F2/b.pdf",
-                                    "attachments/corr-multi/F3/c.pdf",
-                                ]
-                                mock_presign.side_effect = [
-                                    "https://bucket.s3.amazonaws.com/k1?sig=1",
-                                    "https://bucket.s3.amazonaws.com/k2?sig=2",
-                                    "https://bucket.s3.amazonaws.com/k3?sig=3",
-                                ]
-
-                                from pipeline import run
-
-                                payload = _payload(
-                                    correlation_id="corr-multi",
-                                    attachments=[
-                                        {"id": "F1", "name": "a.pdf", "mimetype": "application/pdf", "size": 10, "url_private_download": "u1"},
-                                        {"id": "F2", "name": "b.pdf", "mimetype": "application/pdf", "size": 10, "url_private_download": "u2"},
-                                        {"id": "F3", "name": "c.pdf", "mimetype": "application/pdf", "size": 10, "url_private_download": "u3"},
-                                    ],
-                                )
-                                run({"prompt": json.dumps(payload)})
-
-                                assert mock_upload.call_count == 3
-                                for call in mock_upload.call_args_list:
-                                    args = call[0]
-                                    assert args[1] == "corr-multi"
-                                mock_routing_defaults.assert_called_once()
-                                orch_req = mock_routing_defaults.call_args[0][0]
-                                assert len(orch_req.file_references) == 3
-                                mock_cleanup.assert_called_once_with("corr-multi")
+                with patch("pipeline.relay_attachments", side_effect=_relay_all) as mock_relay:
+                    with patch("pipeline.cleanup_request_files") as mock_cleanup:
+                        from pipeline import run
+
+                        payload = _payload(
+                            correlation_id="corr-multi",
+                            attachments=[
+                                {"id": "F1", "name": "a.pdf", "mimetype": "application/pdf", "size": 10, "url_private_download": "u1"},
+                                {"id": "F2", "name": "b.pdf", "mimetype": "application/pdf", "size": 10, "url_private_download": "u2"},
+                                {"id": "F3", "name": "c.pdf", "mimetype": "application/pdf", "size": 10, "url_private_download": "u3"},
+                            ],
+                        )
+                        run({"prompt": json.dumps(payload)})
+
+                        mock_relay.assert_called_once()
+                        attachments, _token, correlation_id = mock_relay.call_args[0]
+                        assert [a["id"] for a in attachments] == ["F1", "F2", "F3"]
+                        assert correlation_id == "corr-multi"
+                        mock_routing_defaults.assert_called_once()
+                        orch_req = mock_routing_defaults.call_args[0][0]
+                        assert len(orch_req.file_references) == 3
+                        mock_cleanup.assert_called_once_with("corr-multi")
 
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.authorize_request")
@@ -222,27 +222,18 @@ class TestPipelineMultipleAttachments:
         with patch("pipeline.check_rate_limit") as mock_rate:
             mock_rate.return_value = (True, None)
             with patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False):
-                with patch("pipeline.upload_file_to_s3") as mock_upload:
-                    with patch("pipeline.generate_presigned_url") as mock_presign:
-                        with patch("pipeline.cleanup_request_files"):
-                            with patch("pipeline._get_slack_file_bytes") as mock_slack_bytes:
-                                mock_slack_bytes.return_value = b"x"
-                                mock_upload.side_effect = ["att/corr/F1/f1", "att/corr/F2/f2"]
-                                mock_presign.side_effect = [
-                                    "https://s3.example.com/key1?sig=a",
-                                    "https://s3.example.com/key2?sig=b",
-                                ]
-
-                                from pipeline import run
-
-                                run({"prompt": json.dumps(_payload(attachments=[
-                                    {"id": "F1", "name": "f1.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u1"},
-                                    {"id": "F2", "name": "f2.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u2"},
-                                ]))})
-
-                                urls = [a.get("presigned_url") for a in mock_routing_defaults.call_args[0][0].file_references]
-                                assert len(urls) == 2
-                                assert urls[0] != urls[1]
+                with patch("pipeline.relay_attachments", side_effect=_relay_all):
+                    with patch("pipeline.cleanup_request_files"):
+                        from pipeline import run
+
+                        run({"prompt": json.dumps(_payload(attachments=[
+                            {"id": "F1", "name": "f1.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u1"},
+                            {"id": "F2", "name": "f2.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u2"},
+                        ]))})
+
+                        urls = [a.get("presigned_url") for a in mock_routing_defaults.call_args[0][0].file_references]
+                        assert len(urls) == 2
+                        assert urls[0] != urls[1]
 
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.authorize_request")
@@ -257,23 +248,18 @@ class TestPipelineMultipleAttachments:
         with patch("pipeline.check_rate_limit") as mock_rate:
             mock_rate.return_value = (True, None)
             with patch("pipeline.cleanup_request_files") as mock_cleanup:
-                with patch("pipeline.upload_file_to_s3") as mock_upload:
-                    with patch("pipeline.generate_presigned_url"):
-                        with patch("pipeline._get_slack_file_bytes") as mock_slack_bytes:
-                            mock_slack_bytes.return_value = b"data"
-                            mock_upload.return_value = "attachments/cid/F/x"
-
-                            from pipeline import run
+                with patch("pipeline.relay_attachments", side_effect=_relay_all):
+                    from pipeline import run
 
-                            run({"prompt": json.dumps(_payload(
-                                correlation_id="batch-cid",
-                                attachments=[
-                                    {"id": "F1", "name": "a.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u1"},
-                                    {"id": "F2", "name": "b.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u2"},
-                                ],
-                            ))})
+                    run({"prompt": json.dumps(_payload(
+                        correlation_id="batch-cid",
+                        attachments=[
+                            {"id": "F1", "name": "a.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u1"},
+                            {"id": "F2", "name": "b.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": "u2"},
+                        ],
+                    ))})
 
-                            mock_cleanup.assert_called_once_with("batch-cid")
+                    mock_cleanup.assert_called_once_with("batch-cid")
 
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.authorize_request")
@@ -288,25 +274,43 @@ class TestPipelineMultipleAttachments:
         with patch("pipeline.check_rate_limit") as mock_rate:
             mock_rate.return_value = (True, None)
             with patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False):
-                with patch("pipeline.upload_file_to_s3") as mock_upload:
-                    with patch("pipeline.generate_presigned_url") as mock_presign:
-                        with patch("pipeline.cleanup_request_files"):
-                            with patch("pipeline._get_slack_file_bytes") as mock_slack_bytes:
-                                mock_slack_bytes.return_value = b"x"
-                                mock_upload.return_value = "attachments/corr/F/x"
-                                mock_presign.return_value = "https://s3.example.com/k?sig=..."
+                with patch("pipeline.relay_attachments", side_effect=_relay_all) as mock_relay:
+                    with patch("pipeline.cleanup_request_files"):
+                        from pipeline import run
+
+                        six_attachments = [
+                            {"id": f"F{i}", "name": f"f{i}.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": f"u{i}"}
+                            for i in range(1, 7)
+                        ]
+                        run({"prompt": json.dumps(_payload(attachments=six_attachments))})
+
+                        orch_req = mock_routing_defaults.call_args[0][0]
+                        assert len(orch_req.file_references) == 5
+                        assert len(mock_relay.call_args[0][0]) == 5
+
+    @patch("pipeline.send_slack_post_request")
+    @patch("pipeline.authorize_request")
+    @patch("pipeline.check_entity_existence")
+    def test_skipped_attachment_not_in_file_references(
+        self, mock_existence, mock_auth, mock_slack_post, mock_routing_defaults
+    ):
+        """Files the relay skips (download/upload failure, too large) are left out; the request continues."""
+        mock_auth.return_value = MagicMock(authorized=True, unauthorized_entities=[])
+        mock_slack_post.return_value = None
 
-                                from pipeline import run
+        with patch("pipeline.check_rate_limit") as mock_rate:
+            mock_rate.return_value = (True, None)
+            with patch("pipeline.relay_attachments", return_value=[_relayed("F2", "b.pdf")]):
+                with patch("pipeline.cleanup_request_files"):
+                    from pipeline import run
 
-                                six_attachments = [
-                                    {"id": f"F{i}", "name": f"f{i}.pdf", "mimetype": "application/pdf", "size": 1, "url_private_download": f"u{i}"}
-                                    for i in range(1, 7)
-                                ]
-                                run({"prompt": json.dumps(_payload(attachments=six_attachments))})
+                    run({"prompt": json.dumps(_payload(attachments=[
+                        {"id": "F1", "name": "a.pdf", "mimetype": "application/pdf", "size": 1},
+                        {"id": "F2", "name": "b.pdf", "mimetype": "application/pdf", "size": 1},
+                    ]))})
 
-                                orch_req = mock_routing_defaults.call_args[0][0]
-                                assert len(orch_req.file_references) == 5
-                                assert mock_upload.call_count == 5
+                    refs = mock_routing_defaults.call_args[0][0].file_references
+                    assert [r["id"] for r in refs] == ["F2"]
 
 
 class TestPipelineLargeFileArtifactS3:
@@ -1009,3 +1013,149 @@ class TestThreadContextNotDuplicated:
         assert orch_req.thread_context == "過去の会話履歴"
         # thread_context must NOT be embedded inside user_text
         assert "過去の会話履歴" not in orch_req.user_text
+
+
+class TestConcurrentPrechecks:
+    """Security checks run concurrently; context fetches start only after they pass."""
+
+    @patch("pipeline.send_slack_post_request")
+    @patch("pipeline.check_rate_limit")
+    @patch("pipeline.resolve_slack_urls", side_effect=lambda t, *a, **kw: t)
+    @patch("pipeline.build_current_thread_context")
+    @patch("pipeline.authorize_request")
+    @patch("pipeline.check_entity_existence")
+    def test_security_checks_overlap_then_thread_context_overlaps_rate_limit(
+        self, mock_existence, mock_auth, mock_thread_ctx, _mock_urls, mock_rate,
+        _mock_send, mock_routing_defaults
+    ):
+        """Each pair waits for its partner to start; a serial pipeline would deadlock."""
+        import threading
+
+        security = threading.Barrier(2, timeout=5)
+        after_security = threading.Barrier(2, timeout=5)
+
+        def _existence(**kwargs):
+            security.wait()
+            return True
+
+        def _auth(**kwargs):
+            security.wait()
+            return MagicMock(authorized=True, unauthorized_entities=[])
+
+        def _thread_ctx(**kwargs):
+            assert mock_existence.called and mock_auth.called
+            after_security.wait()
+            return "履歴"
+
+        def _rate(**kwargs):
+            after_security.wait()
+            return (True, None)
+
+        mock_existence.side_effect = _existence
+        mock_auth.side_effect = _auth
+        mock_thread_ctx.side_effect = _thread_ctx
+        mock_rate.side_effect = _rate
+
+        from pipeline import run
+
+        result = run({"prompt": json.dumps(_payload())})
+
+        assert json.loads(result)["status"] == "completed"
+        assert mock_routing_defaults.call_args[0][0].thread_context == "履歴"
+
+    @patch("pipeline.send_slack_post_request")
+    @patch("pipeline.check_rate_limit")
+    @patch("pipeline.build_current_thread_context", return_value=None)
+    @patch("pipeline.authorize_request")
+    @patch("pipeline.check_entity_existence")
+    def test_authorization_rejection_does_not_wait_for_slow_existence_check(
+        self, mock_existence, mock_auth, _mock_thread_ctx, mock_rate, _mock_send,
+        mock_routing_defaults
+    ):
+        """First security failure returns immediately and skips the rate limit."""
+        import threading
+        import time
+
+        release = threading.Event()
+
+        def _slow_existence(**kwargs):
+            release.wait(timeout=5)
+            return True
+
+        mock_existence.side_effect = _slow_existence
+        mock_auth.return_value = MagicMock(authorized=False, unauthorized_entities=["U1"])
+
+        from pipeline import run
+
+        started = time.monotonic()
+        try:
+            result = run({"prompt": json.dumps(_payload())})
+        finally:
+            release.set()
+
+        assert time.monotonic() - started < 2
+        assert json.loads(result)["error_code"] == "authorization_failed"
+        mock_rate.assert_not_called()
+        mock_routing_defaults.assert_not_called()
+
+
+class TestStreamingResponses:
+    """SLACK_STREAMING_ENABLED streams partial text and finalizes the same message."""
+
+    @patch("pipeline.send_slack_post_request")
+    @patch("pipeline.check_rate_limit", return_value=(True, None))
+    @patch("pipeline.build_current_thread_context", return_value=None)
+    @patch("pipeline.authorize_request")
+    @patch("pipeline.check_entity_existence")
+    def test_final_post_carries_stream_marker_after_partial(
+        self, mock_existence, mock_auth, _mock_thread_ctx, _mock_rate, mock_send,
+        mock_routing_defaults, monkeypatch
+    ):
+        from src.orchestrator import OrchestrationResult
+
+        monkeypatch.setenv("SLACK_STREAMING_ENABLED", "true")
+        monkeypatch.setenv("SLACK_STREAMING_MIN_CHARS", "1")
+        mock_auth.return_value = MagicMock(authorized=True, unauthorized_entities=[])
+
+        def _orchestrate(request, registry, model, callback_handler=None):
+            callback_handler(data="途中までの回答です。しばらくお待ちください。")
+            return OrchestrationResult(
+                synthesized_text="最終回答です。",
+                turns_used=1,
+                agents_called=[],
+                file_artifact=None,
+                completion_status="complete",
+            )
+
+        mock_routing_defaults.side_effect = _orchestrate
+
+        with patch("slack_response_stream.send_slack_post_request") as mock_partial:
+            from pipeline import run
+
+            result = run({"prompt": json.dumps(_payload())})
+
+        assert json.loads(result)["status"] == "completed"
+        assert mock_partial.call_args[1]["stream"] == {"id": "corr-001", "seq": 1, "final": False}
+        final_kw = mock_send.call_args[1]
+        assert final_kw["text"] == "最終回答です。"
+        assert final_kw["stream"] == {"id": "corr-001", "seq": 2, "final": True}
+
+    @patch("pipeline.send_slack_post_request")
+    @patch("pipeline.check_rate_limit", return_value=(True, None))
+    @patch("pipeline.build_current_thread_context", return_value=None)
+    @patch("pipeline.authorize_request")
+    @patch("pipeline.check_entity_existence")
+    def test_streaming_disabled_posts_single_message(
+        self, mock_existence, mock_auth, _mock_thread_ctx, _mock_rate, mock_send,
+        mock_routing_defaults, monkeypatch
+    ):
+        monkeypatch.delenv("SLACK_STREAMING_ENABLED", raising=False)
+        mock_auth.return_value = MagicMock(authorized=True, unauthorized_entities=[])
+
+        from pipeline import run
+
+        run({"prompt": json.dumps(_payload())})
+
+        assert mock_routing_defaults.call_args[1]["callback_handler"] is None
+        mock_send.assert_called_once()
+        assert mock_send.call_args[1]["stream"] is None
@@ -13,6 +13,7 @@ import pytest
 
 # conftest.py adds src/ to sys.path and mocks fastapi/uvicorn
 import pipeline
+from attachment_relay import RelayedAttachment
 from usage_history import UsageRecord, PipelineResult
 
 # ---------------------------------------------------------------------------
@@ -167,9 +168,14 @@ class TestAttachmentKeysPassed:
             patch("pipeline.run_orchestration_loop", return_value=_default_orch_result()),
             patch("pipeline.send_slack_post_request"),
             patch("pipeline.get_all_cards", return_value={}),
-            patch("pipeline._get_slack_file_bytes", return_value=b"data"),
-            patch("pipeline.upload_file_to_s3", return_value=expected_key),
-            patch("pipeline.generate_presigned_url", return_value="https://presigned"),
+            patch("pipeline.relay_attachments", return_value=[RelayedAttachment(
+                file_id="F001",
+                name="file.pdf",
+                mimetype="application/pdf",
+                size=1000,
+                s3_key=expected_key,
+                presigned_url="https://presigned",
+            )]),
             patch("pipeline.cleanup_request_files"),
             patch("pipeline._save_usage_record") as mock_save,
         ):
@@ -190,3 +196,45 @@ class TestAttachmentKeysPassed:
         assert expected_key in record.attachment_keys, (
             f"expected {expected_key} in attachment_keys, got {record.attachment_keys}"
         )
+
+
+class TestTempFileCleanupDeferred:
+    """Temp attachments are deleted by the writer callback once the record is queued."""
+
+    def _run(self, queued: bool):
+        with (
+            patch("pipeline.check_entity_existence"),
+            patch("pipeline.authorize_request") as mock_auth,
+            patch("pipeline.check_rate_limit", return_value=(True, {})),
+            patch("pipeline.build_current_thread_context", return_value=None),
+            patch("pipeline.resolve_slack_urls", side_effect=lambda t, *a, **kw: t),
+            patch("pipeline.run_orchestration_loop", return_value=_default_orch_result()),
+            patch("pipeline.send_slack_post_request"),
+            patch("pipeline.get_all_cards", return_value={}),
+            patch("pipeline.relay_attachments", return_value=[RelayedAttachment(
+                file_id="F001",
+                name="file.pdf",
+                mimetype="application/pdf",
+                size=1000,
+                s3_key="attachments/corr-test/F001/file.pdf",
+                presigned_url="https://presigned",
+            )]),
+            patch("pipeline.cleanup_request_files") as mock_cleanup,
+            patch("pipeline._save_usage_record", return_value=queued) as mock_save,
+        ):
+            mock_auth.return_value = MagicMock(authorized=True)
+            pipeline.run(_inner(attachments=[{"id": "F001", "name": "file.pdf", "size": 1000}]))
+            cleaned_before_callback = mock_cleanup.called
+            mock_save.call_args[1]["on_persisted"]()
+        return cleaned_before_callback, mock_cleanup
+
+    def test_cleanup_runs_from_callback_when_record_queued(self):
+        cleaned_before_callback, mock_cleanup = self._run(queued=True)
+
+        assert not cleaned_before_callback
+        mock_cleanup.assert_called_once_with("corr-test")
+
+    def test_cleanup_runs_immediately_when_record_not_queued(self):
+        cleaned_before_callback, _ = self._run(queued=False)
+
+        assert cleaned_before_callback
@@ -3,14 +3,18 @@ Unit tests for s3_file_manager.
 
 Tests:
 - upload_file_to_s3: correct S3 key structure, content type set, error handling
+- upload_stream_to_s3: single PutObject vs multipart parts, size limit while streaming
+- attachment cache: lookup by file_id and size, server-side copy, kept by cleanup
 - generate_presigned_url: returns HTTPS URL, expiry parameter passed
 - cleanup_request_files: lists and deletes all objects under correlation_id prefix
 - upload_generated_file_to_s3: generated_files/ prefix, sanitized filename
 - generate_presigned_url_for_generated_file: delegates to generate_presigned_url
 """
 
+import hashlib
 import os
 import sys
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch, call
 
 import pytest
@@ -25,7 +29,7 @@ class TestUploadFileToS3:
     """Tests for upload_file_to_s3."""
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_upload_returns_correct_s3_key_structure(self, mock_boto3):
         """S3 key must be attachments/{correlation_id}/{file_id}/{file_name}."""
         mock_s3 = MagicMock()
@@ -55,7 +59,7 @@ class TestUploadFileToS3:
         assert call_kw["ContentType"] == "application/pdf"
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "my-bucket"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_upload_sets_content_type(self, mock_boto3):
         """ContentType must be set from mimetype parameter."""
         mock_s3 = MagicMock()
@@ -75,7 +79,7 @@ class TestUploadFileToS3:
         assert call_kw["ContentType"] == "image/png"
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "b"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_upload_s3_failure_raises_or_propagates(self, mock_boto3):
         """S3 upload failures should be propagated (caller handles)."""
         mock_s3 = MagicMock()
@@ -96,7 +100,7 @@ class TestUploadFileToS3:
     @patch.dict(os.environ, {}, clear=False)
     def test_upload_requires_bucket_env(self):
         """upload_file_to_s3 should fail or use default when FILE_EXCHANGE_BUCKET unset."""
-        with patch("s3_file_manager.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_s3 = MagicMock()
             mock_boto3.client.return_value = mock_s3
             try:
@@ -117,11 +121,164 @@ class TestUploadFileToS3:
                 pass  # Acceptable: implementation may require env set
 
 
+class TestUploadStreamToS3:
+    """Tests for upload_stream_to_s3 (streamed attachment relay)."""
+
+    PART = 5 * 1024 * 1024
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_small_stream_uses_single_put(self, mock_boto3):
+        mock_s3 = MagicMock()
+        mock_boto3.client.return_value = mock_s3
+
+        from s3_file_manager import upload_stream_to_s3
+
+        key, size, sha256 = upload_stream_to_s3(
+            iter([b"abc", b"", b"def"]), "corr-1", "F1", "a.txt", "text/plain"
+        )
+
+        assert key == f"{EXPECTED_PREFIX}corr-1/F1/a.txt"
+        assert size == 6
+        assert sha256 == hashlib.sha256(b"abcdef").hexdigest()
+        mock_s3.create_multipart_upload.assert_not_called()
+        call_kw = mock_s3.put_object.call_args[1]
+        assert call_kw["Body"] == b"abcdef"
+        assert call_kw["ContentType"] == "text/plain"
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_large_stream_uses_multipart_parts(self, mock_boto3):
+        mock_s3 = MagicMock()
+        mock_s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        mock_s3.upload_part.side_effect = lambda **kw: {"ETag": f"e{kw['PartNumber']}"}
+        mock_boto3.client.return_value = mock_s3
+
+        from s3_file_manager import upload_stream_to_s3
+
+        chunks = [b"x" * (3 * 1024 * 1024)] * 4  # 12 MB → 5 MB + 5 MB + 2 MB
+        key, size, _sha256 = upload_stream_to_s3(iter(chunks), "c", "F1", "big.pdf", "application/pdf")
+
+        assert size == 12 * 1024 * 1024
+        bodies = [c[1]["Body"] for c in mock_s3.upload_part.call_args_list]
+        assert [len(b) for b in bodies] == [self.PART, self.PART, 2 * 1024 * 1024]
+        mock_s3.put_object.assert_not_called()
+        complete_kw = mock_s3.complete_multipart_upload.call_args[1]
+        assert complete_kw["UploadId"] == "up-1"
+        assert complete_kw["MultipartUpload"]["Parts"] == [
+            {"ETag": "e1", "PartNumber": 1},
+            {"ETag": "e2", "PartNumber": 2},
+            {"ETag": "e3", "PartNumber": 3},
+        ]
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_size_limit_enforced_while_streaming(self, mock_boto3):
+        """The stream stops at the limit and the multipart upload is aborted."""
+        mock_s3 = MagicMock()
+        mock_s3.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        mock_s3.upload_part.return_value = {"ETag": "e"}
+        mock_boto3.client.return_value = mock_s3
+        consumed = []
+
+        def chunks():
+            for _ in range(10):
+                consumed.append(1)
+                yield b"x" * (3 * 1024 * 1024)
+
+        from s3_file_manager import FileTooLargeError, upload_stream_to_s3
+
+        with pytest.raises(FileTooLargeError):
+            upload_stream_to_s3(chunks(), "c", "F1", "big.pdf", "application/pdf", max_bytes=10 * 1024 * 1024)
+
+        assert len(consumed) == 4
+        mock_s3.abort_multipart_upload.assert_called_once_with(Bucket="test-bucket", Key="attachments/c/F1/big.pdf", UploadId="up-1")
+        mock_s3.complete_multipart_upload.assert_not_called()
+        mock_s3.put_object.assert_not_called()
+
+
+class TestAttachmentCache:
+    """Tests for find_cached_attachment / store_cached_attachment."""
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_finds_newest_object_of_matching_size(self, mock_boto3):
+        now = datetime.now(timezone.utc)
+        mock_s3 = MagicMock()
+        mock_s3.list_objects_v2.return_value = {"Contents": [
+            {"Key": "attachment_cache/F1/1700/old/a.pdf", "Size": 10, "LastModified": now - timedelta(hours=2)},
+            {"Key": "attachment_cache/F1/1700/new/a.pdf", "Size": 10, "LastModified": now - timedelta(hours=1)},
+            {"Key": "attachment_cache/F1/1700/other/a.pdf", "Size": 99, "LastModified": now},
+        ]}
+        mock_boto3.client.return_value = mock_s3
+
+        from s3_file_manager import find_cached_attachment
+
+        cached = find_cached_attachment("F1", "1700", 10)
+
+        assert cached == ("attachment_cache/F1/1700/new/a.pdf", "new")
+        assert mock_s3.list_objects_v2.call_args[1]["Prefix"] == "attachment_cache/F1/1700/"
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_no_lookup_without_file_version(self, mock_boto3):
+        from s3_file_manager import find_cached_attachment, store_cached_attachment
+
+        assert find_cached_attachment("F1", "", 10) is None
+        assert store_cached_attachment("attachments/c/F1/a.pdf", "F1", "", "abc", "a.pdf") is None
+        mock_boto3.client.return_value.list_objects_v2.assert_not_called()
+        mock_boto3.client.return_value.copy_object.assert_not_called()
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_expired_object_not_reused(self, mock_boto3):
+        mock_s3 = MagicMock()
+        mock_s3.list_objects_v2.return_value = {"Contents": [
+            {"Key": "attachment_cache/F1/1700/h/a.pdf", "Size": 10,
+             "LastModified": datetime.now(timezone.utc) - timedelta(days=6, hours=1)},
+        ]}
+        mock_boto3.client.return_value = mock_s3
+
+        from s3_file_manager import find_cached_attachment
+
+        assert find_cached_attachment("F1", "1700", 10) is None
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_store_copies_to_content_addressed_key(self, mock_boto3):
+        mock_s3 = MagicMock()
+        mock_boto3.client.return_value = mock_s3
+
+        from s3_file_manager import store_cached_attachment
+
+        key = store_cached_attachment("attachments/c/F1/a.pdf", "F1", "1700", "abc", "a.pdf")
+
+        assert key == "attachment_cache/F1/1700/abc/a.pdf"
+        mock_s3.copy_object.assert_called_once_with(
+            CopySource={"Bucket": "test-bucket", "Key": "attachments/c/F1/a.pdf"},
+            Bucket="test-bucket",
+            Key="attachment_cache/F1/1700/abc/a.pdf",
+        )
+
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_store_failure_returns_none(self, mock_boto3):
+        from botocore.exceptions import ClientError
+
+        mock_s3 = MagicMock()
+        mock_s3.copy_object.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "CopyObject")
+        mock_boto3.client.return_value = mock_s3
+
+        from s3_file_manager import store_cached_attachment
+
+        assert store_cached_attachment("attachments/c/F1/a.pdf", "F1", "1700", "abc", "a.pdf") is None
+
+
 class TestGeneratePresignedUrl:
     """Tests for generate_presigned_url."""
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "presign-bucket"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_returns_https_url(self, mock_boto3):
         """Presigned URL must be HTTPS."""
         mock_s3 = MagicMock()
@@ -140,7 +297,7 @@ class TestGeneratePresignedUrl:
         assert call_kw["Params"].get("Key") == "attachments/corr/F1/file.pdf"
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "b"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_expiry_parameter_passed(self, mock_boto3):
         """Expiry parameter must be passed to generate_presigned_url."""
         mock_s3 = MagicMock()
@@ -157,7 +314,7 @@ class TestCleanupRequestFiles:
     """Tests for cleanup_request_files."""
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "cleanup-bucket"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_lists_and_deletes_under_correlation_id_prefix(self, mock_boto3):
         """Must list objects under attachments/{correlation_id}/ and delete each."""
         mock_s3 = MagicMock()
@@ -190,8 +347,24 @@ class TestCleanupRequestFiles:
         assert "attachments/corr-1/F1/a.pdf" in keys
         assert "attachments/corr-1/F2/b.txt" in keys
 
+    @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "cleanup-bucket"}, clear=False)
+    @patch("aws_clients.boto3")
+    def test_cached_attachments_never_listed(self, mock_boto3):
+        """Cleanup lists only the request prefix, so the shared attachment cache is untouched."""
+        mock_s3 = MagicMock()
+        mock_s3.get_paginator.return_value.paginate.return_value = [{}]
+        mock_boto3.client.return_value = mock_s3
+
+        from s3_file_manager import ATTACHMENT_CACHE_PREFIX, cleanup_request_files
+
+        cleanup_request_files("corr-1")
+
+        prefix = mock_s3.get_paginator.return_value.paginate.call_args[1]["Prefix"]
+        assert prefix == "attachments/corr-1/"
+        assert not prefix.startswith(ATTACHMENT_CACHE_PREFIX)
+
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "b"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_cleanup_no_objects_does_not_delete(self, mock_boto3):
         """When no objects under prefix, delete_objects should not be called or receive empty."""
         mock_s3 = MagicMock()
@@ -215,7 +388,7 @@ class TestUploadGeneratedFileToS3:
     """Tests for upload_generated_file_to_s3."""
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_upload_returns_generated_files_prefix_key(self, mock_boto3):
         """S3 key must be generated_files/{correlation_id}/{sanitized_file_name}."""
         mock_s3 = MagicMock()
@@ -243,7 +416,7 @@ class TestUploadGeneratedFileToS3:
         assert call_kw["ContentType"] == "application/pdf"
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "test-bucket"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_upload_sanitizes_filename(self, mock_boto3):
         """Filename with forbidden chars must be sanitized for S3 key."""
         mock_s3 = MagicMock()
@@ -270,7 +443,7 @@ class TestGeneratePresignedUrlForGeneratedFile:
     """Tests for generate_presigned_url_for_generated_file."""
 
     @patch.dict(os.environ, {"FILE_EXCHANGE_BUCKET": "presign-bucket"}, clear=False)
-    @patch("s3_file_manager.boto3")
+    @patch("aws_clients.boto3")
     def test_returns_https_url(self, mock_boto3):
         """Presigned URL for generated file must be HTTPS."""
         mock_s3 = MagicMock()
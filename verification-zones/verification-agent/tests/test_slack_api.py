@@ -0,0 +1,134 @@
+"""
+Unit tests for the shared Slack Web API client layer.
+
+Covers:
+- One keep-alive session shared by all calls
+- Per-token client reuse with LRU eviction
+- HTTP 429 Retry-After handling
+- Per-method latency metrics
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import slack_api
+from slack_api import get_slack_client
+
+
+def _response(status_code=200, body=None, headers=None, content=b""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body or {}
+    response.content = content
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients():
+    slack_api._clients.clear()
+    yield
+    slack_api._clients.clear()
+
+
+@pytest.fixture
+def session():
+    mock_session = MagicMock()
+    with patch("slack_api._get_session", return_value=mock_session), \
+         patch("slack_api.emit_metric") as mock_emit, \
+         patch("slack_api.time.sleep") as mock_sleep:
+        mock_session.emit = mock_emit
+        mock_session.sleep = mock_sleep
+        yield mock_session
+
+
+class TestClientCache:
+    def test_same_token_reuses_client(self):
+        assert get_slack_client("xoxb-a") is get_slack_client("xoxb-a")
+        assert get_slack_client("xoxb-a") is not get_slack_client("xoxb-b")
+
+    def test_least_recently_used_token_evicted(self):
+        with patch.object(slack_api, "SLACK_CLIENT_CACHE_SIZE", 2):
+            first = get_slack_client("xoxb-1")
+            get_slack_client("xoxb-2")
+            get_slack_client("xoxb-1")
+            get_slack_client("xoxb-3")
+
+            assert list(slack_api._clients) == ["xoxb-1", "xoxb-3"]
+            assert get_slack_client("xoxb-1") is first
+
+    def test_session_is_shared_and_pooled(self):
+        with patch.object(slack_api, "_session", None):
+            session = slack_api._get_session()
+            assert slack_api._get_session() is session
+            assert session.get_adapter("https://slack.com/api/")._pool_maxsize == slack_api.SLACK_HTTP_POOL_SIZE
+
+
+class TestCall:
+    def test_get_call_sends_token_and_params(self, session):
+        session.request.return_value = _response(body={"ok": True, "messages": []})
+
+        data = get_slack_client("xoxb-t").call("conversations.replies", {"channel": "C1", "ts": "1.0"})
+
+        assert data == {"ok": True, "messages": []}
+        args, kwargs = session.request.call_args
+        assert args == ("GET", "https://slack.com/api/conversations.replies")
+        assert kwargs["headers"] == {"Authorization": "Bearer xoxb-t"}
+        assert kwargs["params"] == {"channel": "C1", "ts": "1.0"}
+
+    def test_latency_emitted_per_method(self, session):
+        session.request.return_value = _response(body={"ok": True})
+
+        get_slack_client("xoxb-t").call("files.info", {"file": "F1"})
+
+        namespace, metric, _value = session.emit.call_args.args
+        assert (namespace, metric) == ("SlackAI/SlackApi", "SlackApiLatency")
+        assert session.emit.call_args.kwargs["unit"] == "Milliseconds"
+        assert session.emit.call_args.kwargs["dimensions"] == [{"Name": "Method", "Value": "files.info"}]
+
+    def test_rate_limited_call_waits_retry_after_then_succeeds(self, session):
+        session.request.side_effect = [
+            _response(429, headers={"Retry-After": "3"}),
+            _response(body={"ok": True}),
+        ]
+
+        data = get_slack_client("xoxb-t").call("users.info", {"user": "U1"})
+
+        assert data == {"ok": True}
+        session.sleep.assert_called_once_with(3.0)
+        assert session.request.call_count == 2
+
+    def test_rate_limited_result_returned_without_retries(self, session):
+        session.request.return_value = _response(429, headers={"Retry-After": "7"})
+
+        data = get_slack_client("xoxb-t").call("team.info", {"team": "T1"}, max_retries=0)
+
+        assert data == {"ok": False, "error": "ratelimited", "status_code": 429, "retry_after": 7.0}
+        session.sleep.assert_not_called()
+
+    def test_retry_after_beyond_limit_is_not_waited(self, session):
+        session.request.return_value = _response(429, headers={"Retry-After": "120"})
+
+        data = get_slack_client("xoxb-t").call("conversations.info", {"channel": "C1"})
+
+        assert data["error"] == "ratelimited"
+        session.sleep.assert_not_called()
+
+    def test_download_uses_shared_session(self, session):
+        session.request.return_value = _response(content=b"bytes")
+
+        assert get_slack_client("xoxb-t").download("https://files.slack.com/x") == b"bytes"
+        assert session.emit.call_args.kwargs["dimensions"] == [{"Name": "Method", "Value": "files.download"}]
+
+    def test_open_download_streams_body(self, session):
+        response = _response(content=b"unused")
+        session.request.return_value = response
+
+        assert get_slack_client("xoxb-t").open_download("https://files.slack.com/x") is response
+        assert session.request.call_args.kwargs["stream"] is True
+        response.raise_for_status.assert_called_once()
@@ -0,0 +1,47 @@
+"""
+Unit tests for slack_post_request (enqueueing Slack post requests).
+
+Covers:
+- FIFO message group per answer and a unique deduplication id per request
+- Return value for enqueued and skipped requests
+"""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from slack_post_request import send_slack_post_request
+
+QUEUE_URL = "https://sqs.ap-northeast-1.amazonaws.com/123456789012/test-slack-post-request.fifo"
+
+
+class TestSendSlackPostRequest:
+    def test_requests_of_one_answer_share_message_group(self, monkeypatch):
+        monkeypatch.setenv("SLACK_POST_REQUEST_QUEUE_URL", QUEUE_URL)
+        sqs = MagicMock()
+        with patch("slack_post_request.get_client", return_value=sqs):
+            for seq in (1, 2):
+                assert send_slack_post_request(
+                    "C01", "123.456", text=f"part {seq}", bot_token="xoxb-test",
+                    correlation_id="corr-1", stream={"id": "corr-1", "seq": seq, "final": False},
+                ) is True
+
+        first, second = (c[1] for c in sqs.send_message.call_args_list)
+        assert first["MessageGroupId"] == second["MessageGroupId"] == "corr-1"
+        assert first["MessageDeduplicationId"] != second["MessageDeduplicationId"]
+        assert json.loads(second["MessageBody"])["stream"]["seq"] == 2
+
+    def test_message_group_falls_back_to_channel(self, monkeypatch):
+        monkeypatch.setenv("SLACK_POST_REQUEST_QUEUE_URL", QUEUE_URL)
+        sqs = MagicMock()
+        with patch("slack_post_request.get_client", return_value=sqs):
+            send_slack_post_request("C01", None, text="hello", bot_token="xoxb-test")
+
+        assert sqs.send_message.call_args[1]["MessageGroupId"] == "C01"
+
+    def test_returns_false_when_skipped(self, monkeypatch):
+        monkeypatch.delenv("SLACK_POST_REQUEST_QUEUE_URL", raising=False)
+        assert send_slack_post_request("C01", None, text="hello", bot_token="xoxb-test") is False
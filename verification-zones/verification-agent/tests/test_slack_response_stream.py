@@ -0,0 +1,89 @@
+"""
+Unit tests for slack_response_stream (streamed Slack answers).
+
+Covers:
+- Strands callback events (text deltas, tool-use turn boundaries)
+- Flush throttling and the minimum length of the first partial
+- Final stream marker and best-effort handling of enqueue failures
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from slack_response_stream import PARTIAL_SUFFIX, SlackResponseStream, is_streaming_enabled
+
+
+def _stream(**kwargs):
+    params = {"flush_interval": 2.0, "min_chars": 5}
+    params.update(kwargs)
+    return SlackResponseStream("C01", "123.456", "xoxb-test", "corr-1", message_ts="123.456", **params)
+
+
+class TestSlackResponseStream:
+    def test_first_partial_waits_for_min_chars(self):
+        stream = _stream()
+        with patch("slack_response_stream.send_slack_post_request") as mock_send:
+            stream.callback_handler(data="abc")
+            mock_send.assert_not_called()
+            stream.callback_handler(data="defgh")
+        kwargs = mock_send.call_args[1]
+        assert kwargs["text"] == "abcdefgh" + PARTIAL_SUFFIX
+        assert kwargs["stream"] == {"id": "corr-1", "seq": 1, "final": False}
+        assert kwargs["message_ts"] == "123.456"
+
+    def test_partials_throttled_by_interval(self):
+        stream = _stream()
+        with patch("slack_response_stream.send_slack_post_request") as mock_send, \
+             patch("slack_response_stream.time.monotonic", side_effect=[100.0, 101.0, 102.5]):
+            stream.on_text("hello world")
+            stream.on_text(" more")
+            stream.on_text(" text")
+        assert [c[1]["stream"]["seq"] for c in mock_send.call_args_list] == [1, 2]
+        assert mock_send.call_args[1]["text"] == "hello world more text" + PARTIAL_SUFFIX
+
+    def test_tool_use_starts_new_turn(self):
+        stream = _stream(flush_interval=0)
+        with patch("slack_response_stream.send_slack_post_request") as mock_send:
+            stream.callback_handler(data="調べています")
+            stream.callback_handler(current_tool_use={"name": "invoke_docs"})
+            stream.callback_handler(data="回答です。")
+        assert mock_send.call_args[1]["text"] == "回答です。" + PARTIAL_SUFFIX
+
+    def test_finish_returns_final_marker_after_partials(self):
+        stream = _stream(flush_interval=0)
+        with patch("slack_response_stream.send_slack_post_request"):
+            stream.on_text("partial answer")
+        assert stream.finish() == {"id": "corr-1", "seq": 2, "final": True}
+
+    def test_finish_without_partials_returns_none(self):
+        assert _stream().finish() is None
+
+    def test_no_partials_after_finish(self):
+        stream = _stream(flush_interval=0)
+        stream.finish()
+        with patch("slack_response_stream.send_slack_post_request") as mock_send:
+            stream.on_text("late text")
+        mock_send.assert_not_called()
+
+    def test_enqueue_failure_disables_stream(self):
+        stream = _stream(flush_interval=0)
+        with patch("slack_response_stream.send_slack_post_request", side_effect=RuntimeError("sqs down")) as mock_send:
+            stream.on_text("first partial")
+            stream.on_text(" second partial")
+        assert mock_send.call_count == 1
+
+    def test_skipped_partial_disables_stream(self):
+        stream = _stream(flush_interval=0)
+        with patch("slack_response_stream.send_slack_post_request", return_value=False) as mock_send:
+            stream.on_text("first partial")
+            stream.on_text(" second partial")
+        assert mock_send.call_count == 1
+
+    def test_streaming_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SLACK_STREAMING_ENABLED", raising=False)
+        assert is_streaming_enabled() is False
+        monkeypatch.setenv("SLACK_STREAMING_ENABLED", "true")
+        assert is_streaming_enabled() is True
@@ -5,17 +5,25 @@ import os
 import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import slack_thread_context
 from slack_thread_context import build_current_thread_context
 
 
+@pytest.fixture(autouse=True)
+def _clear_thread_cache():
+    slack_thread_context._thread_cache.clear()
+    yield
+    slack_thread_context._thread_cache.clear()
+
+
 class TestSlackThreadContext:
-    @patch("slack_thread_context.requests.get")
-    def test_builds_context_and_skips_current_message(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {
+    @patch("slack_thread_context.get_slack_client")
+    def test_builds_context_and_skips_current_message(self, mock_get_client):
+        mock_get_client.return_value.call.return_value = {
             "ok": True,
             "messages": [
                 {"ts": "100.001", "text": "最初の質問", "user": "U1"},
@@ -23,7 +31,6 @@ class TestSlackThreadContext:
                 {"ts": "100.003", "text": "今の質問", "user": "U1"},
             ],
         }
-        mock_get.return_value = mock_resp
 
         context = build_current_thread_context(
             bot_token="xoxb-test",
@@ -38,12 +45,9 @@ class TestSlackThreadContext:
         assert "Assistant: 回答です" in context
         assert "今の質問" not in context
 
-    @patch("slack_thread_context.requests.get")
-    def test_returns_empty_when_slack_api_error(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {"ok": False, "error": "channel_not_found"}
-        mock_get.return_value = mock_resp
+    @patch("slack_thread_context.get_slack_client")
+    def test_returns_empty_when_slack_api_error(self, mock_get_client):
+        mock_get_client.return_value.call.return_value = {"ok": False, "error": "channel_not_found"}
 
         context = build_current_thread_context(
             bot_token="xoxb-test",
@@ -54,6 +58,101 @@ class TestSlackThreadContext:
         assert context == ""
 
 
+class TestThreadContextCache:
+    def _call(self, **kwargs):
+        return build_current_thread_context(
+            bot_token="xoxb-test",
+            channel_id="C001",
+            thread_ts="100.001",
+            correlation_id="corr-cache",
+            **kwargs,
+        )
+
+    @patch("slack_thread_context.get_slack_client")
+    def test_second_request_fetches_only_newer_replies(self, mock_get_client):
+        call = mock_get_client.return_value.call
+        call.side_effect = [
+            {"ok": True, "messages": [
+                {"ts": "100.001", "text": "質問", "user": "U1"},
+                {"ts": "100.002", "text": "回答", "bot_id": "B1"},
+            ]},
+            # conversations.replies returns the parent message with every page
+            {"ok": True, "messages": [
+                {"ts": "100.001", "text": "質問", "user": "U1"},
+                {"ts": "100.003", "text": "追加の質問", "user": "U1"},
+            ]},
+        ]
+
+        self._call()
+        context = self._call()
+
+        assert "oldest" not in call.call_args_list[0].args[1]
+        assert call.call_args_list[1].args[1]["oldest"] == "100.002"
+        assert context.count("User: 質問") == 1
+        assert "Assistant: 回答" in context
+        assert "User: 追加の質問" in context
+
+    @patch("slack_thread_context.get_slack_client")
+    def test_expired_entry_is_refetched_in_full(self, mock_get_client):
+        call = mock_get_client.return_value.call
+        call.return_value = {"ok": True, "messages": [{"ts": "100.001", "text": "質問", "user": "U1"}]}
+
+        self._call()
+        with patch("slack_thread_context.time.time", return_value=10**12):
+            self._call()
+
+        assert "oldest" not in call.call_args_list[1].args[1]
+
+    @patch("slack_thread_context.get_slack_client")
+    def test_long_thread_paginates_and_keeps_recent_messages(self, mock_get_client):
+        call = mock_get_client.return_value.call
+        call.side_effect = [
+            {"ok": True, "has_more": True, "response_metadata": {"next_cursor": "c2"}, "messages": [
+                {"ts": "100.001", "text": "親メッセージ", "user": "U1"},
+            ] + [{"ts": f"100.{i:03d}", "text": f"古い返信 {i}", "user": "U1"} for i in range(2, 50)]},
+            {"ok": True, "messages": [{"ts": "100.050", "text": "最新の返信", "user": "U1"}]},
+        ]
+
+        context = self._call(max_chars=120)
+
+        assert call.call_args_list[1].args[1]["cursor"] == "c2"
+        assert "User: 親メッセージ" in context
+        assert "User: 最新の返信" in context
+        assert "earlier messages omitted" in context
+        assert "古い返信 2\n" not in context
+
+    def test_cache_evicts_least_recently_used_thread(self):
+        cache = slack_thread_context._ThreadContextCache(max_entries=2, ttl_seconds=60)
+        entry = slack_thread_context._CachedThread(expires_at=cache.new_expiry())
+        cache.put(("C1", "1"), entry)
+        cache.put(("C1", "2"), entry)
+        cache.get(("C1", "1"))
+        cache.put(("C1", "3"), entry)
+
+        assert cache.get(("C1", "2")) is None
+        assert cache.get(("C1", "1")) is entry
+
+    @patch("slack_thread_context.get_slack_client")
+    def test_shared_dynamodb_entry_used_on_local_miss(self, mock_get_client):
+        table = MagicMock()
+        table.get_item.return_value = {"Item": {
+            "cache_key": "thread#C001#100.001",
+            "messages": '[["100.001", "User: 質問"]]',
+            "latest_ts": "100.001",
+            "ttl": 10**12,
+        }}
+        mock_get_client.return_value.call.return_value = {"ok": True, "messages": [
+            {"ts": "100.002", "text": "回答", "bot_id": "B1"},
+        ]}
+        with patch("slack_thread_context._get_cache_table", return_value=table):
+            context = self._call()
+
+        assert mock_get_client.return_value.call.call_args.args[1]["oldest"] == "100.001"
+        assert "User: 質問" in context and "Assistant: 回答" in context
+        saved = table.put_item.call_args.kwargs["Item"]
+        assert saved["latest_ts"] == "100.002"
+
+
 class TestPipelineThreadContextIntegration:
     @patch("pipeline.send_slack_post_request")
     @patch("pipeline.run_orchestration_loop")
@@ -4,20 +4,25 @@ Unit tests for Slack message URL resolver (slack_url_resolver.py).
 Tests cover:
 - URL parsing and timestamp conversion
 - Whitelist channel check
-- Thread fetching (mocked requests)
-- Integration: resolve_slack_urls end-to-end
+- Thread fetching (mocked Slack API client, thread context cache)
+- Integration: resolve_slack_urls end-to-end (deduplication, shared deadline)
 - Pipeline integration (fail-open behaviour)
 """
 
 import json
 import os
 import sys
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import slack_thread_context
+import slack_url_resolver
+from authorization import AuthorizationIndex
 from slack_url_resolver import (
     MAX_URLS_PER_MESSAGE,
     SlackUrlMatch,
@@ -30,6 +35,13 @@ from slack_url_resolver import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_thread_cache():
+    slack_thread_context._thread_cache.clear()
+    yield
+    slack_thread_context._thread_cache.clear()
+
+
 # ---------------------------------------------------------------------------
 # URL Parsing
 # ---------------------------------------------------------------------------
@@ -91,63 +103,80 @@ class TestTimestampConversion:
 # ---------------------------------------------------------------------------
 
 class TestCheckChannelWhitelisted:
-    @patch("slack_url_resolver.load_whitelist_config")
-    def test_channel_in_whitelist(self, mock_load):
-        mock_load.return_value = {"channel_ids": {"C001", "C002"}, "team_ids": set(), "user_ids": set()}
+    @patch("slack_url_resolver.get_authorization_index")
+    def test_channel_in_whitelist(self, mock_index):
+        mock_index.return_value = AuthorizationIndex.from_whitelist({"channel_ids": {"C001", "C002"}})
         assert check_channel_whitelisted("C001") is True
 
-    @patch("slack_url_resolver.load_whitelist_config")
-    def test_channel_not_in_whitelist(self, mock_load):
-        mock_load.return_value = {"channel_ids": {"C001"}, "team_ids": set(), "user_ids": set()}
+    @patch("slack_url_resolver.get_authorization_index")
+    def test_channel_not_in_whitelist(self, mock_index):
+        mock_index.return_value = AuthorizationIndex.from_whitelist({"channel_ids": {"C001"}})
         assert check_channel_whitelisted("C999") is False
 
-    @patch("slack_url_resolver.load_whitelist_config")
-    def test_empty_whitelist_allows_all(self, mock_load):
-        mock_load.return_value = {"channel_ids": set(), "team_ids": set(), "user_ids": set()}
+    @patch("slack_url_resolver.get_authorization_index")
+    def test_empty_whitelist_allows_all(self, mock_index):
+        mock_index.return_value = AuthorizationIndex.from_whitelist({})
         assert check_channel_whitelisted("CANY") is True
 
+    @patch("slack_url_resolver.get_authorization_index")
+    def test_explicit_index_skips_loading(self, mock_index):
+        index = AuthorizationIndex.from_whitelist({"channel_ids": {"C001"}})
+        assert check_channel_whitelisted("C001", index) is True
+        mock_index.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # Thread Fetching
 # ---------------------------------------------------------------------------
 
 class TestFetchThreadReplies:
-    @patch("slack_url_resolver.requests.get")
-    def test_success(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+    @patch("slack_thread_context.get_slack_client")
+    def test_success(self, mock_get_client):
+        mock_get_client.return_value.call.return_value = {
             "ok": True,
             "messages": [
-                {"text": "Hello", "user": "U1"},
-                {"text": "Hi!", "bot_id": "B1"},
+                {"ts": "1706123456.789012", "text": "Hello", "user": "U1"},
+                {"ts": "1706123457.000100", "text": "Hi!", "bot_id": "B1"},
             ],
         }
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
 
         result = fetch_thread_replies("xoxb-test", "C001", "1706123456.789012")
         assert result.error is None
-        assert len(result.messages) == 2
+        assert result.lines == ["User: Hello", "Assistant: Hi!"]
+        mock_get_client.assert_called_once_with("xoxb-test")
+        method, params = mock_get_client.return_value.call.call_args.args
+        assert method == "conversations.replies"
+        assert params["ts"] == "1706123456.789012"
 
-    @patch("slack_url_resolver.requests.get")
-    def test_api_error(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"ok": False, "error": "channel_not_found"}
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
+    @patch("slack_thread_context.get_slack_client")
+    def test_api_error(self, mock_get_client):
+        mock_get_client.return_value.call.return_value = {"ok": False, "error": "channel_not_found"}
 
         result = fetch_thread_replies("xoxb-test", "C001", "1706123456.789012")
         assert result.error is not None
         assert "channel_not_found" in result.error
 
-    @patch("slack_url_resolver.requests.get")
-    def test_network_exception(self, mock_get):
-        mock_get.side_effect = ConnectionError("timeout")
+    @patch("slack_thread_context.get_slack_client")
+    def test_network_exception(self, mock_get_client):
+        mock_get_client.return_value.call.side_effect = ConnectionError("timeout")
 
         result = fetch_thread_replies("xoxb-test", "C001", "1706123456.789012")
         assert result.error is not None
         assert "ConnectionError" in result.error
 
+    @patch("slack_thread_context.get_slack_client")
+    def test_recently_fetched_thread_served_from_cache(self, mock_get_client):
+        mock_get_client.return_value.call.return_value = {
+            "ok": True,
+            "messages": [{"ts": "1706123456.789012", "text": "Hello", "user": "U1"}],
+        }
+
+        fetch_thread_replies("xoxb-test", "C001", "1706123456.789012")
+        result = fetch_thread_replies("xoxb-test", "C001", "1706123456.789012")
+
+        assert result.lines == ["User: Hello"]
+        assert mock_get_client.return_value.call.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # Formatting
@@ -190,6 +219,25 @@ class TestFormatThreadContext:
 # ---------------------------------------------------------------------------
 
 class TestResolveSlackUrls:
+    @pytest.fixture(autouse=True)
+    def _index(self):
+        with patch("slack_url_resolver.get_authorization_index") as mock_index:
+            mock_index.return_value = AuthorizationIndex.from_whitelist({})
+            self.mock_index = mock_index
+            yield
+
+    @patch("slack_url_resolver.fetch_thread_replies")
+    def test_index_loaded_once_for_multiple_urls(self, mock_fetch):
+        mock_fetch.side_effect = lambda _token, channel_id, _ts: ResolvedThread(
+            channel_id=channel_id, messages=[{"text": channel_id, "user": "U1"}]
+        )
+        text = (
+            "https://t.slack.com/archives/C001/p1000000000000001 "
+            "https://t.slack.com/archives/C002/p2000000000000002"
+        )
+        resolve_slack_urls(text, "xoxb-test", "corr-1")
+        self.mock_index.assert_called_once()
+
     @patch("slack_url_resolver.fetch_thread_replies")
     @patch("slack_url_resolver.check_channel_whitelisted")
     def test_enriches_text_with_thread(self, mock_wl, mock_fetch):
@@ -222,10 +270,11 @@ class TestResolveSlackUrls:
     def test_partial_failure(self, mock_wl, mock_fetch):
         """One URL succeeds, one fails → only successful context is prepended."""
         mock_wl.return_value = True
-        mock_fetch.side_effect = [
-            ResolvedThread(channel_id="C001", messages=[{"text": "ok", "user": "U1"}]),
-            ResolvedThread(channel_id="C002", error="channel_not_found"),
-        ]
+        mock_fetch.side_effect = lambda _token, channel_id, _ts: (
+            ResolvedThread(channel_id="C001", messages=[{"text": "ok", "user": "U1"}])
+            if channel_id == "C001"
+            else ResolvedThread(channel_id="C002", error="channel_not_found")
+        )
         text = (
             "https://t.slack.com/archives/C001/p1000000000000001 "
             "https://t.slack.com/archives/C002/p2000000000000002"
@@ -244,6 +293,76 @@ class TestResolveSlackUrls:
         result = resolve_slack_urls(text, "xoxb-test", "corr-1")
         assert result == text  # unchanged, no context block
 
+    @patch("slack_url_resolver.fetch_thread_replies")
+    def test_duplicate_urls_fetched_once(self, mock_fetch):
+        mock_fetch.return_value = ResolvedThread(channel_id="C001", lines=["User: once"])
+        url = "https://t.slack.com/archives/C001/p1000000000000001"
+
+        result = resolve_slack_urls(f"{url} and again {url}", "xoxb-test", "corr-1")
+
+        mock_fetch.assert_called_once_with("xoxb-test", "C001", "1000000000.000001")
+        assert result.count("[Referenced Slack Thread (C001)]") == 1
+        assert url not in result
+
+    @patch("slack_url_resolver.fetch_thread_replies")
+    def test_threads_fetched_concurrently(self, mock_fetch):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(_token, channel_id, _ts):
+            barrier.wait()  # only passes when both fetches run at the same time
+            return ResolvedThread(channel_id=channel_id, lines=[f"User: {channel_id}"])
+
+        mock_fetch.side_effect = fetch
+        text = (
+            "https://t.slack.com/archives/C001/p1000000000000001 "
+            "https://t.slack.com/archives/C002/p2000000000000002"
+        )
+        result = resolve_slack_urls(text, "xoxb-test", "corr-1")
+
+        assert result.index("(C001)") < result.index("(C002)")
+
+    @patch("slack_url_resolver.fetch_thread_replies")
+    def test_fetch_past_deadline_is_skipped(self, mock_fetch):
+        release = threading.Event()
+
+        def fetch(_token, channel_id, _ts):
+            if channel_id == "C002":
+                release.wait(5)
+            return ResolvedThread(channel_id=channel_id, lines=[f"User: {channel_id}"])
+
+        mock_fetch.side_effect = fetch
+        slow_url = "https://t.slack.com/archives/C002/p2000000000000002"
+        text = f"https://t.slack.com/archives/C001/p1000000000000001 {slow_url}"
+        try:
+            with patch.object(slack_url_resolver, "SLACK_URL_RESOLVE_TIMEOUT_SECONDS", 0.2):
+                result = resolve_slack_urls(text, "xoxb-test", "corr-1")
+        finally:
+            release.set()
+
+        assert "[Referenced Slack Thread (C001)]" in result
+        assert "(C002)" not in result
+        assert slow_url in result
+
+    @patch("slack_url_resolver.fetch_thread_replies")
+    def test_single_url_fetch_also_bounded_by_deadline(self, mock_fetch):
+        release = threading.Event()
+
+        def fetch(_token, channel_id, _ts):
+            release.wait(5)
+            return ResolvedThread(channel_id=channel_id, lines=["User: late"])
+
+        mock_fetch.side_effect = fetch
+        url = "https://t.slack.com/archives/C001/p1000000000000001"
+        started = time.monotonic()
+        try:
+            with patch.object(slack_url_resolver, "SLACK_URL_RESOLVE_TIMEOUT_SECONDS", 0.2):
+                result = resolve_slack_urls(f"see {url}", "xoxb-test", "corr-1")
+        finally:
+            release.set()
+
+        assert time.monotonic() - started < 2
+        assert result == f"see {url}"
+
 
 # ---------------------------------------------------------------------------
 # Pipeline integration
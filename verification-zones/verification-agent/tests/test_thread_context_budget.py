@@ -0,0 +1,58 @@
+"""
+Unit tests for character-budgeted thread context selection.
+
+Covers:
+- Parent and most recent messages kept, older ones reported as omitted
+- Long messages truncated with a marker
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from thread_context_budget import budget_thread_lines, truncate_line
+
+
+def test_everything_fits_unchanged():
+    lines = ["User: parent", "Assistant: reply", "User: follow-up"]
+
+    result = budget_thread_lines(lines, max_chars=1000)
+
+    assert result.lines == lines
+    assert result.dropped_messages == 0
+    assert result.truncated_messages == 0
+    assert result.total_messages == 3
+
+
+def test_keeps_parent_and_most_recent_messages():
+    lines = ["User: parent"] + [f"User: message {i:02d}" for i in range(10)]
+
+    result = budget_thread_lines(lines, max_chars=len(lines[0]) + 1 + 3 * (len(lines[1]) + 1))
+
+    assert result.lines[0] == "User: parent"
+    assert result.lines[1] == "[... 7 earlier messages omitted ...]"
+    assert result.lines[2:] == ["User: message 07", "User: message 08", "User: message 09"]
+    assert result.dropped_messages == 7
+
+
+def test_without_parent_keeps_only_recent():
+    lines = [f"User: m{i}" for i in range(5)]
+
+    result = budget_thread_lines(lines, max_chars=2 * (len(lines[0]) + 1), keep_first=False)
+
+    assert result.lines == ["[... 3 earlier messages omitted ...]", "User: m3", "User: m4"]
+
+
+def test_long_messages_truncated_with_marker():
+    long_line = "User: " + "あ" * 500
+
+    result = budget_thread_lines(["User: parent", long_line], max_chars=10_000, max_message_chars=100)
+
+    assert result.truncated_messages == 1
+    assert len(result.lines[1]) == 100
+    assert result.lines[1].endswith(f"…[{len(long_line) - 100} chars truncated]")
+
+
+def test_truncate_line_keeps_short_lines():
+    assert truncate_line("User: short", 100) == "User: short"
@@ -73,7 +73,7 @@ class TestSaveContentToS3:
         mock_dynamodb = MagicMock()
         record = _make_record(input_text="Hello world", output_text="")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -89,7 +89,7 @@ class TestSaveContentToS3:
         mock_dynamodb = MagicMock()
         record = _make_record(input_text="", output_text="Response text")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -109,7 +109,7 @@ class TestSkipEmptyContent:
         mock_dynamodb = MagicMock()
         record = _make_record(input_text="", output_text="")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -125,7 +125,7 @@ class TestSkipEmptyContent:
         mock_dynamodb = MagicMock()
         record = _make_record(input_text="", output_text="")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -149,7 +149,7 @@ class TestAttachmentCopy:
             attachment_keys=[TEMP_KEY_1, TEMP_KEY_2],
         )
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -164,7 +164,7 @@ class TestAttachmentCopy:
             input_text="", output_text="", attachment_keys=[TEMP_KEY_1]
         )
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -184,7 +184,7 @@ class TestDynamoDBItem:
         mock_dynamodb = MagicMock()
         record = _make_record(input_text="hi", output_text="there")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -198,7 +198,7 @@ class TestDynamoDBItem:
         mock_dynamodb = MagicMock()
         record = _make_record(input_text="secret message", output_text="reply")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -214,7 +214,7 @@ class TestDynamoDBItem:
         mock_dynamodb = MagicMock()
         record = _make_record(input_text="msg", output_text="secret reply")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -230,7 +230,7 @@ class TestDynamoDBItem:
         mock_dynamodb = MagicMock()
         record = _make_record()
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -252,7 +252,7 @@ class TestFailOpen:
         mock_dynamodb.put_item.side_effect = Exception("DynamoDB unavailable")
         record = _make_record()
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -265,7 +265,7 @@ class TestFailOpen:
         mock_s3.put_object.side_effect = Exception("S3 throttled")
         record = _make_record(input_text="hello", output_text="world")
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -284,7 +284,7 @@ class TestSkippedAttachments:
             input_text="", output_text="", attachment_keys=[TEMP_KEY_1]
         )
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -309,7 +309,7 @@ class TestCorrelationIdFallback:
             output_text="",
         )
 
-        with patch("usage_history.boto3") as mock_boto3:
+        with patch("aws_clients.boto3") as mock_boto3:
             mock_boto3.client.side_effect = lambda svc, **kw: (
                 mock_s3 if svc == "s3" else mock_dynamodb
             )
@@ -324,3 +324,102 @@ class TestCorrelationIdFallback:
         else:
             corr_id_str = str(corr_id_value)
         assert corr_id_str, "correlation_id must be non-empty (UUID fallback expected)"
+
+
+class TestUsageHistoryWriter:
+    """Background writer: batching, retries, drops and flush."""
+
+    def _run(self, writer, records, mock_s3, mock_dynamodb, on_done=None):
+        with patch("aws_clients.boto3") as mock_boto3, \
+                patch.object(usage_history, "emit_metric") as mock_metric:
+            mock_boto3.client.side_effect = lambda svc, **kw: (
+                mock_s3 if svc == "s3" else mock_dynamodb
+            )
+            results = [
+                writer.submit(TABLE_NAME, HISTORY_BUCKET, TEMP_BUCKET, r, on_done=on_done)
+                for r in records
+            ]
+            assert writer.flush(timeout=5)
+        return results, mock_metric
+
+    def test_writes_records_with_batch_write_item(self):
+        mock_s3 = MagicMock()
+        mock_dynamodb = MagicMock()
+        mock_dynamodb.batch_write_item.return_value = {"UnprocessedItems": {}}
+        writer = usage_history.UsageHistoryWriter(linger_seconds=0.5)
+        records = [_make_record(attachment_keys=[TEMP_KEY_1]) for _ in range(3)]
+
+        results, _ = self._run(writer, records, mock_s3, mock_dynamodb)
+
+        assert results == [True, True, True]
+        mock_dynamodb.put_item.assert_not_called()
+        written = [
+            req["PutRequest"]["Item"]
+            for c in mock_dynamodb.batch_write_item.call_args_list
+            for req in c[1]["RequestItems"][TABLE_NAME]
+        ]
+        assert len(written) == 3
+        assert mock_s3.put_object.call_count == 6
+        assert mock_s3.copy_object.call_count == 3
+        assert written[0]["attachment_keys"]["L"]
+
+    def test_retries_unprocessed_items(self):
+        mock_s3 = MagicMock()
+        mock_dynamodb = MagicMock()
+        writer = usage_history.UsageHistoryWriter()
+        record = _make_record()
+
+        def _batch_write(RequestItems):
+            if mock_dynamodb.batch_write_item.call_count == 1:
+                return {"UnprocessedItems": RequestItems}
+            return {"UnprocessedItems": {}}
+
+        mock_dynamodb.batch_write_item.side_effect = _batch_write
+        with patch.object(usage_history, "BATCH_WRITE_BACKOFF_SECONDS", 0):
+            _, mock_metric = self._run(writer, [record], mock_s3, mock_dynamodb)
+
+        assert mock_dynamodb.batch_write_item.call_count == 2
+        failed = [c for c in mock_metric.call_args_list if c[0][1] == usage_history.METRIC_WRITE_FAILED]
+        assert failed == []
+
+    def test_batch_write_error_is_counted_and_not_raised(self):
+        mock_s3 = MagicMock()
+        mock_dynamodb = MagicMock()
+        mock_dynamodb.batch_write_item.side_effect = Exception("DynamoDB down")
+        writer = usage_history.UsageHistoryWriter()
+        on_done = MagicMock()
+
+        _, mock_metric = self._run(writer, [_make_record()], mock_s3, mock_dynamodb, on_done)
+
+        on_done.assert_called_once()
+        mock_metric.assert_any_call(
+            usage_history.METRICS_NAMESPACE, usage_history.METRIC_WRITE_FAILED, 1
+        )
+
+    def test_drops_record_when_queue_full(self):
+        writer = usage_history.UsageHistoryWriter(max_queue=1)
+        writer._ensure_thread = MagicMock()  # keep the worker from draining the queue
+        with patch.object(usage_history, "emit_metric") as mock_metric:
+            assert writer.submit(TABLE_NAME, HISTORY_BUCKET, TEMP_BUCKET, _make_record())
+            assert not writer.submit(TABLE_NAME, HISTORY_BUCKET, TEMP_BUCKET, _make_record())
+
+        mock_metric.assert_called_once_with(
+            usage_history.METRICS_NAMESPACE, usage_history.METRIC_DROPPED, 1
+        )
+        assert writer.queue_depth == 1
+        assert not writer.flush(timeout=0.05)
+
+    def test_on_done_called_after_attachments_copied(self):
+        mock_s3 = MagicMock()
+        mock_dynamodb = MagicMock()
+        mock_dynamodb.batch_write_item.return_value = {}
+        writer = usage_history.UsageHistoryWriter()
+        order = []
+        mock_s3.copy_object.side_effect = lambda **kw: order.append("copy")
+
+        self._run(
+            writer, [_make_record(attachment_keys=[TEMP_KEY_1])], mock_s3, mock_dynamodb,
+            on_done=lambda: order.append("done"),
+        )
+
+        assert order == ["copy", "done"]